@@ -73,4 +73,6 @@ class AccessExportUseCase:
             baselocs_path=Path(baselocs_path),
             baseccrr_path=Path(baseccrr_path) if baseccrr_path else None,
             db_password=db_password,
+            batch_export=getattr(settings, "ACCESS_EXPORT_BATCH", False),
+            use_worker=getattr(settings, "ACCESS_EXPORT_WORKER", False),
         )
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
@@ -16,6 +18,7 @@ from apps.tickets.application.use_cases.legacy_sync_use_case import (
 from apps.tickets.infrastructure.services.access_extractor import (
     AccessExtractor,
     AccessExtractorConfig,
+    PendingExtraction,
 )
 from apps.tickets.infrastructure.services.access_kilometrage_importer import (
     AccessKilometrageImporter,
@@ -25,6 +28,13 @@ from apps.tickets.infrastructure.services.access_novedad_importer import (
     AccessNovedadImporter,
     AccessNovedadSource,
 )
+from apps.tickets.infrastructure.services.kilometrage_bulk_session import (
+    kilometrage_bulk_session,
+)
+from apps.tickets.infrastructure.services.sync_timings import (
+    STAGE_EXTRACT,
+    SyncTimings,
+)
 
 
 @dataclass(frozen=True)
@@ -34,6 +44,11 @@ class AccessSyncConfig:
     db_password: str | None
     script_path: Path
     powershell_path: Path
+    # Extractor processes allowed to run at once (one per source/table)
+    max_workers: int = 4
+    # Access autonumber columns used as incremental watermarks ("" = by date)
+    novedad_id_field: str = "ID"
+    kilometrage_id_field: str = ""
 
 
 @dataclass(frozen=True)
@@ -59,7 +74,14 @@ class AccessSyncUseCase:
         stdout_writer=None,
         stderr_writer=None,
         filters: AccessSyncFilters | None = None,
+        bulk_load: bool = False,
     ) -> LegacySyncResult:
+        """Extract from Access and import into SQLite.
+
+        ``bulk_load`` runs the kilometrage load inside a bulk session (one
+        transaction, import PRAGMAs, ``km_unit_date_idx`` rebuilt at the
+        end); meant for full reimports.
+        """
         resolved_filters = filters or AccessSyncFilters()
         self._validate_filters(resolved_filters)
         self._validate_config_paths(resolved_filters)
@@ -83,64 +105,121 @@ class AccessSyncUseCase:
         start = perf_counter()
         novedades = self._empty_stats()
         kilometrage = self._empty_stats()
+        timings = SyncTimings()
+        novedad_importer = AccessNovedadImporter(
+            extractor, id_field=self._config.novedad_id_field, timings=timings
+        )
+        kilometrage_importer = AccessKilometrageImporter(
+            extractor, id_field=self._config.kilometrage_id_field, timings=timings
+        )
+        novedad_extractions: list[PendingExtraction] = []
+        kilometrage_extractions: list[PendingExtraction] = []
 
-        if resolved_filters.include_novedades:
-            novedad_importer = AccessNovedadImporter(extractor)
-            baselocs_novedad = (
-                AccessNovedadSource(db_path=baselocs_path, unit_field="Locs")
-                if baselocs_path
-                else None
-            )
-            baseccrr_novedad = (
-                AccessNovedadSource(db_path=baseccrr_path, unit_field="Coche")
-                if baseccrr_path
-                else None
-            )
-            novedades = novedad_importer.import_all(
-                baselocs=baselocs_novedad,
-                baseccrr=baseccrr_novedad,
-                db_password=self._config.db_password,
-                since_date=since_date,
-                dry_run=dry_run,
-                progress_every=progress_every,
-                skip_count=not with_count,
-            )
-
-        if resolved_filters.include_kilometrage:
-            kilometrage_importer = AccessKilometrageImporter(extractor)
-            baselocs_km = (
-                AccessKilometrageSource(
-                    db_path=baselocs_path,
-                    unit_field="Locs",
-                    source_label="access_locs",
-                )
-                if baselocs_path
-                else None
-            )
-            baseccrr_km = (
-                AccessKilometrageSource(
-                    db_path=baseccrr_path,
-                    unit_field="Coche",
-                    source_label="access_ccrr",
-                )
-                if baseccrr_path
-                else None
-            )
-            kilometrage = kilometrage_importer.import_all(
-                baselocs=baselocs_km,
-                baseccrr=baseccrr_km,
-                db_password=self._config.db_password,
-                since_date=since_date,
-                dry_run=dry_run,
-                progress_every=progress_every,
-                skip_count=not with_count,
-            )
+        # The extractor processes only read the Access files, so they run
+        # concurrently; every SQLite write stays on this thread.
+        with ThreadPoolExecutor(
+            max_workers=self._config.max_workers,
+            thread_name_prefix="access-extract",
+        ) as executor:
+            try:
+                if resolved_filters.include_novedades:
+                    novedad_extractions = novedad_importer.start_extractions(
+                        baselocs=(
+                            AccessNovedadSource(
+                                db_path=baselocs_path, unit_field="Locs"
+                            )
+                            if baselocs_path
+                            else None
+                        ),
+                        baseccrr=(
+                            AccessNovedadSource(
+                                db_path=baseccrr_path, unit_field="Coche"
+                            )
+                            if baseccrr_path
+                            else None
+                        ),
+                        executor=executor,
+                        db_password=self._config.db_password,
+                        since_date=since_date,
+                        progress_every=progress_every,
+                        skip_count=not with_count,
+                    )
+                if resolved_filters.include_kilometrage:
+                    kilometrage_extractions = kilometrage_importer.start_extractions(
+                        baselocs=(
+                            AccessKilometrageSource(
+                                db_path=baselocs_path,
+                                unit_field="Locs",
+                                source_label="access_locs",
+                            )
+                            if baselocs_path
+                            else None
+                        ),
+                        baseccrr=(
+                            AccessKilometrageSource(
+                                db_path=baseccrr_path,
+                                unit_field="Coche",
+                                source_label="access_ccrr",
+                            )
+                            if baseccrr_path
+                            else None
+                        ),
+                        executor=executor,
+                        db_password=self._config.db_password,
+                        since_date=since_date,
+                        progress_every=progress_every,
+                        skip_count=not with_count,
+                    )
+
+                if novedad_extractions:
+                    novedades = novedad_importer.import_extracted(
+                        novedad_extractions, dry_run=dry_run
+                    )
+                if kilometrage_extractions:
+                    session = (
+                        kilometrage_bulk_session(drop_index=True)
+                        if bulk_load and not dry_run
+                        else nullcontext()
+                    )
+                    with session:
+                        kilometrage = kilometrage_importer.import_extracted(
+                            kilometrage_extractions, dry_run=dry_run
+                        )
+            finally:
+                # Drop temp files left by extractions that were never imported.
+                for extraction in novedad_extractions + kilometrage_extractions:
+                    AccessExtractor.discard(extraction)
         duration_seconds = perf_counter() - start
 
+        source_durations = {
+            f"novedades:{extraction.label}": extraction.duration_seconds
+            for extraction in novedad_extractions
+        }
+        source_durations.update(
+            {
+                f"kilometrage:{extraction.label}": extraction.duration_seconds
+                for extraction in kilometrage_extractions
+            }
+        )
+        # Extractor processes overlap, so these spans are wall time per source
+        for table, extractions in (
+            (AccessNovedadImporter.TABLE_NAME, novedad_extractions),
+            (AccessKilometrageImporter.TABLE_NAME, kilometrage_extractions),
+        ):
+            for extraction in extractions:
+                timings.add(
+                    STAGE_EXTRACT,
+                    extraction.duration_seconds,
+                    source=extraction.label,
+                    table=table,
+                )
+
         return LegacySyncResult(
             novedades=novedades,
             kilometrage=kilometrage,
             duration_seconds=duration_seconds,
+            source_durations=source_durations,
+            stage_timings=timings.as_list(),
         )
 
     @staticmethod
@@ -161,6 +240,9 @@ class AccessSyncUseCase:
             db_password=getattr(settings, "ACCESS_DB_PASSWORD", None) or None,
             script_path=Path(script_path),
             powershell_path=Path(powershell_path),
+            max_workers=getattr(settings, "ACCESS_SYNC_MAX_WORKERS", 4),
+            novedad_id_field=getattr(settings, "ACCESS_NOVEDAD_ID_FIELD", "ID"),
+            kilometrage_id_field=getattr(settings, "ACCESS_KM_ID_FIELD", ""),
         )
 
     @staticmethod
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from time import perf_counter
 
@@ -11,13 +11,18 @@ from django.conf import settings
 
 @dataclass(frozen=True)
 class SyncStats:
-    """Aggregate stats for a sync step."""
+    """Aggregate stats for a sync step.
+
+    affected_units holds the unit numbers that received new rows, so callers
+    can refresh derived data for those units only.
+    """
 
     processed: int
     inserted: int
     skipped_old: int
     duplicates: int
     invalid: int
+    affected_units: frozenset[str] = field(default_factory=frozenset)
 
 
 @dataclass(frozen=True)
@@ -27,6 +32,10 @@ class LegacySyncResult:
     novedades: SyncStats
     kilometrage: SyncStats
     duration_seconds: float
+    # Extractor seconds per source, e.g. {"novedades:LOCS": 12.3}
+    source_durations: dict[str, float] = field(default_factory=dict)
+    # Seconds and rows per stage/source/table; see SyncTimings.as_list
+    stage_timings: list[dict] = field(default_factory=list)
 
 
 class LegacySyncUseCase:
@@ -45,8 +54,13 @@ class LegacySyncUseCase:
                 LegacyNovedadImporter,
             )
 
-            novedad_importer = novedad_importer or LegacyNovedadImporter()
-            kilometrage_importer = kilometrage_importer or LegacyKilometrageImporter()
+            parse_workers = getattr(settings, "LEGACY_IMPORT_PARSE_WORKERS", 1)
+            novedad_importer = novedad_importer or LegacyNovedadImporter(
+                parse_workers=parse_workers
+            )
+            kilometrage_importer = kilometrage_importer or LegacyKilometrageImporter(
+                parse_workers=parse_workers
+            )
 
         self._novedad_importer = novedad_importer
         self._kilometrage_importer = kilometrage_importer
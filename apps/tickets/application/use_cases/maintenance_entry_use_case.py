@@ -30,6 +30,7 @@ from apps.tickets.domain.services.recipient_resolution import (
     RecipientResolver,
 )
 from apps.tickets.infrastructure.models import (
+    IngresoJobModel,
     IntervencionTipoModel,
     LugarEmailRecipientModel,
     MaintenanceCycleModel,
@@ -41,6 +42,10 @@ from apps.tickets.infrastructure.models import (
 from apps.tickets.infrastructure.services.ingreso_email_dispatch_repo import (
     IngresoEmailDispatchRepository,
 )
+from apps.tickets.infrastructure.services.ingreso_job_queue import IngresoJobQueue
+from apps.tickets.infrastructure.services.kilometrage_cache import (
+    kilometrage_lookup_cache,
+)
 from apps.tickets.infrastructure.services.kilometrage_repository import (
     KilometrageRepository,
 )
@@ -111,6 +116,14 @@ class MaintenanceEntryResult:
     outlook_reason: str | None
 
 
+@dataclass(frozen=True)
+class MaintenanceEntrySubmission:
+    """Result of queueing a maintenance entry for background processing."""
+
+    entry: MaintenanceEntryModel
+    job: IngresoJobModel
+
+
 @dataclass(frozen=True)
 class MaintenanceEntryDeleteResult:
     """Result of maintenance entry deletion."""
@@ -132,6 +145,7 @@ class MaintenanceEntryUseCase:
         dispatch_repo: IngresoEmailDispatchRepository | None = None,
         kilometrage_repo: KilometrageRepository | None = None,
         snapshot_service: UnitMaintenanceSnapshotService | None = None,
+        job_queue: IngresoJobQueue | None = None,
     ) -> None:
         self._suggestion_service = suggestion_service or InterventionSuggestionService()
         self._recipient_resolver = recipient_resolver or RecipientResolver()
@@ -139,6 +153,7 @@ class MaintenanceEntryUseCase:
         self._dispatch_repo = dispatch_repo or IngresoEmailDispatchRepository()
         self._kilometrage_repo = kilometrage_repo or KilometrageRepository()
         self._snapshot_service = snapshot_service or UnitMaintenanceSnapshotService()
+        self._job_queue = job_queue or IngresoJobQueue()
 
     def prepare_draft(
         self,
@@ -324,6 +339,118 @@ class MaintenanceEntryUseCase:
             request_cache=request_cache,
         )
 
+        entry = self._persist_entry(
+            draft,
+            entry_datetime=entry_datetime,
+            trigger_type=trigger_type,
+            trigger_value=trigger_value,
+            trigger_unit=trigger_unit,
+            lugar_id=lugar_id,
+            selected_intervention_code=selected_intervention_code,
+            checklist_tasks=checklist_tasks,
+            observations=observations,
+            user=user,
+        )
+        return self._generate_artifacts(entry, draft, user, terminal_id)
+
+    def submit_entry(
+        self,
+        novedad_id: str,
+        entry_datetime: datetime,
+        trigger_type: str | None,
+        trigger_value: int | None,
+        trigger_unit: str | None,
+        lugar_id: str | None,
+        selected_intervention_code: str | None,
+        checklist_tasks: str | None,
+        observations: str | None,
+        user,
+        terminal_id: str | None = None,
+        request_cache: MaintenanceEntryRequestCache | None = None,
+    ) -> MaintenanceEntrySubmission:
+        """Create a maintenance entry and queue its PDF and email dispatch.
+
+        Takes the same arguments as ``create_entry``. The PDF, recipients
+        and email bodies are produced later by ``process_job`` in a worker.
+
+        Returns:
+            MaintenanceEntrySubmission with the entry and its queued job.
+        """
+
+        draft = self.prepare_draft(
+            novedad_id=novedad_id,
+            trigger_value=trigger_value,
+            trigger_type=trigger_type,
+            trigger_unit=trigger_unit,
+            entry_date=entry_datetime.date(),
+            request_cache=request_cache,
+        )
+        with transaction.atomic():
+            entry = self._persist_entry(
+                draft,
+                entry_datetime=entry_datetime,
+                trigger_type=trigger_type,
+                trigger_value=trigger_value,
+                trigger_unit=trigger_unit,
+                lugar_id=lugar_id,
+                selected_intervention_code=selected_intervention_code,
+                checklist_tasks=checklist_tasks,
+                observations=observations,
+                user=user,
+            )
+            job = self._job_queue.enqueue(entry, origin_terminal_id=terminal_id)
+        return MaintenanceEntrySubmission(entry=entry, job=job)
+
+    def process_job(self, job: IngresoJobModel) -> MaintenanceEntryResult | None:
+        """Generate the PDF and email dispatch of a queued entry.
+
+        The draft is rebuilt from the stored entry. Returns None when the
+        entry was deleted before the job ran.
+        """
+
+        entry = (
+            MaintenanceEntryModel.objects.select_related(
+                "lugar", "selected_intervention", "created_by"
+            )
+            .filter(pk=job.entry_id)
+            .first()
+        )
+        if entry is None:
+            return None
+
+        draft = self.prepare_draft(
+            novedad_id=str(entry.novedad_id),
+            trigger_value=entry.trigger_value,
+            trigger_type=entry.trigger_type,
+            trigger_unit=entry.trigger_unit,
+            entry_date=timezone.localtime(entry.entry_datetime).date(),
+        )
+        result = self._generate_artifacts(
+            entry, draft, entry.created_by, job.origin_terminal_id
+        )
+        self._job_queue.mark_done(
+            job,
+            recipients_status=result.recipients_status,
+            recipients_reason=result.recipients_reason,
+            outlook_status=result.outlook_status,
+            outlook_reason=result.outlook_reason,
+        )
+        return result
+
+    def _persist_entry(
+        self,
+        draft: MaintenanceEntryDraft,
+        *,
+        entry_datetime: datetime,
+        trigger_type: str | None,
+        trigger_value: int | None,
+        trigger_unit: str | None,
+        lugar_id: str | None,
+        selected_intervention_code: str | None,
+        checklist_tasks: str | None,
+        observations: str | None,
+        user,
+    ) -> MaintenanceEntryModel:
         selected_code = selected_intervention_code or draft.suggestion.suggested_code
         selected_intervention = None
         if selected_code:
@@ -350,10 +477,21 @@ class MaintenanceEntryUseCase:
         # Mark novelty as having ingreso generated
         draft.novelty.ingreso_generado = True
         draft.novelty.save(update_fields=["ingreso_generado", "updated_at"])
+        return entry
 
-        pdf_path = self._generate_pdf(entry, draft, user)
-        entry.pdf_path = pdf_path
-        entry.save(update_fields=["pdf_path", "updated_at"])
+    def _generate_artifacts(
+        self,
+        entry: MaintenanceEntryModel,
+        draft: MaintenanceEntryDraft,
+        user,
+        terminal_id: str | None,
+    ) -> MaintenanceEntryResult:
+        # A retried job reuses what an earlier attempt already produced
+        pdf_path = entry.pdf_path
+        if not pdf_path or not Path(pdf_path).exists():
+            pdf_path = self._generate_pdf(entry, draft, user)
+            entry.pdf_path = pdf_path
+            entry.save(update_fields=["pdf_path", "updated_at"])
 
         recipients = self._resolve_recipients(
             lugar_id=str(entry.lugar_id) if entry.lugar_id else None,
@@ -367,6 +505,7 @@ class MaintenanceEntryUseCase:
         if recipients.status == "ok":
             subject, body, body_html = self._build_email_content(entry, draft)
             try:
+                # Returns the dispatch of an earlier attempt instead of a second one
                 self._dispatch_repo.create_pending(
                     entry=entry,
                     to_recipients=recipients.to,
@@ -515,6 +654,41 @@ class MaintenanceEntryUseCase:
             self._emit_cache_telemetry(cache)
         return value
 
+    def _get_km_since_many_cached(
+        self,
+        unit_number: str,
+        target_dates: list[date],
+        request_cache: MaintenanceEntryRequestCache | None,
+    ) -> dict[date, Decimal | None]:
+        cache = self._get_request_cache(request_cache)
+        values: dict[date, Decimal | None] = {}
+        missing: list[date] = []
+        for target_date in dict.fromkeys(target_dates):
+            cache_key = (unit_number, target_date)
+            if cache and cache_key in cache.km_since:
+                cache.km_hits += 1
+                cache.time_saved_seconds += cache.km_since_timings.get(cache_key, 0.0)
+                values[target_date] = cache.km_since[cache_key]
+            else:
+                missing.append(target_date)
+        if missing:
+            if cache:
+                cache.km_misses += len(missing)
+            start_time = time.perf_counter()
+            fetched = self._kilometrage_repo.get_km_since_bulk(
+                [(unit_number, target_date) for target_date in missing]
+            )
+            elapsed = (time.perf_counter() - start_time) / len(missing)
+            for target_date in missing:
+                cache_key = (unit_number, target_date)
+                values[target_date] = fetched.get(cache_key)
+                if cache:
+                    cache.km_since[cache_key] = values[target_date]
+                    cache.km_since_timings[cache_key] = elapsed
+        if cache and values:
+            self._emit_cache_telemetry(cache)
+        return values
+
     def _get_km_at_or_before_cached(
         self,
         unit_number: str,
@@ -577,11 +751,13 @@ class MaintenanceEntryUseCase:
             hit_rate = total_hits / total if total else 0.0
             logger.info(
                 "Ingreso request cache metrics | hits=%s misses=%s hit_rate=%.2f "
-                "time_saved_s=%.4f",
+                "time_saved_s=%.4f shared_km_hits=%s shared_km_misses=%s",
                 total_hits,
                 total_misses,
                 hit_rate,
                 request_cache.time_saved_seconds,
+                kilometrage_lookup_cache.hits,
+                kilometrage_lookup_cache.misses,
             )
         except Exception:  # pragma: no cover - telemetry must be non-blocking
             return
@@ -748,11 +924,24 @@ class MaintenanceEntryUseCase:
                     return item.date_until or item.date_from
             return None
 
+        codes = [
+            "RG",
+            history.last_numeral_code,
+            history.last_rp_code,
+            history.last_abc_code,
+        ]
+        date_by_code = {code: get_date_for_code(code) for code in codes if code}
+        km_by_date = self._get_km_since_many_cached(
+            unit_number,
+            [target_date for target_date in date_by_code.values() if target_date],
+            request_cache,
+        )
+
         def get_km_since_for_code(code: str) -> Decimal | None:
-            target_date = get_date_for_code(code)
+            target_date = date_by_code.get(code)
             if target_date is None:
                 return None
-            return self._get_km_since_cached(unit_number, target_date, request_cache)
+            return km_by_date.get(target_date)
 
         # For units without a RG intervention (e.g. CKD, CNR coaches), fall back
         # to the km since their first km record (puesta en servicio).
@@ -4,6 +4,7 @@ import os
 import sys
 
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
 
 # Management commands that should NOT start the scheduler
 _SKIP_COMMANDS = {
@@ -29,6 +30,9 @@ _SKIP_PREFIXES = (
     "backfill_",
     "normalize_",
     "migrate_",
+    "benchmark_",
+    "reconcile_",
+    "process_",
 )
 
 
@@ -54,6 +58,13 @@ def _should_start_scheduler() -> bool:
     return True
 
 
+def _ensure_triggers(sender, using, **kwargs) -> None:
+    """Re-create triggers dropped by SQLite table rebuilds during migrate."""
+    from apps.tickets.infrastructure.services.db_triggers import ensure_triggers
+
+    ensure_triggers(using=using)
+
+
 class TicketsConfig(AppConfig):
     """Configuration for the tickets app."""
 
@@ -62,6 +73,7 @@ class TicketsConfig(AppConfig):
     verbose_name = "Tickets de Mantenimiento"
 
     def ready(self) -> None:
+        post_migrate.connect(_ensure_triggers, sender=self)
         if not _should_start_scheduler():
             return
         try:
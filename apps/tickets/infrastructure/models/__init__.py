@@ -1,8 +1,16 @@
 """Django models for the tickets infrastructure layer."""
 
 from apps.tickets.infrastructure.models.access_sync_log import AccessSyncLogModel
+from apps.tickets.infrastructure.models.access_sync_state import AccessSyncStateModel
 from apps.tickets.infrastructure.models.base import BaseModel
-from apps.tickets.infrastructure.models.kilometrage import KilometrageRecordModel
+from apps.tickets.infrastructure.models.dashboard_counters import (
+    DashboardCountersModel,
+)
+from apps.tickets.infrastructure.models.ingreso_job import IngresoJobModel
+from apps.tickets.infrastructure.models.kilometrage import (
+    KilometrageMonthlyModel,
+    KilometrageRecordModel,
+)
 from apps.tickets.infrastructure.models.mail_recipient import LugarEmailRecipientModel
 from apps.tickets.infrastructure.models.maintenance_cycle import MaintenanceCycleModel
 from apps.tickets.infrastructure.models.maintenance_entry import MaintenanceEntryModel
@@ -30,6 +38,9 @@ from apps.tickets.infrastructure.models.reference import (
     TrainNumberModel,
     WagonTypeModel,
 )
+from apps.tickets.infrastructure.models.reference_data_version import (
+    ReferenceDataVersionModel,
+)
 from apps.tickets.infrastructure.models.ticket import TicketModel
 from apps.tickets.infrastructure.models.tray_terminal import TrayTerminalModel
 from apps.tickets.infrastructure.models.unit_maintenance_snapshot import (
@@ -41,6 +52,9 @@ __all__ = [
     "BaseModel",
     # Sync log
     "AccessSyncLogModel",
+    "AccessSyncStateModel",
+    # Home page counters
+    "DashboardCountersModel",
     # Reference data
     "AffectedSystemModel",
     "BrandModel",
@@ -53,6 +67,7 @@ __all__ = [
     "RailcarClassModel",
     "WagonTypeModel",
     "TrainNumberModel",
+    "ReferenceDataVersionModel",
     # Maintenance units
     "LocomotiveModel",
     "MaintenanceUnitModel",
@@ -63,7 +78,9 @@ __all__ = [
     "MaintenanceCycleModel",
     "MaintenanceEntryModel",
     "MaintenanceEntryEmailDispatchModel",
+    "IngresoJobModel",
     # Kilometrage
+    "KilometrageMonthlyModel",
     "KilometrageRecordModel",
     # Mail recipients
     "LugarEmailRecipientModel",
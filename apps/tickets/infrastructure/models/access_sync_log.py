@@ -24,6 +24,10 @@ class AccessSyncLogModel(models.Model):
     duration_seconds = models.FloatField(default=0, verbose_name="Duración (s)")
     status = models.CharField(max_length=20, default="ok", verbose_name="Estado")
     error_message = models.TextField(blank=True, default="", verbose_name="Error")
+    # [{"stage", "source", "table", "seconds", "rows"}, ...] from SyncTimings
+    stage_timings = models.JSONField(
+        default=list, blank=True, verbose_name="Tiempos por etapa"
+    )
 
     class Meta:
         db_table = "access_sync_log"
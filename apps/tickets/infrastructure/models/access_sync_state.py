@@ -0,0 +1,39 @@
+"""Model for the per-source Access extraction watermark."""
+
+from django.db import models
+
+
+class AccessSyncStateModel(models.Model):
+    """High-water mark of the last Access rows imported per source and table."""
+
+    source = models.CharField(max_length=30, verbose_name="Origen")
+    table_name = models.CharField(max_length=50, verbose_name="Tabla Access")
+    last_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name="Último ID",
+        help_text="Mayor autonumérico Access importado",
+    )
+    last_date = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="Última fecha",
+        help_text="Mayor fecha de registro importada",
+    )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Actualizado")
+
+    class Meta:
+        db_table = "access_sync_state"
+        verbose_name = "Estado de sync Access"
+        verbose_name_plural = "Estados de sync Access"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "table_name"],
+                name="uniq_access_sync_state_source_table",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"{self.source}/{self.table_name} id={self.last_id} fecha={self.last_date}"
+        )
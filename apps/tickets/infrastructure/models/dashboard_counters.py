@@ -0,0 +1,47 @@
+"""Single-row table with the home page counters."""
+
+from django.db import models
+
+
+class DashboardCountersModel(models.Model):
+    """Ticket and novedad counters shown on the home page.
+
+    Kept current by SQLite triggers on ``ticket`` and ``novedad`` (migration
+    0040). ``novedades_hoy`` and ``novedades_semana`` are relative to
+    ``as_of``; ``DashboardCountersService`` recomputes the row when the day
+    changes and on the scheduled reconcile.
+    """
+
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID)
+    tickets_pending = models.IntegerField(default=0, verbose_name="Tickets pendientes")
+    tickets_completed = models.IntegerField(
+        default=0, verbose_name="Tickets finalizados"
+    )
+    tickets_total = models.IntegerField(default=0, verbose_name="Tickets totales")
+    novedades_hoy = models.IntegerField(default=0, verbose_name="Novedades hoy")
+    novedades_semana = models.IntegerField(
+        default=0, verbose_name="Novedades de la semana"
+    )
+    novedades_total = models.IntegerField(default=0, verbose_name="Novedades totales")
+    as_of = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name="Día de referencia",
+        help_text="Día al que corresponden las novedades de hoy y de la semana",
+    )
+    week_start = models.DateField(
+        null=True, blank=True, verbose_name="Inicio de semana"
+    )
+    reconciled_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Último recálculo"
+    )
+
+    class Meta:
+        db_table = "dashboard_counters"
+        verbose_name = "Contadores del inicio"
+        verbose_name_plural = "Contadores del inicio"
+
+    def __str__(self) -> str:
+        return f"Contadores al {self.as_of}"
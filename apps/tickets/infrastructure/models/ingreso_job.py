@@ -0,0 +1,100 @@
+"""Background job queue for maintenance entry artifacts."""
+
+from __future__ import annotations
+
+from django.db import models
+
+from apps.tickets.infrastructure.models.base import BaseModel
+from apps.tickets.infrastructure.models.maintenance_entry import MaintenanceEntryModel
+
+
+class IngresoJobModel(BaseModel):
+    """Pending PDF and email dispatch work for a maintenance entry.
+
+    The entry is saved in the request; a worker thread claims the job,
+    writes the PDF and creates the email dispatch, then stores the outcome
+    shown by the novedad detail page.
+    """
+
+    class Status(models.TextChoices):
+        QUEUED = "queued", "Queued"
+        RUNNING = "running", "Running"
+        DONE = "done", "Done"
+        FAILED = "failed", "Failed"
+
+    entry = models.ForeignKey(
+        MaintenanceEntryModel,
+        on_delete=models.CASCADE,
+        related_name="jobs",
+        verbose_name="Ingreso",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.QUEUED,
+        verbose_name="Estado",
+    )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Intentos",
+    )
+    last_error = models.TextField(
+        blank=True,
+        null=True,
+        verbose_name="Error",
+    )
+    origin_terminal_id = models.CharField(
+        max_length=36,
+        blank=True,
+        null=True,
+        verbose_name="Terminal de origen",
+    )
+    started_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name="Fecha de inicio",
+    )
+    finished_at = models.DateTimeField(
+        blank=True,
+        null=True,
+        verbose_name="Fecha de fin",
+    )
+    recipients_status = models.CharField(
+        max_length=20,
+        blank=True,
+        default="",
+        verbose_name="Estado de destinatarios",
+    )
+    recipients_reason = models.TextField(
+        blank=True,
+        null=True,
+        verbose_name="Motivo de destinatarios",
+    )
+    outlook_status = models.CharField(
+        max_length=20,
+        blank=True,
+        default="",
+        verbose_name="Estado de correo",
+    )
+    outlook_reason = models.TextField(
+        blank=True,
+        null=True,
+        verbose_name="Motivo de correo",
+    )
+
+    class Meta:
+        db_table = "ingreso_job"
+        verbose_name = "Ingreso - Trabajo en segundo plano"
+        verbose_name_plural = "Ingresos - Trabajos en segundo plano"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["entry"]),
+        ]
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in {self.Status.DONE, self.Status.FAILED}
+
+    def __str__(self) -> str:
+        return f"Ingreso {self.entry_id} - {self.status}"
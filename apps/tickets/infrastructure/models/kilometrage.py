@@ -35,6 +35,14 @@ class KilometrageRecordModel(BaseModel):
         blank=True,
         default="",
     )
+    cumulative_km = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name="Kilometraje acumulado",
+        help_text="Suma de km de la unidad hasta esta fecha inclusive",
+    )
 
     class Meta:
         db_table = "kilometrage_record"
@@ -56,3 +64,40 @@ class KilometrageRecordModel(BaseModel):
 
     def __str__(self) -> str:
         return f"{self.unit_number} - {self.record_date:%d/%m/%Y}"
+
+
+class KilometrageMonthlyModel(BaseModel):
+    """Per-unit monthly km total rolled up from the daily records."""
+
+    unit_number = models.CharField(
+        max_length=50,
+        verbose_name="Número de unidad",
+    )
+    month = models.DateField(
+        verbose_name="Mes",
+        help_text="Primer día del mes",
+    )
+    km_total = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        verbose_name="Kilometraje del mes",
+    )
+    record_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Registros diarios",
+    )
+
+    class Meta:
+        db_table = "kilometrage_monthly"
+        verbose_name = "Kilometraje mensual"
+        verbose_name_plural = "Kilometraje mensual"
+        ordering = ["unit_number", "-month"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["unit_number", "month"],
+                name="uniq_kilometrage_monthly_unit_month",
+            )
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.unit_number} - {self.month:%m/%Y}"
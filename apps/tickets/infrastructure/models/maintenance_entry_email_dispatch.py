@@ -104,6 +104,12 @@ class MaintenanceEntryEmailDispatchModel(BaseModel):
             models.Index(fields=["status", "created_at"]),
             models.Index(fields=["entry"]),
         ]
+        constraints = [
+            # One email per ingreso, also when a background job is retried
+            models.UniqueConstraint(
+                fields=["entry"], name="uniq_email_dispatch_per_entry"
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"Ingreso {self.entry_id} - {self.status}"
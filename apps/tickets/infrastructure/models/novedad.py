@@ -162,7 +162,7 @@ class NovedadModel(models.Model):
             ),
         ]
         indexes = [
-            models.Index(fields=["fecha_desde"]),
+            models.Index(fields=["fecha_desde", "created_at", "id"]),
             models.Index(fields=["maintenance_unit"]),
             models.Index(fields=["intervencion"]),
             models.Index(fields=["legacy_unit_code"]),
@@ -0,0 +1,25 @@
+"""Single-row version stamp for the form reference data."""
+
+from django.db import models
+
+
+class ReferenceDataVersionModel(models.Model):
+    """Counter bumped whenever a table behind the form option lists changes.
+
+    SQLite triggers (migration 0041) increment ``version`` on every insert,
+    delete and relevant update of ``maintenance_unit``, ``intervencion_tipo``,
+    ``lugar``, ``train_number`` and ``failure_type``, from any process.
+    """
+
+    SINGLETON_ID = 1
+
+    id = models.PositiveSmallIntegerField(primary_key=True, default=SINGLETON_ID)
+    version = models.BigIntegerField(default=1, verbose_name="Versión")
+
+    class Meta:
+        db_table = "reference_data_version"
+        verbose_name = "Versión de datos de referencia"
+        verbose_name_plural = "Versiones de datos de referencia"
+
+    def __str__(self) -> str:
+        return f"Datos de referencia v{self.version}"
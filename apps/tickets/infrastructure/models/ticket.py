@@ -190,7 +190,7 @@ class TicketModel(models.Model):
         ordering = ["-date", "-created_at"]
         indexes = [
             models.Index(fields=["ticket_number"]),
-            models.Index(fields=["date"]),
+            models.Index(fields=["date", "created_at", "id"]),
             models.Index(fields=["status"]),
             models.Index(fields=["maintenance_unit"]),
         ]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 import threading
 from typing import TYPE_CHECKING
@@ -18,6 +19,8 @@ _lock = threading.Lock()
 
 # Shift-change hours (local ART time)
 SYNC_HOURS = (6, 14, 22)
+# Nightly drift check of the home page counters (local ART time)
+COUNTERS_RECONCILE_HOUR = 3
 
 
 def run_sync(trigger: str = "scheduled") -> None:
@@ -42,13 +45,28 @@ def run_sync(trigger: str = "scheduled") -> None:
 
     try:
         result = use_case.run()
+        stage_timings = list(result.stage_timings)
 
-        if result.kilometrage.inserted > 0:
+        # Only units that received new novedades or km rows need a new
+        # snapshot; a full rebuild is left to ``build_km_snapshot``.
+        dirty_units = (
+            result.novedades.affected_units | result.kilometrage.affected_units
+        )
+        if dirty_units:
+            from apps.tickets.infrastructure.services.sync_timings import (
+                STAGE_SNAPSHOT_REFRESH,
+                SyncTimings,
+            )
             from apps.tickets.infrastructure.services.unit_maintenance_snapshot_service import (
                 UnitMaintenanceSnapshotService,
             )
 
-            refreshed = UnitMaintenanceSnapshotService().refresh_bulk()
+            timings = SyncTimings()
+            with timings.span(STAGE_SNAPSHOT_REFRESH, rows=len(dirty_units)):
+                refreshed = UnitMaintenanceSnapshotService().refresh_bulk(
+                    unit_numbers=sorted(dirty_units)
+                )
+            stage_timings.extend(timings.as_list())
             logger.info(
                 "Access sync — km snapshot refreshed for %d units (trigger=%s)",
                 refreshed,
@@ -62,6 +80,7 @@ def run_sync(trigger: str = "scheduled") -> None:
             kilometrage_inserted=result.kilometrage.inserted,
             duration_seconds=result.duration_seconds,
             status=AccessSyncLogModel.STATUS_OK,
+            stage_timings=stage_timings,
         )
         logger.info(
             "Access sync OK (trigger=%s) novedades=%d km=%d duration=%.1fs",
@@ -154,10 +173,53 @@ def run_export(trigger: str = "scheduled_export") -> None:
         )
 
 
+def run_counters_reconcile() -> None:
+    """Recompute the home page counters from the ticket and novedad tables."""
+    from apps.tickets.infrastructure.services.dashboard_counters import (
+        DashboardCountersService,
+    )
+
+    try:
+        result = DashboardCountersService().reconcile()
+        logger.info("Dashboard counters reconciled (drift=%s)", result.drift or "none")
+    except Exception as exc:
+        logger.exception("Dashboard counters reconcile failed: %s", exc)
+
+
+def start_ingreso_job_workers() -> int:
+    """Start the ingreso PDF/dispatch workers when async jobs are enabled."""
+    from django.conf import settings
+
+    if not getattr(settings, "INGRESO_ASYNC_JOBS", False):
+        return 0
+
+    from apps.tickets.application.use_cases.maintenance_entry_use_case import (
+        MaintenanceEntryUseCase,
+    )
+    from apps.tickets.infrastructure.services.ingreso_job_queue import (
+        start_ingreso_workers,
+    )
+
+    started = start_ingreso_workers(
+        MaintenanceEntryUseCase().process_job,
+        count=max(int(settings.INGRESO_JOB_WORKERS), 0),
+        poll_seconds=float(settings.INGRESO_JOB_POLL_SECONDS),
+    )
+    if started:
+        logger.info("Ingreso job workers started (%d)", started)
+    return started
+
+
 def start_scheduler() -> None:
     """Start the background scheduler. Safe to call once per process."""
     global _scheduler
 
+    # The ingreso job workers do not depend on apscheduler
+    try:
+        start_ingreso_job_workers()
+    except Exception:
+        logger.exception("Failed to start ingreso job workers")
+
     # Lazy import to avoid blocking if apscheduler is not installed
     try:
         from apscheduler.schedulers.background import BackgroundScheduler
@@ -189,7 +251,15 @@ def start_scheduler() -> None:
                 replace_existing=True,
             )
 
+        _scheduler.add_job(
+            run_counters_reconcile,
+            trigger=CronTrigger(hour=COUNTERS_RECONCILE_HOUR, minute=30, timezone=_ART),
+            id="dashboard_counters_reconcile",
+            replace_existing=True,
+        )
+
         _scheduler.start()
+        atexit.register(stop_scheduler)
         logger.info(
             "Access sync/export scheduler started — sync at %s ART, export at %s ART",
             ", ".join(f"{h:02d}:00" for h in SYNC_HOURS),
@@ -207,3 +277,22 @@ def start_scheduler() -> None:
         daemon=True,
     )
     t.start()
+
+
+def stop_scheduler() -> None:
+    """Stop the scheduler, the Access worker and the ingreso job workers."""
+    global _scheduler
+
+    from apps.tickets.infrastructure.services.access_powershell_worker import (
+        shutdown_access_workers,
+    )
+    from apps.tickets.infrastructure.services.ingreso_job_queue import (
+        shutdown_ingreso_workers,
+    )
+
+    with _lock:
+        if _scheduler is not None:
+            _scheduler.shutdown(wait=False)
+            _scheduler = None
+    shutdown_access_workers()
+    shutdown_ingreso_workers()
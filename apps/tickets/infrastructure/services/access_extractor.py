@@ -8,6 +8,8 @@ import subprocess
 import tempfile
 import threading
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, Future
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
@@ -21,6 +23,22 @@ class AccessExtractorConfig:
     powershell_path: Path
 
 
+@dataclass(frozen=True)
+class PendingExtraction:
+    """Extractor run submitted to an executor for one Access source.
+
+    The future resolves to the record iterator and the seconds the extractor
+    process took.
+    """
+
+    label: str
+    future: Future[tuple[Iterator[dict], float]]
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.future.result()[1]
+
+
 class AccessExtractor:
     """Run the PowerShell extractor for Access data."""
 
@@ -48,7 +66,122 @@ class AccessExtractor:
         progress_every: int = 5000,
         skip_count: bool = True,
         source_label: str | None = None,
+        id_field: str | None = None,
+        since_id: int | None = None,
     ) -> list[dict]:
+        json_temp_file = self._run_to_file(
+            db_path=db_path,
+            table=table,
+            unit_field=unit_field,
+            since_date=since_date,
+            unit_value=unit_value,
+            minimal_columns=minimal_columns,
+            db_password=db_password,
+            progress_every=progress_every,
+            skip_count=skip_count,
+            source_label=source_label,
+            id_field=id_field,
+            since_id=since_id,
+        )
+        try:
+            stdout_data = Path(json_temp_file).read_text(encoding="utf-8")
+        finally:
+            Path(json_temp_file).unlink(missing_ok=True)
+        if not stdout_data or not stdout_data.strip():
+            return []
+
+        payload = self._parse_stdout_json(stdout_data)
+        if isinstance(payload, dict):
+            return [payload]
+        if isinstance(payload, list):
+            return payload
+        return []
+
+    def iter_records(
+        self,
+        db_path: Path,
+        table: str,
+        unit_field: str,
+        since_date: date,
+        unit_value: str | None = None,
+        minimal_columns: bool = False,
+        db_password: str | None = None,
+        progress_every: int = 5000,
+        skip_count: bool = True,
+        source_label: str | None = None,
+        id_field: str | None = None,
+        since_id: int | None = None,
+    ) -> Iterator[dict]:
+        """Run the extractor and yield its records one at a time.
+
+        The script writes newline-delimited JSON (``-Ndjson``) to the temp
+        file, which is decoded line by line, so memory stays flat regardless
+        of the table size. The extractor runs before this returns; the temp
+        file is removed once the records are consumed.
+
+        ``id_field`` adds the Access autonumber to each record as ``Id``;
+        with ``since_id`` only rows above that ID are extracted, ignoring
+        ``since_date``.
+        """
+        json_temp_file = self._run_to_file(
+            db_path=db_path,
+            table=table,
+            unit_field=unit_field,
+            since_date=since_date,
+            unit_value=unit_value,
+            minimal_columns=minimal_columns,
+            db_password=db_password,
+            progress_every=progress_every,
+            skip_count=skip_count,
+            source_label=source_label,
+            id_field=id_field,
+            since_id=since_id,
+            ndjson=True,
+        )
+        return self._iter_file_records(Path(json_temp_file))
+
+    def submit(
+        self, executor: Executor, label: str, **kwargs: object
+    ) -> PendingExtraction:
+        """Start ``iter_records`` on ``executor`` and time the extractor run."""
+
+        def _extract() -> tuple[Iterator[dict], float]:
+            started_at = time.perf_counter()
+            records = self.iter_records(**kwargs)  # type: ignore[arg-type]
+            return records, time.perf_counter() - started_at
+
+        return PendingExtraction(label=label, future=executor.submit(_extract))
+
+    @staticmethod
+    def discard(extraction: PendingExtraction) -> None:
+        """Remove the temp file of an extraction whose records were not read."""
+        try:
+            records, _ = extraction.future.result()
+        except Exception:
+            return
+        close = getattr(records, "close", None)
+        if close is None:
+            return
+        # The reader generator only owns the file once started.
+        next(records, None)
+        close()
+
+    def _run_to_file(
+        self,
+        db_path: Path,
+        table: str,
+        unit_field: str,
+        since_date: date,
+        unit_value: str | None,
+        minimal_columns: bool,
+        db_password: str | None,
+        progress_every: int,
+        skip_count: bool,
+        source_label: str | None,
+        id_field: str | None = None,
+        since_id: int | None = None,
+        ndjson: bool = False,
+    ) -> str:
         if not self._config.script_path.exists():
             raise FileNotFoundError(f"Script not found: {self._config.script_path}")
         if not self._config.powershell_path.exists():
@@ -89,6 +222,12 @@ class AccessExtractor:
             command.append("-SkipCount")
         if minimal_columns:
             command.append("-MinimalColumns")
+        if id_field:
+            command.extend(["-IdField", id_field])
+            if since_id:
+                command.extend(["-SinceId", str(since_id)])
+        if ndjson:
+            command.append("-Ndjson")
 
         prefix = self._build_prefix(source_label, table)
         self._emit_start(
@@ -97,21 +236,33 @@ class AccessExtractor:
             progress_every=progress_every,
             prefix=prefix,
         )
-        stdout_data = self._run_extractor(command, prefix=prefix)
         try:
-            stdout_data = Path(json_temp_file).read_text(encoding="utf-8")
-        finally:
+            self._run_extractor(command, prefix=prefix)
+        except BaseException:
             Path(json_temp_file).unlink(missing_ok=True)
+            raise
         self._emit_info("Conexion OK", prefix=prefix)
-        if not stdout_data or not stdout_data.strip():
-            return []
+        return json_temp_file
 
-        payload = self._parse_stdout_json(stdout_data)
-        if isinstance(payload, dict):
-            return [payload]
-        if isinstance(payload, list):
-            return payload
-        return []
+    def _iter_file_records(self, json_path: Path) -> Iterator[dict]:
+        try:
+            with json_path.open(encoding="utf-8-sig") as handle:
+                yield from self._iter_json_lines(handle)
+        finally:
+            json_path.unlink(missing_ok=True)
+
+    def _iter_json_lines(self, lines: Iterable[str]) -> Iterator[dict]:
+        """Decode NDJSON lines; a JSON array line (legacy payload) is expanded."""
+        for line in lines:
+            candidate = line.strip().lstrip("\ufeff")
+            if candidate.startswith("{"):
+                yield json.loads(candidate)
+            elif candidate.startswith("["):
+                payload = self._parse_stdout_json(candidate)
+                if isinstance(payload, list):
+                    yield from payload
+                elif isinstance(payload, dict):
+                    yield payload
 
     def _run_extractor(self, command: list[str], prefix: str | None) -> str:
         process = subprocess.Popen(
@@ -2,15 +2,43 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from datetime import date, datetime
-from decimal import Decimal, InvalidOperation
+from datetime import date
 from pathlib import Path
+from time import perf_counter
 
 from django.db.models import Max
 
 from apps.tickets.application.use_cases.legacy_sync_use_case import SyncStats
-from apps.tickets.infrastructure.services.access_extractor import AccessExtractor
+from apps.tickets.infrastructure.services.access_extractor import (
+    AccessExtractor,
+    PendingExtraction,
+)
+from apps.tickets.infrastructure.services.access_sync_state_store import (
+    AccessSyncStateStore,
+    WatermarkTracker,
+)
+from apps.tickets.infrastructure.services.kilometrage_cumulative_index import (
+    KilometrageCumulativeIndex,
+)
+from apps.tickets.infrastructure.services.kilometrage_monthly_rollup import (
+    KilometrageMonthlyRollup,
+)
+from apps.tickets.infrastructure.services.row_decoders import (
+    CodeNormalizer,
+    DateDecoder,
+    parse_decimal,
+)
+from apps.tickets.infrastructure.services.sync_timings import (
+    STAGE_DEDUPE,
+    STAGE_INSERT,
+    STAGE_PARSE,
+    STAGE_REFRESH_CUMULATIVE,
+    STAGE_REFRESH_MONTHLY,
+    SyncTimings,
+)
 from apps.tickets.models import KilometrageRecordModel, MaintenanceUnitModel
 
 
@@ -26,12 +54,25 @@ class AccessKilometrageImporter:
 
     TABLE_NAME = "Kilometraje"
     BATCH_SIZE = 5000
+    # Kilometraje has no known autonumber column; the date watermark is used
+    # unless one is configured.
+    ID_FIELD = ""
 
     def __init__(
         self,
         extractor: AccessExtractor,
+        cumulative_index: KilometrageCumulativeIndex | None = None,
+        monthly_rollup: KilometrageMonthlyRollup | None = None,
+        state_store: AccessSyncStateStore | None = None,
+        id_field: str | None = None,
+        timings: SyncTimings | None = None,
     ) -> None:
         self._extractor = extractor
+        self._cumulative_index = cumulative_index or KilometrageCumulativeIndex()
+        self._monthly_rollup = monthly_rollup or KilometrageMonthlyRollup()
+        self._state_store = state_store or AccessSyncStateStore()
+        self._id_field = self.ID_FIELD if id_field is None else id_field
+        self._timings = timings or SyncTimings()
 
     def import_all(
         self,
@@ -43,36 +84,24 @@ class AccessKilometrageImporter:
         progress_every: int = 5000,
         skip_count: bool = True,
     ) -> SyncStats:
-        unit_id_by_number = {
-            number.upper(): unit_id
-            for number, unit_id in MaintenanceUnitModel.objects.values_list(
-                "number", "id"
-            )
-        }
-        aggregated = SyncStats(
-            processed=0,
-            inserted=0,
-            skipped_old=0,
-            duplicates=0,
-            invalid=0,
-        )
+        unit_id_by_number = self._load_unit_ids()
+        aggregated = self._empty_stats()
 
         for source in (baselocs, baseccrr):
             if source is None:
                 continue
             source_label = source.source_label
-            resolved_since = since_date or self._resolve_last_date(source_label)
-            records = self._extractor.extract(
+            records = self._extractor.iter_records(
                 db_path=source.db_path,
                 table=self.TABLE_NAME,
                 unit_field=source.unit_field,
-                since_date=resolved_since,
                 db_password=db_password,
                 progress_every=progress_every,
                 skip_count=skip_count,
                 source_label=source_label,
+                **self._extraction_window(source_label, since_date),
             )
-            stats = self._import_records(
+            stats = self._import_source(
                 records,
                 unit_id_by_number=unit_id_by_number,
                 dry_run=dry_run,
@@ -82,6 +111,118 @@ class AccessKilometrageImporter:
 
         return aggregated
 
+    def start_extractions(
+        self,
+        baselocs: AccessKilometrageSource | None,
+        baseccrr: AccessKilometrageSource | None,
+        executor: Executor,
+        db_password: str | None = None,
+        since_date: date | None = None,
+        progress_every: int = 5000,
+        skip_count: bool = True,
+    ) -> list[PendingExtraction]:
+        """Submit one extractor run per source without touching the DB from it.
+
+        The since date is resolved here, on the calling thread; the records
+        are written later by ``import_extracted``.
+        """
+        extractions = []
+        for source in (baselocs, baseccrr):
+            if source is None:
+                continue
+            extractions.append(
+                self._extractor.submit(
+                    executor,
+                    label=source.source_label,
+                    db_path=source.db_path,
+                    table=self.TABLE_NAME,
+                    unit_field=source.unit_field,
+                    db_password=db_password,
+                    progress_every=progress_every,
+                    skip_count=skip_count,
+                    source_label=source.source_label,
+                    **self._extraction_window(source.source_label, since_date),
+                )
+            )
+        return extractions
+
+    def import_extracted(
+        self,
+        extractions: list[PendingExtraction],
+        dry_run: bool = False,
+    ) -> SyncStats:
+        """Import the records of ``start_extractions`` in submission order."""
+        unit_id_by_number = self._load_unit_ids()
+        aggregated = self._empty_stats()
+        for extraction in extractions:
+            records, _ = extraction.future.result()
+            stats = self._import_source(
+                records,
+                unit_id_by_number=unit_id_by_number,
+                dry_run=dry_run,
+                source_label=extraction.label,
+            )
+            aggregated = self._merge_stats(aggregated, stats)
+        return aggregated
+
+    @staticmethod
+    def _load_unit_ids() -> dict[str, str]:
+        return {
+            number.upper(): unit_id
+            for number, unit_id in MaintenanceUnitModel.objects.values_list(
+                "number", "id"
+            )
+        }
+
+    @staticmethod
+    def _empty_stats() -> SyncStats:
+        return SyncStats(
+            processed=0,
+            inserted=0,
+            skipped_old=0,
+            duplicates=0,
+            invalid=0,
+        )
+
+    def _extraction_window(
+        self, source_label: str, since_date: date | None
+    ) -> dict[str, object]:
+        """Extractor filters for a source; see AccessNovedadImporter."""
+        id_field = self._id_field or None
+        if since_date is not None:
+            return {"since_date": since_date, "id_field": id_field}
+        watermark = self._state_store.get(source_label, self.TABLE_NAME)
+        if watermark and watermark.last_id and id_field:
+            return {
+                "since_date": watermark.last_date or date(1900, 1, 1),
+                "id_field": id_field,
+                "since_id": watermark.last_id,
+            }
+        if watermark and watermark.last_date:
+            return {"since_date": watermark.last_date, "id_field": id_field}
+        return {
+            "since_date": self._resolve_last_date(source_label),
+            "id_field": id_field,
+        }
+
+    def _import_source(
+        self,
+        records: Iterable[dict],
+        unit_id_by_number: dict[str, str],
+        dry_run: bool,
+        source_label: str,
+    ) -> SyncStats:
+        tracker = WatermarkTracker(date_field="Fecha", parse_date=DateDecoder())
+        stats = self._import_records(
+            tracker.track(records),
+            unit_id_by_number=unit_id_by_number,
+            dry_run=dry_run,
+            source_label=source_label,
+        )
+        if not dry_run:
+            self._state_store.advance(source_label, self.TABLE_NAME, tracker.watermark)
+        return stats
+
     def _resolve_last_date(self, source_label: str) -> date:
         last = (
             KilometrageRecordModel.objects.filter(source=source_label).aggregate(
@@ -92,7 +233,7 @@ class AccessKilometrageImporter:
 
     def _import_records(
         self,
-        records: list[dict],
+        records: Iterable[dict],
         unit_id_by_number: dict[str, str],
         dry_run: bool,
         source_label: str,
@@ -103,26 +244,37 @@ class AccessKilometrageImporter:
         invalid = 0
         batch: list[KilometrageRecordModel] = []
         batch_invalid = 0
+        start_by_unit: dict[str, date | None] = {}
+        decode_date = DateDecoder()
+        normalize_unit = CodeNormalizer()
+        flush_seconds = 0.0
 
         def flush_batch() -> None:
             nonlocal batch, batch_invalid, inserted, duplicates, invalid
+            nonlocal flush_seconds
             if not batch and not batch_invalid:
                 return
-            created = 0
-            skipped = 0
+            new_records: list[KilometrageRecordModel] = []
             if batch:
-                created, skipped = self._flush_batch(batch, dry_run)
-            inserted += created
-            duplicates += skipped
+                started = perf_counter()
+                new_records = self._flush_batch(batch, dry_run, source_label)
+                flush_seconds += perf_counter() - started
+            for new_record in new_records:
+                self._cumulative_index.track(
+                    start_by_unit, new_record.unit_number, new_record.record_date
+                )
+            inserted += len(new_records)
+            duplicates += len(batch) - len(new_records)
             invalid += batch_invalid
             batch = []
             batch_invalid = 0
 
+        loop_started = perf_counter()
         for record in records:
             processed += 1
-            unit = (record.get("Unidad") or "").strip().upper()
-            record_date = self._parse_date(record.get("Fecha"))
-            km_value = self._parse_decimal(record.get("Kilometros"))
+            unit = normalize_unit(record.get("Unidad"))
+            record_date = decode_date(record.get("Fecha"))
+            km_value = parse_decimal(record.get("Kilometros"))
 
             if not unit or record_date is None or km_value is None:
                 batch_invalid += 1
@@ -142,6 +294,29 @@ class AccessKilometrageImporter:
                 flush_batch()
 
         flush_batch()
+        # Reading the extractor output and decoding rows, net of the flushes
+        self._timings.add(
+            STAGE_PARSE,
+            perf_counter() - loop_started - flush_seconds,
+            rows=processed,
+            source=source_label,
+            table=self.TABLE_NAME,
+        )
+        if not dry_run and start_by_unit:
+            with self._timings.span(
+                STAGE_REFRESH_CUMULATIVE,
+                rows=len(start_by_unit),
+                source=source_label,
+                table=self.TABLE_NAME,
+            ):
+                self._cumulative_index.refresh_units(start_by_unit)
+            with self._timings.span(
+                STAGE_REFRESH_MONTHLY,
+                rows=len(start_by_unit),
+                source=source_label,
+                table=self.TABLE_NAME,
+            ):
+                self._monthly_rollup.refresh_units(start_by_unit)
 
         return SyncStats(
             processed=processed,
@@ -149,63 +324,53 @@ class AccessKilometrageImporter:
             skipped_old=0,
             duplicates=duplicates,
             invalid=invalid,
+            affected_units=frozenset(start_by_unit),
         )
 
-    @staticmethod
     def _flush_batch(
+        self,
         batch: list[KilometrageRecordModel],
         dry_run: bool,
-    ) -> tuple[int, int]:
-        if dry_run:
-            return len(batch), 0
+        source_label: str = "",
+    ) -> list[KilometrageRecordModel]:
+        """Insert the batch and return the records that were actually new.
 
-        created = KilometrageRecordModel.objects.bulk_create(
-            batch, ignore_conflicts=True
+        ``bulk_create(ignore_conflicts=True)`` hands back every object it was
+        given, so the (unit, date) keys already stored are read up front.
+        """
+        started = perf_counter()
+        existing_keys = set(
+            KilometrageRecordModel.objects.filter(
+                unit_number__in={record.unit_number for record in batch},
+                record_date__gte=min(record.record_date for record in batch),
+                record_date__lte=max(record.record_date for record in batch),
+            ).values_list("unit_number", "record_date")
+        )
+        new_records = []
+        for record in batch:
+            key = (record.unit_number, record.record_date)
+            if key not in existing_keys:
+                existing_keys.add(key)
+                new_records.append(record)
+        self._timings.add(
+            STAGE_DEDUPE,
+            perf_counter() - started,
+            rows=len(batch),
+            source=source_label,
+            table=self.TABLE_NAME,
         )
-        inserted = len(created)
-        return inserted, len(batch) - inserted
-
-    @staticmethod
-    def _parse_date(value: object) -> date | None:
-        if value is None:
-            return None
-        if isinstance(value, date):
-            return value
-        value_str = str(value).strip()
-        if not value_str:
-            return None
-        try:
-            return datetime.fromisoformat(value_str).date()
-        except ValueError:
-            pass
-        for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"):
-            try:
-                return datetime.strptime(value_str, fmt).date()
-            except ValueError:
-                continue
-        return None
 
-    @staticmethod
-    def _parse_decimal(value: object) -> Decimal | None:
-        if value is None:
-            return None
-        if isinstance(value, Decimal):
-            return value
-        if isinstance(value, (int, float)):
-            return Decimal(str(value))
-        value_str = str(value).strip()
-        if not value_str:
-            return None
-        try:
-            return Decimal(value_str)
-        except (InvalidOperation, ValueError):
-            pass
-
-        european_value_str = value_str.replace(".", "").replace(",", ".")
-        try:
-            return Decimal(european_value_str)
-        except (InvalidOperation, ValueError):
-            return None
+        if not dry_run and new_records:
+            with self._timings.span(
+                STAGE_INSERT,
+                rows=len(new_records),
+                source=source_label,
+                table=self.TABLE_NAME,
+            ):
+                KilometrageRecordModel.objects.bulk_create(
+                    new_records, ignore_conflicts=True
+                )
+        return new_records
 
     @staticmethod
     def _merge_stats(left: SyncStats, right: SyncStats) -> SyncStats:
@@ -215,4 +380,5 @@ class AccessKilometrageImporter:
             skipped_old=left.skipped_old + right.skipped_old,
             duplicates=left.duplicates + right.duplicates,
             invalid=left.invalid + right.invalid,
+            affected_units=left.affected_units | right.affected_units,
         )
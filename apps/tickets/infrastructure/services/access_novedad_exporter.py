@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import json
+import os
 import subprocess
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from django.conf import settings
 
+from apps.tickets.infrastructure.services.access_powershell_worker import (
+    get_access_worker,
+)
+
 
 @dataclass
 class ExportConfig:
@@ -19,6 +26,8 @@ class ExportConfig:
     baseccrr_path: Path | None = None
     db_password: str = ""
     powershell_path: Path | None = None
+    batch_export: bool = False
+    use_worker: bool = False
 
 
 @dataclass
@@ -28,6 +37,23 @@ class ExportResult:
     success: bool
     legacy_id: int | None = None
     error: str | None = None
+    already_exists: bool = False
+
+
+@dataclass
+class PendingExport:
+    """Normalized Access row for a pending Novedad."""
+
+    novelty: Any
+    unidad: str
+    fecha_desde: str
+    fecha_hasta: str | None
+    fecha_est: str | None
+    intervencion: str
+    lugar: str
+    observaciones: str | None
+    db_path: Path | None
+    unit_field: str
 
 
 class AccessNovedadExporter:
@@ -56,6 +82,22 @@ class AccessNovedadExporter:
         unidad = self._normalize_text_value(unidad)
         intervencion = self._normalize_text_value(intervencion)
 
+        if self._config.use_worker:
+            try:
+                response = self._worker_request(
+                    operation="CHECK",
+                    db_path=db_path,
+                    unit_field=unit_field,
+                    unidad=unidad,
+                    fecha_desde=fecha_desde or "",
+                    intervencion=intervencion,
+                )
+            except Exception:
+                return None
+            if response.get("status") == "exists" and response.get("legacy_id"):
+                return int(response["legacy_id"])
+            return None
+
         ps_path = self._get_powershell_path()
         args = [
             str(ps_path),
@@ -107,6 +149,24 @@ class AccessNovedadExporter:
         unidad = self._normalize_text_value(unidad)
         intervencion = self._normalize_text_value(intervencion)
 
+        if self._config.use_worker:
+            try:
+                response = self._worker_request(
+                    operation="INSERT",
+                    db_path=db_path,
+                    unit_field=unit_field,
+                    unidad=unidad,
+                    fecha_desde=fecha_desde,
+                    fecha_hasta=fecha_hasta or "",
+                    fecha_est=fecha_est or "",
+                    intervencion=intervencion,
+                    lugar=lugar,
+                    observaciones=observaciones or "",
+                )
+            except Exception as e:
+                return ExportResult(success=False, error=str(e))
+            return self._batch_result(response)
+
         ps_path = self._get_powershell_path()
         args = [
             str(ps_path),
@@ -179,6 +239,26 @@ class AccessNovedadExporter:
         observaciones: str | None,
     ) -> ExportResult:
         """Update an existing Novedad in Access."""
+        if self._config.use_worker:
+            try:
+                response = self._worker_request(
+                    operation="UPDATE",
+                    legacy_id=legacy_id,
+                    unidad=unidad,
+                    fecha_hasta=fecha_hasta or "",
+                    fecha_est=fecha_est or "",
+                    intervencion=intervencion,
+                    lugar=lugar,
+                    observaciones=observaciones or "",
+                )
+            except Exception as e:
+                return ExportResult(success=False, error=str(e))
+            if response.get("status") == "updated":
+                return ExportResult(success=True, legacy_id=legacy_id)
+            return ExportResult(
+                success=False, error=response.get("error") or "Unknown error"
+            )
+
         ps_path = self._get_powershell_path()
         args = [
             str(ps_path),
@@ -226,6 +306,108 @@ class AccessNovedadExporter:
                 error=str(e),
             )
 
+    def export_batch(self, rows: list[PendingExport]) -> list[ExportResult]:
+        """Check and insert many Novedades with a single PowerShell run.
+
+        Rows are written to a JSON manifest processed by the BATCH operation,
+        which keeps one OLEDB connection per database. Results are returned
+        in the same order as ``rows``.
+        """
+        if not rows:
+            return []
+
+        manifest = [
+            {
+                "key": index,
+                "db_path": str(row.db_path or self._config.baselocs_path),
+                "unit_field": row.unit_field,
+                "unidad": row.unidad,
+                "fecha_desde": row.fecha_desde,
+                "fecha_hasta": row.fecha_hasta or "",
+                "fecha_est": row.fecha_est or "",
+                "intervencion": row.intervencion,
+                "lugar": row.lugar,
+                "observaciones": row.observaciones or "",
+            }
+            for index, row in enumerate(rows)
+        ]
+        manifest_path = self._create_temp_file(suffix=".json")
+        result_path = self._create_temp_file(suffix=".json")
+        try:
+            manifest_path.write_text(json.dumps(manifest), encoding="utf-8")
+            args = [
+                str(self._get_powershell_path()),
+                "-File",
+                str(self._config.script_path),
+                "-DbPath",
+                str(self._config.baselocs_path),
+                "-Operation",
+                "BATCH",
+                "-ManifestPath",
+                str(manifest_path),
+                "-ResultPath",
+                str(result_path),
+            ]
+            if self._config.db_password:
+                args.extend(["-DbPassword", self._config.db_password])
+
+            returncode, _stdout, stderr = self._run_script(args)
+            if returncode != 0:
+                raise RuntimeError(stderr or "Unknown error")
+            payload = json.loads(result_path.read_text(encoding="utf-8-sig") or "[]")
+        finally:
+            manifest_path.unlink(missing_ok=True)
+            result_path.unlink(missing_ok=True)
+
+        if isinstance(payload, dict):
+            payload = [payload]
+        results_by_key = {item.get("key"): item for item in payload}
+        return [
+            self._batch_result(results_by_key.get(index)) for index in range(len(rows))
+        ]
+
+    def _worker_request(
+        self,
+        operation: str,
+        db_path: Path | None = None,
+        unit_field: str = "Locs",
+        **fields: Any,
+    ) -> dict[str, Any]:
+        """Send one operation to the shared long-lived PowerShell worker."""
+        worker = get_access_worker(
+            powershell_path=self._get_powershell_path(),
+            script_path=self._config.script_path,
+            db_path=self._config.baselocs_path,
+            db_password=self._config.db_password,
+        )
+        return worker.request(
+            {
+                "operation": operation,
+                "db_path": str(db_path or self._config.baselocs_path),
+                "unit_field": unit_field,
+                **fields,
+            }
+        )
+
+    @staticmethod
+    def _batch_result(item: dict[str, Any] | None) -> ExportResult:
+        if item is None:
+            return ExportResult(success=False, error="Missing batch result")
+        status = item.get("status")
+        legacy_id = item.get("legacy_id")
+        legacy_id = int(legacy_id) if legacy_id else None
+        if status == "exists":
+            return ExportResult(success=True, legacy_id=legacy_id, already_exists=True)
+        if status == "inserted":
+            return ExportResult(success=True, legacy_id=legacy_id)
+        return ExportResult(success=False, error=item.get("error") or "Unknown error")
+
+    @staticmethod
+    def _create_temp_file(suffix: str) -> Path:
+        fd, path = tempfile.mkstemp(prefix="access_export_", suffix=suffix)
+        os.close(fd)
+        return Path(path)
+
     def _get_powershell_path(self) -> Path:
         """Get the PowerShell executable path."""
         if self._config.powershell_path:
@@ -283,6 +465,8 @@ class AccessNovedadExporter:
             baselocs_path=Path(baselocs_path),
             baseccrr_path=Path(baseccrr_path) if baseccrr_path else None,
             db_password=db_password,
+            batch_export=getattr(settings, "ACCESS_EXPORT_BATCH", False),
+            use_worker=getattr(settings, "ACCESS_EXPORT_WORKER", False),
         )
 
     def _resolve_export_target(self, novelty: Any) -> tuple[Path | None, str]:
@@ -319,6 +503,10 @@ class AccessNovedadExporter:
             is_legacy=False,
             is_exported=False,
         )
+        if self._config.batch_export:
+            return self._export_pending_batch(
+                pending.select_related("maintenance_unit", "intervencion", "lugar")
+            )
 
         exported_count = 0
         skipped_count = 0
@@ -327,68 +515,19 @@ class AccessNovedadExporter:
 
         for Novelty in pending:
             try:
-                # Get unit identifier
-                unidad = (
-                    Novelty.maintenance_unit.number
-                    if Novelty.maintenance_unit
-                    else Novelty.legacy_unit_code
-                )
-
-                if not unidad:
+                row = self._prepare_export(Novelty)
+                if row is None:
                     skipped_count += 1
                     continue
 
-                # Get intervencion and lugar codes
-                intervencion = (
-                    Novelty.intervencion.codigo
-                    if Novelty.intervencion
-                    else Novelty.legacy_intervencion_codigo
-                )
-                lugar = (
-                    str(Novelty.lugar.codigo)
-                    if Novelty.lugar
-                    else str(Novelty.legacy_lugar_codigo)
-                    if Novelty.legacy_lugar_codigo
-                    else ""
-                )
-
-                if not intervencion or not lugar:
-                    skipped_count += 1
-                    continue
-
-                unidad = self._normalize_text_value(unidad)
-                intervencion = self._normalize_text_value(intervencion)
-
-                if not unidad or not intervencion:
-                    skipped_count += 1
-                    continue
-
-                # Format dates
-                fecha_desde = (
-                    Novelty.fecha_desde.isoformat() if Novelty.fecha_desde else None
-                )
-                fecha_hasta = (
-                    Novelty.fecha_hasta.isoformat() if Novelty.fecha_hasta else None
-                )
-                fecha_est = (
-                    Novelty.fecha_estimada.isoformat()
-                    if Novelty.fecha_estimada
-                    else None
-                )
-
-                if not fecha_desde:
-                    skipped_count += 1
-                    continue
-
-                db_path, unit_field = self._resolve_export_target(Novelty)
-                db_name = db_path.name if db_path else "<none>"
+                db_name = row.db_path.name if row.db_path else "<none>"
 
                 existing_id = self.check_exists_in_access(
-                    unidad=unidad,
-                    fecha_desde=fecha_desde,
-                    intervencion=intervencion,
-                    db_path=db_path,
-                    unit_field=unit_field,
+                    unidad=row.unidad,
+                    fecha_desde=row.fecha_desde,
+                    intervencion=row.intervencion,
+                    db_path=row.db_path,
+                    unit_field=row.unit_field,
                 )
                 if existing_id is not None:
                     Novelty.is_exported = True
@@ -398,15 +537,15 @@ class AccessNovedadExporter:
                     continue
 
                 result = self.export_novedad(
-                    unidad=unidad,
-                    fecha_desde=fecha_desde,
-                    fecha_hasta=fecha_hasta,
-                    fecha_est=fecha_est,
-                    intervencion=intervencion,
-                    lugar=lugar,
-                    observaciones=Novelty.observaciones,
-                    db_path=db_path,
-                    unit_field=unit_field,
+                    unidad=row.unidad,
+                    fecha_desde=row.fecha_desde,
+                    fecha_hasta=row.fecha_hasta,
+                    fecha_est=row.fecha_est,
+                    intervencion=row.intervencion,
+                    lugar=row.lugar,
+                    observaciones=row.observaciones,
+                    db_path=row.db_path,
+                    unit_field=row.unit_field,
                 )
 
                 if result.success:
@@ -425,8 +564,8 @@ class AccessNovedadExporter:
                 else:
                     error_count += 1
                     errors.append(
-                        f"db={db_name} unit_field={unit_field} unidad={unidad} "
-                        f"intervencion={intervencion} lugar={lugar}: {result.error}"
+                        f"db={db_name} unit_field={row.unit_field} unidad={row.unidad} "
+                        f"intervencion={row.intervencion} lugar={row.lugar}: {result.error}"
                     )
             except Exception as e:
                 error_count += 1
@@ -438,3 +577,114 @@ class AccessNovedadExporter:
             "errors": error_count,
             "error_details": errors,
         }
+
+    def _export_pending_batch(self, pending: Any) -> dict[str, Any]:
+        """Export pending Novedades in one script run and one bulk_update."""
+        from apps.tickets.infrastructure.models.novedad import NovedadModel
+
+        exported_count = 0
+        skipped_count = 0
+        errors = []
+        rows: list[PendingExport] = []
+
+        for novelty in pending:
+            try:
+                row = self._prepare_export(novelty)
+            except Exception as e:
+                errors.append(f"Error: {str(e)}")
+                continue
+            if row is None:
+                skipped_count += 1
+                continue
+            rows.append(row)
+
+        try:
+            results = self.export_batch(rows)
+        except Exception as e:
+            results = [ExportResult(success=False, error=str(e)) for _ in rows]
+
+        to_update = []
+        for row, result in zip(rows, results, strict=True):
+            novelty = row.novelty
+            if result.success or "already exists" in (result.error or "").lower():
+                novelty.is_exported = True
+                if result.legacy_id:
+                    novelty.legacy_id = result.legacy_id
+                to_update.append(novelty)
+                if result.success and not result.already_exists:
+                    exported_count += 1
+                else:
+                    skipped_count += 1
+                continue
+            db_name = row.db_path.name if row.db_path else "<none>"
+            errors.append(
+                f"db={db_name} unit_field={row.unit_field} unidad={row.unidad} "
+                f"intervencion={row.intervencion} lugar={row.lugar}: {result.error}"
+            )
+
+        if to_update:
+            NovedadModel.objects.bulk_update(  # type: ignore[attr-defined]
+                to_update, ["is_exported", "legacy_id"]
+            )
+
+        return {
+            "exported": exported_count,
+            "skipped": skipped_count,
+            "errors": len(errors),
+            "error_details": errors,
+        }
+
+    def _prepare_export(self, novelty: Any) -> PendingExport | None:
+        """Build the Access row for a Novedad, or None when it must be skipped."""
+        # Get unit identifier
+        unidad = (
+            novelty.maintenance_unit.number
+            if novelty.maintenance_unit
+            else novelty.legacy_unit_code
+        )
+        if not unidad:
+            return None
+
+        # Get intervencion and lugar codes
+        intervencion = (
+            novelty.intervencion.codigo
+            if novelty.intervencion
+            else novelty.legacy_intervencion_codigo
+        )
+        lugar = (
+            str(novelty.lugar.codigo)
+            if novelty.lugar
+            else str(novelty.legacy_lugar_codigo)
+            if novelty.legacy_lugar_codigo
+            else ""
+        )
+        if not intervencion or not lugar:
+            return None
+
+        unidad = self._normalize_text_value(unidad)
+        intervencion = self._normalize_text_value(intervencion)
+        if not unidad or not intervencion:
+            return None
+
+        # Format dates
+        fecha_desde = novelty.fecha_desde.isoformat() if novelty.fecha_desde else None
+        fecha_hasta = novelty.fecha_hasta.isoformat() if novelty.fecha_hasta else None
+        fecha_est = (
+            novelty.fecha_estimada.isoformat() if novelty.fecha_estimada else None
+        )
+        if not fecha_desde:
+            return None
+
+        db_path, unit_field = self._resolve_export_target(novelty)
+        return PendingExport(
+            novelty=novelty,
+            unidad=unidad,
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+            fecha_est=fecha_est,
+            intervencion=intervencion,
+            lugar=lugar,
+            observaciones=novelty.observaciones,
+            db_path=db_path,
+            unit_field=unit_field,
+        )
@@ -3,14 +3,37 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Iterable
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date
 from pathlib import Path
+from time import perf_counter
 
 from django.db.models import Max
 
 from apps.tickets.application.use_cases.legacy_sync_use_case import SyncStats
-from apps.tickets.infrastructure.services.access_extractor import AccessExtractor
+from apps.tickets.infrastructure.services.access_extractor import (
+    AccessExtractor,
+    PendingExtraction,
+)
+from apps.tickets.infrastructure.services.access_sync_state_store import (
+    AccessSyncStateStore,
+    WatermarkTracker,
+)
+from apps.tickets.infrastructure.services.kilometrage_cache import (
+    kilometrage_lookup_cache,
+)
+from apps.tickets.infrastructure.services.row_decoders import (
+    CodeNormalizer,
+    DateDecoder,
+)
+from apps.tickets.infrastructure.services.sync_timings import (
+    STAGE_DEDUPE,
+    STAGE_INSERT,
+    STAGE_PARSE,
+    SyncTimings,
+)
 from apps.tickets.models import (
     IntervencionTipoModel,
     LugarModel,
@@ -41,9 +64,27 @@ class AccessNovedadImporter:
 
     TABLE_NAME = "Detenciones"
     BATCH_SIZE = 5000
+    # Distinct dates per business-key lookup, under SQLite's variable limit
+    DATE_CHUNK_SIZE = 500
+    # Access autonumber used as the incremental watermark ("" disables it)
+    ID_FIELD = "ID"
 
-    def __init__(self, extractor: AccessExtractor) -> None:
+    def __init__(
+        self,
+        extractor: AccessExtractor,
+        state_store: AccessSyncStateStore | None = None,
+        id_field: str | None = None,
+        timings: SyncTimings | None = None,
+    ) -> None:
         self._extractor = extractor
+        self._state_store = state_store or AccessSyncStateStore()
+        self._id_field = self.ID_FIELD if id_field is None else id_field
+        self._timings = timings or SyncTimings()
+        self._date_decoders = {
+            field: DateDecoder()
+            for field in ("Fecha_desde", "Fecha_hasta", "Fecha_est")
+        }
+        self._normalize_upper = CodeNormalizer()
 
     def import_all(
         self,
@@ -55,51 +96,167 @@ class AccessNovedadImporter:
         progress_every: int = 5000,
         skip_count: bool = True,
     ) -> SyncStats:
-        resolved_since = since_date or self._resolve_last_date()
-        aggregated = SyncStats(
-            processed=0,
-            inserted=0,
-            skipped_old=0,
-            duplicates=0,
-            invalid=0,
+        aggregated = self._empty_stats()
+        lugares_by_codigo, units_by_number, intervenciones_by_codigo = (
+            self._load_lookups()
         )
-
-        lugares_by_codigo = {
-            lugar.codigo: lugar.id for lugar in LugarModel.objects.all()
-        }
-        units_by_number = {
-            unit.number.upper(): unit.id for unit in MaintenanceUnitModel.objects.all()
-        }
-        intervenciones_by_codigo = {
-            intervencion.codigo: intervencion.id
-            for intervencion in IntervencionTipoModel.objects.all()
-        }
+        seen_business_keys: set[tuple[uuid.UUID, date, uuid.UUID]] = set()
 
         for source in (baselocs, baseccrr):
             if source is None:
                 continue
             source_label = self._source_label(source)
-            records = self._extractor.extract(
+            records = self._extractor.iter_records(
                 db_path=source.db_path,
                 table=self.TABLE_NAME,
                 unit_field=source.unit_field,
-                since_date=resolved_since,
                 db_password=db_password,
                 progress_every=progress_every,
                 skip_count=skip_count,
                 source_label=source_label,
+                **self._extraction_window(source_label, since_date),
             )
-            stats = self._import_records(
+            stats = self._import_source(
+                source_label,
                 records,
                 lugares_by_codigo=lugares_by_codigo,
                 units_by_number=units_by_number,
                 intervenciones_by_codigo=intervenciones_by_codigo,
+                seen_business_keys=seen_business_keys,
                 dry_run=dry_run,
             )
             aggregated = self._merge_stats(aggregated, stats)
 
         return aggregated
 
+    def start_extractions(
+        self,
+        baselocs: AccessNovedadSource | None,
+        baseccrr: AccessNovedadSource | None,
+        executor: Executor,
+        db_password: str | None = None,
+        since_date: date | None = None,
+        progress_every: int = 5000,
+        skip_count: bool = True,
+    ) -> list[PendingExtraction]:
+        """Submit one extractor run per source; see ``import_extracted``."""
+        extractions = []
+        for source in (baselocs, baseccrr):
+            if source is None:
+                continue
+            source_label = self._source_label(source)
+            extractions.append(
+                self._extractor.submit(
+                    executor,
+                    label=source_label,
+                    db_path=source.db_path,
+                    table=self.TABLE_NAME,
+                    unit_field=source.unit_field,
+                    db_password=db_password,
+                    progress_every=progress_every,
+                    skip_count=skip_count,
+                    source_label=source_label,
+                    **self._extraction_window(source_label, since_date),
+                )
+            )
+        return extractions
+
+    def import_extracted(
+        self,
+        extractions: list[PendingExtraction],
+        dry_run: bool = False,
+    ) -> SyncStats:
+        """Import the records of ``start_extractions`` in submission order."""
+        aggregated = self._empty_stats()
+        lugares_by_codigo, units_by_number, intervenciones_by_codigo = (
+            self._load_lookups()
+        )
+        seen_business_keys: set[tuple[uuid.UUID, date, uuid.UUID]] = set()
+        for extraction in extractions:
+            records, _ = extraction.future.result()
+            stats = self._import_source(
+                extraction.label,
+                records,
+                lugares_by_codigo=lugares_by_codigo,
+                units_by_number=units_by_number,
+                intervenciones_by_codigo=intervenciones_by_codigo,
+                seen_business_keys=seen_business_keys,
+                dry_run=dry_run,
+            )
+            aggregated = self._merge_stats(aggregated, stats)
+        return aggregated
+
+    @staticmethod
+    def _load_lookups() -> (
+        tuple[dict[int, int], dict[str, uuid.UUID], dict[str, uuid.UUID]]
+    ):
+        lugares_by_codigo = {
+            lugar.codigo: lugar.id for lugar in LugarModel.objects.all()
+        }
+        units_by_number = {
+            unit.number.upper(): unit.id for unit in MaintenanceUnitModel.objects.all()
+        }
+        intervenciones_by_codigo = {
+            intervencion.codigo: intervencion.id
+            for intervencion in IntervencionTipoModel.objects.all()
+        }
+        return lugares_by_codigo, units_by_number, intervenciones_by_codigo
+
+    @staticmethod
+    def _empty_stats() -> SyncStats:
+        return SyncStats(
+            processed=0,
+            inserted=0,
+            skipped_old=0,
+            duplicates=0,
+            invalid=0,
+        )
+
+    def _extraction_window(
+        self, source_label: str, since_date: date | None
+    ) -> dict[str, object]:
+        """Extractor filters for a source: explicit date, ID watermark or date.
+
+        An explicit ``since_date`` (full or manual resync) wins. Otherwise
+        the stored watermark is used, preferring the Access ID so back-dated
+        rows are still picked up; the first run falls back to the newest
+        legacy ``fecha_desde``.
+        """
+        id_field = self._id_field or None
+        if since_date is not None:
+            return {"since_date": since_date, "id_field": id_field}
+        watermark = self._state_store.get(source_label, self.TABLE_NAME)
+        if watermark and watermark.last_id and id_field:
+            return {
+                "since_date": watermark.last_date or date(1900, 1, 1),
+                "id_field": id_field,
+                "since_id": watermark.last_id,
+            }
+        if watermark and watermark.last_date:
+            return {"since_date": watermark.last_date, "id_field": id_field}
+        return {"since_date": self._resolve_last_date(), "id_field": id_field}
+
+    def _import_source(
+        self,
+        source_label: str,
+        records: Iterable[dict],
+        dry_run: bool,
+        **lookups,
+    ) -> SyncStats:
+        tracker = WatermarkTracker(
+            date_field="Fecha_desde",
+            parse_date=DateDecoder(),
+        )
+        stats = self._import_records(
+            tracker.track(records),
+            dry_run=dry_run,
+            source_label=source_label,
+            **lookups,
+        )
+        if not dry_run:
+            self._state_store.advance(source_label, self.TABLE_NAME, tracker.watermark)
+        return stats
+
     def _resolve_last_date(self) -> date:
         last = NovedadModel.objects.filter(is_legacy=True).aggregate(
             Max("fecha_desde")
@@ -108,19 +265,66 @@ class AccessNovedadImporter:
 
     def _import_records(
         self,
-        records: list[dict],
+        records: Iterable[dict],
         lugares_by_codigo: dict[int, int],
         units_by_number: dict[str, uuid.UUID],
         intervenciones_by_codigo: dict[str, uuid.UUID],
         dry_run: bool,
+        seen_business_keys: set[tuple[uuid.UUID, date, uuid.UUID]] | None = None,
+        source_label: str = "",
     ) -> SyncStats:
+        """Import the records in batches, skipping known business keys.
+
+        Existing keys are looked up per batch, restricted to the batch's
+        ``fecha_desde`` window, so the cost follows the extracted delta rather
+        than the size of the novedad table. ``seen_business_keys`` carries the
+        keys imported earlier in the same run (e.g. from the other source).
+        """
         processed = 0
         inserted = 0
         duplicates = 0
         invalid = 0
         batch: list[NovedadModel] = []
-        existing_business_keys = self._load_existing_business_keys()
-
+        affected_units: set[str] = set()
+        unit_numbers: dict[uuid.UUID, str] = {}
+        if seen_business_keys is None:
+            seen_business_keys = set()
+        timings = self._timings
+        flush_seconds = 0.0
+
+        def flush() -> None:
+            nonlocal batch, inserted, duplicates, flush_seconds
+            started = perf_counter()
+            new_rows = self._drop_known_business_keys(batch, seen_business_keys)
+            deduped = perf_counter()
+            timings.add(
+                STAGE_DEDUPE,
+                deduped - started,
+                rows=len(batch),
+                source=source_label,
+                table=self.TABLE_NAME,
+            )
+            duplicates += len(batch) - len(new_rows)
+            batch = []
+            if new_rows:
+                if dry_run:
+                    inserted += len(new_rows)
+                else:
+                    created_rows = self._flush_batch(new_rows)
+                    timings.add(
+                        STAGE_INSERT,
+                        perf_counter() - deduped,
+                        rows=len(created_rows),
+                        source=source_label,
+                        table=self.TABLE_NAME,
+                    )
+                    inserted += len(created_rows)
+                    duplicates += len(new_rows) - len(created_rows)
+                    new_rows = created_rows
+                affected_units.update(self._unit_numbers(new_rows, unit_numbers))
+            flush_seconds += perf_counter() - started
+
+        loop_started = perf_counter()
         for record in records:
             processed += 1
             parsed = self._parse_row(record)
@@ -133,42 +337,22 @@ class AccessNovedadImporter:
                 if parsed.intervencion_codigo
                 else None
             )
-            legacy_intervencion_codigo = parsed.intervencion_codigo
-
-            maintenance_unit_id = units_by_number.get(parsed.unit_code)
-            legacy_unit_code = parsed.unit_code
-
-            business_key = self._build_business_key(
-                maintenance_unit_id=maintenance_unit_id,
-                fecha_desde=parsed.fecha_desde,
-                intervencion_id=intervencion_id,
-            )
-            if business_key and business_key in existing_business_keys:
-                duplicates += 1
-                continue
-            if business_key:
-                existing_business_keys.add(business_key)
-
             lugar_id = None
             legacy_lugar_codigo = None
             if parsed.lugar_codigo is not None:
                 lugar_id = lugares_by_codigo.get(parsed.lugar_codigo)
                 legacy_lugar_codigo = parsed.lugar_codigo
 
-            if dry_run:
-                inserted += 1
-                continue
-
             batch.append(
                 NovedadModel(
                     id=uuid.uuid4(),
-                    maintenance_unit_id=maintenance_unit_id,
-                    legacy_unit_code=legacy_unit_code,
+                    maintenance_unit_id=units_by_number.get(parsed.unit_code),
+                    legacy_unit_code=parsed.unit_code,
                     fecha_desde=parsed.fecha_desde,
                     fecha_hasta=parsed.fecha_hasta,
                     fecha_estimada=parsed.fecha_estimada,
                     intervencion_id=intervencion_id,
-                    legacy_intervencion_codigo=legacy_intervencion_codigo,
+                    legacy_intervencion_codigo=parsed.intervencion_codigo,
                     lugar_id=lugar_id,
                     legacy_lugar_codigo=legacy_lugar_codigo,
                     observaciones=parsed.observaciones,
@@ -177,15 +361,20 @@ class AccessNovedadImporter:
             )
 
             if len(batch) >= self.BATCH_SIZE:
-                created, skipped = self._flush_batch(batch)
-                inserted += created
-                duplicates += skipped
-                batch = []
-
-        if batch and not dry_run:
-            created, skipped = self._flush_batch(batch)
-            inserted += created
-            duplicates += skipped
+                flush()
+
+        if batch:
+            flush()
+        # Reading the extractor output and decoding rows, net of the flushes
+        timings.add(
+            STAGE_PARSE,
+            perf_counter() - loop_started - flush_seconds,
+            rows=processed,
+            source=source_label,
+            table=self.TABLE_NAME,
+        )
+        if not dry_run:
+            kilometrage_lookup_cache.invalidate_units(affected_units)
 
         return SyncStats(
             processed=processed,
@@ -193,20 +382,22 @@ class AccessNovedadImporter:
             skipped_old=0,
             duplicates=duplicates,
             invalid=invalid,
+            affected_units=frozenset(affected_units),
         )
 
     def _parse_row(self, row: dict[str, object]) -> _NovedadRow | None:
-        unit_code = self._normalize_code(row.get("Unidad"), upper=True)
+        decode = self._date_decoders
+        unit_code = self._normalize_upper(row.get("Unidad"))
         if not unit_code:
             return None
 
-        fecha_desde = self._parse_date(str(row.get("Fecha_desde") or "").strip())
+        fecha_desde = decode["Fecha_desde"](row.get("Fecha_desde"))
         if not fecha_desde:
             return None
 
-        fecha_hasta = self._parse_date(str(row.get("Fecha_hasta") or "").strip())
-        fecha_estimada = self._parse_date(str(row.get("Fecha_est") or "").strip())
-        intervencion_codigo = self._normalize_code(row.get("Intervencion"), upper=True)
+        fecha_hasta = decode["Fecha_hasta"](row.get("Fecha_hasta"))
+        fecha_estimada = decode["Fecha_est"](row.get("Fecha_est"))
+        intervencion_codigo = self._normalize_upper(row.get("Intervencion"))
         lugar_codigo = self._parse_lugar_codigo(row.get("Lugar"))
         observaciones = str(row.get("Observaciones") or "").strip() or None
 
@@ -220,13 +411,6 @@ class AccessNovedadImporter:
             observaciones=observaciones,
         )
 
-    @staticmethod
-    def _normalize_code(value: object, *, upper: bool) -> str | None:
-        text = str(value or "").strip()
-        if not text:
-            return None
-        return text.upper() if upper else text
-
     @staticmethod
     def _parse_lugar_codigo(value: object) -> int | None:
         text = str(value or "").strip()
@@ -240,25 +424,6 @@ class AccessNovedadImporter:
             except ValueError:
                 return None
 
-    @staticmethod
-    def _parse_date(value: str) -> date | None:
-        if not value:
-            return None
-        try:
-            return datetime.fromisoformat(value).date()
-        except ValueError:
-            pass
-        for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"):
-            try:
-                return datetime.strptime(value, fmt).date()
-            except ValueError:
-                continue
-        return None
-
-    @staticmethod
-    def _normalize_optional_date(value: date | None) -> date | None:
-        return value or None
-
     @staticmethod
     def _build_business_key(
         maintenance_unit_id: uuid.UUID | None,
@@ -269,20 +434,93 @@ class AccessNovedadImporter:
             return None
         return (maintenance_unit_id, fecha_desde, intervencion_id)
 
+    def _drop_known_business_keys(
+        self,
+        batch: list[NovedadModel],
+        seen_business_keys: set[tuple[uuid.UUID, date, uuid.UUID]],
+    ) -> list[NovedadModel]:
+        """Return the rows whose business key is neither stored nor seen."""
+        keyed = [
+            (
+                self._build_business_key(
+                    maintenance_unit_id=novedad.maintenance_unit_id,
+                    fecha_desde=novedad.fecha_desde,
+                    intervencion_id=novedad.intervencion_id,
+                ),
+                novedad,
+            )
+            for novedad in batch
+        ]
+        known = self._load_existing_business_keys(
+            [novedad.fecha_desde for key, novedad in keyed if key]
+        )
+        new_rows = []
+        for key, novedad in keyed:
+            if key:
+                if key in known or key in seen_business_keys:
+                    continue
+                seen_business_keys.add(key)
+            new_rows.append(novedad)
+        return new_rows
+
+    @classmethod
+    def _load_existing_business_keys(
+        cls,
+        fechas: list[date],
+    ) -> set[tuple[uuid.UUID, date, uuid.UUID]]:
+        """Stored business keys on the ``fecha_desde`` dates in ``fechas``.
+
+        Exact dates rather than a min..max range: a batch that mixes an old
+        correction with current rows would otherwise load every key between.
+        """
+        distinct = sorted(set(fechas))
+        known = set()
+        for index in range(0, len(distinct), cls.DATE_CHUNK_SIZE):
+            known.update(
+                NovedadModel.objects.filter(
+                    fecha_desde__in=distinct[index : index + cls.DATE_CHUNK_SIZE],
+                    maintenance_unit_id__isnull=False,
+                    intervencion_id__isnull=False,
+                ).values_list("maintenance_unit_id", "fecha_desde", "intervencion_id")
+            )
+        return known
+
     @staticmethod
-    def _load_existing_business_keys() -> set[tuple[uuid.UUID, date, uuid.UUID]]:
-        existing_rows = NovedadModel.objects.filter(
-            maintenance_unit_id__isnull=False,
-            fecha_desde__isnull=False,
-            intervencion_id__isnull=False,
-        ).values_list("maintenance_unit_id", "fecha_desde", "intervencion_id")
-        return set(existing_rows)
+    def _flush_batch(batch: list[NovedadModel]) -> list[NovedadModel]:
+        """Insert ``batch`` and return the rows that were actually written."""
+        NovedadModel.objects.bulk_create(batch, ignore_conflicts=True)
+        # With ignore_conflicts bulk_create hands back every object; the ids
+        # generated here tell which rows made it past the constraints
+        written = set(
+            NovedadModel.objects.filter(
+                id__in=[novedad.id for novedad in batch]
+            ).values_list("id", flat=True)
+        )
+        return [novedad for novedad in batch if novedad.id in written]
 
     @staticmethod
-    def _flush_batch(batch: list[NovedadModel]) -> tuple[int, int]:
-        created = NovedadModel.objects.bulk_create(batch, ignore_conflicts=True)
-        inserted = len(created)
-        return inserted, len(batch) - inserted
+    def _unit_numbers(
+        rows: list[NovedadModel], cache: dict[uuid.UUID, str]
+    ) -> set[str]:
+        """``MaintenanceUnit.number`` of each row, else its legacy unit code.
+
+        ``cache`` maps unit ids to numbers across the batches of one import.
+        """
+        missing = {
+            novedad.maintenance_unit_id
+            for novedad in rows
+            if novedad.maintenance_unit_id and novedad.maintenance_unit_id not in cache
+        }
+        if missing:
+            cache.update(
+                MaintenanceUnitModel.objects.filter(id__in=missing).values_list(
+                    "id", "number"
+                )
+            )
+        return {
+            cache.get(novedad.maintenance_unit_id) or novedad.legacy_unit_code
+            for novedad in rows
+        }
 
     @staticmethod
     def _merge_stats(first: SyncStats, second: SyncStats) -> SyncStats:
@@ -292,6 +530,7 @@ class AccessNovedadImporter:
             skipped_old=first.skipped_old + second.skipped_old,
             duplicates=first.duplicates + second.duplicates,
             invalid=first.invalid + second.invalid,
+            affected_units=first.affected_units | second.affected_units,
         )
 
     @staticmethod
@@ -0,0 +1,230 @@
+"""Persistent PowerShell worker for Access CHECK/INSERT/UPDATE requests.
+
+Each call through ``AccessNovedadExporter._run_script`` starts a fresh 32-bit
+``powershell.exe`` and reopens the .mdb, which costs seconds per operation.
+The worker starts ``export_to_access.ps1 -Operation SERVE`` once and talks to
+it with one JSON object per line on stdin/stdout, so the Access connection
+stays open between requests.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import queue
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class AccessWorkerError(RuntimeError):
+    """Raised when the worker cannot answer a request."""
+
+
+class AccessPowerShellWorker:
+    """Long-lived ``export_to_access.ps1`` process speaking JSON lines."""
+
+    def __init__(
+        self,
+        powershell_path: Path,
+        script_path: Path,
+        db_path: Path,
+        db_password: str = "",
+        timeout_seconds: float = 60.0,
+    ) -> None:
+        self._powershell_path = powershell_path
+        self._script_path = script_path
+        self._db_path = db_path
+        self._db_password = db_password
+        self._timeout_seconds = timeout_seconds
+        self._process: subprocess.Popen[str] | None = None
+        self._responses: queue.Queue[dict[str, Any] | None] = queue.Queue()
+        self._lock = threading.Lock()
+        self._next_key = 0
+        self.restarts = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send one request and wait for its response.
+
+        A worker that died since the previous call is restarted before the
+        request is written. If it dies after the request was sent the call
+        fails instead of being retried, so an INSERT is never sent twice.
+        """
+        with self._lock:
+            if not self.is_running:
+                if self._process is not None:
+                    self.restarts += 1
+                    logger.warning(
+                        "Access worker exited (code=%s); restarting",
+                        self._process.returncode,
+                    )
+                self._start()
+
+            self._next_key += 1
+            key = self._next_key
+            line = json.dumps({**payload, "key": key})
+            try:
+                assert self._process is not None and self._process.stdin is not None
+                self._process.stdin.write(line + "\n")
+                self._process.stdin.flush()
+            except (BrokenPipeError, OSError) as exc:
+                self._stop_process()
+                raise AccessWorkerError(f"Access worker unavailable: {exc}") from exc
+
+            while True:
+                response = self._next_response()
+                if response.get("key") == key:
+                    return response
+
+    def close(self) -> None:
+        """Ask the worker to quit and wait for it, killing it if needed."""
+        with self._lock:
+            process = self._process
+            if process is None:
+                return
+            if process.poll() is None and process.stdin is not None:
+                try:
+                    process.stdin.write(json.dumps({"operation": "QUIT"}) + "\n")
+                    process.stdin.close()
+                except (BrokenPipeError, OSError):
+                    pass
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            self._process = None
+
+    def _start(self) -> None:
+        command = [
+            str(self._powershell_path),
+            "-NoProfile",
+            "-ExecutionPolicy",
+            "Bypass",
+            "-File",
+            str(self._script_path),
+            "-DbPath",
+            str(self._db_path),
+            "-Operation",
+            "SERVE",
+        ]
+        if self._db_password:
+            command.extend(["-DbPassword", self._db_password])
+
+        self._responses = queue.Queue()
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=1,
+        )
+        self._process = process
+        threading.Thread(
+            target=self._read_stdout,
+            args=(process, self._responses),
+            name="access-worker-stdout",
+            daemon=True,
+        ).start()
+        threading.Thread(
+            target=self._read_stderr,
+            args=(process,),
+            name="access-worker-stderr",
+            daemon=True,
+        ).start()
+
+        ready = self._next_response()
+        if ready.get("status") != "ready":
+            self._stop_process()
+            raise AccessWorkerError(f"Unexpected worker handshake: {ready}")
+        logger.info("Access worker started (pid=%s)", process.pid)
+
+    def _next_response(self) -> dict[str, Any]:
+        try:
+            response = self._responses.get(timeout=self._timeout_seconds)
+        except queue.Empty:
+            self._stop_process()
+            raise AccessWorkerError(
+                f"Access worker did not answer within {self._timeout_seconds}s"
+            ) from None
+        if response is None:
+            self._stop_process()
+            raise AccessWorkerError("Access worker exited unexpectedly")
+        return response
+
+    def _stop_process(self) -> None:
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.kill()
+            process.wait()
+
+    @staticmethod
+    def _read_stdout(
+        process: subprocess.Popen[str],
+        responses: queue.Queue[dict[str, Any] | None],
+    ) -> None:
+        assert process.stdout is not None
+        for raw_line in process.stdout:
+            line = raw_line.strip().lstrip("\ufeff")
+            if not line.startswith("{"):
+                continue
+            try:
+                responses.put(json.loads(line))
+            except json.JSONDecodeError:
+                logger.debug("Ignoring malformed worker line: %s", line)
+        responses.put(None)
+
+    @staticmethod
+    def _read_stderr(process: subprocess.Popen[str]) -> None:
+        assert process.stderr is not None
+        for line in process.stderr:
+            message = line.rstrip()
+            if message:
+                logger.debug("Access worker: %s", message)
+
+
+_workers: dict[tuple[str, str, str, str], AccessPowerShellWorker] = {}
+_workers_lock = threading.Lock()
+
+
+def get_access_worker(
+    powershell_path: Path,
+    script_path: Path,
+    db_path: Path,
+    db_password: str = "",
+) -> AccessPowerShellWorker:
+    """Return the process-wide worker for this script and database."""
+    key = (str(powershell_path), str(script_path), str(db_path), db_password)
+    with _workers_lock:
+        worker = _workers.get(key)
+        if worker is None:
+            worker = AccessPowerShellWorker(
+                powershell_path=powershell_path,
+                script_path=script_path,
+                db_path=db_path,
+                db_password=db_password,
+            )
+            _workers[key] = worker
+        return worker
+
+
+def shutdown_access_workers() -> None:
+    """Stop every worker started by this process."""
+    with _workers_lock:
+        workers = list(_workers.values())
+        _workers.clear()
+    for worker in workers:
+        try:
+            worker.close()
+        except Exception:
+            logger.exception("Failed to stop Access worker")
@@ -0,0 +1,85 @@
+"""Per-source, per-table high-water marks for Access extractions."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import date
+
+from apps.tickets.infrastructure.models import AccessSyncStateModel
+
+
+@dataclass(frozen=True)
+class AccessWatermark:
+    """Largest Access ID and record date imported for one source/table."""
+
+    last_id: int | None = None
+    last_date: date | None = None
+
+
+class AccessSyncStateStore:
+    """Read and advance the watermarks in ``access_sync_state``."""
+
+    def get(self, source: str, table_name: str) -> AccessWatermark | None:
+        row = (
+            AccessSyncStateModel.objects.filter(source=source, table_name=table_name)
+            .values("last_id", "last_date")
+            .first()
+        )
+        if row is None:
+            return None
+        return AccessWatermark(last_id=row["last_id"], last_date=row["last_date"])
+
+    def advance(self, source: str, table_name: str, watermark: AccessWatermark) -> None:
+        """Move the stored watermark forward; it never goes back."""
+        if watermark.last_id is None and watermark.last_date is None:
+            return
+        state, _ = AccessSyncStateModel.objects.get_or_create(
+            source=source, table_name=table_name
+        )
+        state.last_id = _max_or_none(state.last_id, watermark.last_id)
+        state.last_date = _max_or_none(state.last_date, watermark.last_date)
+        state.save(update_fields=["last_id", "last_date", "updated_at"])
+
+
+class WatermarkTracker:
+    """Record the largest ID and date seen while records stream through."""
+
+    def __init__(
+        self,
+        date_field: str,
+        parse_date: Callable[[object], date | None],
+        id_field: str = "Id",
+    ) -> None:
+        self._date_field = date_field
+        self._parse_date = parse_date
+        self._id_field = id_field
+        self.last_id: int | None = None
+        self.last_date: date | None = None
+
+    def track(self, records: Iterable[dict]) -> Iterator[dict]:
+        for record in records:
+            self._observe(record)
+            yield record
+
+    @property
+    def watermark(self) -> AccessWatermark:
+        return AccessWatermark(last_id=self.last_id, last_date=self.last_date)
+
+    def _observe(self, record: dict) -> None:
+        raw_id = record.get(self._id_field)
+        if raw_id not in (None, ""):
+            with suppress(TypeError, ValueError):
+                self.last_id = _max_or_none(self.last_id, int(raw_id))
+        record_date = self._parse_date(record.get(self._date_field))
+        if record_date is not None:
+            self.last_date = _max_or_none(self.last_date, record_date)
+
+
+def _max_or_none(current, candidate):
+    if candidate is None:
+        return current
+    if current is None:
+        return candidate
+    return max(current, candidate)
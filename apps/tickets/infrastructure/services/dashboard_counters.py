@@ -0,0 +1,213 @@
+"""Read and reconcile the home page counters.
+
+The ``dashboard_counters`` row is maintained incrementally by triggers on
+``ticket`` and ``novedad``, so ORM saves, ``bulk_create``, queryset updates
+and the importers' raw INSERTs all move the counters without extra code.
+The home page therefore costs a single-row read.
+
+"Today" and "this week" move with the calendar, so the row records the day
+they refer to (``as_of``). ``read`` reconciles when that day has passed, and
+the scheduler reconciles nightly to correct any drift (e.g. rows written
+while the triggers were missing, or after a restore). ``db_triggers``
+re-creates the triggers after ``migrate``; ``reconcile`` reports any that
+are still missing.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from django.db import transaction
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from apps.tickets.infrastructure.models import (
+    DashboardCountersModel,
+    NovedadModel,
+    TicketModel,
+)
+from apps.tickets.infrastructure.services.db_triggers import (
+    TriggerSet,
+    create_trigger,
+    missing_objects,
+)
+
+logger = logging.getLogger(__name__)
+
+COUNTER_FIELDS = (
+    "tickets_pending",
+    "tickets_completed",
+    "tickets_total",
+    "novedades_hoy",
+    "novedades_semana",
+    "novedades_total",
+)
+
+
+_PENDING = (
+    f"(CASE WHEN {{row}}.status = '{TicketModel.Status.PENDING}' THEN 1 ELSE 0 END)"
+)
+_COMPLETED = (
+    f"(CASE WHEN {{row}}.status = '{TicketModel.Status.COMPLETED}' THEN 1 ELSE 0 END)"
+)
+_TODAY = "(CASE WHEN {row}.fecha_desde = as_of THEN 1 ELSE 0 END)"
+_THIS_WEEK = "(CASE WHEN {row}.fecha_desde >= week_start THEN 1 ELSE 0 END)"
+
+
+def _counters_trigger(name: str, event: str, table: str, assignments: list[str]) -> str:
+    return create_trigger(
+        name,
+        event,
+        table,
+        f"UPDATE dashboard_counters SET {', '.join(assignments)} WHERE id = 1;",
+    )
+
+
+def _moved(field: str, flag: str) -> str:
+    return f"{field} = {field} + {flag.format(row='NEW')} - {flag.format(row='OLD')}"
+
+
+@dataclass(frozen=True)
+class ReconcileResult:
+    counters: DashboardCountersModel
+    drift: dict[str, int]
+    missing_triggers: list[str]
+
+
+class DashboardCountersService:
+    """Single-row access to the home page counters."""
+
+    def read(self, today: date | None = None) -> DashboardCountersModel:
+        today = today or timezone.now().date()
+        counters = DashboardCountersModel.objects.filter(
+            pk=DashboardCountersModel.SINGLETON_ID
+        ).first()
+        if counters is None or counters.as_of != today:
+            counters = self.reconcile(today).counters
+        return counters
+
+    def reconcile(self, today: date | None = None) -> ReconcileResult:
+        """Recompute every counter from the source tables.
+
+        ``drift`` holds the fields whose stored value was wrong, as
+        ``recomputed - stored``; a day rollover is not reported as drift.
+        """
+        today = today or timezone.now().date()
+        week_start = today - timedelta(days=today.weekday())
+
+        with transaction.atomic():
+            stored = DashboardCountersModel.objects.filter(
+                pk=DashboardCountersModel.SINGLETON_ID
+            ).first()
+            tickets = TicketModel.objects.aggregate(
+                tickets_pending=Count(
+                    "pk", filter=Q(status=TicketModel.Status.PENDING)
+                ),
+                tickets_completed=Count(
+                    "pk", filter=Q(status=TicketModel.Status.COMPLETED)
+                ),
+                tickets_total=Count("pk"),
+            )
+            novedades = NovedadModel.objects.aggregate(
+                novedades_hoy=Count("pk", filter=Q(fecha_desde=today)),
+                novedades_semana=Count("pk", filter=Q(fecha_desde__gte=week_start)),
+                novedades_total=Count("pk"),
+            )
+            values = {**tickets, **novedades}
+            counters, _ = DashboardCountersModel.objects.update_or_create(
+                pk=DashboardCountersModel.SINGLETON_ID,
+                defaults={
+                    **values,
+                    "as_of": today,
+                    "week_start": week_start,
+                    "reconciled_at": timezone.now(),
+                },
+            )
+
+        drift = {}
+        if stored is not None:
+            same_day = stored.as_of == today
+            for field in COUNTER_FIELDS:
+                if not same_day and field in ("novedades_hoy", "novedades_semana"):
+                    continue
+                delta = values[field] - getattr(stored, field)
+                if delta:
+                    drift[field] = delta
+        if drift:
+            logger.warning("Dashboard counters drifted: %s", drift)
+        missing = missing_objects(DASHBOARD_TRIGGERS.create)
+        if missing:
+            logger.warning("Dashboard counter triggers missing: %s", missing)
+        return ReconcileResult(counters=counters, drift=drift, missing_triggers=missing)
+
+
+DASHBOARD_TRIGGERS = TriggerSet(
+    tables=("ticket", "novedad", "dashboard_counters"),
+    create={
+        "dashboard_ticket_ai": _counters_trigger(
+            "dashboard_ticket_ai",
+            "INSERT",
+            "ticket",
+            [
+                "tickets_total = tickets_total + 1",
+                f"tickets_pending = tickets_pending + {_PENDING.format(row='NEW')}",
+                "tickets_completed = tickets_completed + "
+                f"{_COMPLETED.format(row='NEW')}",
+            ],
+        ),
+        "dashboard_ticket_ad": _counters_trigger(
+            "dashboard_ticket_ad",
+            "DELETE",
+            "ticket",
+            [
+                "tickets_total = tickets_total - 1",
+                f"tickets_pending = tickets_pending - {_PENDING.format(row='OLD')}",
+                "tickets_completed = tickets_completed - "
+                f"{_COMPLETED.format(row='OLD')}",
+            ],
+        ),
+        "dashboard_ticket_au": _counters_trigger(
+            "dashboard_ticket_au",
+            "UPDATE OF status",
+            "ticket",
+            [
+                _moved("tickets_pending", _PENDING),
+                _moved("tickets_completed", _COMPLETED),
+            ],
+        ),
+        "dashboard_novedad_ai": _counters_trigger(
+            "dashboard_novedad_ai",
+            "INSERT",
+            "novedad",
+            [
+                "novedades_total = novedades_total + 1",
+                f"novedades_hoy = novedades_hoy + {_TODAY.format(row='NEW')}",
+                "novedades_semana = novedades_semana + "
+                f"{_THIS_WEEK.format(row='NEW')}",
+            ],
+        ),
+        "dashboard_novedad_ad": _counters_trigger(
+            "dashboard_novedad_ad",
+            "DELETE",
+            "novedad",
+            [
+                "novedades_total = novedades_total - 1",
+                f"novedades_hoy = novedades_hoy - {_TODAY.format(row='OLD')}",
+                "novedades_semana = novedades_semana - "
+                f"{_THIS_WEEK.format(row='OLD')}",
+            ],
+        ),
+        "dashboard_novedad_au": _counters_trigger(
+            "dashboard_novedad_au",
+            "UPDATE OF fecha_desde",
+            "novedad",
+            [
+                _moved("novedades_hoy", _TODAY),
+                _moved("novedades_semana", _THIS_WEEK),
+            ],
+        ),
+    },
+    resync=lambda: DashboardCountersService().reconcile(),
+)
@@ -0,0 +1,99 @@
+"""Re-create the SQLite triggers that derived tables depend on.
+
+Derived tables such as ``novedad_fts``, ``dashboard_counters`` and
+``reference_data_version`` are kept current by triggers that their
+migrations created once. SQLite cannot alter most columns in place, so Django rebuilds
+the table for an ``AlterField`` (copy, drop, rename) and the drop takes
+the table's triggers with it. Nothing fails: the derived table simply
+stops following its source.
+
+``ensure_triggers`` runs after every ``migrate`` (see ``TicketsConfig``)
+and issues ``CREATE TRIGGER IF NOT EXISTS`` for each registered trigger,
+so existing triggers are left alone and dropped ones come back. The
+derived table is then resynced, since rows written (or renumbered by the
+rebuild) while its triggers were missing never reached it.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TriggerSet:
+    """Triggers that maintain one derived table.
+
+    ``tables`` must all exist before the triggers can be created, e.g.
+    while migrating backwards past the migration that added them.
+    ``resync`` brings the derived table back in step after re-creation.
+    """
+
+    tables: tuple[str, ...]
+    create: dict[str, str]
+    resync: Callable[[], object]
+
+
+def create_trigger(name: str, event: str, table: str, body: str) -> str:
+    """``CREATE TRIGGER IF NOT EXISTS`` statement running ``body`` per row."""
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON {table} "
+        f"BEGIN {body} END"
+    )
+
+
+def registered_trigger_sets() -> list[TriggerSet]:
+    # Imported here: the services import this module for missing_objects
+    from apps.tickets.infrastructure.services.dashboard_counters import (
+        DASHBOARD_TRIGGERS,
+    )
+    from apps.tickets.infrastructure.services.novedad_search_index import (
+        NOVEDAD_FTS_TRIGGERS,
+    )
+    from apps.tickets.infrastructure.services.reference_data_cache import (
+        REFERENCE_VERSION_TRIGGERS,
+    )
+
+    return [NOVEDAD_FTS_TRIGGERS, DASHBOARD_TRIGGERS, REFERENCE_VERSION_TRIGGERS]
+
+
+def missing_objects(names, using: str = DEFAULT_DB_ALIAS) -> list[str]:
+    """Names of tables or triggers not present in the SQLite schema."""
+    names = list(names)
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return names
+    placeholders = ", ".join(["%s"] * len(names))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT name FROM sqlite_master WHERE name IN ({placeholders})", names
+        )
+        present = {row[0] for row in cursor.fetchall()}
+    return [name for name in names if name not in present]
+
+
+def ensure_triggers(using: str = DEFAULT_DB_ALIAS) -> list[str]:
+    """Create any registered trigger that is missing; returns their names."""
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return []
+    created = []
+    for trigger_set in registered_trigger_sets():
+        if missing_objects(trigger_set.tables, using):
+            continue
+        missing = missing_objects(trigger_set.create, using)
+        if not missing:
+            continue
+        with connection.cursor() as cursor:
+            for name in missing:
+                cursor.execute(trigger_set.create[name])
+        trigger_set.resync()
+        created.extend(missing)
+    if created:
+        logger.warning("Re-created missing triggers: %s", ", ".join(created))
+    return created
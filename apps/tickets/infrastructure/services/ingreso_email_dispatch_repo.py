@@ -24,19 +24,26 @@ class IngresoEmailDispatchRepository:
         body_html: str | None,
         origin_terminal_id: str | None = None,
     ) -> MaintenanceEntryEmailDispatchModel:
-        """Create a pending dispatch record."""
+        """Create the pending dispatch of an entry, or return the existing one.
 
-        return MaintenanceEntryEmailDispatchModel.objects.create(
+        The unique constraint on ``entry`` makes this safe against a retried
+        job or a concurrent caller: the losing insert reads the winner.
+        """
+
+        dispatch, _ = MaintenanceEntryEmailDispatchModel.objects.get_or_create(
             entry=entry,
-            status=MaintenanceEntryEmailDispatchModel.Status.PENDING,
-            attempts=0,
-            to_recipients=to_recipients,
-            cc_recipients=cc_recipients,
-            subject=subject,
-            body=body,
-            body_html=body_html,
-            origin_terminal_id=origin_terminal_id,
+            defaults={
+                "status": MaintenanceEntryEmailDispatchModel.Status.PENDING,
+                "attempts": 0,
+                "to_recipients": to_recipients,
+                "cc_recipients": cc_recipients,
+                "subject": subject,
+                "body": body,
+                "body_html": body_html,
+                "origin_terminal_id": origin_terminal_id,
+            },
         )
+        return dispatch
 
     def get_next_pending(
         self,
@@ -85,30 +92,27 @@ class IngresoEmailDispatchRepository:
     ) -> MaintenanceEntryEmailDispatchModel | None:
         """Atomically claim a pending dispatch using select_for_update."""
 
+        # Only dispatches whose PDF has been written; with background
+        # ingreso jobs the PDF can lag behind the entry
+        ready = MaintenanceEntryEmailDispatchModel.objects.filter(
+            status=MaintenanceEntryEmailDispatchModel.Status.PENDING,
+            entry__pdf_path__gt="",
+        )
+
         with transaction.atomic():
             # Build query based on terminal routing logic
             if allow_any:
                 # Backward compatibility: any pending dispatch
-                queryset = MaintenanceEntryEmailDispatchModel.objects.filter(
-                    status=MaintenanceEntryEmailDispatchModel.Status.PENDING,
-                )
+                queryset = ready
             elif terminal_id:
                 # Priority 1: dispatch for this terminal
-                queryset = MaintenanceEntryEmailDispatchModel.objects.filter(
-                    status=MaintenanceEntryEmailDispatchModel.Status.PENDING,
-                    origin_terminal_id=terminal_id,
-                )
+                queryset = ready.filter(origin_terminal_id=terminal_id)
                 if not queryset.exists():
                     # Priority 2: unassigned dispatch (can be claimed by any terminal)
-                    queryset = MaintenanceEntryEmailDispatchModel.objects.filter(
-                        status=MaintenanceEntryEmailDispatchModel.Status.PENDING,
-                        origin_terminal_id__isnull=True,
-                    )
+                    queryset = ready.filter(origin_terminal_id__isnull=True)
             else:
                 # No terminal_id: unassigned or any
-                queryset = MaintenanceEntryEmailDispatchModel.objects.filter(
-                    status=MaintenanceEntryEmailDispatchModel.Status.PENDING,
-                )
+                queryset = ready
 
             # Use select_for_update with skip_locked to avoid race conditions
             dispatch = (
@@ -0,0 +1,240 @@
+"""Database-backed queue for the PDF and email work of maintenance entries.
+
+The entry form only saves the entry and an ``ingreso_job`` row. Worker
+threads started next to the scheduler claim queued rows with a conditional
+UPDATE, so two workers (or a worker and ``process_ingreso_jobs``) never
+process the same job, and run the handler supplied by the application layer.
+A failed job is queued again until ``MAX_ATTEMPTS``; a job left RUNNING by a
+process that died is released after ``STALE_AFTER``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from datetime import timedelta
+
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.tickets.infrastructure.models import IngresoJobModel, MaintenanceEntryModel
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 3
+STALE_AFTER = timedelta(minutes=10)
+# Queued jobs looked at per claim; losers of a race move on to the next one
+_CLAIM_CANDIDATES = 5
+
+JobHandler = Callable[[IngresoJobModel], object]
+
+
+class IngresoJobQueue:
+    """Persistence adapter for ingreso background jobs."""
+
+    def enqueue(
+        self,
+        entry: MaintenanceEntryModel,
+        origin_terminal_id: str | None = None,
+    ) -> IngresoJobModel:
+        """Queue the artifacts of ``entry`` and wake the workers on commit."""
+
+        job = IngresoJobModel.objects.create(
+            entry=entry,
+            status=IngresoJobModel.Status.QUEUED,
+            origin_terminal_id=origin_terminal_id,
+        )
+        transaction.on_commit(wake_ingreso_workers)
+        return job
+
+    def claim_next(self) -> IngresoJobModel | None:
+        """Mark the oldest queued job RUNNING and return it."""
+
+        self._release_stale()
+        candidates = IngresoJobModel.objects.filter(
+            status=IngresoJobModel.Status.QUEUED
+        ).order_by("created_at")
+        for job_id in candidates.values_list("id", flat=True)[:_CLAIM_CANDIDATES]:
+            now = timezone.now()
+            claimed = IngresoJobModel.objects.filter(
+                pk=job_id, status=IngresoJobModel.Status.QUEUED
+            ).update(
+                status=IngresoJobModel.Status.RUNNING,
+                attempts=F("attempts") + 1,
+                started_at=now,
+                updated_at=now,
+            )
+            if claimed:
+                return IngresoJobModel.objects.get(pk=job_id)
+        return None
+
+    def _release_stale(self) -> int:
+        """Queue again RUNNING jobs whose worker stopped answering."""
+        return IngresoJobModel.objects.filter(
+            status=IngresoJobModel.Status.RUNNING,
+            started_at__lt=timezone.now() - STALE_AFTER,
+        ).update(
+            status=IngresoJobModel.Status.QUEUED,
+            updated_at=timezone.now(),
+        )
+
+    def run_next(self, handler: JobHandler) -> bool:
+        """Claim one job and run ``handler`` on it; False if the queue is empty.
+
+        The handler records the outcome through ``mark_done``; an exception
+        is stored on the job and the job is retried.
+        """
+
+        job = self.claim_next()
+        if job is None:
+            return False
+        try:
+            handler(job)
+        except Exception as exc:
+            logger.exception("Ingreso job %s failed", job.pk)
+            self.mark_failed(job, exc.args[0] if exc.args else str(exc))
+        return True
+
+    def mark_done(
+        self,
+        job: IngresoJobModel,
+        *,
+        recipients_status: str,
+        recipients_reason: str | None,
+        outlook_status: str,
+        outlook_reason: str | None,
+    ) -> IngresoJobModel:
+        """Mark a job as done with the recipient and dispatch outcome."""
+
+        job.status = IngresoJobModel.Status.DONE
+        job.last_error = None
+        job.finished_at = timezone.now()
+        job.recipients_status = recipients_status
+        job.recipients_reason = recipients_reason
+        job.outlook_status = outlook_status
+        job.outlook_reason = outlook_reason
+        # Update by pk: the entry may have been deleted (and the job with it)
+        IngresoJobModel.objects.filter(pk=job.pk).update(
+            status=job.status,
+            last_error=None,
+            finished_at=job.finished_at,
+            recipients_status=recipients_status,
+            recipients_reason=recipients_reason,
+            outlook_status=outlook_status,
+            outlook_reason=outlook_reason,
+            updated_at=job.finished_at,
+        )
+        return job
+
+    def mark_failed(self, job: IngresoJobModel, error: str) -> IngresoJobModel:
+        """Store the error; queue the job again unless it ran out of attempts."""
+
+        attempts = (
+            IngresoJobModel.objects.filter(pk=job.pk)
+            .values_list("attempts", flat=True)
+            .first()
+        )
+        if attempts is None:
+            return job
+        job.attempts = attempts
+        job.last_error = str(error)
+        if attempts < MAX_ATTEMPTS:
+            job.status = IngresoJobModel.Status.QUEUED
+            job.finished_at = None
+        else:
+            job.status = IngresoJobModel.Status.FAILED
+            job.finished_at = timezone.now()
+        IngresoJobModel.objects.filter(pk=job.pk).update(
+            status=job.status,
+            last_error=job.last_error,
+            finished_at=job.finished_at,
+            updated_at=timezone.now(),
+        )
+        return job
+
+    def latest_for_entry(self, entry_id) -> IngresoJobModel | None:
+        """Return the most recent job of an entry."""
+        return (
+            IngresoJobModel.objects.filter(entry_id=entry_id)
+            .order_by("-created_at")
+            .first()
+        )
+
+
+class IngresoJobWorker(threading.Thread):
+    """Daemon thread that drains the queue, then sleeps until woken."""
+
+    def __init__(
+        self,
+        handler: JobHandler,
+        wake_event: threading.Event,
+        poll_seconds: float = 5.0,
+        job_queue: IngresoJobQueue | None = None,
+        name: str = "ingreso-job-worker",
+    ) -> None:
+        super().__init__(name=name, daemon=True)
+        self._handler = handler
+        self._wake = wake_event
+        self._poll_seconds = poll_seconds
+        self._queue = job_queue or IngresoJobQueue()
+        self._stopping = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopping.is_set():
+            close_old_connections()
+            try:
+                processed = self._queue.run_next(self._handler)
+            except Exception:
+                logger.exception("Ingreso job worker iteration failed")
+                processed = False
+            if processed:
+                continue
+            self._wake.wait(self._poll_seconds)
+            self._wake.clear()
+        close_old_connections()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._wake.set()
+
+
+_workers: list[IngresoJobWorker] = []
+_workers_lock = threading.Lock()
+_wake_event = threading.Event()
+
+
+def start_ingreso_workers(
+    handler: JobHandler, count: int = 1, poll_seconds: float = 5.0
+) -> int:
+    """Start ``count`` workers for this process; no-op if already running."""
+    with _workers_lock:
+        if _workers:
+            return 0
+        for index in range(count):
+            worker = IngresoJobWorker(
+                handler,
+                _wake_event,
+                poll_seconds=poll_seconds,
+                name=f"ingreso-job-worker-{index + 1}",
+            )
+            worker.start()
+            _workers.append(worker)
+    return count
+
+
+def wake_ingreso_workers() -> None:
+    """Make idle workers look at the queue now instead of at the next poll."""
+    _wake_event.set()
+
+
+def shutdown_ingreso_workers(timeout: float = 5.0) -> None:
+    """Stop every worker started by this process."""
+    with _workers_lock:
+        workers = list(_workers)
+        _workers.clear()
+    for worker in workers:
+        worker.stop()
+    for worker in workers:
+        worker.join(timeout)
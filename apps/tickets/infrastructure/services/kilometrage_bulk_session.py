@@ -0,0 +1,108 @@
+"""Bulk-load session for large kilometrage imports on SQLite.
+
+Wraps a load in a single transaction, relaxes the durability/cache PRAGMAs
+while it runs and can drop ``km_unit_date_idx`` so SQLite does not maintain
+it row by row. Settings and the index are always restored, also on error.
+See ``docs/OPTIMIZACION_IMPORT_ACCESS.md``.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from django.db import connection, transaction
+
+from apps.tickets.infrastructure.models import KilometrageRecordModel
+
+logger = logging.getLogger(__name__)
+
+# PRAGMA name -> value applied during the session
+BULK_PRAGMAS = {
+    "synchronous": "OFF",
+    "cache_size": "-64000",
+    "temp_store": "MEMORY",
+}
+# SQLite refuses to change these inside an open transaction; they are left
+# untouched when the session joins a caller's transaction.
+OUTSIDE_TRANSACTION_PRAGMAS = frozenset({"synchronous", "temp_store"})
+DROPPABLE_INDEX = "km_unit_date_idx"
+
+_state = threading.local()
+
+
+@contextmanager
+def kilometrage_bulk_session(drop_index: bool = False) -> Iterator[None]:
+    """Run the enclosed kilometrage load as one bulk transaction.
+
+    ``drop_index`` removes ``km_unit_date_idx`` for the duration of the load
+    and rebuilds it once at the end; lookups keep working meanwhile through
+    the unique ``(unit_number, record_date)`` constraint. Nested sessions
+    join the outer one.
+    """
+    if getattr(_state, "active", False):
+        yield
+        return
+
+    _state.active = True
+    try:
+        if connection.vendor != "sqlite":
+            with transaction.atomic():
+                yield
+            return
+
+        previous = _apply_pragmas()
+        try:
+            with transaction.atomic():
+                if drop_index:
+                    _drop_index()
+                yield
+                if drop_index:
+                    _create_index()
+        finally:
+            _restore_pragmas(previous)
+    finally:
+        _state.active = False
+
+
+def _apply_pragmas() -> dict[str, object]:
+    previous: dict[str, object] = {}
+    with connection.cursor() as cursor:
+        for name, value in BULK_PRAGMAS.items():
+            if name in OUTSIDE_TRANSACTION_PRAGMAS and connection.in_atomic_block:
+                continue
+            cursor.execute(f"PRAGMA {name}")
+            previous[name] = cursor.fetchone()[0]
+            cursor.execute(f"PRAGMA {name} = {value}")
+    return previous
+
+
+def _restore_pragmas(previous: dict[str, object]) -> None:
+    with connection.cursor() as cursor:
+        for name, value in previous.items():
+            try:
+                cursor.execute(f"PRAGMA {name} = {value}")
+            except Exception:
+                logger.exception("Could not restore PRAGMA %s=%s", name, value)
+
+
+def _km_index():
+    return next(
+        index
+        for index in KilometrageRecordModel._meta.indexes
+        if index.name == DROPPABLE_INDEX
+    )
+
+
+def _drop_index() -> None:
+    with connection.cursor() as cursor:
+        cursor.execute(f'DROP INDEX IF EXISTS "{DROPPABLE_INDEX}"')
+
+
+def _create_index() -> None:
+    editor = connection.schema_editor()
+    sql = str(_km_index().create_sql(KilometrageRecordModel, editor))
+    with connection.cursor() as cursor:
+        cursor.execute(sql)
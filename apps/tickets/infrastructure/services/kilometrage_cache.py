@@ -0,0 +1,92 @@
+"""Process-wide LRU cache for kilometrage lookups."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from django.conf import settings
+
+_MISSING = object()
+
+
+class KilometrageLookupCache:
+    """Size-bounded LRU cache shared by every KilometrageRepository.
+
+    Keys are ``(lookup, unit_key, *args)`` tuples and None results are cached
+    too. Importers and novedad saves call ``invalidate_units`` for the units
+    they touched; entries also expire after ``ttl_seconds`` so writes made by
+    another process (management commands) are picked up eventually.
+    """
+
+    MISSING = _MISSING
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+        self._keys_by_unit: dict[str, set[tuple]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    def get(self, key: tuple) -> object:
+        """Return the cached value, or ``KilometrageLookupCache.MISSING``."""
+        if not self.enabled:
+            return _MISSING
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.monotonic():
+                self._discard(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: tuple, value: object) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            self._keys_by_unit.setdefault(key[1], set()).add(key)
+            while len(self._entries) > self._max_entries:
+                oldest_key = next(iter(self._entries))
+                self._discard(oldest_key)
+
+    def invalidate_units(self, unit_numbers: Iterable[str]) -> None:
+        """Evict every cached lookup for the given unit numbers."""
+        with self._lock:
+            for unit_number in unit_numbers:
+                for key in self._keys_by_unit.pop(unit_number.strip().upper(), ()):
+                    self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_unit.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _discard(self, key: tuple) -> None:
+        self._entries.pop(key, None)
+        unit_keys = self._keys_by_unit.get(key[1])
+        if unit_keys is not None:
+            unit_keys.discard(key)
+            if not unit_keys:
+                del self._keys_by_unit[key[1]]
+
+
+kilometrage_lookup_cache = KilometrageLookupCache(
+    max_entries=getattr(settings, "KM_LOOKUP_CACHE_MAX_ENTRIES", 4096),
+    ttl_seconds=getattr(settings, "KM_LOOKUP_CACHE_TTL_SECONDS", 300),
+)
@@ -0,0 +1,111 @@
+"""Maintain the per-unit running km total stored on kilometrage records."""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+from django.db import transaction
+
+from apps.tickets.infrastructure.models import KilometrageRecordModel
+from apps.tickets.infrastructure.services.kilometrage_cache import (
+    kilometrage_lookup_cache,
+)
+
+
+class KilometrageCumulativeIndex:
+    """Keep ``KilometrageRecordModel.cumulative_km`` consistent per unit.
+
+    ``cumulative_km`` is the running total of ``km_value`` up to and including
+    each record, so "km since date X" becomes the latest cumulative minus the
+    cumulative of the last record before X. Importers report the earliest date
+    they touched for each unit and only that suffix is recomputed.
+    """
+
+    BATCH_SIZE = 2000
+
+    @staticmethod
+    def track(
+        start_by_unit: dict[str, date | None], unit_number: str, record_date: date
+    ) -> None:
+        """Record that a unit changed on record_date (keeps the earliest date)."""
+        current = start_by_unit.get(unit_number)
+        if unit_number not in start_by_unit or (
+            current is not None and record_date < current
+        ):
+            start_by_unit[unit_number] = record_date
+
+    def refresh_units(self, start_by_unit: dict[str, date | None]) -> int:
+        """Recompute cumulatives for each unit from its start date onward.
+
+        Importers call this after inserting rows, so it also evicts the
+        cached km lookups of those units.
+
+        Args:
+            start_by_unit: Stored unit number -> earliest changed date. A None
+                date recomputes the unit's whole history.
+
+        Returns:
+            Number of records whose cumulative value changed.
+        """
+        updated = 0
+        with transaction.atomic():
+            for unit_number, from_date in start_by_unit.items():
+                updated += self._refresh_unit(unit_number, from_date)
+        kilometrage_lookup_cache.invalidate_units(start_by_unit)
+        return updated
+
+    def rebuild_all(self) -> int:
+        """Recompute cumulatives for every unit with kilometrage records."""
+        unit_numbers = (
+            KilometrageRecordModel.objects.order_by()
+            .values_list("unit_number", flat=True)
+            .distinct()
+        )
+        return self.refresh_units(dict.fromkeys(unit_numbers))
+
+    def _refresh_unit(self, unit_number: str, from_date: date | None) -> int:
+        running = Decimal("0")
+        if from_date is not None:
+            previous = (
+                KilometrageRecordModel.objects.filter(
+                    unit_number=unit_number,
+                    record_date__lt=from_date,
+                )
+                .order_by("-record_date")
+                .values("cumulative_km")
+                .first()
+            )
+            if previous is not None:
+                if previous["cumulative_km"] is None:
+                    # Prefix was never indexed: rebuild the whole unit instead.
+                    from_date = None
+                else:
+                    running = previous["cumulative_km"]
+
+        rows = KilometrageRecordModel.objects.filter(unit_number=unit_number)
+        if from_date is not None:
+            rows = rows.filter(record_date__gte=from_date)
+
+        updated = 0
+        pending: list[KilometrageRecordModel] = []
+        for record_id, km_value, cumulative_km in (
+            rows.order_by("record_date")
+            .values_list("id", "km_value", "cumulative_km")
+            .iterator(chunk_size=self.BATCH_SIZE)
+        ):
+            running += km_value
+            if cumulative_km != running:
+                pending.append(
+                    KilometrageRecordModel(id=record_id, cumulative_km=running)
+                )
+            if len(pending) >= self.BATCH_SIZE:
+                updated += self._flush(pending)
+                pending = []
+        if pending:
+            updated += self._flush(pending)
+        return updated
+
+    @staticmethod
+    def _flush(pending: list[KilometrageRecordModel]) -> int:
+        return KilometrageRecordModel.objects.bulk_update(pending, ["cumulative_km"])
@@ -0,0 +1,79 @@
+"""Maintain the per-unit monthly kilometrage rollup table."""
+
+from __future__ import annotations
+
+from datetime import date
+
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+from apps.tickets.infrastructure.models import (
+    KilometrageMonthlyModel,
+    KilometrageRecordModel,
+)
+
+
+class KilometrageMonthlyRollup:
+    """Keep ``KilometrageMonthlyModel`` in step with the daily records.
+
+    Importers report the earliest date they touched per unit (the same map
+    ``KilometrageCumulativeIndex`` uses) and only the months from that date
+    onward are re-aggregated.
+    """
+
+    BATCH_SIZE = 2000
+
+    def refresh_units(self, start_by_unit: dict[str, date | None]) -> int:
+        """Re-aggregate the months of each unit from its start date onward.
+
+        Args:
+            start_by_unit: Stored unit number -> earliest changed date. A None
+                date re-aggregates the unit's whole history.
+
+        Returns:
+            Number of monthly rows written.
+        """
+        written = 0
+        with transaction.atomic():
+            for unit_number, from_date in start_by_unit.items():
+                written += self._refresh_unit(unit_number, from_date)
+        return written
+
+    def rebuild_all(self) -> int:
+        """Re-aggregate every unit with kilometrage records."""
+        unit_numbers = (
+            KilometrageRecordModel.objects.order_by()
+            .values_list("unit_number", flat=True)
+            .distinct()
+        )
+        return self.refresh_units(dict.fromkeys(unit_numbers))
+
+    def _refresh_unit(self, unit_number: str, from_date: date | None) -> int:
+        # Rollup rows are keyed by the upper-cased number; older imports
+        # stored some daily records with mixed-case numbers
+        unit_key = unit_number.strip().upper()
+        records = KilometrageRecordModel.objects.filter(unit_number__iexact=unit_key)
+        stale = KilometrageMonthlyModel.objects.filter(unit_number=unit_key)
+        if from_date is not None:
+            month_start = from_date.replace(day=1)
+            records = records.filter(record_date__gte=month_start)
+            stale = stale.filter(month__gte=month_start)
+
+        rows = [
+            KilometrageMonthlyModel(unit_number=unit_key, **row)
+            for row in records.order_by()
+            .annotate(month=TruncMonth("record_date"))
+            .values("month")
+            .annotate(km_total=Sum("km_value"), record_count=Count("id"))
+        ]
+        stale.exclude(month__in=[row.month for row in rows]).delete()
+        if rows:
+            KilometrageMonthlyModel.objects.bulk_create(
+                rows,
+                batch_size=self.BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["unit_number", "month"],
+                update_fields=["km_total", "record_count", "updated_at"],
+            )
+        return len(rows)
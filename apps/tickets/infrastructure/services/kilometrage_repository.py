@@ -2,16 +2,40 @@
 
 from __future__ import annotations
 
-from datetime import date
+import uuid
+from collections.abc import Callable, Iterable
+from datetime import date, timedelta
 from decimal import Decimal
 
+from django.db import connection
 from django.db.models import Sum
+from django.db.models.functions import TruncMonth, Upper
 
-from apps.tickets.infrastructure.models import KilometrageRecordModel
+from apps.tickets.infrastructure.models import (
+    KilometrageMonthlyModel,
+    KilometrageRecordModel,
+)
+from apps.tickets.infrastructure.services.kilometrage_cache import (
+    KilometrageLookupCache,
+    kilometrage_lookup_cache,
+)
 
 
 class KilometrageRepository:
-    """Provide kilometrage lookups backed by the database."""
+    """Provide kilometrage lookups backed by the database.
+
+    The ``*_bulk`` variants answer many (unit, date) lookups with a few grouped
+    statements. They match the normalized (stripped, upper-case) unit number
+    the importers store, which lets SQLite use ``km_unit_date_idx``.
+
+    Point lookups and km-since totals go through the process-wide
+    ``kilometrage_lookup_cache``.
+    """
+
+    PAIR_CHUNK_SIZE = 400
+
+    def __init__(self, cache: KilometrageLookupCache | None = None) -> None:
+        self._cache = cache or kilometrage_lookup_cache
 
     def get_km_at_or_before(
         self, unit_number: str, target_date: date
@@ -27,21 +51,27 @@ class KilometrageRepository:
         """
 
         unit_key = unit_number.strip().upper()
-        record = (
-            KilometrageRecordModel.objects.filter(
-                unit_number__iexact=unit_key,
-                record_date__lte=target_date,
+
+        def fetch() -> Decimal | None:
+            record = (
+                KilometrageRecordModel.objects.filter(
+                    unit_number__iexact=unit_key,
+                    record_date__lte=target_date,
+                )
+                .order_by("-record_date")
+                .first()
             )
-            .order_by("-record_date")
-            .first()
-        )
-        return record.km_value if record else None
+            return record.km_value if record else None
+
+        return self._cached(("at_or_before", unit_key, target_date), fetch)
 
     def get_km_since(self, unit_number: str, from_date: date) -> Decimal | None:
         """Return total kilometers since a given date.
 
         Sums all km values from the first record on or after from_date
-        to the latest record.
+        to the latest record. When the unit's records carry a cumulative
+        total this is answered from two rows: the latest cumulative minus
+        the cumulative of the last record before from_date.
 
         Args:
             unit_number: Unit identifier.
@@ -52,32 +82,379 @@ class KilometrageRepository:
         """
 
         unit_key = unit_number.strip().upper()
-        result = KilometrageRecordModel.objects.filter(
-            unit_number__iexact=unit_key,
-            record_date__gte=from_date,
-        ).aggregate(total=Sum("km_value"))
-        return result["total"] if result["total"] is not None else None
+        return self._cached(
+            ("since", unit_key, from_date),
+            lambda: self._fetch_km_since(unit_key, from_date),
+        )
 
     def get_latest_km(self, unit_number: str) -> Decimal | None:
         """Return latest kilometer value for a unit."""
 
         unit_key = unit_number.strip().upper()
-        record = (
-            KilometrageRecordModel.objects.filter(unit_number__iexact=unit_key)
-            .order_by("-record_date")
-            .first()
-        )
-        return record.km_value if record else None
+
+        def fetch() -> Decimal | None:
+            record = (
+                KilometrageRecordModel.objects.filter(unit_number__iexact=unit_key)
+                .order_by("-record_date")
+                .first()
+            )
+            return record.km_value if record else None
+
+        return self._cached(("latest", unit_key), fetch)
 
     def get_km_for_month(
         self, unit_number: str, year: int, month: int
     ) -> Decimal | None:
-        """Return total kilometers for a given month."""
+        """Return total kilometers for a given month.
+
+        Read from the monthly rollup; months missing there are summed from
+        the daily records over the month's date range.
+        """
 
         unit_key = unit_number.strip().upper()
+        month_start = date(year, month, 1)
+
+        def fetch() -> Decimal | None:
+            total = (
+                KilometrageMonthlyModel.objects.filter(
+                    unit_number=unit_key, month=month_start
+                )
+                .values_list("km_total", flat=True)
+                .first()
+            )
+            if total is not None:
+                return total
+            result = KilometrageRecordModel.objects.filter(
+                unit_number__iexact=unit_key,
+                record_date__gte=month_start,
+                record_date__lt=_add_months(month_start, 1),
+            ).aggregate(total=Sum("km_value"))
+            return result["total"]
+
+        return self._cached(("month", unit_key, year, month), fetch)
+
+    def get_average_monthly_km(
+        self, unit_number: str, as_of: date, months: int
+    ) -> Decimal | None:
+        """Return the average monthly km over the last complete months.
+
+        See ``get_average_monthly_km_bulk``.
+        """
+
+        return self.get_average_monthly_km_bulk([unit_number], as_of, months)[
+            unit_number
+        ]
+
+    def get_average_monthly_km_bulk(
+        self, unit_numbers: Iterable[str], as_of: date, months: int
+    ) -> dict[str, Decimal | None]:
+        """Return each unit's average monthly km from the rollup.
+
+        The window is the ``months`` complete months before ``as_of``'s month;
+        months without records count as zero.
+
+        Args:
+            unit_numbers: Unit identifiers.
+            as_of: Reference date (its own month is excluded).
+            months: Window length in months.
+
+        Returns:
+            Mapping from each unit number to its average (None if the unit has
+            no km in the window).
+        """
+
+        requested = {
+            unit_number: unit_number.strip().upper() for unit_number in unit_numbers
+        }
+        window_end = as_of.replace(day=1)
+        window_start = _add_months(window_end, -months)
+
+        totals: dict[str, Decimal] = {}
+        unit_keys = sorted(set(requested.values()))
+        for index in range(0, len(unit_keys), self.PAIR_CHUNK_SIZE):
+            grouped = (
+                KilometrageMonthlyModel.objects.filter(
+                    unit_number__in=unit_keys[index : index + self.PAIR_CHUNK_SIZE],
+                    month__gte=window_start,
+                    month__lt=window_end,
+                )
+                .order_by()
+                .values("unit_number")
+                .annotate(total=Sum("km_total"))
+            )
+            for row in grouped:
+                totals[row["unit_number"]] = row["total"]
+
+        return {
+            unit_number: totals[unit_key] / months if unit_key in totals else None
+            for unit_number, unit_key in requested.items()
+        }
+
+    def _fetch_km_since(self, unit_key: str, from_date: date) -> Decimal | None:
+        latest = (
+            KilometrageRecordModel.objects.filter(unit_number=unit_key)
+            .order_by("-record_date")
+            .values("record_date", "cumulative_km")
+            .first()
+        )
+        previous = None
+        if latest is not None and latest["record_date"] >= from_date:
+            previous = (
+                KilometrageRecordModel.objects.filter(
+                    unit_number=unit_key,
+                    record_date__lt=from_date,
+                )
+                .order_by("-record_date")
+                .values("record_date", "cumulative_km")
+                .first()
+            )
+        resolved, value = self._km_since_from_cumulative(latest, previous, from_date)
+        if resolved:
+            return value
+        return self._sum_km_since(unit_key, from_date)
+
+    def get_km_at_or_before_bulk(
+        self, pairs: Iterable[tuple[str, date]]
+    ) -> dict[tuple[str, date], Decimal | None]:
+        """Return the km value at or before each (unit_number, date) pair.
+
+        Args:
+            pairs: (unit_number, cutoff date) lookups.
+
+        Returns:
+            Mapping from each requested pair to its km value (None if no record).
+        """
+
+        requested = {pair: self._normalize_pair(pair) for pair in pairs}
+        rows = self._rows_at_or_before(set(requested.values()))
+        return {
+            pair: row["km_value"] if (row := rows.get(key)) else None
+            for pair, key in requested.items()
+        }
+
+    def get_km_since_bulk(
+        self, pairs: Iterable[tuple[str, date]]
+    ) -> dict[tuple[str, date], Decimal | None]:
+        """Return total kilometers since each (unit_number, date) pair.
+
+        Latest and previous records for every pair are resolved together and
+        the totals come from their cumulative values; pairs whose records are
+        not indexed yet fall back to a SUM query.
+
+        Args:
+            pairs: (unit_number, starting date inclusive) lookups.
+
+        Returns:
+            Mapping from each requested pair to its total (None if no records).
+        """
+
+        results: dict[tuple[str, date], Decimal | None] = {}
+        requested: dict[tuple[str, date], tuple[str, date]] = {}
+        for pair in pairs:
+            unit_key, from_date = self._normalize_pair(pair)
+            cached = self._cache.get(("since", unit_key, from_date))
+            if cached is KilometrageLookupCache.MISSING:
+                requested[pair] = (unit_key, from_date)
+            else:
+                results[pair] = cached
+
+        lookup_keys: set[tuple[str, date]] = set()
+        for unit_key, from_date in requested.values():
+            lookup_keys.add((unit_key, date.max))
+            if from_date > date.min:
+                lookup_keys.add((unit_key, from_date - timedelta(days=1)))
+        rows = self._rows_at_or_before(lookup_keys)
+
+        for pair, (unit_key, from_date) in requested.items():
+            latest = rows.get((unit_key, date.max))
+            previous = None
+            if from_date > date.min:
+                previous = rows.get((unit_key, from_date - timedelta(days=1)))
+            resolved, value = self._km_since_from_cumulative(
+                latest, previous, from_date
+            )
+            if not resolved:
+                value = self._sum_km_since(unit_key, from_date)
+            self._cache.set(("since", unit_key, from_date), value)
+            results[pair] = value
+        return results
+
+    def get_latest_km_bulk(
+        self, unit_numbers: Iterable[str]
+    ) -> dict[str, Decimal | None]:
+        """Return the latest km value for each unit number."""
+
+        requested = {
+            unit_number: (unit_number.strip().upper(), date.max)
+            for unit_number in unit_numbers
+        }
+        rows = self._rows_at_or_before(set(requested.values()))
+        return {
+            unit_number: row["km_value"] if (row := rows.get(key)) else None
+            for unit_number, key in requested.items()
+        }
+
+    def get_km_for_month_bulk(
+        self, items: Iterable[tuple[str, int, int]]
+    ) -> dict[tuple[str, int, int], Decimal | None]:
+        """Return total kilometers for each (unit_number, year, month) item.
+
+        Totals come from the monthly rollup; items it lacks are answered by
+        one grouped SUM over the daily records per chunk of units.
+        """
+
+        requested = {
+            item: (item[0].strip().upper(), item[1], item[2]) for item in items
+        }
+        if not requested:
+            return {}
+
+        months = sorted({(year, month) for _, year, month in requested.values()})
+        first_year, first_month = months[0]
+        last_year, last_month = months[-1]
+        start = date(first_year, first_month, 1)
+        end = _add_months(date(last_year, last_month, 1), 1)
+
+        totals: dict[tuple[str, int, int], Decimal | None] = {}
+        unit_keys = sorted({unit_key for unit_key, _, _ in requested.values()})
+        for index in range(0, len(unit_keys), self.PAIR_CHUNK_SIZE):
+            for (
+                unit_key,
+                month_start,
+                km_total,
+            ) in KilometrageMonthlyModel.objects.filter(
+                unit_number__in=unit_keys[index : index + self.PAIR_CHUNK_SIZE],
+                month__gte=start,
+                month__lt=end,
+            ).values_list("unit_number", "month", "km_total"):
+                totals[(unit_key, month_start.year, month_start.month)] = km_total
+
+        # Months missing from the rollup are summed from the daily records.
+        missing_units = sorted(
+            {key[0] for key in requested.values() if key not in totals}
+        )
+        for index in range(0, len(missing_units), self.PAIR_CHUNK_SIZE):
+            chunk = missing_units[index : index + self.PAIR_CHUNK_SIZE]
+            # Matched case-insensitively, like the single-month fallback
+            grouped = (
+                KilometrageRecordModel.objects.filter(
+                    record_date__gte=start,
+                    record_date__lt=end,
+                )
+                .annotate(unit_key=Upper("unit_number"))
+                .filter(unit_key__in=chunk)
+                .order_by()
+                .annotate(month=TruncMonth("record_date"))
+                .values("unit_key", "month")
+                .annotate(total=Sum("km_value"))
+            )
+            for row in grouped:
+                month_start = row["month"]
+                totals.setdefault(
+                    (row["unit_key"], month_start.year, month_start.month),
+                    row["total"],
+                )
+
+        return {item: totals.get(key) for item, key in requested.items()}
+
+    def _cached(self, key: tuple, fetch: Callable[[], Decimal | None]):
+        value = self._cache.get(key)
+        if value is KilometrageLookupCache.MISSING:
+            value = fetch()
+            self._cache.set(key, value)
+        return value
+
+    @staticmethod
+    def _normalize_pair(pair: tuple[str, date]) -> tuple[str, date]:
+        unit_number, target_date = pair
+        return unit_number.strip().upper(), target_date
+
+    @staticmethod
+    def _km_since_from_cumulative(
+        latest: dict | None,
+        previous: dict | None,
+        from_date: date,
+    ) -> tuple[bool, Decimal | None]:
+        """Resolve km-since from cumulative rows.
+
+        Returns (resolved, value); resolved is False when the rows involved
+        carry no cumulative value and the caller must fall back to SUM.
+        """
+        if latest is None or latest["cumulative_km"] is None:
+            return False, None
+        if latest["record_date"] < from_date:
+            return True, None
+        if previous is None:
+            return True, latest["cumulative_km"]
+        if previous["cumulative_km"] is None:
+            return False, None
+        return True, latest["cumulative_km"] - previous["cumulative_km"]
+
+    @staticmethod
+    def _sum_km_since(unit_key: str, from_date: date) -> Decimal | None:
         result = KilometrageRecordModel.objects.filter(
             unit_number__iexact=unit_key,
-            record_date__year=year,
-            record_date__month=month,
+            record_date__gte=from_date,
         ).aggregate(total=Sum("km_value"))
         return result["total"] if result["total"] is not None else None
+
+    def _rows_at_or_before(
+        self, keys: set[tuple[str, date]]
+    ) -> dict[tuple[str, date], dict]:
+        """Return the last record at or before each (unit_key, date) key.
+
+        Each chunk of keys is resolved by a single statement: the keys are fed
+        as a VALUES table and a correlated ``LIMIT 1`` subquery walks
+        ``km_unit_date_idx`` backwards from each date. Keys without a record
+        are absent from the result.
+        """
+        if not keys:
+            return {}
+
+        table = connection.ops.quote_name(KilometrageRecordModel._meta.db_table)
+        ordered_keys = sorted(keys)
+        record_id_by_key: dict[tuple[str, date], uuid.UUID] = {}
+        for index in range(0, len(ordered_keys), self.PAIR_CHUNK_SIZE):
+            chunk = ordered_keys[index : index + self.PAIR_CHUNK_SIZE]
+            key_by_param = {
+                (unit_key, target_date.isoformat()): (unit_key, target_date)
+                for unit_key, target_date in chunk
+            }
+            values_sql = ", ".join(["(%s, %s)"] * len(chunk))
+            params = [value for param in key_by_param for value in param]
+            sql = (
+                f"WITH requested(unit_number, target_date) AS (VALUES {values_sql}) "
+                "SELECT requested.unit_number, requested.target_date, "
+                f"(SELECT k.id FROM {table} AS k "
+                "WHERE k.unit_number = requested.unit_number "
+                "AND k.record_date <= requested.target_date "
+                "ORDER BY k.record_date DESC LIMIT 1) "
+                "FROM requested"
+            )
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                for unit_key, target_iso, record_id in cursor.fetchall():
+                    if record_id is not None:
+                        record_id_by_key[key_by_param[(unit_key, target_iso)]] = (
+                            uuid.UUID(str(record_id))
+                        )
+
+        rows_by_id: dict[uuid.UUID, dict] = {}
+        record_ids = sorted(set(record_id_by_key.values()))
+        for index in range(0, len(record_ids), self.PAIR_CHUNK_SIZE):
+            for row in KilometrageRecordModel.objects.filter(
+                id__in=record_ids[index : index + self.PAIR_CHUNK_SIZE]
+            ).values("id", "record_date", "km_value", "cumulative_km"):
+                rows_by_id[row["id"]] = row
+
+        return {
+            key: rows_by_id[record_id]
+            for key, record_id in record_id_by_key.items()
+            if record_id in rows_by_id
+        }
+
+
+def _add_months(month_start: date, months: int) -> date:
+    """Shift a first-of-month date by a number of months."""
+    month_index = month_start.month - 1 + months
+    return date(month_start.year + month_index // 12, month_index % 12 + 1, 1)
@@ -3,11 +3,22 @@
 from __future__ import annotations
 
 import csv
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
 from dataclasses import dataclass
-from datetime import date, datetime
-from decimal import Decimal, InvalidOperation
+from datetime import date
+from decimal import Decimal
+from itertools import accumulate
 from pathlib import Path
 
+from apps.tickets.infrastructure.services.legacy_txt_parsing import parse_legacy_date
+from apps.tickets.infrastructure.services.row_decoders import (
+    CodeNormalizer,
+    parse_comma_decimal,
+)
+
 
 @dataclass(frozen=True)
 class KilometrageRecord:
@@ -18,12 +29,36 @@ class KilometrageRecord:
     km_value: Decimal
 
 
+@dataclass(frozen=True)
+class _UnitSeries:
+    """Date-sorted kilometrage of one unit with running totals.
+
+    ``prefix_km[i]`` is the sum of ``km_values[:i]``.
+    """
+
+    ordinals: array
+    km_values: tuple[Decimal, ...]
+    prefix_km: tuple[Decimal, ...]
+
+
 class LegacyKilometrageRepository:
-    """Load kilometrage values from legacy TXT exports."""
+    """Load kilometrage values from legacy TXT exports.
+
+    Both files are read in a single pass into a per-unit index that is kept
+    until one of them changes on disk (size or mtime); lookups are binary
+    searches over that index.
+    """
+
+    SOURCES = (
+        ("KilometrajeLocs.txt", "Locs"),
+        ("Kilometraje_CCRR.txt", "Coche"),
+    )
 
     def __init__(self, base_path: Path | None = None):
         self._base_path = base_path or Path("context/db-legacy")
-        self._cache: dict[str, list[KilometrageRecord]] = {}
+        self._index: dict[str, _UnitSeries] = {}
+        self._signature: tuple[tuple[str, int, int], ...] | None = None
+        self._lock = threading.Lock()
 
     def get_km_at_or_before(
         self, unit_number: str, target_date: date
@@ -38,12 +73,13 @@ class LegacyKilometrageRepository:
             Kilometer value if found, otherwise None.
         """
 
-        records = self._get_records(unit_number)
-        filtered = [r for r in records if r.record_date <= target_date]
-        if not filtered:
+        series = self._get_series(unit_number)
+        if series is None:
+            return None
+        position = bisect_right(series.ordinals, target_date.toordinal())
+        if position == 0:
             return None
-        filtered.sort(key=lambda r: r.record_date)
-        return filtered[-1].km_value
+        return series.km_values[position - 1]
 
     def get_km_since(self, unit_number: str, from_date: date) -> Decimal | None:
         """Return total kilometers since a given date.
@@ -59,76 +95,97 @@ class LegacyKilometrageRepository:
             Total kilometers accumulated since from_date, or None if no records.
         """
 
-        records = self._get_records(unit_number)
-        filtered = [r for r in records if r.record_date >= from_date]
-        if not filtered:
+        series = self._get_series(unit_number)
+        if series is None:
             return None
-        filtered.sort(key=lambda r: r.record_date)
-        total_km = sum((r.km_value for r in filtered), Decimal("0"))
-        return total_km
+        position = bisect_left(series.ordinals, from_date.toordinal())
+        if position == len(series.ordinals):
+            return None
+        return series.prefix_km[-1] - series.prefix_km[position]
 
     def get_latest_km(self, unit_number: str) -> Decimal | None:
         """Return latest kilometer value for a unit."""
 
-        records = self._get_records(unit_number)
-        if not records:
+        series = self._get_series(unit_number)
+        if series is None:
             return None
-        records.sort(key=lambda r: r.record_date)
-        return records[-1].km_value
+        return series.km_values[-1]
 
-    def _get_records(self, unit_number: str) -> list[KilometrageRecord]:
+    def _get_series(self, unit_number: str) -> _UnitSeries | None:
         unit_key = unit_number.strip().upper()
-        if unit_key in self._cache:
-            return self._cache[unit_key]
-
-        records = []
-        for file_name, unit_field in [
-            ("KilometrajeLocs.txt", "Locs"),
-            ("Kilometraje_CCRR.txt", "Coche"),
-        ]:
+        signature = self._current_signature()
+        with self._lock:
+            if signature != self._signature:
+                self._index = self._build_index()
+                self._signature = signature
+            return self._index.get(unit_key)
+
+    def _current_signature(self) -> tuple[tuple[str, int, int], ...]:
+        signature = []
+        for file_name, _ in self.SOURCES:
+            try:
+                stat = (self._base_path / file_name).stat()
+            except OSError:
+                continue
+            signature.append((file_name, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _build_index(self) -> dict[str, _UnitSeries]:
+        records_by_unit: dict[str, list[tuple[int, Decimal]]] = {}
+        for file_name, unit_field in self.SOURCES:
             file_path = self._base_path / file_name
             if not file_path.exists():
                 continue
-            records.extend(self._read_file(file_path, unit_field, unit_key))
+            for unit_key, record_date, km_value in self._read_file(
+                file_path, unit_field
+            ):
+                records_by_unit.setdefault(unit_key, []).append(
+                    (record_date.toordinal(), km_value)
+                )
 
-        self._cache[unit_key] = records
-        return records
+        index: dict[str, _UnitSeries] = {}
+        for unit_key, records in records_by_unit.items():
+            # Stable sort: same-date rows keep file order (Locs before CCRR).
+            records.sort(key=lambda item: item[0])
+            km_values = tuple(km for _, km in records)
+            index[unit_key] = _UnitSeries(
+                ordinals=array("l", (ordinal for ordinal, _ in records)),
+                km_values=km_values,
+                prefix_km=tuple(accumulate(km_values, initial=Decimal("0"))),
+            )
+        return index
 
     def _read_file(
-        self, file_path: Path, unit_field: str, unit_key: str
-    ) -> list[KilometrageRecord]:
-        records: list[KilometrageRecord] = []
-        with open(file_path, encoding="latin-1") as handle:
-            reader = csv.DictReader(handle, delimiter=";")
+        self, file_path: Path, unit_field: str
+    ) -> Iterator[tuple[str, date, Decimal]]:
+        with open(file_path, encoding="latin-1", newline="") as handle:
+            reader = csv.reader(handle, delimiter=";")
+            header = next(reader, None)
+            if header is None:
+                return
+            columns = {name.strip(): position for position, name in enumerate(header)}
+            try:
+                unit_column = columns[unit_field]
+                date_column = columns["Fecha"]
+                km_column = columns["Kms_diario"]
+            except KeyError:
+                return
+            width = max(unit_column, date_column, km_column) + 1
+            normalize_unit = CodeNormalizer()
             for row in reader:
-                raw_unit = (row.get(unit_field) or "").strip().upper()
-                if raw_unit != unit_key:
+                if len(row) < width:
                     continue
-                raw_date = (row.get("Fecha") or "").strip()
-                raw_km = (row.get("Kms_diario") or "").strip()
-                if raw_km:
-                    raw_km = raw_km.replace(",", ".")
-                parsed_date = self._parse_date(raw_date)
+                unit_key = normalize_unit(row[unit_column])
+                if not unit_key:
+                    continue
+                parsed_date = self._parse_date(row[date_column])
                 if not parsed_date:
                     continue
-                try:
-                    km_value = Decimal(raw_km)
-                except (InvalidOperation, ValueError):
+                km_value = parse_comma_decimal(row[km_column].strip())
+                if km_value is None:
                     continue
-                records.append(
-                    KilometrageRecord(
-                        unit_number=unit_key,
-                        record_date=parsed_date,
-                        km_value=km_value,
-                    )
-                )
-        return records
+                yield unit_key, parsed_date, km_value
 
     @staticmethod
     def _parse_date(value: str) -> date | None:
-        if not value:
-            return None
-        try:
-            return datetime.strptime(value, "%d/%m/%Y").date()
-        except ValueError:
-            return None
+        return parse_legacy_date(value)
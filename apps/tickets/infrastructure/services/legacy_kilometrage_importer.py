@@ -3,13 +3,29 @@
 from __future__ import annotations
 
 import csv
-from datetime import date, datetime
-from decimal import Decimal, InvalidOperation
+import uuid
+from collections.abc import Iterator
+from datetime import date
+from decimal import Decimal
+from itertools import islice
 from pathlib import Path
 
+from django.db import connection, transaction
 from django.db.models import Max
+from django.utils import timezone
 
 from apps.tickets.application.use_cases.legacy_sync_use_case import SyncStats
+from apps.tickets.infrastructure.services.kilometrage_cumulative_index import (
+    KilometrageCumulativeIndex,
+)
+from apps.tickets.infrastructure.services.kilometrage_monthly_rollup import (
+    KilometrageMonthlyRollup,
+)
+from apps.tickets.infrastructure.services.legacy_txt_parsing import (
+    parse_file_in_processes,
+    parse_kilometrage_row,
+    parse_legacy_date,
+)
 from apps.tickets.models import KilometrageRecordModel, MaintenanceUnitModel
 
 
@@ -23,6 +39,32 @@ class LegacyKilometrageImporter:
         ("Kilometraje_CCRR.txt", "Coche"),
     ]
     BATCH_SIZE = 1000
+    DIRECT_BATCH_SIZE = 10000
+    SOURCE = "legacy_csv"
+    # Files smaller than this are parsed in-process even with parse_workers
+    PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+    def __init__(
+        self,
+        cumulative_index: KilometrageCumulativeIndex | None = None,
+        monthly_rollup: KilometrageMonthlyRollup | None = None,
+        direct_insert: bool = False,
+        parse_workers: int = 1,
+    ) -> None:
+        """Create the importer.
+
+        ``direct_insert`` streams rows into ``INSERT OR IGNORE`` with
+        ``executemany`` instead of building model instances and pre-checking
+        existing keys. It applies to SQLite writes only; dry runs and other
+        backends keep the ORM path.
+
+        ``parse_workers`` > 1 parses large files in that many processes (0
+        uses every core); inserts stay in this process.
+        """
+        self._cumulative_index = cumulative_index or KilometrageCumulativeIndex()
+        self._monthly_rollup = monthly_rollup or KilometrageMonthlyRollup()
+        self._direct_insert = direct_insert
+        self._parse_workers = parse_workers
 
     def import_all(
         self,
@@ -90,58 +132,52 @@ class LegacyKilometrageImporter:
                 invalid=0,
             )
 
+        if self._direct_insert and not dry_run and connection.vendor == "sqlite":
+            return self._import_file_direct(
+                file_path, unit_field, unit_id_by_number, latest_by_unit, full_import
+            )
+
         processed = 0
         inserted = 0
         skipped_old = 0
         invalid = 0
         batch = []
+        start_by_unit: dict[str, date | None] = {}
 
-        with open(file_path, encoding="latin-1") as handle:
-            reader = csv.DictReader(handle, delimiter=self.DELIMITER)
-            for row in reader:
-                processed += 1
-                unit_number = (row.get(unit_field) or "").strip().upper()
-                if not unit_number:
-                    invalid += 1
-                    continue
-
-                parsed_date = self._parse_date((row.get("Fecha") or "").strip())
-                if not parsed_date:
-                    invalid += 1
-                    continue
+        for parsed in self._iter_parsed(file_path, unit_field):
+            processed += 1
+            if parsed is None:
+                invalid += 1
+                continue
+            unit_number, parsed_date, km_value = parsed
 
-                raw_km = (row.get("Kms_diario") or "").strip()
-                if raw_km:
-                    raw_km = raw_km.replace(",", ".")
-                try:
-                    km_value = Decimal(raw_km)
-                except (InvalidOperation, ValueError):
-                    invalid += 1
+            if not full_import:
+                last_date = latest_by_unit.get(unit_number)
+                if last_date and parsed_date <= last_date:
+                    skipped_old += 1
                     continue
 
-                if not full_import:
-                    last_date = latest_by_unit.get(unit_number)
-                    if last_date and parsed_date <= last_date:
-                        skipped_old += 1
-                        continue
-
-                unit_id = unit_id_by_number.get(unit_number)
-                batch.append(
-                    KilometrageRecordModel(
-                        maintenance_unit_id=unit_id,
-                        unit_number=unit_number,
-                        record_date=parsed_date,
-                        km_value=km_value,
-                        source="legacy_csv",
-                    )
+            unit_id = unit_id_by_number.get(unit_number)
+            batch.append(
+                KilometrageRecordModel(
+                    maintenance_unit_id=unit_id,
+                    unit_number=unit_number,
+                    record_date=parsed_date,
+                    km_value=km_value,
+                    source=self.SOURCE,
                 )
+            )
+            self._cumulative_index.track(start_by_unit, unit_number, parsed_date)
 
-                if len(batch) >= self.BATCH_SIZE:
-                    inserted += self._flush_batch(batch, dry_run)
-                    batch = []
+            if len(batch) >= self.BATCH_SIZE:
+                inserted += self._flush_batch(batch, dry_run)
+                batch = []
 
         if batch:
             inserted += self._flush_batch(batch, dry_run)
+        if not dry_run and start_by_unit:
+            self._cumulative_index.refresh_units(start_by_unit)
+            self._monthly_rollup.refresh_units(start_by_unit)
 
         return SyncStats(
             processed=processed,
@@ -151,14 +187,127 @@ class LegacyKilometrageImporter:
             invalid=invalid,
         )
 
+    def _import_file_direct(
+        self,
+        file_path: Path,
+        unit_field: str,
+        unit_id_by_number: dict[str, str],
+        latest_by_unit: dict[str, date],
+        full_import: bool,
+    ) -> SyncStats:
+        """Stream parsed rows into ``INSERT OR IGNORE`` in one transaction.
+
+        The unique (unit_number, record_date) constraint drops duplicates, so
+        no existing keys are read beforehand; the cursor's rowcount gives the
+        rows actually inserted.
+        """
+        counts = {"processed": 0, "skipped_old": 0, "invalid": 0}
+        unit_fk_field = KilometrageRecordModel._meta.get_field("maintenance_unit")
+        unit_db_id_by_number = {
+            number: unit_fk_field.get_db_prep_save(unit_id, connection)
+            for number, unit_id in unit_id_by_number.items()
+        }
+        start_by_unit: dict[str, date | None] = {}
+        km_field = KilometrageRecordModel._meta.get_field("km_value")
+        now = KilometrageRecordModel._meta.get_field("created_at").get_db_prep_save(
+            timezone.now(), connection
+        )
+
+        def params() -> Iterator[tuple]:
+            for parsed in self._iter_parsed(file_path, unit_field):
+                counts["processed"] += 1
+                if parsed is None:
+                    counts["invalid"] += 1
+                    continue
+                unit_number, parsed_date, km_value = parsed
+                if not full_import:
+                    last_date = latest_by_unit.get(unit_number)
+                    if last_date and parsed_date <= last_date:
+                        counts["skipped_old"] += 1
+                        continue
+                self._cumulative_index.track(start_by_unit, unit_number, parsed_date)
+                yield (
+                    uuid.uuid4().hex,
+                    now,
+                    now,
+                    unit_db_id_by_number.get(unit_number),
+                    unit_number,
+                    parsed_date.isoformat(),
+                    connection.ops.adapt_decimalfield_value(
+                        km_value, km_field.max_digits, km_field.decimal_places
+                    ),
+                    self.SOURCE,
+                )
+
+        inserted = 0
+        rows = params()
+        with transaction.atomic(), connection.cursor() as cursor:
+            sql = self._direct_insert_sql()
+            while chunk := list(islice(rows, self.DIRECT_BATCH_SIZE)):
+                cursor.executemany(sql, chunk)
+                inserted += max(cursor.rowcount, 0)
+            if start_by_unit:
+                self._cumulative_index.refresh_units(start_by_unit)
+                self._monthly_rollup.refresh_units(start_by_unit)
+
+        return SyncStats(
+            processed=counts["processed"],
+            inserted=inserted,
+            skipped_old=counts["skipped_old"],
+            duplicates=0,
+            invalid=counts["invalid"],
+        )
+
+    @staticmethod
+    def _direct_insert_sql() -> str:
+        opts = KilometrageRecordModel._meta
+        columns = ", ".join(
+            connection.ops.quote_name(opts.get_field(name).column)
+            for name in (
+                "id",
+                "created_at",
+                "updated_at",
+                "maintenance_unit",
+                "unit_number",
+                "record_date",
+                "km_value",
+                "source",
+            )
+        )
+        return (
+            f"INSERT OR IGNORE INTO {connection.ops.quote_name(opts.db_table)} "
+            f"({columns}) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"
+        )
+
+    def _iter_parsed(
+        self, file_path: Path, unit_field: str
+    ) -> Iterator[tuple[str, date, Decimal] | None]:
+        """Yield parsed rows (None for invalid ones) from a TXT export."""
+        if (
+            self._parse_workers != 1
+            and file_path.stat().st_size >= self.PARALLEL_MIN_BYTES
+        ):
+            yield from parse_file_in_processes(
+                file_path,
+                parse_kilometrage_row,
+                unit_field,
+                workers=self._parse_workers,
+                delimiter=self.DELIMITER,
+            )
+            return
+        with open(file_path, encoding="latin-1") as handle:
+            for row in csv.DictReader(handle, delimiter=self.DELIMITER):
+                yield self._parse_row(row, unit_field)
+
+    @staticmethod
+    def _parse_row(
+        row: dict[str, str | None], unit_field: str
+    ) -> tuple[str, date, Decimal] | None:
+        return parse_kilometrage_row(row, unit_field)
+
     @staticmethod
     def _parse_date(value: str) -> date | None:
-        if not value:
-            return None
-        try:
-            return datetime.strptime(value, "%d/%m/%Y").date()
-        except ValueError:
-            return None
+        return parse_legacy_date(value)
 
     @staticmethod
     def _flush_batch(batch, dry_run: bool) -> int:
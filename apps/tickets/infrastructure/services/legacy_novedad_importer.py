@@ -4,11 +4,17 @@ from __future__ import annotations
 
 import csv
 import uuid
-from dataclasses import dataclass
-from datetime import date, datetime
+from collections.abc import Iterator
+from datetime import date
 from pathlib import Path
 
 from apps.tickets.application.use_cases.legacy_sync_use_case import SyncStats
+from apps.tickets.infrastructure.services.legacy_txt_parsing import (
+    LegacyNovedadRow,
+    parse_file_in_processes,
+    parse_legacy_date,
+    parse_novedad_row,
+)
 from apps.tickets.models import (
     IntervencionTipoModel,
     LugarModel,
@@ -17,23 +23,20 @@ from apps.tickets.models import (
 )
 
 
-@dataclass(frozen=True)
-class _NovedadRow:
-    unit_code: str
-    fecha_desde: date
-    fecha_hasta: date | None
-    fecha_estimada: date | None
-    intervencion_codigo: str
-    lugar_codigo: str
-    observaciones: str | None
-
-
 class LegacyNovedadImporter:
     """Import detenciones from legacy TXT exports."""
 
     DEFAULT_PATH = Path("context/db-legacy")
     DELIMITER = ";"
     BATCH_SIZE = 1000
+    # Files smaller than this are parsed in-process even with parse_workers
+    PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+    def __init__(self, parse_workers: int = 1) -> None:
+        """``parse_workers`` > 1 parses large files in that many processes
+        (0 uses every core); deduplication and inserts stay in this process.
+        """
+        self._parse_workers = parse_workers
 
     def import_detenciones(
         self,
@@ -114,72 +117,69 @@ class LegacyNovedadImporter:
         invalid = 0
         batch: list[NovedadModel] = []
 
-        with open(file_path, "r", encoding="latin-1") as handle:
-            reader = csv.DictReader(handle, delimiter=self.DELIMITER)
-            for row in reader:
-                processed += 1
-                parsed = self._parse_row(row, unit_field)
-                if not parsed:
-                    invalid += 1
-                    continue
-
-                fecha_hasta_key = self._normalize_optional_date(parsed.fecha_hasta)
-                dup_key = (
-                    parsed.unit_code,
-                    str(parsed.fecha_desde),
-                    fecha_hasta_key,
-                    parsed.intervencion_codigo,
-                    parsed.lugar_codigo,
-                )
-                if dup_key in existing_records:
-                    duplicates += 1
-                    continue
+        for parsed in self._iter_parsed(file_path, unit_field):
+            processed += 1
+            if not parsed:
+                invalid += 1
+                continue
+
+            fecha_hasta_key = self._normalize_optional_date(parsed.fecha_hasta)
+            dup_key = (
+                parsed.unit_code,
+                str(parsed.fecha_desde),
+                fecha_hasta_key,
+                parsed.intervencion_codigo,
+                parsed.lugar_codigo,
+            )
+            if dup_key in existing_records:
+                duplicates += 1
+                continue
 
-                intervencion = intervenciones_by_codigo.get(parsed.intervencion_codigo)
-                legacy_intervencion_codigo = (
-                    parsed.intervencion_codigo if not intervencion else None
-                )
+            intervencion = intervenciones_by_codigo.get(parsed.intervencion_codigo)
+            legacy_intervencion_codigo = (
+                parsed.intervencion_codigo if not intervencion else None
+            )
 
-                maintenance_unit = units_by_number.get(parsed.unit_code)
-                legacy_unit_code = parsed.unit_code if not maintenance_unit else None
-
-                lugar = None
-                legacy_lugar_codigo = None
-                if parsed.lugar_codigo:
-                    try:
-                        lugar_codigo = int(parsed.lugar_codigo)
-                        lugar = lugares_by_codigo.get(lugar_codigo)
-                        if not lugar:
-                            legacy_lugar_codigo = lugar_codigo
-                    except ValueError:
-                        legacy_lugar_codigo = None
-
-                if dry_run:
-                    inserted += 1
-                    existing_records.add(dup_key)
-                    continue
-
-                batch.append(
-                    NovedadModel(
-                        id=uuid.uuid4(),
-                        maintenance_unit=maintenance_unit,
-                        legacy_unit_code=legacy_unit_code,
-                        fecha_desde=parsed.fecha_desde,
-                        fecha_hasta=parsed.fecha_hasta,
-                        fecha_estimada=parsed.fecha_estimada,
-                        intervencion=intervencion,
-                        legacy_intervencion_codigo=legacy_intervencion_codigo,
-                        lugar=lugar,
-                        legacy_lugar_codigo=legacy_lugar_codigo,
-                        observaciones=parsed.observaciones,
-                        is_legacy=True,
-                    )
-                )
+            maintenance_unit = units_by_number.get(parsed.unit_code)
+            legacy_unit_code = parsed.unit_code if not maintenance_unit else None
+
+            lugar = None
+            legacy_lugar_codigo = None
+            if parsed.lugar_codigo:
+                try:
+                    lugar_codigo = int(parsed.lugar_codigo)
+                    lugar = lugares_by_codigo.get(lugar_codigo)
+                    if not lugar:
+                        legacy_lugar_codigo = lugar_codigo
+                except ValueError:
+                    legacy_lugar_codigo = None
+
+            if dry_run:
+                inserted += 1
                 existing_records.add(dup_key)
+                continue
+
+            batch.append(
+                NovedadModel(
+                    id=uuid.uuid4(),
+                    maintenance_unit=maintenance_unit,
+                    legacy_unit_code=legacy_unit_code,
+                    fecha_desde=parsed.fecha_desde,
+                    fecha_hasta=parsed.fecha_hasta,
+                    fecha_estimada=parsed.fecha_estimada,
+                    intervencion=intervencion,
+                    legacy_intervencion_codigo=legacy_intervencion_codigo,
+                    lugar=lugar,
+                    legacy_lugar_codigo=legacy_lugar_codigo,
+                    observaciones=parsed.observaciones,
+                    is_legacy=True,
+                )
+            )
+            existing_records.add(dup_key)
 
-                if len(batch) >= self.BATCH_SIZE:
-                    inserted += self._flush_batch(batch)
-                    batch = []
+            if len(batch) >= self.BATCH_SIZE:
+                inserted += self._flush_batch(batch)
+                batch = []
 
         if batch and not dry_run:
             inserted += self._flush_batch(batch)
@@ -192,39 +192,33 @@ class LegacyNovedadImporter:
             invalid=invalid,
         )
 
-    def _parse_row(self, row: dict[str, str], unit_field: str) -> _NovedadRow | None:
-        unit_code = (row.get(unit_field) or "").strip()
-        if not unit_code:
-            return None
-
-        fecha_desde = self._parse_date((row.get("Fecha_desde") or "").strip())
-        if not fecha_desde:
-            return None
-
-        fecha_hasta = self._parse_date((row.get("Fecha_hasta") or "").strip())
-        fecha_estimada = self._parse_date((row.get("Fecha_est") or "").strip())
-        intervencion_codigo = (row.get("Intervencion") or "").strip()
-        lugar_codigo = (row.get("Lugar") or "").strip()
-        observaciones = (row.get("Observaciones") or "").strip() or None
-
-        return _NovedadRow(
-            unit_code=unit_code,
-            fecha_desde=fecha_desde,
-            fecha_hasta=fecha_hasta,
-            fecha_estimada=fecha_estimada,
-            intervencion_codigo=intervencion_codigo,
-            lugar_codigo=lugar_codigo,
-            observaciones=observaciones,
-        )
+    def _iter_parsed(
+        self, file_path: Path, unit_field: str
+    ) -> Iterator[LegacyNovedadRow | None]:
+        """Yield parsed rows (None for invalid ones) from a TXT export."""
+        if (
+            self._parse_workers != 1
+            and file_path.stat().st_size >= self.PARALLEL_MIN_BYTES
+        ):
+            yield from parse_file_in_processes(
+                file_path,
+                parse_novedad_row,
+                unit_field,
+                workers=self._parse_workers,
+                delimiter=self.DELIMITER,
+            )
+            return
+        with open(file_path, "r", encoding="latin-1") as handle:
+            for row in csv.DictReader(handle, delimiter=self.DELIMITER):
+                yield self._parse_row(row, unit_field)
+
+    @staticmethod
+    def _parse_row(row: dict[str, str], unit_field: str) -> LegacyNovedadRow | None:
+        return parse_novedad_row(row, unit_field)
 
     @staticmethod
     def _parse_date(value: str) -> date | None:
-        if not value:
-            return None
-        try:
-            return datetime.strptime(value, "%d/%m/%Y").date()
-        except ValueError:
-            return None
+        return parse_legacy_date(value)
 
     @staticmethod
     def _normalize_optional_date(value: date | None) -> date | None:
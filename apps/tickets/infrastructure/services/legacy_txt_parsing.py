@@ -0,0 +1,181 @@
+"""Row parsing for legacy TXT exports, optionally spread over processes.
+
+Nothing here touches Django, so the functions can run in
+``ProcessPoolExecutor`` workers, which on Windows start a fresh interpreter
+without the app registry.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+from apps.tickets.infrastructure.services.row_decoders import (
+    LEGACY_DATE_FORMATS,
+    CodeNormalizer,
+    DateDecoder,
+    parse_comma_decimal,
+)
+
+ENCODING = "latin-1"
+
+# Per-process decoders; every legacy date column is dd/mm/yyyy
+parse_legacy_date = DateDecoder(LEGACY_DATE_FORMATS)
+_upper_codes = CodeNormalizer(upper=True)
+_codes = CodeNormalizer(upper=False)
+
+
+@dataclass(frozen=True)
+class LegacyNovedadRow:
+    unit_code: str
+    fecha_desde: date
+    fecha_hasta: date | None
+    fecha_estimada: date | None
+    intervencion_codigo: str
+    lugar_codigo: str
+    observaciones: str | None
+
+
+def parse_kilometrage_row(
+    row: dict[str, str | None], unit_field: str
+) -> tuple[str, date, Decimal] | None:
+    """Return ``(unit_number, record_date, km_value)`` or None if invalid."""
+    unit_number = _upper_codes(row.get(unit_field))
+    if not unit_number:
+        return None
+
+    parsed_date = parse_legacy_date(row.get("Fecha"))
+    if not parsed_date:
+        return None
+
+    km_value = parse_comma_decimal((row.get("Kms_diario") or "").strip())
+    if km_value is None:
+        return None
+    return unit_number, parsed_date, km_value
+
+
+def parse_novedad_row(
+    row: dict[str, str | None], unit_field: str
+) -> LegacyNovedadRow | None:
+    unit_code = _codes(row.get(unit_field))
+    if not unit_code:
+        return None
+
+    fecha_desde = parse_legacy_date(row.get("Fecha_desde"))
+    if not fecha_desde:
+        return None
+
+    return LegacyNovedadRow(
+        unit_code=unit_code,
+        fecha_desde=fecha_desde,
+        fecha_hasta=parse_legacy_date(row.get("Fecha_hasta")),
+        fecha_estimada=parse_legacy_date(row.get("Fecha_est")),
+        intervencion_codigo=_codes(row.get("Intervencion")) or "",
+        lugar_codigo=_codes(row.get("Lugar")) or "",
+        observaciones=(row.get("Observaciones") or "").strip() or None,
+    )
+
+
+def split_line_chunks(
+    file_path: Path, chunk_count: int, delimiter: str
+) -> tuple[list[str], list[tuple[int, int]]]:
+    """Return the header and ``chunk_count`` byte ranges ending on newlines.
+
+    Assumes one record per physical line, which holds for the Access TXT
+    exports (no quoted multi-line fields).
+    """
+    size = file_path.stat().st_size
+    with open(file_path, "rb") as handle:
+        header_line = handle.readline()
+        fieldnames = next(
+            csv.reader([header_line.decode(ENCODING)], delimiter=delimiter), []
+        )
+        data_start = handle.tell()
+        step = max((size - data_start) // max(chunk_count, 1), 1)
+
+        ranges = []
+        start = data_start
+        while start < size:
+            handle.seek(min(start + step, size))
+            handle.readline()
+            end = min(handle.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return fieldnames, ranges
+
+
+def iter_chunk_rows(
+    file_path: Path,
+    start: int,
+    end: int,
+    fieldnames: list[str],
+    delimiter: str,
+) -> Iterator[dict[str, str | None]]:
+    with open(file_path, "rb") as handle:
+        handle.seek(start)
+        text = handle.read(end - start).decode(ENCODING)
+    yield from csv.DictReader(
+        io.StringIO(text, newline=""), fieldnames=fieldnames, delimiter=delimiter
+    )
+
+
+def _parse_chunk(
+    file_path: Path,
+    start: int,
+    end: int,
+    fieldnames: list[str],
+    delimiter: str,
+    parse_row: Callable,
+    unit_field: str,
+) -> tuple[list, int]:
+    rows = []
+    invalid = 0
+    for row in iter_chunk_rows(file_path, start, end, fieldnames, delimiter):
+        parsed = parse_row(row, unit_field)
+        if parsed is None:
+            invalid += 1
+        else:
+            rows.append(parsed)
+    return rows, invalid
+
+
+def parse_file_in_processes(
+    file_path: Path,
+    parse_row: Callable,
+    unit_field: str,
+    workers: int,
+    delimiter: str = ";",
+) -> Iterator[object | None]:
+    """Parse a TXT export in worker processes, yielding rows in file order.
+
+    ``parse_row`` must be a module-level function of this module so it can
+    be pickled. Invalid rows are yielded as None, after the valid rows of
+    their chunk, so callers can count them like the sequential reader.
+    """
+    workers = workers or os.cpu_count() or 1
+    fieldnames, ranges = split_line_chunks(file_path, workers * 4, delimiter)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _parse_chunk,
+                file_path,
+                start,
+                end,
+                fieldnames,
+                delimiter,
+                parse_row,
+                unit_field,
+            )
+            for start, end in ranges
+        ]
+        for future in futures:
+            rows, invalid = future.result()
+            yield from rows
+            yield from [None] * invalid
@@ -0,0 +1,307 @@
+"""Digest-based reconciliation of Access Detenciones against SQLite novedades.
+
+Both sides are reduced to the business key ``(unit, fecha_desde,
+intervencion)`` that ``fg001.py`` compares. Keys are grouped into
+``(unit, year)`` buckets, and each bucket gets an order-independent digest:
+the count of distinct keys plus the sum of their 64-bit hashes. The
+fleet-wide pass keeps only the digests and the hashes (for deduplication) in
+memory. Keys are read again, from Access filtered by unit and from SQLite,
+only for the buckets whose digests differ, and those are diffed key by key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import date
+from pathlib import Path
+
+from django.db.models import Q
+
+from apps.tickets.infrastructure.services.access_extractor import AccessExtractor
+from apps.tickets.infrastructure.services.row_decoders import (
+    CodeNormalizer,
+    DateDecoder,
+)
+from apps.tickets.models import NovedadModel
+
+BusinessKey = tuple[str, date, str]
+Bucket = tuple[str, int]
+
+_HASH_MASK = (1 << 64) - 1
+
+
+@dataclass(frozen=True)
+class ReconciliationSource:
+    """One Access database holding a Detenciones table."""
+
+    label: str
+    db_path: Path
+    unit_field: str
+
+
+@dataclass
+class BucketDigest:
+    """Order-independent digest of the keys in one (unit, year) bucket."""
+
+    count: int = 0
+    total: int = 0
+
+    def add(self, key_hash: int) -> None:
+        self.count += 1
+        self.total = (self.total + key_hash) & _HASH_MASK
+
+
+@dataclass(frozen=True)
+class BucketDiff:
+    unit: str
+    year: int
+    access_keys: int
+    sqlite_keys: int
+    missing_in_sqlite: list[tuple[str, str]]
+    extra_in_sqlite: list[tuple[str, str]]
+
+
+@dataclass
+class ReconciliationReport:
+    """Outcome of a reconciliation run; ``to_dict`` is JSON-serializable."""
+
+    since_date: date
+    access_rows: int = 0
+    access_invalid_rows: int = 0
+    sqlite_rows: int = 0
+    units_compared: int = 0
+    units_differing: int = 0
+    buckets_compared: int = 0
+    diffs: list[BucketDiff] = field(default_factory=list)
+
+    @property
+    def missing_total(self) -> int:
+        return sum(len(diff.missing_in_sqlite) for diff in self.diffs)
+
+    @property
+    def extra_total(self) -> int:
+        return sum(len(diff.extra_in_sqlite) for diff in self.diffs)
+
+    @property
+    def is_consistent(self) -> bool:
+        return not self.diffs
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["since_date"] = self.since_date.isoformat()
+        data["missing_total"] = self.missing_total
+        data["extra_total"] = self.extra_total
+        return data
+
+
+def _key_hash(key: BusinessKey) -> int:
+    unit, fecha, intervencion = key
+    raw = f"{unit}|{fecha.isoformat()}|{intervencion}".encode()
+    return int.from_bytes(hashlib.blake2b(raw, digest_size=8).digest(), "big")
+
+
+def _bucket_digests(keys: Iterable[BusinessKey]) -> dict[Bucket, BucketDigest]:
+    """Digest distinct keys per (unit, year); duplicates count once."""
+    digests: dict[Bucket, BucketDigest] = defaultdict(BucketDigest)
+    seen: set[int] = set()
+    for key in keys:
+        key_hash = _key_hash(key)
+        if key_hash in seen:
+            continue
+        seen.add(key_hash)
+        digests[(key[0], key[1].year)].add(key_hash)
+    return dict(digests)
+
+
+class NovedadReconciliationService:
+    """Compare Access Detenciones with SQLite novedades by bucket digest."""
+
+    TABLE_NAME = "Detenciones"
+
+    def __init__(
+        self,
+        extractor: AccessExtractor,
+        sources: Iterable[ReconciliationSource],
+        db_password: str | None = None,
+        progress_every: int = 5000,
+        skip_count: bool = True,
+        log: Callable[[str], None] | None = None,
+    ) -> None:
+        self._extractor = extractor
+        self._sources = list(sources)
+        self._db_password = db_password
+        self._progress_every = progress_every
+        self._skip_count = skip_count
+        self._log = log or (lambda _message: None)
+        self._normalize = CodeNormalizer()
+
+    def reconcile(
+        self,
+        since_date: date = date(1900, 1, 1),
+        units: Iterable[str] | None = None,
+    ) -> ReconciliationReport:
+        """Reconcile every unit (or only ``units``) after ``since_date``.
+
+        The bound is exclusive on both sides, like the extractor's
+        ``[Fecha_desde] > #since#`` filter.
+        """
+        unit_filter = (
+            {code for code in (self._normalize(unit) for unit in units) if code}
+            if units is not None
+            else None
+        )
+        report = ReconciliationReport(since_date=since_date)
+
+        access_digests = _bucket_digests(
+            self._filtered_access_keys(since_date, unit_filter, report)
+        )
+        queryset = NovedadModel.objects.filter(fecha_desde__gt=since_date)
+        if unit_filter is not None:
+            queryset = queryset.filter(self._units_q(unit_filter))
+        sqlite_digests = _bucket_digests(
+            key
+            for key in self._sqlite_keys(queryset, report)
+            if unit_filter is None or key[0] in unit_filter
+        )
+
+        buckets = access_digests.keys() | sqlite_digests.keys()
+        report.buckets_compared = len(buckets)
+        report.units_compared = len({unit for unit, _ in buckets})
+        differing: dict[str, set[int]] = defaultdict(set)
+        for bucket in buckets:
+            if access_digests.get(bucket) != sqlite_digests.get(bucket):
+                differing[bucket[0]].add(bucket[1])
+        report.units_differing = len(differing)
+        self._log(
+            f"{report.buckets_compared} buckets compared, "
+            f"{sum(len(years) for years in differing.values())} differ "
+            f"in {len(differing)} units"
+        )
+
+        for unit in sorted(differing):
+            report.diffs.extend(self._drill_down(unit, differing[unit], since_date))
+        return report
+
+    def _filtered_access_keys(
+        self,
+        since_date: date,
+        unit_filter: set[str] | None,
+        report: ReconciliationReport,
+    ) -> Iterator[BusinessKey]:
+        # Units asked for by name are extracted with the unit filter;
+        # otherwise one fleet-wide pass per source.
+        unit_values = sorted(unit_filter) if unit_filter else [None]
+        for unit_value in unit_values:
+            for key in self._access_keys(since_date, unit_value, report):
+                if unit_filter is None or key[0] in unit_filter:
+                    yield key
+
+    def _access_keys(
+        self,
+        since_date: date,
+        unit_value: str | None,
+        report: ReconciliationReport | None = None,
+    ) -> Iterator[BusinessKey]:
+        decode_date = DateDecoder()
+        for source in self._sources:
+            if not source.db_path or not source.db_path.exists():
+                self._log(f"Skipping {source.label}: DB not found ({source.db_path})")
+                continue
+            self._log(
+                f"Reading {self.TABLE_NAME} from {source.label}"
+                + (f" for {unit_value}" if unit_value else "")
+            )
+            records = self._extractor.iter_records(
+                db_path=source.db_path,
+                table=self.TABLE_NAME,
+                unit_field=source.unit_field,
+                unit_value=unit_value,
+                since_date=since_date,
+                minimal_columns=True,
+                db_password=self._db_password,
+                progress_every=self._progress_every,
+                skip_count=self._skip_count,
+                source_label=source.label,
+            )
+            for record in records:
+                unit = self._normalize(record.get("Unidad"))
+                fecha = decode_date(record.get("Fecha_desde"))
+                intervencion = self._normalize(record.get("Intervencion"))
+                if report is not None:
+                    report.access_rows += 1
+                if not unit or not fecha or not intervencion:
+                    if report is not None:
+                        report.access_invalid_rows += 1
+                    continue
+                yield (unit, fecha, intervencion)
+
+    def _sqlite_keys(
+        self, queryset, report: ReconciliationReport | None = None
+    ) -> Iterator[BusinessKey]:
+        rows = queryset.values_list(
+            "maintenance_unit__number",
+            "legacy_unit_code",
+            "fecha_desde",
+            "intervencion__codigo",
+            "legacy_intervencion_codigo",
+        ).iterator(chunk_size=5000)
+        for unit_number, legacy_unit, fecha, codigo, legacy_codigo in rows:
+            if report is not None:
+                report.sqlite_rows += 1
+            unit = self._normalize(unit_number or legacy_unit)
+            intervencion = self._normalize(codigo or legacy_codigo)
+            if unit and fecha and intervencion:
+                yield (unit, fecha, intervencion)
+
+    @staticmethod
+    def _units_q(units: Iterable[str]) -> Q:
+        query = Q()
+        for unit in units:
+            query |= Q(maintenance_unit__number__iexact=unit)
+            query |= Q(legacy_unit_code__iexact=unit)
+        return query
+
+    def _drill_down(
+        self, unit: str, years: set[int], since_date: date
+    ) -> list[BucketDiff]:
+        access_keys = {
+            key
+            for key in self._access_keys(since_date, unit)
+            if key[0] == unit and key[1].year in years
+        }
+        sqlite_keys = {
+            key
+            for key in self._sqlite_keys(
+                NovedadModel.objects.filter(
+                    self._units_q([unit]),
+                    fecha_desde__gt=since_date,
+                    fecha_desde__year__in=years,
+                )
+            )
+            if key[0] == unit
+        }
+
+        diffs = []
+        for year in sorted(years):
+            access_year = {key for key in access_keys if key[1].year == year}
+            sqlite_year = {key for key in sqlite_keys if key[1].year == year}
+            diffs.append(
+                BucketDiff(
+                    unit=unit,
+                    year=year,
+                    access_keys=len(access_year),
+                    sqlite_keys=len(sqlite_year),
+                    missing_in_sqlite=_key_pairs(access_year - sqlite_year),
+                    extra_in_sqlite=_key_pairs(sqlite_year - access_year),
+                )
+            )
+        return diffs
+
+
+def _key_pairs(keys: set[BusinessKey]) -> list[tuple[str, str]]:
+    return [
+        (fecha.isoformat(), intervencion) for _, fecha, intervencion in sorted(keys)
+    ]
@@ -0,0 +1,160 @@
+"""SQLite FTS5 index over the searchable text of novedades.
+
+``novedad_fts`` (created in migration 0038) holds one row per novedad, with
+the same rowid as the ``novedad`` row. It has three indexed columns:
+
+- ``unit``: unit number and legacy code, plus the same codes without their
+  leading letters so "904" still finds "A904".
+- ``intervencion``: the intervention code and legacy code.
+- ``observaciones``.
+
+Triggers on ``novedad`` keep it in step on insert, update and delete. That
+covers ORM saves, ``bulk_create`` and the importers' raw INSERTs alike.
+A table rebuild during a migration drops them; ``db_triggers`` re-creates
+them after ``migrate``, and the index counts as unavailable while any is
+missing.
+``rebuild`` repopulates it from scratch, e.g. after a unit is renumbered
+or after VACUUM, which SQLite allows to renumber rowids.
+"""
+
+from __future__ import annotations
+
+import re
+
+from django.db import connection, transaction
+from django.db.models import QuerySet
+from django.db.models.expressions import RawSQL
+
+from apps.tickets.infrastructure.services.db_triggers import (
+    TriggerSet,
+    create_trigger,
+    missing_objects,
+)
+
+TABLE_NAME = "novedad_fts"
+
+_LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_UNIT_NUMBER = (
+    "coalesce((SELECT number FROM maintenance_unit "
+    "WHERE id = {row}.maintenance_unit_id), '')"
+)
+_INTERVENCION_CODIGO = (
+    "coalesce((SELECT codigo FROM intervencion_tipo "
+    "WHERE id = {row}.intervencion_id), '')"
+)
+# Column expressions over a novedad row aliased as {row}; the migration
+# triggers use the same text
+UNIT_TEXT_SQL = (
+    f"{_UNIT_NUMBER} || ' ' || coalesce({{row}}.legacy_unit_code, '') || ' ' || "
+    f"ltrim({_UNIT_NUMBER}, '{_LETTERS}') || ' ' || "
+    f"ltrim(coalesce({{row}}.legacy_unit_code, ''), '{_LETTERS}')"
+)
+INTERVENCION_TEXT_SQL = (
+    f"{_INTERVENCION_CODIGO} || ' ' || "
+    "coalesce({row}.legacy_intervencion_codigo, '')"
+)
+OBSERVACIONES_TEXT_SQL = "coalesce({row}.observaciones, '')"
+
+_INSERT_NEW = (
+    f"INSERT INTO {TABLE_NAME} "
+    "(rowid, novedad_id, unit, intervencion, observaciones) "
+    f"VALUES (NEW.rowid, NEW.id, {UNIT_TEXT_SQL.format(row='NEW')}, "
+    f"{INTERVENCION_TEXT_SQL.format(row='NEW')}, "
+    f"{OBSERVACIONES_TEXT_SQL.format(row='NEW')});"
+)
+_DELETE_OLD = f"DELETE FROM {TABLE_NAME} WHERE rowid = OLD.rowid;"
+_INDEXED_COLUMNS = (
+    "maintenance_unit_id, legacy_unit_code, intervencion_id, "
+    "legacy_intervencion_codigo, observaciones"
+)
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_match_query(text: str) -> str | None:
+    """Turn free text into an FTS5 query: every word, as a prefix, must match.
+
+    Words are quoted, so FTS5 operators typed by the user are taken
+    literally.
+    """
+    tokens = _TOKEN_RE.findall(text or "")
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+class NovedadSearchIndex:
+    """Query and maintain the ``novedad_fts`` full-text index."""
+
+    def is_available(self) -> bool:
+        """True when the index table and all of its triggers exist."""
+        if connection.vendor != "sqlite":
+            return False
+        return not missing_objects([TABLE_NAME, *NOVEDAD_FTS_TRIGGERS.create])
+
+    def search(self, queryset: QuerySet, text: str) -> QuerySet | None:
+        """Restrict ``queryset`` to FTS matches, best-ranked first.
+
+        Returns None when the text has no searchable words or the index is
+        missing, so the caller can fall back to its LIKE filters.
+        """
+        match = build_match_query(text)
+        if match is None or not self.is_available():
+            return None
+        table = queryset.model._meta.db_table
+        return (
+            queryset.filter(
+                pk__in=RawSQL(
+                    f"SELECT novedad_id FROM {TABLE_NAME} WHERE {TABLE_NAME} MATCH %s",
+                    (match,),
+                )
+            )
+            .annotate(
+                search_rank=RawSQL(
+                    f"SELECT rank FROM {TABLE_NAME} WHERE {TABLE_NAME} MATCH %s "
+                    f'AND {TABLE_NAME}.rowid = "{table}".rowid',
+                    (match,),
+                )
+            )
+            .order_by("search_rank", "-fecha_desde", "-created_at")
+        )
+
+    def rebuild(self) -> int:
+        """Repopulate the index from the novedad table; returns rows indexed."""
+        row = "n"
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {TABLE_NAME}")
+            cursor.execute(
+                f"INSERT INTO {TABLE_NAME} "
+                "(rowid, novedad_id, unit, intervencion, observaciones) "
+                f"SELECT {row}.rowid, {row}.id, "
+                f"{UNIT_TEXT_SQL.format(row=row)}, "
+                f"{INTERVENCION_TEXT_SQL.format(row=row)}, "
+                f"{OBSERVACIONES_TEXT_SQL.format(row=row)} "
+                f"FROM novedad AS {row}"
+            )
+            indexed = cursor.rowcount
+            cursor.execute(
+                f"INSERT INTO {TABLE_NAME}({TABLE_NAME}) VALUES ('optimize')"
+            )
+        return indexed
+
+
+NOVEDAD_FTS_TRIGGERS = TriggerSet(
+    tables=("novedad", TABLE_NAME),
+    create={
+        "novedad_fts_ai": create_trigger(
+            "novedad_fts_ai", "INSERT", "novedad", _INSERT_NEW
+        ),
+        "novedad_fts_ad": create_trigger(
+            "novedad_fts_ad", "DELETE", "novedad", _DELETE_OLD
+        ),
+        "novedad_fts_au": create_trigger(
+            "novedad_fts_au",
+            f"UPDATE OF {_INDEXED_COLUMNS}",
+            "novedad",
+            _DELETE_OLD + " " + _INSERT_NEW,
+        ),
+    },
+    resync=lambda: NovedadSearchIndex().rebuild(),
+)
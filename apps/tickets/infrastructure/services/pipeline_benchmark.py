@@ -0,0 +1,440 @@
+"""Synthetic-fleet benchmark of the sync and ingreso hot paths.
+
+``SyntheticFleet`` builds a deterministic fleet (locomotives and coaches,
+decades of daily km, novedades with weighted intervention codes) as the
+Access-shaped records the importers receive from the extractor.
+``PipelineBenchmark`` feeds those records through the real code paths in
+order: Access km import, Access novedad import, snapshot refresh, ingreso
+draft preparation and the novedad list view. It records wall time, rows
+and SQL statements per stage. The result is a JSON-serializable dict meant
+to be stored and compared across commits.
+
+Everything writes to the default database. Run it against a scratch
+database (see the ``benchmark_pipeline`` command), never the real one.
+"""
+
+from __future__ import annotations
+
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+
+import django
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.tickets.application.use_cases.maintenance_entry_use_case import (
+    MaintenanceEntryUseCase,
+)
+from apps.tickets.infrastructure.services.access_kilometrage_importer import (
+    AccessKilometrageImporter,
+)
+from apps.tickets.infrastructure.services.access_novedad_importer import (
+    AccessNovedadImporter,
+)
+from apps.tickets.infrastructure.services.unit_maintenance_snapshot_service import (
+    UnitMaintenanceSnapshotService,
+)
+from apps.tickets.models import (
+    BrandModel,
+    IntervencionTipoModel,
+    LocomotiveModel,
+    LocomotiveModelModel,
+    LugarModel,
+    MaintenanceUnitModel,
+    NovedadModel,
+)
+
+# Relative frequency of intervention codes per unit type; AL and CORR are
+# the day-to-day stops, numerals and general repairs are rare
+LOCOMOTIVE_INTERVENTIONS = {
+    "A": 30,
+    "AB": 10,
+    "ABC": 5,
+    "N1": 2,
+    "RG": 1,
+    "AL": 30,
+    "CORR": 22,
+}
+RAILCAR_INTERVENTIONS = {
+    "A": 30,
+    "AB": 10,
+    "ABC": 4,
+    "RP": 2,
+    "RG": 1,
+    "AL": 30,
+    "CORR": 23,
+}
+LUGAR_CODES = tuple(range(900, 912))
+
+
+@dataclass(frozen=True)
+class FleetProfile:
+    """Size and shape of the synthetic fleet."""
+
+    locomotives: int = 24
+    railcars: int = 24
+    years: int = 22
+    novedades_per_unit_year: int = 8
+    end_date: date | None = None
+    seed: int = 1
+
+    def resolved_end_date(self) -> date:
+        # Ending today keeps the list view's default 60-day window populated
+        return self.end_date or timezone.localdate()
+
+
+@dataclass
+class StageResult:
+    name: str
+    seconds: float
+    rows: int = 0
+    queries: int = 0
+    extra: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["rows_per_second"] = (
+            round(self.rows / self.seconds, 1) if self.rows and self.seconds else None
+        )
+        return data
+
+
+class _QueryCounter:
+    """``execute_wrapper`` hook counting statements without keeping their SQL."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class SyntheticFleet:
+    """Deterministic fleet plus the Access records describing its history."""
+
+    BRAND_CODE = "GM"
+    MODEL_CODE = "GT22-CW"
+
+    def __init__(self, profile: FleetProfile) -> None:
+        self.profile = profile
+        self.end_date = profile.resolved_end_date()
+        self.start_date = date(self.end_date.year - profile.years + 1, 1, 1)
+        self.units = [
+            (f"BL{index:03d}", MaintenanceUnitModel.UnitType.LOCOMOTIVE)
+            for index in range(profile.locomotives)
+        ] + [
+            (f"BC{index:03d}", MaintenanceUnitModel.UnitType.RAILCAR)
+            for index in range(profile.railcars)
+        ]
+
+    def create_reference_data(self) -> None:
+        """Create units, brand links, intervention types and lugares."""
+        brand, _ = BrandModel.objects.get_or_create(
+            code=self.BRAND_CODE,
+            defaults={"id": uuid.uuid4(), "name": "GM", "full_name": "GM"},
+        )
+        model, _ = LocomotiveModelModel.objects.get_or_create(
+            code=self.MODEL_CODE,
+            defaults={"id": uuid.uuid4(), "name": self.MODEL_CODE, "brand": brand},
+        )
+        codes = set(LOCOMOTIVE_INTERVENTIONS) | set(RAILCAR_INTERVENTIONS)
+        for codigo in sorted(codes):
+            IntervencionTipoModel.objects.get_or_create(
+                codigo=codigo, defaults={"descripcion": f"Intervención {codigo}"}
+            )
+        for codigo in LUGAR_CODES:
+            LugarModel.objects.get_or_create(
+                codigo=codigo, defaults={"descripcion": f"Lugar {codigo}"}
+            )
+
+        units = MaintenanceUnitModel.objects.bulk_create(
+            [
+                MaintenanceUnitModel(
+                    id=uuid.uuid4(),
+                    number=number,
+                    unit_type=unit_type,
+                    rolling_stock_category=(
+                        MaintenanceUnitModel.Category.TRACTION
+                        if unit_type == MaintenanceUnitModel.UnitType.LOCOMOTIVE
+                        else MaintenanceUnitModel.Category.RAILCAR
+                    ),
+                )
+                for number, unit_type in self.units
+            ]
+        )
+        LocomotiveModel.objects.bulk_create(
+            [
+                LocomotiveModel(maintenance_unit=unit, brand=brand, model=model)
+                for unit in units
+                if unit.unit_type == MaintenanceUnitModel.UnitType.LOCOMOTIVE
+            ]
+        )
+
+    def kilometrage_records(self) -> list[dict]:
+        """Daily km per unit; about one day in ten has no record (out of service)."""
+        rng = random.Random(self.profile.seed)
+        records = []
+        days = (self.end_date - self.start_date).days + 1
+        for number, unit_type in self.units:
+            mean = (
+                rng.uniform(250, 450)
+                if unit_type == MaintenanceUnitModel.UnitType.LOCOMOTIVE
+                else rng.uniform(200, 350)
+            )
+            for offset in range(days):
+                if rng.random() < 0.1:
+                    continue
+                km = max(0.0, rng.gauss(mean, mean * 0.35))
+                records.append(
+                    {
+                        "Unidad": number,
+                        "Fecha": (self.start_date + timedelta(days=offset)).isoformat(),
+                        "Kilometros": f"{km:.1f}",
+                    }
+                )
+        return records
+
+    def novedad_records(self) -> list[dict]:
+        """Novedades spread over every year, with weighted intervention codes."""
+        rng = random.Random(self.profile.seed + 1)
+        records = []
+        for number, unit_type in self.units:
+            weights = (
+                LOCOMOTIVE_INTERVENTIONS
+                if unit_type == MaintenanceUnitModel.UnitType.LOCOMOTIVE
+                else RAILCAR_INTERVENTIONS
+            )
+            codes = list(weights)
+            for year in range(self.start_date.year, self.end_date.year + 1):
+                year_start = date(year, 1, 1)
+                year_days = (min(date(year, 12, 31), self.end_date) - year_start).days
+                count = max(
+                    0, round(rng.gauss(self.profile.novedades_per_unit_year, 2))
+                )
+                for _ in range(count):
+                    fecha_desde = year_start + timedelta(days=rng.randint(0, year_days))
+                    fecha_hasta = fecha_desde + timedelta(days=rng.randint(0, 20))
+                    records.append(
+                        {
+                            "Unidad": number,
+                            "Fecha_desde": fecha_desde.isoformat(),
+                            "Fecha_hasta": (
+                                fecha_hasta.isoformat()
+                                if fecha_hasta < self.end_date
+                                else ""
+                            ),
+                            "Fecha_est": "",
+                            "Intervencion": rng.choices(codes, list(weights.values()))[
+                                0
+                            ],
+                            "Lugar": str(rng.choice(LUGAR_CODES)),
+                            "Observaciones": f"Sintético {rng.randint(1, 9999)}",
+                        }
+                    )
+        return records
+
+
+class PipelineBenchmark:
+    """Run every stage once on a fresh synthetic fleet and collect timings."""
+
+    def __init__(
+        self,
+        profile: FleetProfile,
+        repeat: int = 5,
+        draft_samples: int = 20,
+        log: Callable[[str], None] | None = None,
+    ) -> None:
+        self._profile = profile
+        self._repeat = max(1, repeat)
+        self._draft_samples = draft_samples
+        self._log = log or (lambda _message: None)
+        self._fleet = SyntheticFleet(profile)
+
+    def run(self) -> dict:
+        stages = [
+            self._measure("seed_reference_data", self._seed),
+            self._measure("access_km_import", self._import_kilometrage),
+            self._measure("access_novedad_import", self._import_novedades),
+            self._measure("snapshot_refresh_bulk", self._refresh_snapshots),
+            self._measure("prepare_draft", self._prepare_drafts),
+            self._measure("novedad_list_view", self._list_novedades),
+        ]
+        return {
+            "meta": self._meta(),
+            "stages": {stage.name: stage.to_dict() for stage in stages},
+        }
+
+    def _measure(self, name: str, stage: Callable[[], tuple[int, dict]]):
+        self._log(f"{name}...")
+        counter = _QueryCounter()
+        started = time.perf_counter()
+        with connection.execute_wrapper(counter):
+            rows, extra = stage()
+        result = StageResult(
+            name=name,
+            seconds=round(time.perf_counter() - started, 4),
+            rows=rows,
+            queries=counter.count,
+            extra=extra,
+        )
+        self._log(
+            f"{name}: {result.seconds:.2f}s, {rows} rows, {counter.count} queries"
+        )
+        return result
+
+    def _seed(self) -> tuple[int, dict]:
+        self._fleet.create_reference_data()
+        return len(self._fleet.units), {}
+
+    def _import_kilometrage(self) -> tuple[int, dict]:
+        records = self._fleet.kilometrage_records()
+        # Records are handed over directly; the extractor is never called
+        importer = AccessKilometrageImporter(extractor=None)
+        stats = importer._import_records(
+            records,
+            unit_id_by_number=importer._load_unit_ids(),
+            dry_run=False,
+            source_label="access_bench",
+        )
+        return stats.inserted, {"processed": stats.processed}
+
+    def _import_novedades(self) -> tuple[int, dict]:
+        records = self._fleet.novedad_records()
+        importer = AccessNovedadImporter(extractor=None)
+        lugares, units, intervenciones = importer._load_lookups()
+        stats = importer._import_records(
+            records,
+            lugares_by_codigo=lugares,
+            units_by_number=units,
+            intervenciones_by_codigo=intervenciones,
+            dry_run=False,
+        )
+        return stats.inserted, {
+            "processed": stats.processed,
+            "duplicates": stats.duplicates,
+        }
+
+    def _refresh_snapshots(self) -> tuple[int, dict]:
+        refreshed = UnitMaintenanceSnapshotService().refresh_bulk(
+            unit_numbers=[number for number, _ in self._fleet.units]
+        )
+        return refreshed, {}
+
+    def _prepare_drafts(self) -> tuple[int, dict]:
+        novedad_ids = list(
+            NovedadModel.objects.filter(
+                maintenance_unit__number__in=[number for number, _ in self._fleet.units]
+            )
+            .order_by("-fecha_desde")
+            .values_list("pk", flat=True)[: self._draft_samples]
+        )
+        use_case = MaintenanceEntryUseCase()
+        timings = []
+        for _ in range(self._repeat):
+            for novedad_id in novedad_ids:
+                started = time.perf_counter()
+                use_case.prepare_draft(
+                    novedad_id=str(novedad_id),
+                    trigger_value=None,
+                    trigger_type=None,
+                    trigger_unit=None,
+                )
+                timings.append(time.perf_counter() - started)
+        return len(timings), _latency_summary(timings)
+
+    def _list_novedades(self) -> tuple[int, dict]:
+        user, _ = get_user_model().objects.get_or_create(username="pipeline-bench")
+        client = Client()
+        client.force_login(user)
+        url = reverse("tickets:novedad_list")
+        year_ago = self._fleet.end_date - timedelta(days=365)
+        scenarios = {
+            "default": {},
+            "search": {"search": "BL00"},
+            "last_year": {"date_from": year_ago.isoformat()},
+        }
+
+        extra = {}
+        requests = 0
+        for label, params in scenarios.items():
+            timings = []
+            queries = []
+            for _ in range(self._repeat):
+                counter = _QueryCounter()
+                started = time.perf_counter()
+                with connection.execute_wrapper(counter):
+                    response = client.get(url, params)
+                timings.append(time.perf_counter() - started)
+                queries.append(counter.count)
+                if response.status_code != 200:
+                    raise RuntimeError(
+                        f"novedad list {label} returned {response.status_code}"
+                    )
+            requests += len(timings)
+            extra[label] = {**_latency_summary(timings), "queries": max(queries)}
+        return requests, extra
+
+    def _meta(self) -> dict:
+        profile = asdict(self._profile)
+        profile["end_date"] = self._fleet.end_date.isoformat()
+        return {
+            "commit": _git_commit(),
+            "created_at": timezone.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "repeat": self._repeat,
+            "profile": profile,
+        }
+
+
+def _latency_summary(timings: list[float]) -> dict:
+    if not timings:
+        return {"median_ms": None, "p95_ms": None}
+    ordered = sorted(timings)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return {
+        "median_ms": round(statistics.median(ordered) * 1000, 2),
+        "p95_ms": round(p95 * 1000, 2),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=Path(__file__).resolve().parents[4],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def iter_stage_comparison(current: dict, baseline: dict) -> Iterator[tuple]:
+    """Yield ``(stage, baseline_seconds, current_seconds, ratio)`` per shared stage."""
+    for name, stage in current.get("stages", {}).items():
+        previous = baseline.get("stages", {}).get(name)
+        if not previous or not previous.get("seconds"):
+            continue
+        yield (
+            name,
+            previous["seconds"],
+            stage["seconds"],
+            (stage["seconds"] / previous["seconds"]),
+        )
@@ -0,0 +1,187 @@
+"""Process-wide cache of the option lists used by the novedad and ticket forms.
+
+Entries are keyed by ``(name, category)`` and tagged with the
+``reference_data_version`` stamp they were built from. Triggers bump that
+stamp on any change to the underlying tables, from any process (web,
+scheduler, management commands). A form render therefore costs a
+single-row version read while the lists are unchanged. The same stamp is
+the ETag of the JSON endpoint, so browsers revalidate the lists without
+downloading them again. ``db_triggers`` re-creates the triggers after
+``migrate`` if a table rebuild dropped them.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+from django.db.models import F
+
+from apps.tickets.infrastructure.models import (
+    FailureTypeModel,
+    IntervencionTipoModel,
+    LugarModel,
+    MaintenanceUnitModel,
+    ReferenceDataVersionModel,
+    TrainNumberModel,
+)
+from apps.tickets.infrastructure.services.db_triggers import (
+    TriggerSet,
+    create_trigger,
+)
+
+NOVEDAD_OPTIONS = "novedad"
+TICKET_OPTIONS = "ticket"
+
+
+def build_novedad_options(category: str | None = None) -> dict[str, list[dict]]:
+    """Unit, intervention and lugar datalists for the novedad form."""
+    unit_types = dict(MaintenanceUnitModel.UnitType.choices)
+    unit_queryset = MaintenanceUnitModel.objects.order_by("number")
+    if category:
+        unit_queryset = unit_queryset.filter(rolling_stock_category=category)
+    unit_options = [
+        {
+            "number": number,
+            "display": f"{number} ({unit_types.get(unit_type, unit_type)})",
+        }
+        for number, unit_type in unit_queryset.values_list("number", "unit_type")
+    ]
+    intervencion_options = list(
+        IntervencionTipoModel.objects.filter(is_active=True)
+        .order_by("codigo")
+        .values("codigo", "descripcion")
+    )
+    lugar_options = [
+        {
+            "code": short_desc or codigo,
+            "label": f"{codigo} - {descripcion}",
+        }
+        for codigo, descripcion, short_desc in LugarModel.objects.filter(is_active=True)
+        .order_by("descripcion")
+        .values_list("codigo", "descripcion", "short_desc")
+    ]
+    return {
+        "unit_options": unit_options,
+        "intervencion_options": intervencion_options,
+        "lugar_options": lugar_options,
+    }
+
+
+def build_ticket_options(category: str | None = None) -> dict[str, list[dict]]:
+    """Train datalist and failure-type codes for the ticket form."""
+    return {
+        "trains": [
+            {"number": number}
+            for number in TrainNumberModel.objects.filter(is_active=True).values_list(
+                "number", flat=True
+            )
+        ],
+        "failure_types": [
+            {"id": str(pk), "code": code}
+            for pk, code in FailureTypeModel.objects.filter(is_active=True).values_list(
+                "id", "code"
+            )
+        ],
+    }
+
+
+# Columns that feed the option lists; other updates leave the stamp alone
+WATCHED_COLUMNS = {
+    "maintenance_unit": ["number", "unit_type", "rolling_stock_category"],
+    "intervencion_tipo": ["codigo", "descripcion", "is_active"],
+    "lugar": ["codigo", "descripcion", "short_desc", "is_active"],
+    "train_number": ["number", "is_active"],
+    "failure_type": ["code", "is_active"],
+}
+
+_BUMP = "UPDATE reference_data_version SET version = version + 1 WHERE id = 1;"
+
+
+def _version_triggers() -> dict[str, str]:
+    create = {}
+    for table, columns in WATCHED_COLUMNS.items():
+        events = {
+            "ai": "INSERT",
+            "ad": "DELETE",
+            "au": f"UPDATE OF {', '.join(columns)}",
+        }
+        for suffix, event in events.items():
+            name = f"reference_version_{table}_{suffix}"
+            create[name] = create_trigger(name, event, table, _BUMP)
+    return create
+
+
+def _bump_version() -> None:
+    ReferenceDataVersionModel.objects.filter(
+        pk=ReferenceDataVersionModel.SINGLETON_ID
+    ).update(version=F("version") + 1)
+
+
+REFERENCE_VERSION_TRIGGERS = TriggerSet(
+    tables=(*WATCHED_COLUMNS, "reference_data_version"),
+    create=_version_triggers(),
+    resync=_bump_version,
+)
+
+_BUILDERS: dict[str, Callable[[str | None], dict[str, list[dict]]]] = {
+    NOVEDAD_OPTIONS: build_novedad_options,
+    TICKET_OPTIONS: build_ticket_options,
+}
+
+
+class ReferenceDataCache:
+    """Option lists cached per process until the version stamp moves."""
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], tuple[int, dict]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def version() -> int:
+        version = (
+            ReferenceDataVersionModel.objects.filter(
+                pk=ReferenceDataVersionModel.SINGLETON_ID
+            )
+            .values_list("version", flat=True)
+            .first()
+        )
+        if version is None:
+            # Row lost (e.g. flushed); recreate it so the triggers have a
+            # target, from a fresh stamp so no cached entry matches it
+            row, _ = ReferenceDataVersionModel.objects.get_or_create(
+                pk=ReferenceDataVersionModel.SINGLETON_ID,
+                defaults={"version": time.time_ns()},
+            )
+            version = row.version
+        return version
+
+    def options(self, name: str, category: str | None = None) -> tuple[int, dict]:
+        """``(version, lists)`` for ``name``; raises KeyError if unknown."""
+        builder = _BUILDERS[name]
+        key = (name, category or "")
+        version = self.version()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                return entry
+            self.misses += 1
+        payload = builder(category)
+        # The stamp is read before building: a change made meanwhile leaves
+        # the entry one version behind, so the next read rebuilds it
+        with self._lock:
+            self._entries[key] = (version, payload)
+        return version, payload
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+reference_data_cache = ReferenceDataCache()
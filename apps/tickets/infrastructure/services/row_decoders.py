@@ -0,0 +1,186 @@
+"""Column decoders shared by the Access and legacy TXT importers.
+
+A ``DateDecoder`` belongs to one column: the first non-empty value picks
+the format the column is locked to, and later values try it first. Results
+never depend on row order: a value the locked format rejects walks the
+formats in priority order without moving the lock, and an ambiguous slash
+date (day and month both <= 12) under a day-first lock still resolves to
+m/d/y, as the fixed ISO -> m/d/y -> d/m/y order would. Dates are split by
+hand instead of going through ``strptime``.
+
+``CodeNormalizer`` memoizes the strip/upper of repeated codes (units,
+intervenciones, lugares). Nothing here imports Django, so the decoders
+also run in the legacy parse worker processes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+
+# Access/PowerShell values: ISO first, then US, then day-first
+ACCESS_DATE_FORMATS = ("iso", "ymd", "mdy", "dmy")
+# Legacy TXT exports are always dd/mm/yyyy
+LEGACY_DATE_FORMATS = ("dmy",)
+
+
+def _split(text: str, separator: str) -> tuple[str, str, str] | None:
+    parts = text.split(separator)
+    if len(parts) != 3 or not all(part.isdigit() for part in parts):
+        return None
+    return parts[0], parts[1], parts[2]
+
+
+def _build(year: str, month: str, day: str) -> date | None:
+    # Same widths strptime accepts for %Y, %m and %d
+    if len(year) != 4 or not 0 < len(month) <= 2 or not 0 < len(day) <= 2:
+        return None
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _parse_iso(text: str) -> date | None:
+    try:
+        return datetime.fromisoformat(text).date()
+    except ValueError:
+        return None
+
+
+def _parse_ymd(text: str) -> date | None:
+    parts = _split(text, "-")
+    return _build(parts[0], parts[1], parts[2]) if parts else None
+
+
+def _parse_mdy(text: str) -> date | None:
+    parts = _split(text, "/")
+    return _build(parts[2], parts[0], parts[1]) if parts else None
+
+
+def _parse_dmy(text: str) -> date | None:
+    parts = _split(text, "/")
+    return _build(parts[2], parts[1], parts[0]) if parts else None
+
+
+_DATE_PARSERS: dict[str, Callable[[str], date | None]] = {
+    "iso": _parse_iso,
+    "ymd": _parse_ymd,
+    "mdy": _parse_mdy,
+    "dmy": _parse_dmy,
+}
+
+
+class DateDecoder:
+    """Parse the dates of one column, locked to the format of its first value."""
+
+    def __init__(self, formats: tuple[str, ...] = ACCESS_DATE_FORMATS) -> None:
+        self._parsers = tuple(_DATE_PARSERS[name] for name in formats)
+        self._locked: Callable[[str], date | None] | None = None
+        # Higher-priority parser that wins over the lock on ambiguous values
+        self._preferred: Callable[[str], date | None] | None = None
+
+    def __call__(self, value: object) -> date | None:
+        if value is None:
+            return None
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        text = str(value).strip()
+        if not text:
+            return None
+
+        locked = self._locked
+        if locked is not None:
+            parsed = locked(text)
+            if parsed is not None:
+                if self._preferred is not None:
+                    preferred = self._preferred(text)
+                    if preferred is not None:
+                        return preferred
+                return parsed
+        for parser in self._parsers:
+            if parser is locked:
+                continue
+            parsed = parser(text)
+            if parsed is not None:
+                if locked is None:
+                    self._lock(parser)
+                return parsed
+        return None
+
+    def _lock(self, parser: Callable[[str], date | None]) -> None:
+        self._locked = parser
+        # ISO and y-m-d agree whenever both parse; only d/m/y can disagree
+        # with a format ahead of it (m/d/y) on the same text
+        earlier = self._parsers[: self._parsers.index(parser)]
+        if parser is _parse_dmy and _parse_mdy in earlier:
+            self._preferred = _parse_mdy
+
+
+def parse_date(value: object, formats: tuple[str, ...] = ACCESS_DATE_FORMATS):
+    """One-off date parse trying ``formats`` in order (no column state)."""
+    return DateDecoder(formats)(value)
+
+
+def parse_decimal(value: object) -> Decimal | None:
+    """Parse an Access number, invariant ("266.4") or European ("1.234,56").
+
+    A comma can never be parsed by ``Decimal`` directly, so those values go
+    straight to the European conversion instead of failing once first.
+    """
+    if value is None:
+        return None
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, (int, float)):
+        return Decimal(str(value))
+    text = str(value).strip()
+    if not text:
+        return None
+    if "," not in text:
+        try:
+            return Decimal(text)
+        except (InvalidOperation, ValueError):
+            pass
+    try:
+        return Decimal(text.replace(".", "").replace(",", "."))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def parse_comma_decimal(text: str) -> Decimal | None:
+    """Parse a legacy TXT number where the comma is the decimal separator."""
+    try:
+        return Decimal(text.replace(",", "."))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+class CodeNormalizer:
+    """Strip (and optionally upper-case) codes, memoizing repeated values."""
+
+    def __init__(self, upper: bool = True, max_entries: int = 50_000) -> None:
+        self._upper = upper
+        self._max_entries = max_entries
+        self._cache: dict[object, str | None] = {}
+
+    def __call__(self, value: object) -> str | None:
+        try:
+            return self._cache[value]
+        except KeyError:
+            pass
+        except TypeError:
+            return self._normalize(value)
+        normalized = self._normalize(value)
+        if len(self._cache) < self._max_entries:
+            self._cache[value] = normalized
+        return normalized
+
+    def _normalize(self, value: object) -> str | None:
+        text = str(value or "").strip()
+        if not text:
+            return None
+        return text.upper() if self._upper else text
@@ -0,0 +1,91 @@
+"""Per-stage timings collected during an Access sync run.
+
+Each span is keyed by ``(stage, source, table)``; repeated spans (one per
+batch) accumulate seconds and rows. ``as_list`` gives the JSON stored on
+``AccessSyncLogModel.stage_timings``, ordered by pipeline stage.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+
+# Stage names, in pipeline order
+STAGE_EXTRACT = "extract"
+STAGE_PARSE = "parse"
+STAGE_DEDUPE = "dedupe"
+STAGE_INSERT = "insert"
+STAGE_REFRESH_CUMULATIVE = "refresh_cumulative"
+STAGE_REFRESH_MONTHLY = "refresh_monthly"
+STAGE_SNAPSHOT_REFRESH = "snapshot_refresh"
+STAGE_ORDER = (
+    STAGE_EXTRACT,
+    STAGE_PARSE,
+    STAGE_DEDUPE,
+    STAGE_INSERT,
+    STAGE_REFRESH_CUMULATIVE,
+    STAGE_REFRESH_MONTHLY,
+    STAGE_SNAPSHOT_REFRESH,
+)
+
+
+@dataclass
+class StageSpan:
+    stage: str
+    source: str
+    table: str
+    seconds: float = 0.0
+    rows: int = 0
+
+
+class SyncTimings:
+    """Accumulates seconds and row counts per (stage, source, table)."""
+
+    def __init__(self) -> None:
+        self._spans: dict[tuple[str, str, str], StageSpan] = {}
+
+    def add(
+        self,
+        stage: str,
+        seconds: float,
+        rows: int = 0,
+        source: str = "",
+        table: str = "",
+    ) -> None:
+        key = (stage, source, table)
+        span = self._spans.get(key)
+        if span is None:
+            span = self._spans[key] = StageSpan(stage, source, table)
+        span.seconds += seconds
+        span.rows += rows
+
+    @contextmanager
+    def span(
+        self, stage: str, rows: int = 0, source: str = "", table: str = ""
+    ) -> Iterator[None]:
+        started = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, perf_counter() - started, rows, source, table)
+
+    def as_list(self) -> list[dict]:
+        return [
+            {
+                "stage": span.stage,
+                "source": span.source,
+                "table": span.table,
+                "seconds": round(span.seconds, 3),
+                "rows": span.rows,
+            }
+            for span in sorted(self._spans.values(), key=_stage_position)
+        ]
+
+
+def _stage_position(span: StageSpan) -> int:
+    try:
+        return STAGE_ORDER.index(span.stage)
+    except ValueError:
+        return len(STAGE_ORDER)
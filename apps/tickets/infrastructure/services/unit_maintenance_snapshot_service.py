@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from datetime import date
 from decimal import Decimal
 
-from django.db.models import Sum
+from django.db.models import Min
 
 from apps.tickets.domain.services.intervention_suggestion import (
     InterventionHistoryItem,
     InterventionSuggestionService,
     MaintenanceCycle,
+    UnitMaintenanceHistory,
 )
 from apps.tickets.infrastructure.models import (
     KilometrageRecordModel,
@@ -20,6 +22,9 @@ from apps.tickets.infrastructure.models import (
     NovedadModel,
     UnitMaintenanceSnapshotModel,
 )
+from apps.tickets.infrastructure.services.kilometrage_repository import (
+    KilometrageRepository,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,13 +34,42 @@ class UnitMaintenanceSnapshotService:
 
     The snapshot replaces expensive SUM queries on the maintenance entry
     critical path with a single row lookup per unit.
+
+    ``refresh_bulk`` works set-based: per chunk of units it loads closed
+    novedades, PS dates and km totals with a few grouped queries, derives the
+    history in memory and upserts every snapshot with one statement.
     """
 
+    BULK_CHUNK_SIZE = 500
+    _LABEL_RELATIONS = (
+        "locomotive__brand",
+        "locomotive__model",
+        "railcar__brand",
+        "motorcoach__brand",
+        "wagon__brand",
+    )
+    _SNAPSHOT_FIELDS = (
+        "unit_number",
+        "last_rg_date",
+        "km_since_rg",
+        "last_numeral_code",
+        "last_numeral_date",
+        "km_since_numeral",
+        "last_rp_code",
+        "last_rp_date",
+        "km_since_rp",
+        "last_abc_code",
+        "last_abc_date",
+        "km_since_abc",
+    )
+
     def __init__(
         self,
         suggestion_service: InterventionSuggestionService | None = None,
+        kilometrage_repo: KilometrageRepository | None = None,
     ) -> None:
         self._suggestion_service = suggestion_service or InterventionSuggestionService()
+        self._kilometrage_repo = kilometrage_repo or KilometrageRepository()
 
     # ------------------------------------------------------------------
     # Public API
@@ -74,27 +108,17 @@ class UnitMaintenanceSnapshotService:
         # e.g. CKD locos, CNR coaches).
         rg_date = history.last_rg_date or self._ps_date_from_km(maintenance_unit.number)
 
-        km_rg = self._km_since(maintenance_unit.number, rg_date)
-        km_numeral = self._km_since(maintenance_unit.number, history.last_numeral_date)
-        km_rp = self._km_since(maintenance_unit.number, history.last_rp_date)
-        km_abc = self._km_since(maintenance_unit.number, history.last_abc_date)
+        pairs = [
+            (maintenance_unit.number, from_date)
+            for from_date in self._km_dates(history, rg_date)
+        ]
+        km_by_pair = self._kilometrage_repo.get_km_since_bulk(pairs) if pairs else {}
 
         snapshot, _ = UnitMaintenanceSnapshotModel.objects.update_or_create(
             maintenance_unit=maintenance_unit,
-            defaults={
-                "unit_number": maintenance_unit.number,
-                "last_rg_date": rg_date,
-                "km_since_rg": km_rg,
-                "last_numeral_code": history.last_numeral_code,
-                "last_numeral_date": history.last_numeral_date,
-                "km_since_numeral": km_numeral,
-                "last_rp_code": history.last_rp_code,
-                "last_rp_date": history.last_rp_date,
-                "km_since_rp": km_rp,
-                "last_abc_code": history.last_abc_code,
-                "last_abc_date": history.last_abc_date,
-                "km_since_abc": km_abc,
-            },
+            defaults=self._snapshot_values(
+                maintenance_unit.number, history, rg_date, km_by_pair
+            ),
         )
         return snapshot
 
@@ -131,19 +155,22 @@ class UnitMaintenanceSnapshotService:
         Returns:
             Number of units processed.
         """
-        qs = MaintenanceUnitModel.objects.all()
+        qs = MaintenanceUnitModel.objects.select_related(
+            *self._LABEL_RELATIONS
+        ).order_by("number")
         if unit_numbers:
             qs = qs.filter(number__in=[u.strip().upper() for u in unit_numbers])
 
+        cycle_index = self._load_cycle_index()
         count = 0
-        for mu in qs.iterator():
-            try:
-                self.refresh_unit(mu)
-                count += 1
-                if progress_callback:
-                    progress_callback(mu.number)
-            except Exception:
-                logger.exception("Failed to refresh snapshot for unit %s", mu.number)
+        chunk: list[MaintenanceUnitModel] = []
+        for mu in qs.iterator(chunk_size=self.BULK_CHUNK_SIZE):
+            chunk.append(mu)
+            if len(chunk) >= self.BULK_CHUNK_SIZE:
+                count += self._refresh_chunk(chunk, cycle_index, progress_callback)
+                chunk = []
+        if chunk:
+            count += self._refresh_chunk(chunk, cycle_index, progress_callback)
         return count
 
     def get_snapshot(self, unit_number: str) -> UnitMaintenanceSnapshotModel | None:
@@ -160,16 +187,196 @@ class UnitMaintenanceSnapshotService:
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _refresh_chunk(
+        self,
+        units: list[MaintenanceUnitModel],
+        cycle_index: dict[tuple[str, str], list[tuple[str | None, MaintenanceCycle]]],
+        progress_callback=None,
+    ) -> int:
+        """Compute and upsert snapshots for a chunk of units."""
+        history_by_unit = self._load_history_bulk([mu.id for mu in units])
+
+        histories: dict[str, UnitMaintenanceHistory] = {}
+        computed: list[MaintenanceUnitModel] = []
+        for mu in units:
+            try:
+                brand_code, model_code, brand_name, model_name = self._unit_labels(mu)
+                histories[mu.number] = self._suggestion_service.get_maintenance_history(
+                    unit_type=mu.unit_type,
+                    brand_code=brand_code,
+                    model_code=model_code,
+                    cycles=self._resolve_cycles(
+                        cycle_index, mu.unit_type, brand_code, model_code
+                    ),
+                    history=history_by_unit.get(mu.id, []),
+                    brand_name=brand_name,
+                    model_name=model_name,
+                    unit_number=mu.number,
+                )
+                computed.append(mu)
+            except Exception:
+                logger.exception("Failed to refresh snapshot for unit %s", mu.number)
+
+        ps_dates = self._ps_dates_from_km(
+            [mu.number for mu in computed if not histories[mu.number].last_rg_date]
+        )
+        rg_dates = {
+            mu.number: histories[mu.number].last_rg_date or ps_dates.get(mu.number)
+            for mu in computed
+        }
+        pairs = [
+            (mu.number, from_date)
+            for mu in computed
+            for from_date in self._km_dates(histories[mu.number], rg_dates[mu.number])
+        ]
+        km_by_pair = self._kilometrage_repo.get_km_since_bulk(pairs) if pairs else {}
+
+        snapshots = [
+            UnitMaintenanceSnapshotModel(
+                maintenance_unit=mu,
+                **self._snapshot_values(
+                    mu.number, histories[mu.number], rg_dates[mu.number], km_by_pair
+                ),
+            )
+            for mu in computed
+        ]
+        if snapshots:
+            UnitMaintenanceSnapshotModel.objects.bulk_create(
+                snapshots,
+                update_conflicts=True,
+                unique_fields=["maintenance_unit"],
+                update_fields=[*self._SNAPSHOT_FIELDS, "computed_at", "updated_at"],
+            )
+        if progress_callback:
+            for mu in computed:
+                progress_callback(mu.number)
+        return len(snapshots)
+
     @staticmethod
-    def _km_since(unit_number: str, from_date: date | None) -> Decimal | None:
-        """Sum km records from from_date (inclusive) to present."""
-        if from_date is None:
-            return None
-        result = KilometrageRecordModel.objects.filter(
-            unit_number__iexact=unit_number.strip(),
-            record_date__gte=from_date,
-        ).aggregate(total=Sum("km_value"))
-        return result["total"]
+    def _km_dates(history: UnitMaintenanceHistory, rg_date: date | None) -> list[date]:
+        """Return the dates whose km-since the snapshot stores."""
+        candidates = (
+            rg_date,
+            history.last_numeral_date,
+            history.last_rp_date,
+            history.last_abc_date,
+        )
+        return [from_date for from_date in candidates if from_date]
+
+    def _snapshot_values(
+        self,
+        unit_number: str,
+        history: UnitMaintenanceHistory,
+        rg_date: date | None,
+        km_by_pair: dict[tuple[str, date], Decimal | None],
+    ) -> dict[str, object]:
+        def km_since(from_date: date | None) -> Decimal | None:
+            return km_by_pair.get((unit_number, from_date)) if from_date else None
+
+        return {
+            "unit_number": unit_number,
+            "last_rg_date": rg_date,
+            "km_since_rg": km_since(rg_date),
+            "last_numeral_code": history.last_numeral_code,
+            "last_numeral_date": history.last_numeral_date,
+            "km_since_numeral": km_since(history.last_numeral_date),
+            "last_rp_code": history.last_rp_code,
+            "last_rp_date": history.last_rp_date,
+            "km_since_rp": km_since(history.last_rp_date),
+            "last_abc_code": history.last_abc_code,
+            "last_abc_date": history.last_abc_date,
+            "km_since_abc": km_since(history.last_abc_date),
+        }
+
+    @staticmethod
+    def _ps_dates_from_km(unit_numbers: list[str]) -> dict[str, date]:
+        """Return the earliest km record date for each unit (PS proxy)."""
+        if not unit_numbers:
+            return {}
+        return dict(
+            KilometrageRecordModel.objects.filter(unit_number__in=unit_numbers)
+            .order_by()
+            .values("unit_number")
+            .annotate(first_date=Min("record_date"))
+            .values_list("unit_number", "first_date")
+        )
+
+    @staticmethod
+    def _load_history_bulk(
+        unit_ids: list,
+    ) -> dict[object, list[InterventionHistoryItem]]:
+        """Return closed interventions per unit id, newest first."""
+        history_by_unit: dict[object, list[InterventionHistoryItem]] = defaultdict(list)
+        rows = (
+            NovedadModel.objects.filter(
+                maintenance_unit_id__in=unit_ids,
+                fecha_hasta__isnull=False,
+            )
+            .order_by("-fecha_desde")
+            .values_list(
+                "maintenance_unit_id",
+                "intervencion__codigo",
+                "fecha_desde",
+                "fecha_hasta",
+            )
+        )
+        for unit_id, code, date_from, date_until in rows:
+            if code:
+                history_by_unit[unit_id].append(
+                    InterventionHistoryItem(
+                        intervention_code=code,
+                        date_from=date_from,
+                        date_until=date_until,
+                    )
+                )
+        return history_by_unit
+
+    @staticmethod
+    def _load_cycle_index() -> (
+        dict[tuple[str, str], list[tuple[str | None, MaintenanceCycle]]]
+    ):
+        """Return active cycles keyed by (rolling stock type, brand code)."""
+        cycle_index: dict[
+            tuple[str, str], list[tuple[str | None, MaintenanceCycle]]
+        ] = defaultdict(list)
+        for cycle in MaintenanceCycleModel.objects.filter(
+            is_active=True
+        ).select_related("brand", "model"):
+            model_code = cycle.model.code.upper() if cycle.model else None
+            cycle_index[(cycle.rolling_stock_type, cycle.brand.code.upper())].append(
+                (
+                    model_code,
+                    MaintenanceCycle(
+                        intervention_code=cycle.intervention_code,
+                        intervention_name=cycle.intervention_name,
+                        trigger_type=cycle.trigger_type,
+                        trigger_value=cycle.trigger_value,
+                        trigger_unit=cycle.trigger_unit,
+                    ),
+                )
+            )
+        return cycle_index
+
+    @staticmethod
+    def _resolve_cycles(
+        cycle_index: dict[tuple[str, str], list[tuple[str | None, MaintenanceCycle]]],
+        unit_type: str,
+        brand_code: str | None,
+        model_code: str | None,
+    ) -> list[MaintenanceCycle]:
+        """Pick model-specific cycles, else the brand-wide ones (as _load_cycles)."""
+        if not brand_code:
+            return []
+        candidates = cycle_index.get((unit_type, brand_code.upper()), [])
+        if model_code:
+            specific = [
+                cycle
+                for cycle_model, cycle in candidates
+                if cycle_model == model_code.upper()
+            ]
+            if specific:
+                return specific
+        return [cycle for cycle_model, cycle in candidates if cycle_model is None]
 
     @staticmethod
     def _ps_date_from_km(unit_number: str) -> date | None:
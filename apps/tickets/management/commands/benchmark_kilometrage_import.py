@@ -0,0 +1,136 @@
+"""Compare the ORM and direct-insert paths of the legacy kilometrage import."""
+
+from __future__ import annotations
+
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.tickets.infrastructure.services.kilometrage_cumulative_index import (
+    KilometrageCumulativeIndex,
+)
+from apps.tickets.infrastructure.services.kilometrage_monthly_rollup import (
+    KilometrageMonthlyRollup,
+)
+from apps.tickets.infrastructure.services.legacy_kilometrage_importer import (
+    LegacyKilometrageImporter,
+)
+
+
+class _Rollback(Exception):
+    """Raised to discard the rows written by one benchmark run."""
+
+
+class _RefreshTimer:
+    """Accumulates the time spent in the post-load refresh steps."""
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def wrap(self, refresh):
+        def timed(start_by_unit):
+            started = time.perf_counter()
+            try:
+                return refresh(start_by_unit)
+            finally:
+                self.seconds += time.perf_counter() - started
+
+        return timed
+
+
+class Command(BaseCommand):
+    """Time both import paths on a synthetic TXT export."""
+
+    help = (
+        "Benchmark legacy kilometrage import (ORM vs INSERT OR IGNORE) on "
+        "synthetic data; every run is rolled back"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            type=int,
+            default=200_000,
+            help="Rows in the synthetic Kilometraje_Locs.txt",
+        )
+        parser.add_argument(
+            "--units",
+            type=int,
+            default=100,
+            help="Distinct units spread across the rows",
+        )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=1,
+            help="Random seed for the synthetic km values",
+        )
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            base_path = Path(tmp_dir)
+            self._write_export(
+                base_path, options["rows"], options["units"], options["seed"]
+            )
+
+            load_seconds = {}
+            for label, direct_insert in (("orm", False), ("direct", True)):
+                elapsed, refresh, inserted = self._run(base_path, direct_insert)
+                load = elapsed - refresh
+                load_seconds[label] = load
+                self.stdout.write(
+                    f"{label:>6}: {inserted} rows, load {load:.2f}s "
+                    f"({inserted / load:,.0f} rows/s), "
+                    f"cumulative/monthly refresh {refresh:.2f}s"
+                )
+
+        self.stdout.write(
+            f"load speedup: {load_seconds['orm'] / load_seconds['direct']:.1f}x"
+        )
+
+    @staticmethod
+    def _write_export(base_path: Path, rows: int, units: int, seed: int) -> None:
+        rng = random.Random(seed)
+        start = date(2000, 1, 1)
+        lines = ["Locs;Fecha;Kms_diario"]
+        for index in range(rows):
+            unit = f"BENCH{index % units:04d}"
+            record_date = start + timedelta(days=index // units)
+            km = f"{rng.uniform(0, 900):.2f}".replace(".", ",")
+            lines.append(f"{unit};{record_date:%d/%m/%Y};{km}")
+        (base_path / "Kilometraje_Locs.txt").write_text(
+            "\n".join(lines) + "\n", encoding="latin-1"
+        )
+
+    @staticmethod
+    def _run(base_path: Path, direct_insert: bool) -> tuple[float, float, int]:
+        """Import once inside a rolled-back transaction.
+
+        Returns total seconds, seconds spent refreshing cumulatives and
+        monthly rollups (the same work on both paths) and rows inserted.
+        """
+        timer = _RefreshTimer()
+        cumulative_index = KilometrageCumulativeIndex()
+        cumulative_index.refresh_units = timer.wrap(cumulative_index.refresh_units)
+        monthly_rollup = KilometrageMonthlyRollup()
+        monthly_rollup.refresh_units = timer.wrap(monthly_rollup.refresh_units)
+        importer = LegacyKilometrageImporter(
+            cumulative_index=cumulative_index,
+            monthly_rollup=monthly_rollup,
+            direct_insert=direct_insert,
+        )
+
+        started = time.perf_counter()
+        try:
+            with transaction.atomic():
+                stats = importer.import_all(base_path=base_path, full=True)
+                elapsed = time.perf_counter() - started
+                raise _Rollback
+        except _Rollback:
+            pass
+        return elapsed, timer.seconds, stats.inserted
@@ -0,0 +1,130 @@
+"""Benchmark the sync and ingreso hot paths on a synthetic fleet."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from apps.tickets.infrastructure.services.pipeline_benchmark import (
+    FleetProfile,
+    PipelineBenchmark,
+    iter_stage_comparison,
+)
+
+
+class Command(BaseCommand):
+    """Build a synthetic fleet in a scratch SQLite DB and time each stage."""
+
+    help = (
+        "Benchmark Access import, snapshot refresh, ingreso drafts and the "
+        "novedad list on a synthetic fleet in a scratch SQLite database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--db",
+            type=str,
+            default=None,
+            help="Scratch SQLite file (default: a temporary file, deleted afterwards)",
+        )
+        parser.add_argument("--locomotives", type=int, default=24)
+        parser.add_argument("--railcars", type=int, default=24)
+        parser.add_argument(
+            "--years", type=int, default=22, help="Years of daily km per unit"
+        )
+        parser.add_argument(
+            "--novedades-per-year",
+            type=int,
+            default=8,
+            help="Mean novedades per unit and year",
+        )
+        parser.add_argument("--seed", type=int, default=1)
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=5,
+            help="Repetitions of the read-only stages (drafts, list view)",
+        )
+        parser.add_argument(
+            "--output",
+            type=str,
+            default=None,
+            help="Write the JSON results here ('-' for stdout)",
+        )
+        parser.add_argument(
+            "--baseline",
+            type=str,
+            default=None,
+            help="Earlier JSON results to compare stage timings against",
+        )
+
+    def handle(self, *args, **options):
+        baseline = None
+        if options["baseline"]:
+            try:
+                baseline = json.loads(Path(options["baseline"]).read_text("utf-8"))
+            except (OSError, ValueError) as exc:
+                raise CommandError(f"Cannot read baseline: {exc}") from exc
+
+        profile = FleetProfile(
+            locomotives=options["locomotives"],
+            railcars=options["railcars"],
+            years=options["years"],
+            novedades_per_unit_year=options["novedades_per_year"],
+            seed=options["seed"],
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            db_path = Path(options["db"] or Path(tmp_dir) / "benchmark.db")
+            if db_path.exists():
+                raise CommandError(f"{db_path} already exists; use a new file")
+            self._use_scratch_database(db_path)
+            try:
+                results = PipelineBenchmark(
+                    profile, repeat=options["repeat"], log=self._log
+                ).run()
+            finally:
+                connections["default"].close()
+
+        payload = json.dumps(results, indent=2)
+        if options["output"] == "-":
+            self.stdout.write(payload)
+        elif options["output"]:
+            Path(options["output"]).write_text(payload + "\n", encoding="utf-8")
+            self._log(f"Results written to {options['output']}")
+
+        if options["output"] != "-":
+            for name, stage in results["stages"].items():
+                self.stdout.write(
+                    f"{name:>22}: {stage['seconds']:8.2f}s "
+                    f"{stage['rows']:>9} rows {stage['queries']:>7} queries"
+                )
+        if baseline:
+            before_profile = baseline.get("meta", {}).get("profile")
+            if before_profile != results["meta"]["profile"]:
+                self._log("Baseline was run with a different fleet profile")
+            for name, before, after, ratio in iter_stage_comparison(results, baseline):
+                self.stdout.write(
+                    f"{name:>22}: {before:.2f}s -> {after:.2f}s ({ratio:.2f}x)"
+                )
+
+    def _use_scratch_database(self, db_path: Path) -> None:
+        """Point the default connection at ``db_path`` and migrate it."""
+        connection = connections["default"]
+        if connection.vendor != "sqlite":
+            raise CommandError("The pipeline benchmark only runs on SQLite")
+        connection.close()
+        connection.settings_dict["NAME"] = str(db_path)
+        settings.DATABASES["default"]["NAME"] = str(db_path)
+        self._log(f"Migrating scratch database {db_path}")
+        call_command("migrate", verbosity=0, interactive=False)
+
+    def _log(self, message: str) -> None:
+        self.stderr.write(f"[{datetime.now():%H:%M:%S}] {message}")
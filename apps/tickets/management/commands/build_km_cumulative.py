@@ -0,0 +1,53 @@
+"""Management command to rebuild the cumulative km index."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.tickets.infrastructure.services.kilometrage_cumulative_index import (
+    KilometrageCumulativeIndex,
+)
+
+
+class Command(BaseCommand):
+    """Recompute KilometrageRecordModel.cumulative_km.
+
+    Importers keep the running totals current; use this after editing
+    kilometrage rows by hand or to rebuild the index from scratch.
+
+    Usage:
+        python manage.py build_km_cumulative
+        python manage.py build_km_cumulative --unit A710 --unit CKD8G0013
+    """
+
+    help = "Rebuild the per-unit cumulative km index"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--unit",
+            dest="units",
+            action="append",
+            default=None,
+            metavar="UNIT_NUMBER",
+            help=(
+                "Rebuild only the specified unit (can be repeated for multiple "
+                "units). Defaults to all units."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        index = KilometrageCumulativeIndex()
+        unit_numbers = options.get("units")
+
+        if unit_numbers:
+            self.stdout.write(
+                f"Rebuilding cumulative km for: {', '.join(unit_numbers)}"
+            )
+            updated = index.refresh_units(
+                dict.fromkeys(u.strip().upper() for u in unit_numbers)
+            )
+        else:
+            self.stdout.write("Rebuilding cumulative km for all units...")
+            updated = index.rebuild_all()
+
+        self.stdout.write(self.style.SUCCESS(f"Done. {updated} record(s) updated."))
@@ -0,0 +1,51 @@
+"""Management command to rebuild the monthly kilometrage rollup."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.tickets.infrastructure.services.kilometrage_monthly_rollup import (
+    KilometrageMonthlyRollup,
+)
+
+
+class Command(BaseCommand):
+    """Recompute KilometrageMonthlyModel from the daily records.
+
+    Importers keep the rollup current; use this after editing kilometrage
+    rows by hand or to rebuild the table from scratch.
+
+    Usage:
+        python manage.py build_km_monthly
+        python manage.py build_km_monthly --unit A710 --unit CKD8G0013
+    """
+
+    help = "Rebuild the per-unit monthly km rollup"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--unit",
+            dest="units",
+            action="append",
+            default=None,
+            metavar="UNIT_NUMBER",
+            help=(
+                "Rebuild only the specified unit (can be repeated for multiple "
+                "units). Defaults to all units."
+            ),
+        )
+
+    def handle(self, *args, **options):
+        rollup = KilometrageMonthlyRollup()
+        unit_numbers = options.get("units")
+
+        if unit_numbers:
+            self.stdout.write(f"Rebuilding monthly km for: {', '.join(unit_numbers)}")
+            written = rollup.refresh_units(
+                dict.fromkeys(u.strip().upper() for u in unit_numbers)
+            )
+        else:
+            self.stdout.write("Rebuilding monthly km for all units...")
+            written = rollup.rebuild_all()
+
+        self.stdout.write(self.style.SUCCESS(f"Done. {written} month(s) written."))
@@ -0,0 +1,31 @@
+"""Management command to rebuild the novedad full-text search index."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tickets.infrastructure.services.novedad_search_index import (
+    NovedadSearchIndex,
+)
+
+
+class Command(BaseCommand):
+    """Repopulate novedad_fts from the novedad table.
+
+    Triggers keep the index current on every insert, update and delete; use
+    this after renaming units or intervention codes, or after VACUUM.
+
+    Usage:
+        python manage.py build_novedad_search
+    """
+
+    help = "Rebuild the FTS5 index used by the novedad search"
+
+    def handle(self, *args, **options):
+        index = NovedadSearchIndex()
+        if not index.is_available():
+            raise CommandError("novedad_fts does not exist; run migrate first.")
+
+        self.stdout.write("Rebuilding novedad search index...")
+        indexed = index.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} novedades."))
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
 from pathlib import Path
 
 from django.core.management.base import BaseCommand
 
+from apps.tickets.infrastructure.services.kilometrage_bulk_session import (
+    kilometrage_bulk_session,
+)
 from apps.tickets.infrastructure.services.legacy_kilometrage_importer import (
     LegacyKilometrageImporter,
 )
@@ -35,6 +39,22 @@ class Command(BaseCommand):
             action="store_true",
             help="Show what would be imported without writing",
         )
+        parser.add_argument(
+            "--drop-km-index",
+            action="store_true",
+            help="Drop km_unit_date_idx during the load and rebuild it at the end",
+        )
+        parser.add_argument(
+            "--direct-insert",
+            action="store_true",
+            help="Write rows with executemany INSERT OR IGNORE instead of the ORM",
+        )
+        parser.add_argument(
+            "--parse-workers",
+            type=int,
+            default=1,
+            help="Processes used to parse large files (0 = all cores)",
+        )
 
     def handle(self, *args, **options):
         base_path = Path(options["path"]) if options["path"] else self.DEFAULT_PATH
@@ -46,13 +66,22 @@ class Command(BaseCommand):
             f"Importing kilometrage from {base_path} (full={options['full']})"
         )
 
-        importer = LegacyKilometrageImporter()
-        stats = importer.import_all(
-            base_path=base_path,
-            full=options["full"],
-            dry_run=options["dry_run"],
-            raise_on_missing=False,
+        importer = LegacyKilometrageImporter(
+            direct_insert=options["direct_insert"],
+            parse_workers=options["parse_workers"],
         )
+        session = (
+            nullcontext()
+            if options["dry_run"]
+            else kilometrage_bulk_session(drop_index=options["drop_km_index"])
+        )
+        with session:
+            stats = importer.import_all(
+                base_path=base_path,
+                full=options["full"],
+                dry_run=options["dry_run"],
+                raise_on_missing=False,
+            )
         self.stdout.write(
             "Kilometrage: imported {inserted}, processed {processed}, "
             "skipped_old {skipped_old}, invalid {invalid}".format(
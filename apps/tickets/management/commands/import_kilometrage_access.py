@@ -5,8 +5,8 @@ from __future__ import annotations
 import json
 import subprocess
 import threading
+from contextlib import nullcontext
 from datetime import date, datetime
-from decimal import Decimal, InvalidOperation
 from pathlib import Path
 
 from django.conf import settings
@@ -14,6 +14,20 @@ from django.core.management.base import BaseCommand
 from django.db import transaction
 from django.db.models import Max
 
+from apps.tickets.infrastructure.services.kilometrage_bulk_session import (
+    kilometrage_bulk_session,
+)
+from apps.tickets.infrastructure.services.kilometrage_cumulative_index import (
+    KilometrageCumulativeIndex,
+)
+from apps.tickets.infrastructure.services.kilometrage_monthly_rollup import (
+    KilometrageMonthlyRollup,
+)
+from apps.tickets.infrastructure.services.row_decoders import (
+    CodeNormalizer,
+    DateDecoder,
+    parse_decimal,
+)
 from apps.tickets.infrastructure.services.unit_maintenance_snapshot_service import (
     UnitMaintenanceSnapshotService,
 )
@@ -98,6 +112,11 @@ class Command(BaseCommand):
             action="store_true",
             help="Skip final bulk refresh of maintenance snapshots",
         )
+        parser.add_argument(
+            "--drop-km-index",
+            action="store_true",
+            help="Drop km_unit_date_idx during the load and rebuild it at the end",
+        )
 
     def handle(self, *args, **options):
         script_path = Path(options["script_path"])
@@ -176,6 +195,7 @@ class Command(BaseCommand):
             source_label=source_label,
             update=options["update"],
             skip_snapshot_refresh=options["skip_snapshot_refresh"],
+            drop_km_index=options["drop_km_index"],
         )
 
     def _resolve_last_date(
@@ -251,6 +271,7 @@ class Command(BaseCommand):
         source_label: str,
         update: bool = False,
         skip_snapshot_refresh: bool = False,
+        drop_km_index: bool = False,
     ) -> None:
         total = len(records)
         processed = 0
@@ -259,6 +280,8 @@ class Command(BaseCommand):
         skipped = 0
         invalid = 0
         affected_units: set[str] = set()
+        cumulative_index = KilometrageCumulativeIndex()
+        start_by_unit: dict[str, date | None] = {}
 
         unit_id_by_number = {
             number.upper(): unit_id
@@ -268,6 +291,8 @@ class Command(BaseCommand):
         }
 
         batch: list[KilometrageRecordModel] = []
+        decode_date = DateDecoder()
+        normalize_unit = CodeNormalizer()
 
         def flush_batch() -> None:
             nonlocal inserted, updated, skipped, batch
@@ -294,40 +319,51 @@ class Command(BaseCommand):
                     skipped += len(batch) - len(result)
             batch = []
 
-        for record in records:
-            processed += 1
-            unit = (record.get("Unidad") or "").strip()
-            record_date = self._parse_date(record.get("Fecha"))
-            km_value = self._parse_decimal(record.get("Kilometros"))
-
-            if not unit or record_date is None or km_value is None:
-                invalid += 1
-            else:
-                affected_units.add(unit)
-                batch.append(
-                    KilometrageRecordModel(
-                        maintenance_unit_id=unit_id_by_number.get(unit.upper()),
-                        unit_number=unit,
-                        record_date=record_date,
-                        km_value=km_value,
-                        source=source_label,
+        # One transaction with relaxed PRAGMAs for the whole load.
+        session = (
+            nullcontext()
+            if dry_run
+            else kilometrage_bulk_session(drop_index=drop_km_index)
+        )
+        with session:
+            for record in records:
+                processed += 1
+                unit = normalize_unit(record.get("Unidad"))
+                record_date = decode_date(record.get("Fecha"))
+                km_value = parse_decimal(record.get("Kilometros"))
+
+                if not unit or record_date is None or km_value is None:
+                    invalid += 1
+                else:
+                    affected_units.add(unit)
+                    cumulative_index.track(start_by_unit, unit, record_date)
+                    batch.append(
+                        KilometrageRecordModel(
+                            maintenance_unit_id=unit_id_by_number.get(unit),
+                            unit_number=unit,
+                            record_date=record_date,
+                            km_value=km_value,
+                            source=source_label,
+                        )
                     )
+                    if len(batch) >= self.BATCH_SIZE:
+                        flush_batch()
+
+                self._log_progress(
+                    processed,
+                    total,
+                    inserted,
+                    updated,
+                    skipped,
+                    invalid,
+                    progress_every,
+                    update,
                 )
-                if len(batch) >= self.BATCH_SIZE:
-                    flush_batch()
-
-            self._log_progress(
-                processed,
-                total,
-                inserted,
-                updated,
-                skipped,
-                invalid,
-                progress_every,
-                update,
-            )
 
-        flush_batch()
+            flush_batch()
+            if not dry_run and start_by_unit:
+                cumulative_index.refresh_units(start_by_unit)
+                KilometrageMonthlyRollup().refresh_units(start_by_unit)
 
         if update:
             self.stdout.write(
@@ -399,45 +435,3 @@ class Command(BaseCommand):
                     invalid=invalid,
                 )
             )
-
-    def _parse_date(self, value: object) -> date | None:
-        if value is None:
-            return None
-        if isinstance(value, date):
-            return value
-        value_str = str(value).strip()
-        if not value_str:
-            return None
-        try:
-            return datetime.fromisoformat(value_str).date()
-        except ValueError:
-            pass
-        for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%d/%m/%Y"):
-            try:
-                return datetime.strptime(value_str, fmt).date()
-            except ValueError:
-                continue
-        return None
-
-    def _parse_decimal(self, value: object) -> Decimal | None:
-        if value is None:
-            return None
-        if isinstance(value, Decimal):
-            return value
-        if isinstance(value, (int, float)):
-            return Decimal(str(value))
-        value_str = str(value).strip()
-        if not value_str:
-            return None
-        # PowerShell outputs values in InvariantCulture (period as decimal separator).
-        # Try direct parse first to avoid stripping the period (e.g. "266.4" → 266.4).
-        try:
-            return Decimal(value_str)
-        except (InvalidOperation, ValueError):
-            pass
-        # Fallback: European format (period = thousands separator, comma = decimal).
-        value_str = value_str.replace(".", "").replace(",", ".")
-        try:
-            return Decimal(value_str)
-        except (InvalidOperation, ValueError):
-            return None
@@ -9,6 +9,10 @@ from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db import connection
 
+from apps.tickets.infrastructure.services.novedad_search_index import (
+    NovedadSearchIndex,
+)
+
 
 class Command(BaseCommand):
     """Compact and analyze the SQLite database."""
@@ -34,6 +38,13 @@ class Command(BaseCommand):
         with connection.cursor() as cursor:
             cursor.execute("VACUUM")
 
+        # VACUUM may renumber rowids of tables without an INTEGER PRIMARY
+        # KEY, and novedad_fts is keyed by the novedad rowid
+        search_index = NovedadSearchIndex()
+        if search_index.is_available():
+            self.stdout.write("Rebuilding novedad search index...")
+            search_index.rebuild()
+
         if options.get("analyze"):
             self.stdout.write("Running ANALYZE...")
             with connection.cursor() as cursor:
@@ -0,0 +1,53 @@
+"""Management command to run queued ingreso PDF and email jobs."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.tickets.application.use_cases.maintenance_entry_use_case import (
+    MaintenanceEntryUseCase,
+)
+from apps.tickets.infrastructure.models import IngresoJobModel
+from apps.tickets.infrastructure.services.ingreso_job_queue import IngresoJobQueue
+
+
+class Command(BaseCommand):
+    """Drain the ingreso job queue in this process.
+
+    The worker threads of the web process normally do this. Run it by hand
+    when no web process is up, or to retry jobs after fixing the cause of
+    a failure (``--retry-failed``).
+
+    Usage:
+        python manage.py process_ingreso_jobs
+        python manage.py process_ingreso_jobs --retry-failed
+    """
+
+    help = "Generate the PDF and email dispatch of queued maintenance entries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--retry-failed",
+            action="store_true",
+            help="Queue again the jobs that ran out of attempts",
+        )
+
+    def handle(self, *args, **options):
+        if options["retry_failed"]:
+            requeued = IngresoJobModel.objects.filter(
+                status=IngresoJobModel.Status.FAILED
+            ).update(status=IngresoJobModel.Status.QUEUED, attempts=0)
+            self.stdout.write(f"Requeued {requeued} failed jobs.")
+
+        job_queue = IngresoJobQueue()
+        handler = MaintenanceEntryUseCase(job_queue=job_queue).process_job
+        processed = 0
+        while job_queue.run_next(handler):
+            processed += 1
+
+        failed = IngresoJobModel.objects.filter(
+            status=IngresoJobModel.Status.FAILED
+        ).count()
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} jobs."))
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{failed} jobs failed."))
@@ -0,0 +1,45 @@
+"""Management command to recompute the home page counters."""
+
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from apps.tickets.infrastructure.services.dashboard_counters import (
+    COUNTER_FIELDS,
+    DashboardCountersService,
+)
+
+
+class Command(BaseCommand):
+    """Recount tickets and novedades into the dashboard_counters row.
+
+    Triggers keep the row current; the scheduler runs this nightly. Run it
+    by hand after restoring a backup or editing the database outside Django.
+
+    Usage:
+        python manage.py reconcile_dashboard_counters
+    """
+
+    help = "Recompute the home page ticket and novedad counters"
+
+    def handle(self, *args, **options):
+        result = DashboardCountersService().reconcile()
+        for field in COUNTER_FIELDS:
+            self.stdout.write(f"  {field}: {getattr(result.counters, field)}")
+        if result.drift:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Corrected drift: "
+                    + ", ".join(f"{k}={v:+d}" for k, v in result.drift.items())
+                )
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("Counters were already in sync."))
+        if result.missing_triggers:
+            self.stdout.write(
+                self.style.ERROR(
+                    "Missing triggers, counters will drift until "
+                    "`python manage.py migrate` re-creates them: "
+                    + ", ".join(result.missing_triggers)
+                )
+            )
@@ -0,0 +1,170 @@
+"""Reconcile Access Detenciones against SQLite novedades by bucket digest."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.tickets.infrastructure.services.access_extractor import (
+    AccessExtractor,
+    AccessExtractorConfig,
+)
+from apps.tickets.infrastructure.services.novedad_reconciliation import (
+    NovedadReconciliationService,
+    ReconciliationReport,
+    ReconciliationSource,
+)
+
+
+class Command(BaseCommand):
+    """Compare Detenciones per (unit, year) digest and report the differences."""
+
+    help = "Reconcile Access Detenciones with SQLite novedades (digest per unit/year)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--unit",
+            action="append",
+            dest="units",
+            help="Unit to reconcile (repeatable); default is the whole fleet",
+        )
+        parser.add_argument(
+            "--source",
+            choices=["locs", "ccrr", "both"],
+            default="both",
+            help="Access database(s) to read",
+        )
+        parser.add_argument(
+            "--since-date",
+            type=str,
+            default="1900-01-01",
+            help="Only compare fecha_desde after this date (YYYY-MM-DD, exclusive)",
+        )
+        parser.add_argument(
+            "--json",
+            type=str,
+            default=None,
+            help="Write the structured report to this path ('-' for stdout)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Keys listed per differing bucket in the text output",
+        )
+        parser.add_argument(
+            "--progress-every",
+            type=int,
+            default=5000,
+            help="Extractor progress heartbeat every N rows",
+        )
+        parser.add_argument(
+            "--with-count",
+            action="store_true",
+            help="Ask the extractor for a row count first (slower)",
+        )
+        parser.add_argument(
+            "--fail-on-diff",
+            action="store_true",
+            help="Exit with an error when any bucket differs",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            since_date = datetime.strptime(options["since_date"], "%Y-%m-%d").date()
+        except ValueError as exc:
+            raise CommandError("Invalid --since-date; use YYYY-MM-DD") from exc
+
+        service = NovedadReconciliationService(
+            extractor=AccessExtractor(
+                AccessExtractorConfig(
+                    script_path=Path(
+                        getattr(
+                            settings, "ACCESS_EXTRACTOR_SCRIPT", "extractor_access.ps1"
+                        )
+                    ),
+                    powershell_path=Path(
+                        getattr(
+                            settings,
+                            "ACCESS_POWERSHELL_PATH",
+                            r"C:\Windows\SysWOW64\WindowsPowerShell\v1.0\powershell.exe",
+                        )
+                    ),
+                ),
+                stdout_writer=self._log,
+                stderr_writer=self._log,
+            ),
+            sources=self._sources(options["source"]),
+            db_password=getattr(settings, "ACCESS_DB_PASSWORD", "") or None,
+            progress_every=options["progress_every"],
+            skip_count=not options["with_count"],
+            log=self._log,
+        )
+        report = service.reconcile(since_date=since_date, units=options["units"])
+
+        if options["json"]:
+            payload = json.dumps(report.to_dict(), indent=2, ensure_ascii=False)
+            if options["json"] == "-":
+                self.stdout.write(payload)
+            else:
+                Path(options["json"]).write_text(payload, encoding="utf-8")
+                self._log(f"Report written to {options['json']}")
+        if options["json"] != "-":
+            self._write_text_report(report, options["limit"])
+
+        if options["fail_on_diff"] and not report.is_consistent:
+            raise CommandError(
+                f"{len(report.diffs)} buckets differ "
+                f"({report.missing_total} missing, {report.extra_total} extra)"
+            )
+
+    @staticmethod
+    def _sources(selected: str) -> list[ReconciliationSource]:
+        sources = [
+            ReconciliationSource(
+                "LOCS", Path(getattr(settings, "ACCESS_BASELOCS_PATH", "")), "Locs"
+            ),
+            ReconciliationSource(
+                "CCRR", Path(getattr(settings, "ACCESS_BASECCRR_PATH", "")), "Coche"
+            ),
+        ]
+        if selected == "locs":
+            return sources[:1]
+        if selected == "ccrr":
+            return sources[1:]
+        return sources
+
+    def _write_text_report(self, report: ReconciliationReport, limit: int) -> None:
+        for diff in report.diffs:
+            self.stdout.write(
+                f"\n=== {diff.unit} {diff.year}: Access {diff.access_keys} keys, "
+                f"SQLite {diff.sqlite_keys} keys ==="
+            )
+            self.stdout.write(f"Missing in SQLite: {len(diff.missing_in_sqlite)}")
+            for fecha, intervencion in diff.missing_in_sqlite[:limit]:
+                self.stdout.write(f"   {fecha} {intervencion}")
+            self.stdout.write(f"Extra in SQLite: {len(diff.extra_in_sqlite)}")
+            for fecha, intervencion in diff.extra_in_sqlite[:limit]:
+                self.stdout.write(f"   {fecha} {intervencion}")
+
+        self.stdout.write(
+            "\nAccess rows {access_rows} ({invalid} without key), SQLite rows "
+            "{sqlite_rows}; {units} units / {buckets} buckets compared, "
+            "{differing} units differ; missing {missing}, extra {extra}".format(
+                access_rows=report.access_rows,
+                invalid=report.access_invalid_rows,
+                sqlite_rows=report.sqlite_rows,
+                units=report.units_compared,
+                buckets=report.buckets_compared,
+                differing=report.units_differing,
+                missing=report.missing_total,
+                extra=report.extra_total,
+            )
+        )
+
+    def _log(self, message: str) -> None:
+        self.stderr.write(f"[{datetime.now():%H:%M:%S}] {message}")
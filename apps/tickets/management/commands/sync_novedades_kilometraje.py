@@ -173,6 +173,7 @@ class Command(BaseCommand):
             stdout_writer=self.stdout.write,
             stderr_writer=self.stderr.write,
             filters=filters,
+            bulk_load=options["full"],
         )
 
         self.stdout.write("Resumen final")
@@ -193,3 +194,15 @@ class Command(BaseCommand):
         self.stdout.write(
             "Duration: {seconds:.2f}s".format(seconds=result.duration_seconds)
         )
+        for source, seconds in result.source_durations.items():
+            self.stdout.write(
+                "  Extraccion {source}: {seconds:.2f}s".format(
+                    source=source, seconds=seconds
+                )
+            )
+        for stage in result.stage_timings:
+            self.stdout.write(
+                "  {stage} {source} {table}: {seconds:.2f}s, {rows} rows".format(
+                    **stage
+                )
+            )
@@ -0,0 +1,58 @@
+"""Add per-unit cumulative km to kilometrage records and backfill it."""
+
+from decimal import Decimal
+
+from django.db import migrations, models
+
+BATCH_SIZE = 2000
+
+
+def backfill_cumulative_km(apps, schema_editor):
+    """Store the running km total per unit, ordered by record date."""
+
+    record_model = apps.get_model("tickets", "KilometrageRecordModel")
+    unit_numbers = (
+        record_model.objects.order_by().values_list("unit_number", flat=True).distinct()
+    )
+
+    for unit_number in list(unit_numbers):
+        running = Decimal("0")
+        pending = []
+        rows = (
+            record_model.objects.filter(unit_number=unit_number)
+            .order_by("record_date")
+            .values_list("id", "km_value")
+        )
+        for record_id, km_value in rows.iterator(chunk_size=BATCH_SIZE):
+            running += km_value
+            pending.append(record_model(id=record_id, cumulative_km=running))
+            if len(pending) >= BATCH_SIZE:
+                record_model.objects.bulk_update(pending, ["cumulative_km"])
+                pending = []
+        if pending:
+            record_model.objects.bulk_update(pending, ["cumulative_km"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0033_dedupe_novedad_business_key_and_unique"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="kilometragerecordmodel",
+            name="cumulative_km",
+            field=models.DecimalField(
+                blank=True,
+                decimal_places=2,
+                help_text="Suma de km de la unidad hasta esta fecha inclusive",
+                max_digits=14,
+                null=True,
+                verbose_name="Kilometraje acumulado",
+            ),
+        ),
+        migrations.RunPython(
+            backfill_cumulative_km,
+            migrations.RunPython.noop,
+        ),
+    ]
@@ -0,0 +1,117 @@
+"""Add the per-unit monthly kilometrage rollup and backfill it.
+
+Rollup rows are keyed by the upper-cased unit number, so daily records
+stored with mixed-case numbers by older imports fold into the same row.
+"""
+
+import uuid
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth, Upper
+
+BATCH_SIZE = 2000
+
+
+def backfill_monthly_rollup(apps, schema_editor):
+    """Aggregate the daily records into one row per unit and month."""
+
+    record_model = apps.get_model("tickets", "KilometrageRecordModel")
+    monthly_model = apps.get_model("tickets", "KilometrageMonthlyModel")
+    rows = (
+        record_model.objects.order_by()
+        .annotate(unit_key=Upper("unit_number"), month=TruncMonth("record_date"))
+        .values("unit_key", "month")
+        .annotate(km_total=Sum("km_value"), record_count=Count("id"))
+    )
+    pending = []
+    for row in rows.iterator(chunk_size=BATCH_SIZE):
+        pending.append(
+            monthly_model(
+                unit_number=row["unit_key"],
+                month=row["month"],
+                km_total=row["km_total"],
+                record_count=row["record_count"],
+            )
+        )
+        if len(pending) >= BATCH_SIZE:
+            monthly_model.objects.bulk_create(pending)
+            pending = []
+    if pending:
+        monthly_model.objects.bulk_create(pending)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0034_kilometragerecordmodel_cumulative_km"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="KilometrageMonthlyModel",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Fecha de creación"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="Fecha de actualización"
+                    ),
+                ),
+                (
+                    "unit_number",
+                    models.CharField(max_length=50, verbose_name="Número de unidad"),
+                ),
+                (
+                    "month",
+                    models.DateField(
+                        help_text="Primer día del mes", verbose_name="Mes"
+                    ),
+                ),
+                (
+                    "km_total",
+                    models.DecimalField(
+                        decimal_places=2,
+                        max_digits=14,
+                        verbose_name="Kilometraje del mes",
+                    ),
+                ),
+                (
+                    "record_count",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="Registros diarios"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Kilometraje mensual",
+                "verbose_name_plural": "Kilometraje mensual",
+                "db_table": "kilometrage_monthly",
+                "ordering": ["unit_number", "-month"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("unit_number", "month"),
+                        name="uniq_kilometrage_monthly_unit_month",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(
+            backfill_monthly_rollup,
+            migrations.RunPython.noop,
+        ),
+    ]
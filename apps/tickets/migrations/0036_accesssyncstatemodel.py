@@ -0,0 +1,64 @@
+"""Add the per-source Access extraction watermark table."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0035_kilometragemonthlymodel"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AccessSyncStateModel",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("source", models.CharField(max_length=30, verbose_name="Origen")),
+                (
+                    "table_name",
+                    models.CharField(max_length=50, verbose_name="Tabla Access"),
+                ),
+                (
+                    "last_id",
+                    models.BigIntegerField(
+                        blank=True,
+                        help_text="Mayor autonumérico Access importado",
+                        null=True,
+                        verbose_name="Último ID",
+                    ),
+                ),
+                (
+                    "last_date",
+                    models.DateField(
+                        blank=True,
+                        help_text="Mayor fecha de registro importada",
+                        null=True,
+                        verbose_name="Última fecha",
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="Actualizado"),
+                ),
+            ],
+            options={
+                "verbose_name": "Estado de sync Access",
+                "verbose_name_plural": "Estados de sync Access",
+                "db_table": "access_sync_state",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("source", "table_name"),
+                        name="uniq_access_sync_state_source_table",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,19 @@
+"""Store per-stage timings with each Access sync log entry."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0036_accesssyncstatemodel"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="accesssynclogmodel",
+            name="stage_timings",
+            field=models.JSONField(
+                blank=True, default=list, verbose_name="Tiempos por etapa"
+            ),
+        ),
+    ]
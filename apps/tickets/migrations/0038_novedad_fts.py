@@ -0,0 +1,101 @@
+"""Add the novedad_fts full-text index and the triggers that maintain it.
+
+The column expressions mirror
+apps.tickets.infrastructure.services.novedad_search_index; rebuild the
+index with ``build_novedad_search`` if they change.
+"""
+
+from django.db import migrations
+
+CREATE_TABLE = """
+CREATE VIRTUAL TABLE novedad_fts USING fts5(
+    novedad_id UNINDEXED,
+    unit,
+    intervencion,
+    observaciones,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+
+INSERT_NEW = """
+INSERT INTO novedad_fts (rowid, novedad_id, unit, intervencion, observaciones)
+    VALUES (
+        NEW.rowid,
+        NEW.id,
+        coalesce((SELECT number FROM maintenance_unit WHERE id = NEW.maintenance_unit_id), '')
+            || ' ' || coalesce(NEW.legacy_unit_code, '')
+            || ' ' || ltrim(
+                coalesce((SELECT number FROM maintenance_unit WHERE id = NEW.maintenance_unit_id), ''),
+                'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+            )
+            || ' ' || ltrim(
+                coalesce(NEW.legacy_unit_code, ''),
+                'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+            ),
+        coalesce((SELECT codigo FROM intervencion_tipo WHERE id = NEW.intervencion_id), '')
+            || ' ' || coalesce(NEW.legacy_intervencion_codigo, ''),
+        coalesce(NEW.observaciones, '')
+    );
+"""
+
+CREATE_TRIGGERS = [
+    f"""
+CREATE TRIGGER novedad_fts_ai AFTER INSERT ON novedad BEGIN
+{INSERT_NEW}
+END
+""",
+    """
+CREATE TRIGGER novedad_fts_ad AFTER DELETE ON novedad BEGIN
+    DELETE FROM novedad_fts WHERE rowid = OLD.rowid;
+END
+""",
+    f"""
+CREATE TRIGGER novedad_fts_au AFTER UPDATE OF
+    maintenance_unit_id,
+    legacy_unit_code,
+    intervencion_id,
+    legacy_intervencion_codigo,
+    observaciones
+ON novedad BEGIN
+    DELETE FROM novedad_fts WHERE rowid = OLD.rowid;
+{INSERT_NEW}
+END
+""",
+]
+
+POPULATE = """
+INSERT INTO novedad_fts (rowid, novedad_id, unit, intervencion, observaciones)
+    SELECT n.rowid, n.id,
+        coalesce((SELECT number FROM maintenance_unit WHERE id = n.maintenance_unit_id), '')
+            || ' ' || coalesce(n.legacy_unit_code, '')
+            || ' ' || ltrim(
+                coalesce((SELECT number FROM maintenance_unit WHERE id = n.maintenance_unit_id), ''),
+                'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+            )
+            || ' ' || ltrim(
+                coalesce(n.legacy_unit_code, ''),
+                'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+            ),
+        coalesce((SELECT codigo FROM intervencion_tipo WHERE id = n.intervencion_id), '')
+            || ' ' || coalesce(n.legacy_intervencion_codigo, ''),
+        coalesce(n.observaciones, '')
+    FROM novedad AS n
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0037_accesssynclog_stage_timings"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=[CREATE_TABLE, *CREATE_TRIGGERS, POPULATE],
+            reverse_sql=[
+                "DROP TRIGGER IF EXISTS novedad_fts_au",
+                "DROP TRIGGER IF EXISTS novedad_fts_ad",
+                "DROP TRIGGER IF EXISTS novedad_fts_ai",
+                "DROP TABLE IF EXISTS novedad_fts",
+            ],
+        ),
+    ]
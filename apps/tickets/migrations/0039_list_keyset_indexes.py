@@ -0,0 +1,33 @@
+"""Widen the list date indexes to the keyset pagination order."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0038_novedad_fts"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="novedadmodel",
+            name="novedad_fecha_d_f52441_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="ticketmodel",
+            name="ticket_date_4c710e_idx",
+        ),
+        migrations.AddIndex(
+            model_name="novedadmodel",
+            index=models.Index(
+                fields=["fecha_desde", "created_at", "id"],
+                name="novedad_fecha_d_8f76d1_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ticketmodel",
+            index=models.Index(
+                fields=["date", "created_at", "id"], name="ticket_date_d45b80_idx"
+            ),
+        ),
+    ]
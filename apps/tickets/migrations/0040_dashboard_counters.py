@@ -0,0 +1,186 @@
+"""Add the home page counters row and the triggers that maintain it.
+
+Status values mirror TicketModel.Status. The row is seeded without
+``as_of``, so the first home page load recomputes every counter.
+"""
+
+from django.db import migrations, models
+
+PENDING = "(CASE WHEN {row}.status = 'pendiente' THEN 1 ELSE 0 END)"
+COMPLETED = "(CASE WHEN {row}.status = 'finalizado' THEN 1 ELSE 0 END)"
+TODAY = "(CASE WHEN {row}.fecha_desde = as_of THEN 1 ELSE 0 END)"
+THIS_WEEK = "(CASE WHEN {row}.fecha_desde >= week_start THEN 1 ELSE 0 END)"
+
+
+def _trigger(name: str, event: str, table: str, assignments: list[str]) -> str:
+    return (
+        f"CREATE TRIGGER {name} AFTER {event} ON {table} BEGIN "
+        f"UPDATE dashboard_counters SET {', '.join(assignments)} WHERE id = 1; "
+        "END"
+    )
+
+
+CREATE_TRIGGERS = [
+    _trigger(
+        "dashboard_ticket_ai",
+        "INSERT",
+        "ticket",
+        [
+            "tickets_total = tickets_total + 1",
+            f"tickets_pending = tickets_pending + {PENDING.format(row='NEW')}",
+            f"tickets_completed = tickets_completed + {COMPLETED.format(row='NEW')}",
+        ],
+    ),
+    _trigger(
+        "dashboard_ticket_ad",
+        "DELETE",
+        "ticket",
+        [
+            "tickets_total = tickets_total - 1",
+            f"tickets_pending = tickets_pending - {PENDING.format(row='OLD')}",
+            f"tickets_completed = tickets_completed - {COMPLETED.format(row='OLD')}",
+        ],
+    ),
+    _trigger(
+        "dashboard_ticket_au",
+        "UPDATE OF status",
+        "ticket",
+        [
+            f"tickets_pending = tickets_pending + {PENDING.format(row='NEW')}"
+            f" - {PENDING.format(row='OLD')}",
+            f"tickets_completed = tickets_completed + {COMPLETED.format(row='NEW')}"
+            f" - {COMPLETED.format(row='OLD')}",
+        ],
+    ),
+    _trigger(
+        "dashboard_novedad_ai",
+        "INSERT",
+        "novedad",
+        [
+            "novedades_total = novedades_total + 1",
+            f"novedades_hoy = novedades_hoy + {TODAY.format(row='NEW')}",
+            f"novedades_semana = novedades_semana + {THIS_WEEK.format(row='NEW')}",
+        ],
+    ),
+    _trigger(
+        "dashboard_novedad_ad",
+        "DELETE",
+        "novedad",
+        [
+            "novedades_total = novedades_total - 1",
+            f"novedades_hoy = novedades_hoy - {TODAY.format(row='OLD')}",
+            f"novedades_semana = novedades_semana - {THIS_WEEK.format(row='OLD')}",
+        ],
+    ),
+    _trigger(
+        "dashboard_novedad_au",
+        "UPDATE OF fecha_desde",
+        "novedad",
+        [
+            f"novedades_hoy = novedades_hoy + {TODAY.format(row='NEW')}"
+            f" - {TODAY.format(row='OLD')}",
+            f"novedades_semana = novedades_semana + {THIS_WEEK.format(row='NEW')}"
+            f" - {THIS_WEEK.format(row='OLD')}",
+        ],
+    ),
+]
+
+SEED = """
+INSERT INTO dashboard_counters (
+    id, tickets_pending, tickets_completed, tickets_total,
+    novedades_hoy, novedades_semana, novedades_total
+)
+SELECT 1,
+    (SELECT count(*) FROM ticket WHERE status = 'pendiente'),
+    (SELECT count(*) FROM ticket WHERE status = 'finalizado'),
+    (SELECT count(*) FROM ticket),
+    0,
+    0,
+    (SELECT count(*) FROM novedad)
+"""
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0039_list_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DashboardCountersModel",
+            fields=[
+                (
+                    "id",
+                    models.PositiveSmallIntegerField(
+                        default=1, primary_key=True, serialize=False
+                    ),
+                ),
+                (
+                    "tickets_pending",
+                    models.IntegerField(default=0, verbose_name="Tickets pendientes"),
+                ),
+                (
+                    "tickets_completed",
+                    models.IntegerField(default=0, verbose_name="Tickets finalizados"),
+                ),
+                (
+                    "tickets_total",
+                    models.IntegerField(default=0, verbose_name="Tickets totales"),
+                ),
+                (
+                    "novedades_hoy",
+                    models.IntegerField(default=0, verbose_name="Novedades hoy"),
+                ),
+                (
+                    "novedades_semana",
+                    models.IntegerField(
+                        default=0, verbose_name="Novedades de la semana"
+                    ),
+                ),
+                (
+                    "novedades_total",
+                    models.IntegerField(default=0, verbose_name="Novedades totales"),
+                ),
+                (
+                    "as_of",
+                    models.DateField(
+                        blank=True,
+                        help_text=(
+                            "Día al que corresponden las novedades de hoy y de "
+                            "la semana"
+                        ),
+                        null=True,
+                        verbose_name="Día de referencia",
+                    ),
+                ),
+                (
+                    "week_start",
+                    models.DateField(
+                        blank=True, null=True, verbose_name="Inicio de semana"
+                    ),
+                ),
+                (
+                    "reconciled_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Último recálculo"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Contadores del inicio",
+                "verbose_name_plural": "Contadores del inicio",
+                "db_table": "dashboard_counters",
+            },
+        ),
+        migrations.RunSQL(
+            sql=[*CREATE_TRIGGERS, SEED],
+            reverse_sql=[
+                "DROP TRIGGER IF EXISTS dashboard_novedad_au",
+                "DROP TRIGGER IF EXISTS dashboard_novedad_ad",
+                "DROP TRIGGER IF EXISTS dashboard_novedad_ai",
+                "DROP TRIGGER IF EXISTS dashboard_ticket_au",
+                "DROP TRIGGER IF EXISTS dashboard_ticket_ad",
+                "DROP TRIGGER IF EXISTS dashboard_ticket_ai",
+            ],
+        ),
+    ]
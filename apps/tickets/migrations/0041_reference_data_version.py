@@ -0,0 +1,70 @@
+"""Add the reference-data version stamp and the triggers that bump it.
+
+The UPDATE triggers only watch the columns that feed the form option
+lists (see apps.tickets.infrastructure.services.reference_data_cache).
+"""
+
+from django.db import migrations, models
+
+WATCHED_COLUMNS = {
+    "maintenance_unit": ["number", "unit_type", "rolling_stock_category"],
+    "intervencion_tipo": ["codigo", "descripcion", "is_active"],
+    "lugar": ["codigo", "descripcion", "short_desc", "is_active"],
+    "train_number": ["number", "is_active"],
+    "failure_type": ["code", "is_active"],
+}
+
+BUMP = "UPDATE reference_data_version SET version = version + 1 WHERE id = 1;"
+
+
+def _triggers() -> tuple[list[str], list[str]]:
+    create, drop = [], []
+    for table, columns in WATCHED_COLUMNS.items():
+        events = {
+            "ai": "INSERT",
+            "ad": "DELETE",
+            "au": f"UPDATE OF {', '.join(columns)}",
+        }
+        for suffix, event in events.items():
+            name = f"reference_version_{table}_{suffix}"
+            create.append(
+                f"CREATE TRIGGER {name} AFTER {event} ON {table} BEGIN {BUMP} END"
+            )
+            drop.append(f"DROP TRIGGER IF EXISTS {name}")
+    return create, drop
+
+
+CREATE_TRIGGERS, DROP_TRIGGERS = _triggers()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0040_dashboard_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReferenceDataVersionModel",
+            fields=[
+                (
+                    "id",
+                    models.PositiveSmallIntegerField(
+                        default=1, primary_key=True, serialize=False
+                    ),
+                ),
+                ("version", models.BigIntegerField(default=1, verbose_name="Versión")),
+            ],
+            options={
+                "verbose_name": "Versión de datos de referencia",
+                "verbose_name_plural": "Versiones de datos de referencia",
+                "db_table": "reference_data_version",
+            },
+        ),
+        migrations.RunSQL(
+            sql=[
+                *CREATE_TRIGGERS,
+                "INSERT INTO reference_data_version (id, version) VALUES (1, 1)",
+            ],
+            reverse_sql=DROP_TRIGGERS,
+        ),
+    ]
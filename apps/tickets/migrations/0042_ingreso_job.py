@@ -0,0 +1,139 @@
+"""Add the queue table for background ingreso PDF and email jobs."""
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0041_reference_data_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IngresoJobModel",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4,
+                        editable=False,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, verbose_name="Fecha de creación"
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(
+                        auto_now=True, verbose_name="Fecha de actualización"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("queued", "Queued"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="queued",
+                        max_length=20,
+                        verbose_name="Estado",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveIntegerField(default=0, verbose_name="Intentos"),
+                ),
+                (
+                    "last_error",
+                    models.TextField(blank=True, null=True, verbose_name="Error"),
+                ),
+                (
+                    "origin_terminal_id",
+                    models.CharField(
+                        blank=True,
+                        max_length=36,
+                        null=True,
+                        verbose_name="Terminal de origen",
+                    ),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Fecha de inicio"
+                    ),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="Fecha de fin"
+                    ),
+                ),
+                (
+                    "recipients_status",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=20,
+                        verbose_name="Estado de destinatarios",
+                    ),
+                ),
+                (
+                    "recipients_reason",
+                    models.TextField(
+                        blank=True, null=True, verbose_name="Motivo de destinatarios"
+                    ),
+                ),
+                (
+                    "outlook_status",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        max_length=20,
+                        verbose_name="Estado de correo",
+                    ),
+                ),
+                (
+                    "outlook_reason",
+                    models.TextField(
+                        blank=True, null=True, verbose_name="Motivo de correo"
+                    ),
+                ),
+                (
+                    "entry",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="jobs",
+                        to="tickets.maintenanceentrymodel",
+                        verbose_name="Ingreso",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Ingreso - Trabajo en segundo plano",
+                "verbose_name_plural": "Ingresos - Trabajos en segundo plano",
+                "db_table": "ingreso_job",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "created_at"],
+                        name="ingreso_job_status_2f12b4_idx",
+                    ),
+                    models.Index(
+                        fields=["entry"], name="ingreso_job_entry_i_778aeb_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
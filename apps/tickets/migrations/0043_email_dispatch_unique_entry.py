@@ -0,0 +1,59 @@
+"""Deduplicate email dispatches per ingreso and make entry unique.
+
+A retried background job could queue a second dispatch for the same
+ingreso. Keep the most advanced one (sent, then drafted, claimed, pending,
+failed; oldest first) and delete the rest.
+"""
+
+from django.db import migrations, models
+
+STATUS_PRIORITY = ["sent", "drafted", "claimed", "pending", "failed"]
+
+
+def dedupe_email_dispatches(apps, schema_editor):
+    """Keep one dispatch per entry, preferring the furthest along."""
+
+    DispatchModel = apps.get_model("tickets", "MaintenanceEntryEmailDispatchModel")
+
+    rows = DispatchModel.objects.order_by("entry_id", "created_at", "id").values_list(
+        "id", "entry_id", "status"
+    )
+
+    best: dict = {}
+    ids_to_delete = []
+    for dispatch_id, entry_id, status in rows.iterator():
+        rank = (
+            STATUS_PRIORITY.index(status)
+            if status in STATUS_PRIORITY
+            else len(STATUS_PRIORITY)
+        )
+        kept = best.get(entry_id)
+        if kept is None:
+            best[entry_id] = (rank, dispatch_id)
+        elif rank < kept[0]:
+            ids_to_delete.append(kept[1])
+            best[entry_id] = (rank, dispatch_id)
+        else:
+            ids_to_delete.append(dispatch_id)
+
+    if ids_to_delete:
+        DispatchModel.objects.filter(id__in=ids_to_delete).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("tickets", "0042_ingreso_job"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            dedupe_email_dispatches,
+            migrations.RunPython.noop,
+        ),
+        migrations.AddConstraint(
+            model_name="maintenanceentryemaildispatchmodel",
+            constraint=models.UniqueConstraint(
+                fields=["entry"], name="uniq_email_dispatch_per_entry"
+            ),
+        ),
+    ]
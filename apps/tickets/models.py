@@ -6,12 +6,16 @@ so Django can find them for migrations and admin.
 
 from apps.tickets.infrastructure.models import (
     AccessSyncLogModel,
+    AccessSyncStateModel,
     AffectedSystemModel,
     BaseModel,
     BrandModel,
+    DashboardCountersModel,
     FailureTypeModel,
     GOPModel,
+    IngresoJobModel,
     IntervencionTipoModel,
+    KilometrageMonthlyModel,
     KilometrageRecordModel,
     LocomotiveModel,
     LocomotiveModelModel,
@@ -26,6 +30,7 @@ from apps.tickets.infrastructure.models import (
     PersonalModel,
     RailcarClassModel,
     RailcarModel,
+    ReferenceDataVersionModel,
     TicketModel,
     TrainNumberModel,
     WagonModel,
@@ -35,11 +40,15 @@ from apps.tickets.infrastructure.models import (
 __all__ = [
     "BaseModel",
     "AccessSyncLogModel",
+    "AccessSyncStateModel",
     "AffectedSystemModel",
     "BrandModel",
+    "DashboardCountersModel",
     "FailureTypeModel",
     "GOPModel",
+    "IngresoJobModel",
     "IntervencionTipoModel",
+    "KilometrageMonthlyModel",
     "KilometrageRecordModel",
     "LugarEmailRecipientModel",
     "LocomotiveModel",
@@ -54,6 +63,7 @@ __all__ = [
     "PersonalModel",
     "RailcarClassModel",
     "RailcarModel",
+    "ReferenceDataVersionModel",
     "WagonModel",
     "WagonTypeModel",
     "TicketModel",
@@ -0,0 +1,33 @@
+"""JSON endpoint polled by the novedad detail page while an ingreso job runs."""
+
+from __future__ import annotations
+
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, JsonResponse
+from django.views.decorators.cache import never_cache
+from django.views.decorators.http import require_GET
+
+from apps.tickets.infrastructure.services.ingreso_job_queue import IngresoJobQueue
+
+
+@login_required
+@never_cache
+@require_GET
+def ingreso_job_status(request, entry_id):
+    """Return the state of the latest background job of an entry."""
+    job = IngresoJobQueue().latest_for_entry(entry_id)
+    if job is None:
+        raise Http404("No job for this entry")
+
+    return JsonResponse(
+        {
+            "status": job.status,
+            "finished": job.is_finished,
+            "pdf_ready": bool(job.entry.pdf_path),
+            "attempts": job.attempts,
+            "recipients_status": job.recipients_status,
+            "outlook_status": job.outlook_status,
+            "outlook_reason": job.outlook_reason,
+            "last_error": job.last_error,
+        }
+    )
@@ -0,0 +1,206 @@
+"""Cursor (keyset) pagination for the list views.
+
+Offset pagination costs a ``COUNT(*)`` plus an ``OFFSET`` scan per page,
+and both grow with the page depth. Here the page boundary is the row's
+ordering key instead: the next page is ``WHERE key < last_key ORDER BY key
+LIMIT n + 1``, which uses the ordering index at any depth.
+
+The key is the queryset's own ``order_by`` plus the primary key as a
+tiebreaker, so the same paginator serves the date ordering of the lists
+and the rank ordering of the FTS search. Cursors are opaque, URL-safe
+strings passed back as ``?after=`` or ``?before=``.
+
+The header count is capped (``COUNT`` over ``LIMIT count_cap + 1``), so it
+stays cheap on wide date ranges; ``paginator.count`` is still exact, but
+it is only computed when read.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from functools import cached_property
+from uuid import UUID
+
+from django.db.models import Q, QuerySet
+
+AFTER_PARAM = "after"
+BEFORE_PARAM = "before"
+
+
+def _encode_value(value):
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: list) -> str:
+    payload = json.dumps([_encode_value(value) for value in values])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list | None:
+    """Values of a cursor, or None if it is malformed or has the wrong size."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
+    if not isinstance(values, list) or len(values) != size:
+        return None
+    return values
+
+
+class KeysetPaginator:
+    """Pages a queryset by its ordering key rather than by offset."""
+
+    def __init__(self, queryset: QuerySet, per_page: int, count_cap: int = 1000):
+        self.queryset = queryset
+        self.per_page = per_page
+        self.count_cap = count_cap
+        self.ordering = self._ordering(queryset)
+
+    @staticmethod
+    def _ordering(queryset: QuerySet) -> list[tuple[str, bool]]:
+        """(name, descending) pairs, ending with the primary key."""
+        ordering = []
+        for term in queryset.query.order_by or queryset.model._meta.ordering:
+            if not isinstance(term, str) or term == "?":
+                raise ValueError(
+                    f"Keyset pagination needs plain field ordering: {term}"
+                )
+            name = term.lstrip("-")
+            ordering.append(("pk" if name in ("pk", "id") else name, term[0] == "-"))
+        if not any(name == "pk" for name, _ in ordering):
+            descending = ordering[-1][1] if ordering else False
+            ordering.append(("pk", descending))
+        return ordering
+
+    @cached_property
+    def count(self) -> int:
+        """Exact row count; runs a full COUNT(*) when first read."""
+        return self.queryset.count()
+
+    @cached_property
+    def approximate_count(self) -> int:
+        """Row count capped at ``count_cap`` + 1 rows scanned."""
+        return self.queryset[: self.count_cap + 1].count()
+
+    @property
+    def count_is_capped(self) -> bool:
+        return self.approximate_count > self.count_cap
+
+    def page(self, after: str | None = None, before: str | None = None):
+        size = len(self.ordering)
+        after_values = decode_cursor(after, size) if after else None
+        before_values = None if after_values else decode_cursor(before or "", size)
+
+        if before_values is not None:
+            rows = list(
+                self._seek(self.queryset, before_values, reverse=True).order_by(
+                    *self._order_terms(reverse=True)
+                )[: self.per_page + 1]
+            )
+            has_previous = len(rows) > self.per_page
+            rows = rows[: self.per_page]
+            rows.reverse()
+            return KeysetPage(self, rows, has_previous=has_previous, has_next=True)
+
+        queryset = self.queryset.order_by(*self._order_terms())
+        if after_values is not None:
+            queryset = self._seek(queryset, after_values)
+        rows = list(queryset[: self.per_page + 1])
+        has_next = len(rows) > self.per_page
+        return KeysetPage(
+            self,
+            rows[: self.per_page],
+            has_previous=after_values is not None,
+            has_next=has_next,
+        )
+
+    def cursor_for(self, row) -> str:
+        return encode_cursor(
+            [
+                row.pk if name == "pk" else getattr(row, name)
+                for name, _ in self.ordering
+            ]
+        )
+
+    def _order_terms(self, reverse: bool = False) -> list[str]:
+        return [
+            f"-{name}" if descending != reverse else name
+            for name, descending in self.ordering
+        ]
+
+    def _seek(self, queryset: QuerySet, values: list, reverse: bool = False):
+        """Rows strictly past ``values`` in (possibly reversed) key order.
+
+        Expanded as ``a > x OR (a = x AND b > y) OR ...`` since row-value
+        comparisons are not available as ORM lookups here.
+        """
+        condition = Q()
+        equal: dict = {}
+        for (name, descending), value in zip(self.ordering, values, strict=True):
+            lookup = "lt" if descending != reverse else "gt"
+            condition |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        return queryset.filter(condition)
+
+
+class KeysetPage:
+    """One page of rows plus the cursors to its neighbours."""
+
+    def __init__(self, paginator, object_list, has_previous, has_next):
+        self.paginator = paginator
+        self.object_list = object_list
+        self.has_previous_page = has_previous and bool(object_list)
+        self.has_next_page = has_next and bool(object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def has_previous(self) -> bool:
+        return self.has_previous_page
+
+    def has_next(self) -> bool:
+        return self.has_next_page
+
+    def has_other_pages(self) -> bool:
+        return self.has_previous_page or self.has_next_page
+
+    @property
+    def previous_cursor(self) -> str | None:
+        if not self.has_previous_page:
+            return None
+        return self.paginator.cursor_for(self.object_list[0])
+
+    @property
+    def next_cursor(self) -> str | None:
+        if not self.has_next_page:
+            return None
+        return self.paginator.cursor_for(self.object_list[-1])
+
+
+class KeysetPaginationMixin:
+    """ListView mixin: replaces ``?page=`` offsets with ``?after=``/``?before=``.
+
+    The queryset must be ordered by plain fields or annotations; the primary
+    key is appended as a tiebreaker.
+    """
+
+    count_cap = 1000
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(queryset, page_size, count_cap=self.count_cap)
+        page = paginator.page(
+            after=self.request.GET.get(AFTER_PARAM),
+            before=self.request.GET.get(BEFORE_PARAM),
+        )
+        return paginator, page, page.object_list, page.has_other_pages()
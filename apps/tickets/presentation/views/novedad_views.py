@@ -36,15 +36,23 @@ from apps.tickets.domain.services.intervention_suggestion import (
     InterventionPriorityResolver,
 )
 from apps.tickets.infrastructure.models.access_sync_log import AccessSyncLogModel
+from apps.tickets.infrastructure.services.kilometrage_cache import (
+    kilometrage_lookup_cache,
+)
 from apps.tickets.infrastructure.services.kilometrage_repository import (
     KilometrageRepository,
 )
+from apps.tickets.infrastructure.services.novedad_search_index import (
+    NovedadSearchIndex,
+)
+from apps.tickets.infrastructure.services.reference_data_cache import (
+    NOVEDAD_OPTIONS,
+)
 from apps.tickets.infrastructure.services.unit_maintenance_snapshot_service import (
     UnitMaintenanceSnapshotService,
 )
 from apps.tickets.models import (
-    IntervencionTipoModel,
-    LugarModel,
+    IngresoJobModel,
     MaintenanceUnitModel,
     NovedadModel,
 )
@@ -53,12 +61,20 @@ from apps.tickets.presentation.forms import (
     NovedadFilterForm,
     NovedadForm,
 )
+from apps.tickets.presentation.views.keyset_pagination import (
+    AFTER_PARAM,
+    BEFORE_PARAM,
+    KeysetPaginationMixin,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class NovedadListView(LoginRequiredMixin, ListView):
-    """List novedad records with filtering capabilities."""
+class NovedadListView(LoginRequiredMixin, KeysetPaginationMixin, ListView):
+    """List novedad records with filtering capabilities.
+
+    Pages by (fecha_desde, created_at, id), or by FTS rank when searching.
+    """
 
     model = NovedadModel
     template_name = "tickets/novedad_list.html"
@@ -127,11 +143,18 @@ class NovedadListView(LoginRequiredMixin, ListView):
             include_al = data.get("include_alistamientos")
 
             if search := data.get("search"):
-                queryset = queryset.filter(
-                    Q(maintenance_unit__number__icontains=search)
-                    | Q(legacy_unit_code__icontains=search)
-                    | Q(observaciones__icontains=search)
-                    | Q(intervencion__codigo__icontains=search)
+                # FTS5 prefix match, best-ranked first; LIKE scan only if the
+                # index is missing or the text has no words
+                searched = NovedadSearchIndex().search(queryset, search)
+                queryset = (
+                    searched
+                    if searched is not None
+                    else queryset.filter(
+                        Q(maintenance_unit__number__icontains=search)
+                        | Q(legacy_unit_code__icontains=search)
+                        | Q(observaciones__icontains=search)
+                        | Q(intervencion__codigo__icontains=search)
+                    )
                 )
 
             if not include_al:
@@ -164,9 +187,27 @@ class NovedadListView(LoginRequiredMixin, ListView):
         context["show_processing_message"] = self.range_days > self.DEFAULT_RANGE_DAYS
         context["using_default_range"] = getattr(self, "using_default_range", False)
         context["more_history_query"] = self._build_more_history_query()
-        context["last_sync"] = AccessSyncLogModel.objects.first()
+        last_sync = AccessSyncLogModel.objects.first()
+        context["last_sync"] = last_sync
+        # Export runs (scheduled_export, startup_export) log no stage timings
+        if last_sync is not None and last_sync.trigger.endswith("_export"):
+            last_sync = AccessSyncLogModel.objects.exclude(
+                trigger__endswith="_export"
+            ).first()
+        context["last_sync_stages"] = self._sync_stage_rows(last_sync)
         return context
 
+    @staticmethod
+    def _sync_stage_rows(last_sync: AccessSyncLogModel | None) -> list[dict]:
+        """Stage timings of the last sync, flagging the slowest one."""
+        if last_sync is None:
+            return []
+        stages = [dict(stage) for stage in last_sync.stage_timings or []]
+        if stages:
+            slowest = max(stages, key=lambda stage: stage.get("seconds") or 0)
+            slowest["slowest"] = True
+        return stages
+
     def _filter_by_unit_type(self, queryset, unit_type):
         if not unit_type:
             return queryset
@@ -240,7 +281,8 @@ class NovedadListView(LoginRequiredMixin, ListView):
             return None
         params = self.request.GET.copy()
         mutable = params.dict()
-        mutable.pop("page", None)
+        for key in ("page", AFTER_PARAM, BEFORE_PARAM):
+            mutable.pop(key, None)
         mutable["range_days"] = str(next_range)
         return f"?{urlencode(mutable)}"
 
@@ -272,6 +314,7 @@ class NovedadSyncView(LoginRequiredMixin, View):
                 kilometrage_inserted=result.kilometrage.inserted,
                 duration_seconds=result.duration_seconds,
                 status=AccessSyncLogModel.STATUS_OK,
+                stage_timings=result.stage_timings,
             )
             dur = int(result.duration_seconds)
             message = (
@@ -314,6 +357,13 @@ class NovedadDetailView(LoginRequiredMixin, DetailView):
         if self.object and self.object.maintenance_unit:
             category = self.object.maintenance_unit.rolling_stock_category
         context["category"] = category
+        context["ingreso_job"] = None
+        if self.object.ingreso_generado:
+            context["ingreso_job"] = (
+                IngresoJobModel.objects.filter(entry__novedad=self.object)
+                .order_by("-created_at")
+                .first()
+            )
         return context
 
 
@@ -395,28 +445,43 @@ class MaintenanceEntryCreateView(LoginRequiredMixin, FormView):
         # Get terminal_id from header (if provided by frontend/tray bridge)
         terminal_id = self.request.headers.get("X-TERMINAL-ID")
 
-        use_case = MaintenanceEntryUseCase()
-        create_entry_start = time.perf_counter()
-        result = use_case.create_entry(
-            novedad_id=str(self.novedad.pk),
-            entry_datetime=form.cleaned_data["entry_datetime"],
-            trigger_type=form.resolved_trigger_type,
-            trigger_value=form.resolved_trigger_value,
-            trigger_unit=form.resolved_trigger_unit,
-            lugar_id=str(form.cleaned_data["lugar"].pk)
+        entry_kwargs = {
+            "novedad_id": str(self.novedad.pk),
+            "entry_datetime": form.cleaned_data["entry_datetime"],
+            "trigger_type": form.resolved_trigger_type,
+            "trigger_value": form.resolved_trigger_value,
+            "trigger_unit": form.resolved_trigger_unit,
+            "lugar_id": str(form.cleaned_data["lugar"].pk)
             if form.cleaned_data.get("lugar")
             else None,
-            selected_intervention_code=(
+            "selected_intervention_code": (
                 form.cleaned_data["selected_intervention"].codigo
                 if form.cleaned_data.get("selected_intervention")
                 else None
             ),
-            checklist_tasks=form.cleaned_data.get("checklist_tasks"),
-            observations=form.cleaned_data.get("observations"),
-            user=self.request.user,
-            terminal_id=terminal_id,
-            request_cache=getattr(self, "_request_cache", None),
-        )
+            "checklist_tasks": form.cleaned_data.get("checklist_tasks"),
+            "observations": form.cleaned_data.get("observations"),
+            "user": self.request.user,
+            "terminal_id": terminal_id,
+            "request_cache": getattr(self, "_request_cache", None),
+        }
+
+        use_case = MaintenanceEntryUseCase()
+        create_entry_start = time.perf_counter()
+        if getattr(settings, "INGRESO_ASYNC_JOBS", False):
+            use_case.submit_entry(**entry_kwargs)
+            logger.info(
+                "MaintenanceEntryCreateView.submit_entry took %.3fs",
+                time.perf_counter() - create_entry_start,
+            )
+            messages.success(
+                self.request,
+                "Ingreso a mantenimiento registrado. El PDF y el correo se están "
+                "preparando; el estado se actualiza en esta página.",
+            )
+            return super().form_valid(form)
+
+        result = use_case.create_entry(**entry_kwargs)
         logger.info(
             "MaintenanceEntryCreateView.create_entry took %.3fs",
             time.perf_counter() - create_entry_start,
@@ -607,40 +672,18 @@ class MaintenanceEntryCreateView(LoginRequiredMixin, FormView):
 
 
 class NovedadReferenceMixin:
-    """Provide reference data for novedad forms."""
+    """Provide reference data for novedad forms.
+
+    The datalists are loaded by the page from the cached, ETag-validated
+    ``reference_options`` endpoint instead of being rendered inline.
+    """
 
     def _reference_options(self):
         category = self.kwargs.get("category")
-        unit_queryset = MaintenanceUnitModel.objects.order_by("number")
+        url = reverse("tickets:reference_options", kwargs={"name": NOVEDAD_OPTIONS})
         if category:
-            unit_queryset = unit_queryset.filter(rolling_stock_category=category)
-        unit_options = [
-            {
-                "number": unit.number,
-                "display": f"{unit.number} ({unit.get_unit_type_display()})",
-            }
-            for unit in unit_queryset
-        ]
-        intervencion_options = list(
-            IntervencionTipoModel.objects.filter(is_active=True)
-            .order_by("codigo")
-            .values("codigo", "descripcion")
-        )
-        lugar_options = [
-            {
-                "code": option.short_desc or option.codigo,
-                "label": f"{option.codigo} - {option.descripcion}",
-            }
-            for option in LugarModel.objects.filter(is_active=True).order_by(
-                "descripcion"
-            )
-        ]
-
-        return {
-            "unit_options": unit_options,
-            "intervencion_options": intervencion_options,
-            "lugar_options": lugar_options,
-        }
+            url = f"{url}?{urlencode({'category': category})}"
+        return {"reference_options_url": url}
 
     @staticmethod
     def _refresh_snapshot(novedad: NovedadModel) -> None:
@@ -654,6 +697,7 @@ class NovedadReferenceMixin:
         mu = getattr(novedad, "maintenance_unit", None)
         if not mu:
             return
+        kilometrage_lookup_cache.invalidate_units([mu.number])
         try:
             UnitMaintenanceSnapshotService().refresh_unit(mu)
         except Exception:
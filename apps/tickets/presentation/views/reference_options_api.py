@@ -0,0 +1,39 @@
+"""JSON endpoint serving the cached form option lists with an ETag."""
+
+from __future__ import annotations
+
+from django.contrib.auth.decorators import login_required
+from django.http import Http404, JsonResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.views.decorators.http import require_GET
+
+from apps.tickets.infrastructure.services.reference_data_cache import (
+    reference_data_cache,
+)
+
+
+def reference_options_etag(name: str, category: str, version: int) -> str:
+    return f'"{name}-{category or "all"}-v{version}"'
+
+
+@login_required
+@require_GET
+def reference_options(request, name: str):
+    """Return the option lists for a form; 304 while the version is unchanged.
+
+    ``Cache-Control: no-cache`` makes the browser revalidate on each form
+    load, which costs one version read here and no body when nothing changed.
+    """
+    category = request.GET.get("category", "")
+    try:
+        version, payload = reference_data_cache.options(name, category or None)
+    except KeyError as exc:
+        raise Http404("Unknown option list") from exc
+
+    etag = reference_options_etag(name, category, version)
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = JsonResponse({"version": version, **payload})
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
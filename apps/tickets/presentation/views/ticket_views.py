@@ -2,7 +2,6 @@
 
 import logging
 import uuid
-from datetime import timedelta
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
@@ -22,13 +21,16 @@ from django.views.generic import (
 )
 
 from apps.tickets.application.use_cases.legacy_sync_use_case import LegacySyncUseCase
-from apps.tickets.models import (
-    FailureTypeModel,
-    NovedadModel,
-    TicketModel,
-    TrainNumberModel,
+from apps.tickets.infrastructure.services.dashboard_counters import (
+    DashboardCountersService,
 )
+from apps.tickets.infrastructure.services.reference_data_cache import (
+    TICKET_OPTIONS,
+    reference_data_cache,
+)
+from apps.tickets.models import TicketModel
 from apps.tickets.presentation.forms import TicketFilterForm, TicketForm
+from apps.tickets.presentation.views.keyset_pagination import KeysetPaginationMixin
 
 logger = logging.getLogger(__name__)
 
@@ -40,25 +42,14 @@ class HomeView(LoginRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        # Count tickets by status
-        context["pending_count"] = TicketModel.objects.filter(
-            status=TicketModel.Status.PENDING
-        ).count()
-        context["completed_count"] = TicketModel.objects.filter(
-            status=TicketModel.Status.COMPLETED
-        ).count()
-        context["total_count"] = TicketModel.objects.count()
-
-        # Count novedades
-        today = timezone.now().date()
-        week_start = today - timedelta(days=today.weekday())
-        context["novedades_hoy"] = NovedadModel.objects.filter(
-            fecha_desde=today
-        ).count()
-        context["novedades_semana"] = NovedadModel.objects.filter(
-            fecha_desde__gte=week_start
-        ).count()
-        context["novedades_total"] = NovedadModel.objects.count()
+        # Single-row read; triggers keep the counters current
+        counters = DashboardCountersService().read()
+        context["pending_count"] = counters.tickets_pending
+        context["completed_count"] = counters.tickets_completed
+        context["total_count"] = counters.tickets_total
+        context["novedades_hoy"] = counters.novedades_hoy
+        context["novedades_semana"] = counters.novedades_semana
+        context["novedades_total"] = counters.novedades_total
 
         sync_status = self.request.session.pop("legacy_sync_status", None)
         if sync_status:
@@ -142,8 +133,19 @@ class LegacySyncView(LoginRequiredMixin, View):
         )
 
 
-class TicketListView(LoginRequiredMixin, ListView):
-    """List all tickets with filtering."""
+def _ticket_reference_options() -> dict:
+    """Failure-type codes for the form script; trains load from the API."""
+    _, options = reference_data_cache.options(TICKET_OPTIONS)
+    return {
+        "failure_types": options["failure_types"],
+        "reference_options_url": reverse(
+            "tickets:reference_options", kwargs={"name": TICKET_OPTIONS}
+        ),
+    }
+
+
+class TicketListView(LoginRequiredMixin, KeysetPaginationMixin, ListView):
+    """List all tickets with filtering, paged by (date, created_at, id)."""
 
     model = TicketModel
     template_name = "tickets/ticket_list.html"
@@ -304,10 +306,7 @@ class TicketCreateView(LoginRequiredMixin, CreateView):
         context["action"] = "Crear"
         context["unit_type"] = self.kwargs.get("unit_type")
         context["category"] = self.kwargs.get("category")
-        # Add trains for datalist autocomplete
-        context["trains"] = TrainNumberModel.objects.filter(is_active=True)
-        # Add failure types for JS auto-select
-        context["failure_types"] = FailureTypeModel.objects.filter(is_active=True)
+        context.update(_ticket_reference_options())
         return context
 
     def get_success_url(self):
@@ -355,10 +354,7 @@ class TicketUpdateView(LoginRequiredMixin, UpdateView):
         if self.object and self.object.maintenance_unit:
             context["unit_type"] = self.object.maintenance_unit.unit_type
             context["category"] = self.object.maintenance_unit.rolling_stock_category
-        # Add trains for datalist autocomplete
-        context["trains"] = TrainNumberModel.objects.filter(is_active=True)
-        # Add failure types for JS auto-select
-        context["failure_types"] = FailureTypeModel.objects.filter(is_active=True)
+        context.update(_ticket_reference_options())
         return context
 
     def get_success_url(self):
@@ -28,6 +28,10 @@ from apps.tickets.presentation.views.ingreso_email_api import (
     ingreso_email_pending,
     ingreso_email_result,
 )
+from apps.tickets.presentation.views.ingreso_job_api import ingreso_job_status
+from apps.tickets.presentation.views.reference_options_api import (
+    reference_options,
+)
 from apps.tickets.presentation.views.tray_api import (
     tray_heartbeat,
     tray_list_online,
@@ -193,6 +197,12 @@ urlpatterns = [
         ingreso_email_pdf,
         name="ingreso_email_pdf",
     ),
+    # Ingreso background job status (polled by the novedad detail page)
+    path(
+        "api/ingresos/<uuid:entry_id>/status/",
+        ingreso_job_status,
+        name="ingreso_job_status",
+    ),
     # Tray terminal management
     path(
         "api/tray/register/",
@@ -214,4 +224,10 @@ urlpatterns = [
         tray_list_online,
         name="tray_list_online",
     ),
+    # Form option lists (cached, ETag)
+    path(
+        "api/reference-options/<str:name>/",
+        reference_options,
+        name="reference_options",
+    ),
 ]
@@ -136,10 +136,27 @@ INGRESO_EMAIL_SIGNING_SECRET = os.getenv("INGRESO_EMAIL_SIGNING_SECRET", "")
 INGRESO_REQUEST_CACHE_ENABLED = os.getenv(
     "INGRESO_REQUEST_CACHE_ENABLED", ""
 ).strip().lower() in {"1", "true", "yes", "on"}
+# Generate ingreso PDFs and email dispatches in background worker threads;
+# off keeps the work inside the POST request. The workers start with the
+# scheduler (manage.py runserver) and from config/wsgi.py under waitress.
+# ``python manage.py process_ingreso_jobs`` drains the queue by hand.
+INGRESO_ASYNC_JOBS = os.getenv("INGRESO_ASYNC_JOBS", "").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+INGRESO_JOB_WORKERS = int(os.getenv("INGRESO_JOB_WORKERS", "1"))
+INGRESO_JOB_POLL_SECONDS = float(os.getenv("INGRESO_JOB_POLL_SECONDS", "5"))
+# Process-wide kilometrage lookup cache (0 entries disables it)
+KM_LOOKUP_CACHE_MAX_ENTRIES = int(os.getenv("KM_LOOKUP_CACHE_MAX_ENTRIES", "4096"))
+KM_LOOKUP_CACHE_TTL_SECONDS = int(os.getenv("KM_LOOKUP_CACHE_TTL_SECONDS", "300"))
 
 LEGACY_DATA_PATH = os.getenv("LEGACY_DATA_PATH", "").strip() or str(
     BASE_DIR / "context" / "db-legacy"
 )
+# Processes used to parse large legacy TXT exports (1 = in-process, 0 = all cores)
+LEGACY_IMPORT_PARSE_WORKERS = int(os.getenv("LEGACY_IMPORT_PARSE_WORKERS", "1"))
 # Shared path reference: G:\Material Rodante\IFM\DOCUMENT\db-access
 
 ACCESS_BASELOCS_PATH = os.getenv("ACCESS_BASELOCS_PATH", "").strip()
@@ -154,6 +171,26 @@ ACCESS_EXPORT_SCRIPT = os.getenv("ACCESS_EXPORT_SCRIPT", "").strip() or str(
 ACCESS_POWERSHELL_PATH = os.getenv("ACCESS_POWERSHELL_PATH", "").strip() or str(
     r"C:\Windows\SysWOW64\WindowsPowerShell\v1.0\powershell.exe"
 )
+# Concurrent extractor processes during an Access sync (LOCS/CCRR x tables)
+ACCESS_SYNC_MAX_WORKERS = max(1, int(os.getenv("ACCESS_SYNC_MAX_WORKERS", "4")))
+# Access autonumber columns used as sync watermarks ("" falls back to dates)
+ACCESS_NOVEDAD_ID_FIELD = os.getenv("ACCESS_NOVEDAD_ID_FIELD", "ID").strip()
+ACCESS_KM_ID_FIELD = os.getenv("ACCESS_KM_ID_FIELD", "").strip()
+# Export all pending novedades in a single PowerShell run (manifest + BATCH);
+# opt-in until the BATCH path has been exercised against Access on Windows
+ACCESS_EXPORT_BATCH = os.getenv("ACCESS_EXPORT_BATCH", "").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
+# Route single CHECK/INSERT/UPDATE calls through one long-lived PowerShell
+ACCESS_EXPORT_WORKER = os.getenv("ACCESS_EXPORT_WORKER", "").strip().lower() in {
+    "1",
+    "true",
+    "yes",
+    "on",
+}
 
 # UM detail fixed averages (km/month)
 UM_DETAIL_FIXED_AVG_KM = {
@@ -9,3 +9,12 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+# Waitress imports this module without going through manage.py, so the
+# scheduler never starts here. Start the ingreso job workers on their own;
+# a no-op unless INGRESO_ASYNC_JOBS is on or when they already run.
+from apps.tickets.infrastructure.scheduler import (  # noqa: E402
+    start_ingreso_job_workers,
+)
+
+start_ingreso_job_workers()
@@ -8,7 +8,10 @@ param(
     [string]$OutFile = "",
     [int]$ProgressEvery = 500,
     [switch]$SkipCount,
-    [switch]$MinimalColumns
+    [switch]$MinimalColumns,
+    [switch]$Ndjson,
+    [string]$IdField = "",
+    [long]$SinceId = 0
 )
 
 $invariantCulture = [System.Globalization.CultureInfo]::InvariantCulture
@@ -108,8 +111,18 @@ if ($Tabla -ieq "Kilometraje") {
     }
 }
 
+# Con -IdField se incluye el autonumerico como "Id" en cada registro; con
+# -SinceId se filtra por ID en lugar de fecha (marca de agua incremental).
+if ($IdField) {
+    $selectFields = "[$IdField], $selectFields"
+}
+
 $whereClauses = [System.Collections.Generic.List[string]]::new()
-$whereClauses.Add("[$dateField] > #$SinceDate#")
+if ($IdField -and $SinceId -gt 0) {
+    $whereClauses.Add("[$IdField] > $SinceId")
+} else {
+    $whereClauses.Add("[$dateField] > #$SinceDate#")
+}
 if ($UnitValue) {
     $escapedUnitValue = $UnitValue.Replace("'", "''")
     $whereClauses.Add("[$UnitField] = '$escapedUnitValue'")
@@ -134,25 +147,36 @@ $current = 0
 
 $results = [System.Collections.Generic.List[object]]::new()
 
+# Con -Ndjson cada registro se escribe como una linea JSON apenas se lee,
+# sin acumular la tabla completa en memoria.
+$ndjsonWriter = $null
+if ($Ndjson) {
+    if ($OutFile) {
+        $ndjsonWriter = [System.IO.StreamWriter]::new($OutFile, $false, $utf8NoBom)
+    } else {
+        $ndjsonWriter = [Console]::Out
+    }
+}
+
 # Recorrer los resultados
 while (-not $rs.EOF) {
     $current += 1
     if ($Tabla -ieq "Kilometraje") {
-        $results.Add([PSCustomObject]@{
+        $record = [PSCustomObject]@{
             Unidad = $rs.Fields.Item($UnitField).Value
             Kilometros = Format-DecimalInvariant $rs.Fields.Item("Kms_diario").Value
             Fecha = Format-DateValue $rs.Fields.Item("Fecha").Value
             Observaciones = $rs.Fields.Item("Observaciones").Value
-        })
+        }
     } else {
         if ($MinimalColumns) {
-            $results.Add([PSCustomObject]@{
+            $record = [PSCustomObject]@{
                 Unidad = $rs.Fields.Item($UnitField).Value
                 Fecha_desde = Format-DateValue $rs.Fields.Item("Fecha_desde").Value
                 Intervencion = $rs.Fields.Item("Intervencion").Value
-            })
+            }
         } else {
-            $results.Add([PSCustomObject]@{
+            $record = [PSCustomObject]@{
                 Unidad = $rs.Fields.Item($UnitField).Value
                 Fecha_desde = Format-DateValue $rs.Fields.Item("Fecha_desde").Value
                 Fecha_hasta = Format-DateValue $rs.Fields.Item("Fecha_hasta").Value
@@ -160,9 +184,17 @@ while (-not $rs.EOF) {
                 Intervencion = $rs.Fields.Item("Intervencion").Value
                 Lugar = $rs.Fields.Item("Lugar").Value
                 Observaciones = $rs.Fields.Item("Observaciones").Value
-            })
+            }
         }
     }
+    if ($IdField) {
+        $record | Add-Member -NotePropertyName Id -NotePropertyValue $rs.Fields.Item($IdField).Value
+    }
+    if ($ndjsonWriter) {
+        $ndjsonWriter.WriteLine(($record | ConvertTo-Json -Depth 4 -Compress))
+    } else {
+        $results.Add($record)
+    }
     if ($progressEvery -gt 0 -and ($current % $progressEvery -eq 0)) {
         if ($totalRows -gt 0) {
             $percent = [math]::Round(($current / $totalRows) * 100, 1)
@@ -190,6 +222,13 @@ if ($current -gt 0) {
     }
 }
 
+if ($Ndjson) {
+    if ($OutFile) {
+        $ndjsonWriter.Close()
+    }
+    exit 0
+}
+
 # Emit JSON payload (prefer file sink when provided)
 if ($current -eq 0) {
     $json = "[]"
@@ -1,6 +1,5 @@
 import argparse
 import os
-from collections import defaultdict
 from datetime import date, datetime
 from pathlib import Path
 
@@ -120,41 +119,27 @@ def source_definitions(
     return all_sources
 
 
-def resolve_units(args: argparse.Namespace, access_units: set[str]) -> list[str]:
+def resolve_units(args: argparse.Namespace) -> list[str] | None:
     if args.all_units:
-        return sorted(access_units)
+        return None
     if args.units:
         return sorted({unit for unit in (norm_code(u) for u in args.units) if unit})
     return [DEFAULT_UNIT]
 
 
-def print_unit_block(
-    unit: str,
-    access_rows: int,
-    access_keys: set[tuple[date, str]],
-    access_invalid_keys: int,
-    sqlite_rows: int,
-    sqlite_keys: set[tuple[date, str]],
-    missing_in_sqlite: list[tuple[date, str]],
-    extra_in_sqlite: list[tuple[date, str]],
-    limit_missing: int,
-    limit_extra: int,
-) -> None:
-    print(f"\n=== UNIDAD {unit} ===")
-    print("Access rows:", access_rows)
-    print("Access keys válidas (fecha_desde+interv):", len(access_keys))
-    print("Access rows sin clave completa (fecha/interv vacía):", access_invalid_keys)
-    print("SQLite rows:", sqlite_rows)
-    print("SQLite keys válidas (fecha_desde+interv):", len(sqlite_keys))
-    print("FALTAN en SQLite:", len(missing_in_sqlite))
-    print("EXTRA en SQLite:", len(extra_in_sqlite))
+def print_diff_block(diff: object, limit_missing: int, limit_extra: int) -> None:
+    print(f"\n=== UNIDAD {diff.unit} / AÑO {diff.year} ===")
+    print("Access keys válidas (fecha_desde+interv):", diff.access_keys)
+    print("SQLite keys válidas (fecha_desde+interv):", diff.sqlite_keys)
+    print("FALTAN en SQLite:", len(diff.missing_in_sqlite))
+    print("EXTRA en SQLite:", len(diff.extra_in_sqlite))
 
     print(f"\nPrimeros {limit_missing} faltantes:")
-    for item in missing_in_sqlite[:limit_missing]:
+    for item in diff.missing_in_sqlite[:limit_missing]:
         print("  ", item)
 
     print(f"\nPrimeros {limit_extra} extra:")
-    for item in extra_in_sqlite[:limit_extra]:
+    for item in diff.extra_in_sqlite[:limit_extra]:
         print("  ", item)
 
 
@@ -171,7 +156,10 @@ def main() -> None:
         AccessExtractor,
         AccessExtractorConfig,
     )
-    from apps.tickets.models import MaintenanceUnitModel, NovedadModel
+    from apps.tickets.infrastructure.services.novedad_reconciliation import (
+        NovedadReconciliationService,
+        ReconciliationSource,
+    )
 
     log("Iniciando comparación Access vs SQLite")
     log(
@@ -198,137 +186,35 @@ def main() -> None:
         stderr_writer=log,
     )
 
-    sources = source_definitions(settings, args.source)
+    # Digests per (unit, year) first; keys are only listed for buckets that differ
+    service = NovedadReconciliationService(
+        extractor=extractor,
+        sources=[
+            ReconciliationSource(label, db_path, unit_field)
+            for label, db_path, unit_field in source_definitions(settings, args.source)
+        ],
+        db_password=(getattr(settings, "ACCESS_DB_PASSWORD", "") or None),
+        progress_every=args.progress_every,
+        skip_count=not args.with_count,
+        log=log,
+    )
+    report = service.reconcile(since_date=since_date, units=resolve_units(args))
 
-    access_rows_total = 0
-    access_rows_by_unit: dict[str, int] = defaultdict(int)
-    access_invalid_rows_by_unit: dict[str, int] = defaultdict(int)
-    access_keys_by_unit: dict[str, set[tuple[date, str]]] = defaultdict(set)
-
-    access_units: set[str] = set()
-    if args.all_units:
-        for label, db_path, unit_field in sources:
-            if not db_path or not db_path.exists():
-                log(f"Saltando origen {label}: DB inexistente ({db_path})")
-                continue
-
-            log(f"Descubriendo unidades en {label}...")
-            rows = extractor.extract(
-                db_path=db_path,
-                table="Detenciones",
-                unit_field=unit_field,
-                since_date=since_date,
-                db_password=(getattr(settings, "ACCESS_DB_PASSWORD", "") or None),
-                progress_every=args.progress_every,
-                skip_count=not args.with_count,
-                source_label=label,
-            )
-            for row in rows:
-                unit = norm_code(row.get("Unidad"))
-                if unit:
-                    access_units.add(unit)
-
-    units_to_compare = resolve_units(args, access_units)
-    if args.all_units and not units_to_compare:
-        log("No se encontraron unidades en Access para el source seleccionado.")
-
-    for unit in units_to_compare:
-        for label, db_path, unit_field in sources:
-            if not db_path or not db_path.exists():
-                continue
-
-            log(f"Extrayendo Detenciones desde {label} para unidad {unit}...")
-            rows = extractor.extract(
-                db_path=db_path,
-                table="Detenciones",
-                unit_field=unit_field,
-                unit_value=unit,
-                since_date=since_date,
-                minimal_columns=True,
-                db_password=(getattr(settings, "ACCESS_DB_PASSWORD", "") or None),
-                progress_every=args.progress_every,
-                skip_count=not args.with_count,
-                source_label=label,
-            )
-            log(f"{label} {unit}: filas leídas {len(rows)}")
-            access_rows_total += len(rows)
-
-            for row in rows:
-                row_unit = norm_code(row.get("Unidad"))
-                if row_unit != unit:
-                    continue
-                access_rows_by_unit[unit] += 1
-                fecha = parse_date(row.get("Fecha_desde"))
-                intervencion = norm_code(row.get("Intervencion"))
-                if fecha and intervencion:
-                    access_keys_by_unit[unit].add((fecha, intervencion))
-                else:
-                    access_invalid_rows_by_unit[unit] += 1
-
-    print("\n=== RESUMEN GLOBAL ACCESS ===")
-    print("Access rows total leídas:", access_rows_total)
-    print("Unidades detectadas en Access:", len(access_units))
-    print("Unidades a comparar:", len(units_to_compare))
-
-    global_missing = 0
-    global_extra = 0
-    global_access_keys = 0
-    global_sqlite_keys = 0
-    global_access_rows = 0
-    global_sqlite_rows = 0
-
-    for unit in units_to_compare:
-        maintenance_unit = MaintenanceUnitModel.objects.filter(
-            number__iexact=unit
-        ).first()
-        if maintenance_unit:
-            qs = NovedadModel.objects.filter(maintenance_unit=maintenance_unit)
-            qs = qs | NovedadModel.objects.filter(legacy_unit_code__iexact=unit)
-        else:
-            qs = NovedadModel.objects.filter(legacy_unit_code__iexact=unit)
-
-        sqlite_rows = list(qs.select_related("intervencion"))
-        sqlite_keys: set[tuple[date, str]] = set()
-        for row in sqlite_rows:
-            code = norm_code(
-                row.intervencion.codigo
-                if row.intervencion
-                else row.legacy_intervencion_codigo
-            )
-            if row.fecha_desde and code:
-                sqlite_keys.add((row.fecha_desde, code))
-
-        access_keys = access_keys_by_unit.get(unit, set())
-        missing_in_sqlite = sorted(access_keys - sqlite_keys)
-        extra_in_sqlite = sorted(sqlite_keys - access_keys)
-
-        global_missing += len(missing_in_sqlite)
-        global_extra += len(extra_in_sqlite)
-        global_access_keys += len(access_keys)
-        global_sqlite_keys += len(sqlite_keys)
-        global_access_rows += access_rows_by_unit.get(unit, 0)
-        global_sqlite_rows += len(sqlite_rows)
-
-        print_unit_block(
-            unit=unit,
-            access_rows=access_rows_by_unit.get(unit, 0),
-            access_keys=access_keys,
-            access_invalid_keys=access_invalid_rows_by_unit.get(unit, 0),
-            sqlite_rows=len(sqlite_rows),
-            sqlite_keys=sqlite_keys,
-            missing_in_sqlite=missing_in_sqlite,
-            extra_in_sqlite=extra_in_sqlite,
-            limit_missing=args.limit_missing,
-            limit_extra=args.limit_extra,
-        )
+    for diff in report.diffs:
+        print_diff_block(diff, args.limit_missing, args.limit_extra)
 
     print("\n=== RESUMEN GLOBAL COMPARACIÓN ===")
-    print("Access rows (unidades comparadas):", global_access_rows)
-    print("Access keys válidas (unidades comparadas):", global_access_keys)
-    print("SQLite rows (unidades comparadas):", global_sqlite_rows)
-    print("SQLite keys válidas (unidades comparadas):", global_sqlite_keys)
-    print("FALTAN totales en SQLite:", global_missing)
-    print("EXTRA totales en SQLite:", global_extra)
+    print("Access rows leídas:", report.access_rows)
+    print(
+        "Access rows sin clave completa (fecha/interv vacía):",
+        report.access_invalid_rows,
+    )
+    print("SQLite rows:", report.sqlite_rows)
+    print("Unidades comparadas:", report.units_compared)
+    print("Buckets unidad/año comparados:", report.buckets_compared)
+    print("Unidades con diferencias:", report.units_differing)
+    print("FALTAN totales en SQLite:", report.missing_total)
+    print("EXTRA totales en SQLite:", report.extra_total)
 
 
 if __name__ == "__main__":
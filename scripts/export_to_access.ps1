@@ -1,12 +1,15 @@
 # Export Novedades from SQLite to Access .mdb
-# Supports INSERT, UPDATE, and CHECK operations
+# Supports INSERT, UPDATE, CHECK, BATCH and SERVE operations
+# BATCH reads a JSON manifest (one CHECK + INSERT per row) and writes per-row
+# results to -ResultPath, reusing one OLEDB connection per database.
+# SERVE keeps running and answers line-delimited JSON requests on stdin.
 
 param(
     [Parameter(Mandatory=$true)]
     [string]$DbPath,
     
     [Parameter(Mandatory=$false)]
-    [ValidateSet("INSERT", "UPDATE", "CHECK")]
+    [ValidateSet("INSERT", "UPDATE", "CHECK", "BATCH", "SERVE")]
     [string]$Operation = "INSERT",
     
     # For CHECK/INSERT/UPDATE - PK fields
@@ -37,10 +40,20 @@ param(
 
     [Parameter(Mandatory=$false)]
     [ValidateSet("Locs", "Coche")]
-    [string]$UnitField = "Locs"
+    [string]$UnitField = "Locs",
+
+    # For BATCH - JSON manifest in, JSON results out
+    [Parameter(Mandatory=$false)]
+    [string]$ManifestPath = "",
+
+    [Parameter(Mandatory=$false)]
+    [string]$ResultPath = ""
 )
 
 $invariantCulture = [System.Globalization.CultureInfo]::InvariantCulture
+$utf8NoBom = [System.Text.UTF8Encoding]::new($false)
+# Last insert error, so BATCH can report it per row
+$script:LastOperationError = $null
 
 function Get-DateValue {
     param([object]$Value)
@@ -247,10 +260,11 @@ INSERT INTO [Detenciones] (
                 $lugarExists = "query_error"
             }
 
-            [Console]::Error.WriteLine("FK_ERROR:Error de clave foránea (unit_field=$UnitField, unidad=$($Data.Unidad), intervencion=$($Data.Intervencion), lugar=$($Data.Lugar), unit_exists=$unitExists, intervencion_exists=$intervExists, lugar_exists=$lugarExists)")
+            $script:LastOperationError = "FK_ERROR:Error de clave foránea (unit_field=$UnitField, unidad=$($Data.Unidad), intervencion=$($Data.Intervencion), lugar=$($Data.Lugar), unit_exists=$unitExists, intervencion_exists=$intervExists, lugar_exists=$lugarExists)"
         } else {
-            [Console]::Error.WriteLine("Error inserting: $msg")
+            $script:LastOperationError = "Error inserting: $msg"
         }
+        [Console]::Error.WriteLine($script:LastOperationError)
         return $null
     }
 }
@@ -303,29 +317,199 @@ WHERE [ID] = $LegacyId
     }
 }
 
+function Open-AccessConnection {
+    param([string]$Path)
+
+    # Connection string
+    $passwordSegment = ""
+    if ($DbPassword) {
+        $passwordSegment = "Jet OLEDB:Database Password=$DbPassword;"
+    }
+    $connStringACE = "Provider=Microsoft.ACE.OLEDB.12.0;Data Source=$Path;$passwordSegment"
+    $connStringJet = "Provider=Microsoft.Jet.OLEDB.4.0;Data Source=$Path;$passwordSegment"
+
+    $newConn = New-Object -ComObject ADODB.Connection
+    try {
+        $newConn.Open($connStringACE)
+        [Console]::Error.WriteLine("Conexion exitosa a $Path usando ACE OLEDB.")
+    } catch {
+        $newConn.Open($connStringJet)
+        [Console]::Error.WriteLine("Conexion exitosa a $Path usando Jet OLEDB.")
+    }
+    return $newConn
+}
+
+function Invoke-NovedadRequest {
+    param(
+        [object]$Item,
+        [hashtable]$Connections
+    )
+
+    # Operations: CHECK, INSERT, EXPORT (CHECK + INSERT) and UPDATE
+    $entry = [ordered]@{
+        key = $Item.key
+        status = "error"
+        legacy_id = $null
+        error = $null
+    }
+    try {
+        $itemOperation = if ($Item.operation) { ([string]$Item.operation).ToUpperInvariant() } else { "EXPORT" }
+        $targetPath = if ($Item.db_path) { [string]$Item.db_path } else { $DbPath }
+        # Test/Add read the unit column from script scope
+        $script:UnitField = if ($Item.unit_field) { [string]$Item.unit_field } else { "Locs" }
+        if (-not $Connections.ContainsKey($targetPath)) {
+            if (-not (Test-Path $targetPath)) {
+                throw "DbPath invalido o inexistente: $targetPath"
+            }
+            $Connections[$targetPath] = Open-AccessConnection -Path $targetPath
+        }
+        $targetConn = $Connections[$targetPath]
+
+        $unidad = [string]$Item.unidad
+        $fechaDesde = [string]$Item.fecha_desde
+        $intervencion = [string]$Item.intervencion
+        $existingId = $null
+        if ($itemOperation -ne "INSERT" -and $fechaDesde) {
+            $existingId = Test-NovedadExistsInAccess -Conn $targetConn -Unidad $unidad -Fecha_hasta "" -Intervencion $intervencion -Lugar "" -Fecha_desde $fechaDesde
+        }
+
+        switch ($itemOperation) {
+            "CHECK" {
+                if ($existingId) {
+                    $entry.status = "exists"
+                    $entry.legacy_id = [int]$existingId
+                } else {
+                    $entry.status = "missing"
+                }
+            }
+            "UPDATE" {
+                $legacyId = if ($Item.legacy_id) { [int]$Item.legacy_id } else { $existingId }
+                if (-not $legacyId) {
+                    $entry.error = "No se encontró registro para actualizar"
+                } else {
+                    $novedadData = @{
+                        Unidad = $unidad
+                        Fecha_hasta = [string]$Item.fecha_hasta
+                        Fecha_est = [string]$Item.fecha_est
+                        Observaciones = [string]$Item.observaciones
+                    }
+                    if (Update-NovedadInAccess -Conn $targetConn -LegacyId $legacyId -Data $novedadData) {
+                        $entry.status = "updated"
+                        $entry.legacy_id = [int]$legacyId
+                    } else {
+                        $entry.error = "Error updating"
+                    }
+                }
+            }
+            default {
+                if ($existingId) {
+                    $entry.status = "exists"
+                    $entry.legacy_id = [int]$existingId
+                } else {
+                    $script:LastOperationError = $null
+                    $novedadData = @{
+                        Unidad = $unidad
+                        Fecha_desde = $fechaDesde
+                        Fecha_hasta = [string]$Item.fecha_hasta
+                        Fecha_est = [string]$Item.fecha_est
+                        Intervencion = $intervencion
+                        Lugar = [string]$Item.lugar
+                        Observaciones = [string]$Item.observaciones
+                    }
+                    $newId = Add-NovedadToAccess -Conn $targetConn -Data $novedadData
+                    if ($null -ne $newId) {
+                        $entry.status = "inserted"
+                        if ([int]$newId -gt 0) {
+                            $entry.legacy_id = [int]$newId
+                        }
+                    } elseif ($script:LastOperationError) {
+                        $entry.error = Get-SafeErrorMessage -Message $script:LastOperationError
+                    } else {
+                        $entry.error = "Unknown error"
+                    }
+                }
+            }
+        }
+    } catch {
+        $entry.error = Get-SafeErrorMessage -Message $_.Exception.Message
+    }
+    return [PSCustomObject]$entry
+}
+
+function Close-ExtraConnections {
+    param([hashtable]$Connections)
+
+    foreach ($path in @($Connections.Keys)) {
+        if ($path -ne $DbPath) {
+            $Connections[$path].Close()
+        }
+    }
+}
+
+function Invoke-NovedadBatch {
+    param([object]$Conn)
+
+    # One connection per target database, opened on first use
+    $connections = @{ $DbPath = $Conn }
+    $manifest = [System.IO.File]::ReadAllText($ManifestPath, [System.Text.Encoding]::UTF8) | ConvertFrom-Json
+    $batchResults = [System.Collections.Generic.List[object]]::new()
+
+    foreach ($item in @($manifest)) {
+        $batchResults.Add((Invoke-NovedadRequest -Item $item -Connections $connections))
+    }
+    Close-ExtraConnections -Connections $connections
+
+    $json = ConvertTo-Json -InputObject $batchResults.ToArray() -Depth 4 -Compress
+    if ($batchResults.Count -eq 0) {
+        $json = "[]"
+    }
+    [System.IO.File]::WriteAllText($ResultPath, $json, $utf8NoBom)
+    [Console]::Error.WriteLine("Lote procesado: $($batchResults.Count) novedades")
+}
+
+function Invoke-NovedadServer {
+    param([object]$Conn)
+
+    # Line-delimited JSON: one request per stdin line, one response per stdout
+    # line. Connections stay open until stdin closes or QUIT arrives.
+    [Console]::InputEncoding = $utf8NoBom
+    [Console]::OutputEncoding = $utf8NoBom
+    $stdout = [System.IO.StreamWriter]::new([Console]::OpenStandardOutput(), $utf8NoBom)
+    $stdout.AutoFlush = $true
+    $connections = @{ $DbPath = $Conn }
+
+    $stdout.WriteLine('{"status":"ready"}')
+    while ($true) {
+        $line = [Console]::In.ReadLine()
+        if ($null -eq $line) {
+            break
+        }
+        if (-not $line.Trim()) {
+            continue
+        }
+        try {
+            $request = $line | ConvertFrom-Json
+        } catch {
+            $stdout.WriteLine((ConvertTo-Json -InputObject ([ordered]@{ key = $null; status = "error"; legacy_id = $null; error = "Invalid request" }) -Compress))
+            continue
+        }
+        if ($request.operation -ieq "QUIT") {
+            break
+        }
+        $response = Invoke-NovedadRequest -Item $request -Connections $connections
+        $stdout.WriteLine((ConvertTo-Json -InputObject $response -Depth 4 -Compress))
+    }
+    Close-ExtraConnections -Connections $connections
+}
+
 # Main execution
 if (-not $DbPath -or -not (Test-Path $DbPath)) {
     Write-Output "ERROR: DbPath invalido o inexistente: $DbPath"
     exit 1
 }
 
-# Connection string
-$passwordSegment = ""
-if ($DbPassword) {
-    $passwordSegment = "Jet OLEDB:Database Password=$DbPassword;"
-}
-$connStringACE = "Provider=Microsoft.ACE.OLEDB.12.0;Data Source=$DbPath;$passwordSegment"
-$connStringJet = "Provider=Microsoft.Jet.OLEDB.4.0;Data Source=$DbPath;$passwordSegment"
-
 try {
-    $conn = New-Object -ComObject ADODB.Connection
-    try {
-        $conn.Open($connStringACE)
-        [Console]::Error.WriteLine("Conexion exitosa a $DbPath usando ACE OLEDB.")
-    } catch {
-        $conn.Open($connStringJet)
-        [Console]::Error.WriteLine("Conexion exitosa a $DbPath usando Jet OLEDB.")
-    }
+    $conn = Open-AccessConnection -Path $DbPath
 } catch {
     [Console]::Error.WriteLine("Error al conectar a la base de datos.")
     [Console]::Error.WriteLine("Mensaje original: $(Get-SafeErrorMessage -Message $_.Exception.Message)")
@@ -337,6 +521,19 @@ $result = $null
 $operationSucceeded = $false
 
 switch ($Operation) {
+    "BATCH" {
+        if (-not $ManifestPath -or -not (Test-Path $ManifestPath) -or -not $ResultPath) {
+            [Console]::Error.WriteLine("BATCH requiere: -ManifestPath, -ResultPath")
+            $conn.Close()
+            exit 1
+        }
+        Invoke-NovedadBatch -Conn $conn
+        $operationSucceeded = $true
+    }
+    "SERVE" {
+        Invoke-NovedadServer -Conn $conn
+        $operationSucceeded = $true
+    }
     "CHECK" {
         if (-not $Unidad -or -not $Intervencion -or -not $Fecha_desde) {
             [Console]::Error.WriteLine("CHECK requiere: -Unidad, -Fecha_desde, -Intervencion")
@@ -0,0 +1,26 @@
+"""Fixtures compartidos por toda la suite."""
+
+import pytest
+
+from apps.tickets.infrastructure.services.kilometrage_cache import (
+    kilometrage_lookup_cache,
+)
+from apps.tickets.infrastructure.services.reference_data_cache import (
+    reference_data_cache,
+)
+
+
+@pytest.fixture(autouse=True)
+def _limpiar_cache_kilometraje():
+    """Cada prueba arranca sin lecturas de kilometraje cacheadas."""
+    kilometrage_lookup_cache.clear()
+    yield
+    kilometrage_lookup_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _limpiar_cache_referencias():
+    """El rollback de cada prueba reinicia la versión; no reusar listas viejas."""
+    reference_data_cache.clear()
+    yield
+    reference_data_cache.clear()
@@ -0,0 +1,72 @@
+"""Pruebas del caso de uso de sincronizacion Access."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from apps.tickets.application.use_cases.access_sync_use_case import (
+    AccessSyncConfig,
+    AccessSyncUseCase,
+)
+from apps.tickets.infrastructure.services.access_extractor import AccessExtractor
+from apps.tickets.models import KilometrageRecordModel, NovedadModel
+
+
+@pytest.mark.django_db
+def test_run_extrae_fuentes_en_paralelo_y_escribe_en_serie(monkeypatch):
+    """Las cuatro extracciones corren juntas y se informa la duracion de cada una."""
+    barrier = threading.Barrier(4, timeout=5)
+    writer_threads: set[str] = set()
+
+    def _fake_iter_records(self, **kwargs):  # noqa: ARG001
+        # Solo pasa si las cuatro extracciones estan en curso a la vez.
+        barrier.wait()
+        unit = "A100" if kwargs["unit_field"] == "Locs" else "C200"
+        if kwargs["table"] == "Kilometraje":
+            return iter([{"Unidad": unit, "Fecha": "2024-01-01", "Kilometros": "15"}])
+        return iter(
+            [{"Unidad": unit, "Fecha_desde": "2024-01-02", "Intervencion": "RA"}]
+        )
+
+    real_bulk_create = KilometrageRecordModel.objects.bulk_create
+
+    def _tracking_bulk_create(*args, **kwargs):
+        writer_threads.add(threading.current_thread().name)
+        return real_bulk_create(*args, **kwargs)
+
+    monkeypatch.setattr(AccessExtractor, "iter_records", _fake_iter_records)
+    monkeypatch.setattr(
+        KilometrageRecordModel.objects, "bulk_create", _tracking_bulk_create
+    )
+
+    use_case = AccessSyncUseCase(
+        config=AccessSyncConfig(
+            baselocs_path=Path("baseLocs.mdb"),
+            baseccrr_path=Path("baseCCRR.mdb"),
+            db_password=None,
+            script_path=Path("extractor_access.ps1"),
+            powershell_path=Path("powershell.exe"),
+        )
+    )
+    result = use_case.run(since_date=None, progress_every=0)
+
+    assert result.novedades.inserted == 2
+    assert result.kilometrage.inserted == 2
+    assert set(result.source_durations) == {
+        "novedades:LOCS",
+        "novedades:CCRR",
+        "kilometrage:access_locs",
+        "kilometrage:access_ccrr",
+    }
+    assert writer_threads == {threading.current_thread().name}
+    stages = {
+        (stage["stage"], stage["source"], stage["table"])
+        for stage in result.stage_timings
+    }
+    assert ("extract", "LOCS", "Detenciones") in stages
+    assert ("dedupe", "CCRR", "Detenciones") in stages
+    assert ("insert", "access_locs", "Kilometraje") in stages
+    assert ("refresh_cumulative", "access_ccrr", "Kilometraje") in stages
+    assert result.stage_timings[0]["stage"] == "extract"
+    assert NovedadModel.objects.filter(is_legacy=True).count() == 2
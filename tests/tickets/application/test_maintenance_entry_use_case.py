@@ -7,6 +7,7 @@ from unittest.mock import patch
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
 from django.utils import timezone
 
 from apps.tickets.application.use_cases.maintenance_entry_use_case import (
@@ -18,9 +19,14 @@ from apps.tickets.domain.services.intervention_suggestion import (
     InterventionSuggestion,
     UnitMaintenanceHistory,
 )
+from apps.tickets.infrastructure.services.ingreso_email_dispatch_repo import (
+    IngresoEmailDispatchRepository,
+)
+from apps.tickets.infrastructure.services.ingreso_job_queue import IngresoJobQueue
 from apps.tickets.models import (
     BrandModel,
     GOPModel,
+    IngresoJobModel,
     IntervencionTipoModel,
     LocomotiveModel,
     LocomotiveModelModel,
@@ -779,3 +785,133 @@ def test_delete_entry_removes_pdf_and_dispatches_when_present(tmp_path):
     ).exists()
     assert not MaintenanceEntryModel.objects.filter(id=entry.id).exists()
     assert not pdf_path.exists()
+
+
+def _submit_async_entry(use_case):
+    unit = MaintenanceUnitModel.objects.create(
+        id=uuid.uuid4(), number="A905", unit_type="locomotora"
+    )
+    lugar = LugarModel.objects.create(
+        id=uuid.uuid4(), codigo=121, descripcion="PMRE", short_desc="PMRE"
+    )
+    novedad = NovedadModel.objects.create(
+        id=uuid.uuid4(),
+        maintenance_unit=unit,
+        fecha_desde=datetime(2026, 3, 1).date(),
+        lugar=lugar,
+        is_legacy=False,
+    )
+    LugarEmailRecipientModel.objects.create(
+        id=uuid.uuid4(),
+        lugar=lugar,
+        unit_type="locomotora",
+        recipient_type="to",
+        email="to@example.com",
+        is_active=True,
+    )
+    user = get_user_model().objects.create_user(username="async", password="test")
+    submission = use_case.submit_entry(
+        novedad_id=str(novedad.pk),
+        entry_datetime=timezone.make_aware(datetime(2026, 3, 6, 23, 30)),
+        trigger_type="km",
+        trigger_value=20000,
+        trigger_unit="km",
+        lugar_id=str(lugar.pk),
+        selected_intervention_code=None,
+        checklist_tasks=None,
+        observations=None,
+        user=user,
+        terminal_id="terminal-1",
+    )
+    return submission, novedad
+
+
+@pytest.mark.django_db
+def test_submit_entry_encola_y_el_job_genera_pdf_y_envio(tmp_path, settings):
+    """El ingreso se guarda sin PDF; el job genera el PDF y el envío."""
+    settings.BASE_DIR = tmp_path
+
+    use_case = MaintenanceEntryUseCase()
+    submission, novedad = _submit_async_entry(use_case)
+
+    submission.entry.refresh_from_db()
+    novedad.refresh_from_db()
+    assert novedad.ingreso_generado is True
+    assert not submission.entry.pdf_path
+    assert submission.job.status == IngresoJobModel.Status.QUEUED
+    assert not MaintenanceEntryEmailDispatchModel.objects.exists()
+
+    assert IngresoJobQueue().run_next(use_case.process_job) is True
+
+    submission.entry.refresh_from_db()
+    job = IngresoJobModel.objects.get(pk=submission.job.pk)
+    assert submission.entry.pdf_path
+    assert job.status == IngresoJobModel.Status.DONE
+    assert job.attempts == 1
+    assert (job.recipients_status, job.outlook_status) == ("ok", "pending")
+    dispatch = MaintenanceEntryEmailDispatchModel.objects.get(entry=submission.entry)
+    assert dispatch.origin_terminal_id == "terminal-1"
+    assert IngresoJobQueue().run_next(use_case.process_job) is False
+
+
+@pytest.mark.django_db
+def test_job_reintentado_no_duplica_el_envio(tmp_path, settings):
+    """Si el job falla tras crear el envío, el reintento no lo repite."""
+    settings.BASE_DIR = tmp_path
+    use_case = MaintenanceEntryUseCase()
+    submission, _ = _submit_async_entry(use_case)
+    queue = IngresoJobQueue()
+
+    with patch.object(
+        MaintenanceEntryUseCase,
+        "_generate_pdf",
+        autospec=True,
+        side_effect=MaintenanceEntryUseCase._generate_pdf,
+    ) as generate_pdf:
+        with patch.object(
+            IngresoJobQueue, "mark_done", side_effect=RuntimeError("db bloqueada")
+        ):
+            assert queue.run_next(use_case.process_job) is True
+        assert IngresoJobModel.objects.get(pk=submission.job.pk).status == (
+            IngresoJobModel.Status.QUEUED
+        )
+
+        assert queue.run_next(use_case.process_job) is True
+
+    assert generate_pdf.call_count == 1
+    job = IngresoJobModel.objects.get(pk=submission.job.pk)
+    assert job.status == IngresoJobModel.Status.DONE
+    assert job.attempts == 2
+    assert job.outlook_status == "pending"
+    assert (
+        MaintenanceEntryEmailDispatchModel.objects.filter(
+            entry=submission.entry
+        ).count()
+        == 1
+    )
+
+
+@pytest.mark.django_db
+def test_envio_unico_por_ingreso_lo_garantiza_la_base(tmp_path, settings):
+    """Un segundo envío del mismo ingreso devuelve el existente o falla en la base."""
+    settings.BASE_DIR = tmp_path
+    use_case = MaintenanceEntryUseCase()
+    submission, _ = _submit_async_entry(use_case)
+    assert IngresoJobQueue().run_next(use_case.process_job) is True
+    dispatch = MaintenanceEntryEmailDispatchModel.objects.get(entry=submission.entry)
+
+    again = IngresoEmailDispatchRepository().create_pending(
+        entry=submission.entry,
+        to_recipients=["otro@example.com"],
+        cc_recipients=[],
+        subject="Otro",
+        body="Otro",
+        body_html=None,
+    )
+
+    assert again.pk == dispatch.pk
+    assert again.subject == dispatch.subject
+    with pytest.raises(IntegrityError), transaction.atomic():
+        MaintenanceEntryEmailDispatchModel.objects.create(
+            entry=submission.entry, subject="Duplicado", body="Duplicado"
+        )
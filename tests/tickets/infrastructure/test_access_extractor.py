@@ -345,3 +345,64 @@ def test_run_extractor_emits_heartbeat_when_writer_and_long_running(monkeypatch)
         msg.startswith("[Detenciones] Extractor running... elapsed ")
         for msg in stdout_messages
     )
+
+
+def test_iter_records_streams_ndjson_from_outfile(monkeypatch, tmp_path):
+    """iter_records pide NDJSON y decodifica el archivo línea por línea."""
+
+    popen_command = []
+    temp_path = tmp_path / "access_extract.json"
+    temp_path.write_text(
+        "\ufeff"
+        '{"Unidad":"A100","Fecha":"2024-01-01","Kilometros":"10"}\n'
+        "\n"
+        '{"Unidad":"A101","Fecha":"2024-01-02","Kilometros":"20"}\n'
+        '[{"Unidad":"A102","Fecha":"2024-01-03","Kilometros":"30"}]\n',
+        encoding="utf-8",
+    )
+
+    class DummyStdout:
+        def read(self):
+            return ""
+
+    class DummyProcess:
+        returncode = 0
+
+        def __init__(self):
+            self.stdout = DummyStdout()
+            self.stderr = []
+
+        def wait(self, timeout=None):  # noqa: ARG002
+            return 0
+
+    def fake_popen(command, **kwargs):  # noqa: ARG001
+        popen_command.extend(command)
+        return DummyProcess()
+
+    monkeypatch.setattr(
+        "apps.tickets.infrastructure.services.access_extractor.subprocess.Popen",
+        fake_popen,
+    )
+    monkeypatch.setattr(
+        "apps.tickets.infrastructure.services.access_extractor.tempfile.mkstemp",
+        lambda **_kwargs: (123, str(temp_path)),
+    )
+    monkeypatch.setattr(
+        "apps.tickets.infrastructure.services.access_extractor.os.close",
+        lambda _fd: None,
+    )
+
+    extractor = AccessExtractor(
+        config=AccessExtractorConfig(script_path=temp_path, powershell_path=temp_path)
+    )
+    records = extractor.iter_records(
+        db_path=temp_path,
+        table="Kilometraje",
+        unit_field="Locs",
+        since_date=date(1900, 1, 1),
+        progress_every=0,
+    )
+
+    assert "-Ndjson" in popen_command
+    assert [record["Unidad"] for record in records] == ["A100", "A101", "A102"]
+    assert not temp_path.exists()
@@ -1,12 +1,18 @@
 """Pruebas para el importador de kilometraje Access."""
 
+from collections.abc import Iterator
+from datetime import date
 from decimal import Decimal
+from pathlib import Path
 
 import pytest
 
 from apps.tickets.infrastructure.services.access_kilometrage_importer import (
     AccessKilometrageImporter,
+    AccessKilometrageSource,
 )
+from apps.tickets.infrastructure.services.row_decoders import parse_decimal
+from apps.tickets.models import KilometrageRecordModel
 
 
 @pytest.mark.parametrize(
@@ -24,4 +30,52 @@ from apps.tickets.infrastructure.services.access_kilometrage_importer import (
 )
 def test_parse_decimal_regresion(raw_value, expected):
     """Parsea decimales con formatos US y europeo sin romper regresiones."""
-    assert AccessKilometrageImporter._parse_decimal(raw_value) == expected
+    assert parse_decimal(raw_value) == expected
+
+
+class DummyExtractor:
+    """Extractor doble para devolver registros predefinidos."""
+
+    def __init__(self, records: list[dict[str, object]]) -> None:
+        self._records = records
+
+    def extract(self, **kwargs) -> list[dict[str, object]]:  # noqa: ARG002
+        return self._records
+
+    def iter_records(self, **kwargs) -> Iterator[dict[str, object]]:  # noqa: ARG002
+        return iter(self._records)
+
+
+@pytest.mark.django_db
+def test_importador_reporta_solo_unidades_con_filas_nuevas():
+    """Solo informa las unidades que recibieron registros nuevos."""
+    KilometrageRecordModel.objects.create(
+        unit_number="A300",
+        record_date=date(2024, 1, 1),
+        km_value=Decimal("10"),
+        source="access_locs",
+    )
+    importer = AccessKilometrageImporter(
+        DummyExtractor(
+            [
+                {"Unidad": "a300", "Fecha": "2024-01-01", "Kilometros": "10"},
+                {"Unidad": "A301", "Fecha": "2024-01-01", "Kilometros": "5"},
+                {"Unidad": "A301", "Fecha": "2024-01-02", "Kilometros": "6"},
+            ]
+        )
+    )
+
+    stats = importer.import_all(
+        baselocs=AccessKilometrageSource(
+            db_path=Path("baselocs.mdb"),
+            unit_field="Locs",
+            source_label="access_locs",
+        ),
+        baseccrr=None,
+        since_date=date(2024, 1, 1),
+    )
+
+    assert stats.inserted == 2
+    assert stats.duplicates == 1
+    assert stats.affected_units == frozenset({"A301"})
+    assert KilometrageRecordModel.objects.filter(unit_number="A301").count() == 2
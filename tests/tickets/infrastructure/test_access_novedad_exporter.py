@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
@@ -124,3 +125,133 @@ def test_export_all_pending_normalizes_strings_before_check(monkeypatch):
     assert stats["exported"] == 1
     assert stats["errors"] == 0
     assert captured == {"unidad": "a100", "intervencion": "ra"}
+
+
+def test_export_batch_runs_script_once_with_manifest(monkeypatch):
+    """El modo lote arma un manifiesto y lee los resultados por fila."""
+    exporter = _build_exporter()
+    novelty = _DummyNovelty(
+        maintenance_unit=type("MU", (), {"number": "A100", "unit_type": "vagon"})(),
+        intervencion=type("IT", (), {"codigo": "RA"})(),
+        lugar=type("LG", (), {"codigo": 1})(),
+        fecha_desde=date(2024, 1, 1),
+    )
+    rows = [exporter._prepare_export(novelty), exporter._prepare_export(novelty)]
+    calls: list[list[str]] = []
+
+    def _fake_run_script(args):
+        calls.append(args)
+        manifest_path = Path(args[args.index("-ManifestPath") + 1])
+        result_path = Path(args[args.index("-ResultPath") + 1])
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        assert [item["unit_field"] for item in manifest] == ["Coche", "Coche"]
+        assert manifest[0]["db_path"] == "baseCCRR.mdb"
+        result_path.write_text(
+            json.dumps(
+                [
+                    {"key": 0, "status": "inserted", "legacy_id": 10},
+                    {"key": 1, "status": "error", "error": "FK_ERROR:x"},
+                ]
+            ),
+            encoding="utf-8",
+        )
+        return 0, "", ""
+
+    monkeypatch.setattr(exporter, "_run_script", _fake_run_script)
+
+    results = exporter.export_batch(rows)
+
+    assert len(calls) == 1
+    assert "BATCH" in calls[0]
+    assert results == [
+        ExportResult(success=True, legacy_id=10),
+        ExportResult(success=False, error="FK_ERROR:x"),
+    ]
+    assert not Path(calls[0][calls[0].index("-ManifestPath") + 1]).exists()
+
+
+def test_export_pending_batch_applies_results_with_bulk_update(monkeypatch):
+    """Aplica los resultados del lote con un único bulk_update."""
+    from apps.tickets.infrastructure.models import novedad as novedad_module
+
+    exporter = _build_exporter()
+    inserted, existing, failed = (
+        _DummyNovelty(
+            maintenance_unit=type(
+                "MU", (), {"number": number, "unit_type": "locomotora"}
+            )(),
+            intervencion=type("IT", (), {"codigo": "RA"})(),
+            lugar=type("LG", (), {"codigo": 1})(),
+            fecha_desde=date(2024, 1, 1),
+        )
+        for number in ("A100", "A101", "A102")
+    )
+    skipped = _DummyNovelty(
+        maintenance_unit=None,
+        intervencion=None,
+        lugar=None,
+        fecha_desde=date(2024, 1, 1),
+    )
+
+    def _fake_export_batch(rows):
+        assert [row.unidad for row in rows] == ["A100", "A101", "A102"]
+        return [
+            ExportResult(success=True, legacy_id=55),
+            ExportResult(success=True, legacy_id=77, already_exists=True),
+            ExportResult(success=False, error="FK_ERROR:x"),
+        ]
+
+    updates: list[tuple[list[object], list[str]]] = []
+    monkeypatch.setattr(exporter, "export_batch", _fake_export_batch)
+    monkeypatch.setattr(
+        novedad_module.NovedadModel.objects,
+        "bulk_update",
+        lambda objs, fields: updates.append((list(objs), fields)),
+    )
+
+    stats = exporter._export_pending_batch([inserted, existing, failed, skipped])
+
+    assert stats["exported"] == 1
+    assert stats["skipped"] == 2
+    assert stats["errors"] == 1
+    assert "unidad=A102" in stats["error_details"][0]
+    assert updates == [([inserted, existing], ["is_exported", "legacy_id"])]
+    assert (inserted.legacy_id, existing.legacy_id) == (55, 77)
+    assert failed.is_exported is False
+
+
+def test_check_exists_uses_worker_when_enabled(monkeypatch):
+    """Con use_worker, CHECK va al worker persistente y no lanza PowerShell."""
+    from apps.tickets.infrastructure.services import access_novedad_exporter
+
+    exporter = AccessNovedadExporter(
+        config=ExportConfig(
+            script_path=Path("scripts/export_to_access.ps1"),
+            baselocs_path=Path("baseLocs.mdb"),
+            use_worker=True,
+        )
+    )
+    requests: list[dict[str, object]] = []
+
+    class _FakeWorker:
+        def request(self, payload):
+            requests.append(payload)
+            return {"key": 1, "status": "exists", "legacy_id": 321}
+
+    monkeypatch.setattr(
+        access_novedad_exporter, "get_access_worker", lambda **_kwargs: _FakeWorker()
+    )
+
+    def _should_not_run(args):  # noqa: ARG001
+        raise AssertionError("no debe lanzar un PowerShell por llamada")
+
+    monkeypatch.setattr(exporter, "_run_script", _should_not_run)
+
+    legacy_id = exporter.check_exists_in_access(
+        unidad=" A100 ", fecha_desde="2024-01-01", intervencion="RA"
+    )
+
+    assert legacy_id == 321
+    assert requests[0]["operation"] == "CHECK"
+    assert requests[0]["unidad"] == "A100"
+    assert requests[0]["db_path"] == "baseLocs.mdb"
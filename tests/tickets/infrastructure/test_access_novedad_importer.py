@@ -1,16 +1,20 @@
 """Pruebas para el importador de novedades desde Access."""
 
+from collections.abc import Iterator
 from datetime import date
 from pathlib import Path
 from uuid import uuid4
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from apps.tickets.infrastructure.services.access_novedad_importer import (
     AccessNovedadImporter,
     AccessNovedadSource,
 )
 from apps.tickets.models import (
+    AccessSyncStateModel,
     IntervencionTipoModel,
     MaintenanceUnitModel,
     NovedadModel,
@@ -26,6 +30,9 @@ class DummyExtractor:
     def extract(self, **kwargs) -> list[dict[str, object]]:  # noqa: ARG002
         return self._records
 
+    def iter_records(self, **kwargs) -> Iterator[dict[str, object]]:  # noqa: ARG002
+        return iter(self._records)
+
 
 @pytest.mark.django_db
 def test_importador_access_no_duplica_con_manual_existente():
@@ -72,6 +79,7 @@ def test_importador_access_no_duplica_con_manual_existente():
     assert stats.processed == 1
     assert stats.inserted == 0
     assert stats.duplicates == 1
+    assert stats.affected_units == frozenset()
     assert NovedadModel.objects.count() == 1
 
 
@@ -103,6 +111,7 @@ def test_importador_access_permiste_fallback_legacy_sin_mapeo():
     assert stats.processed == 1
     assert stats.inserted == 1
     assert stats.duplicates == 0
+    assert stats.affected_units == frozenset({"ZZ999"})
 
     novedad = NovedadModel.objects.get()
     assert novedad.maintenance_unit_id is None
@@ -110,3 +119,170 @@ def test_importador_access_permiste_fallback_legacy_sin_mapeo():
     assert novedad.intervencion_id is None
     assert novedad.legacy_intervencion_codigo == "XX"
     assert novedad.is_legacy is True
+
+
+class RecordingExtractor(DummyExtractor):
+    """Extractor doble que guarda los filtros recibidos en cada corrida."""
+
+    def __init__(self, records: list[dict[str, object]]) -> None:
+        super().__init__(records)
+        self.calls: list[dict[str, object]] = []
+
+    def iter_records(self, **kwargs) -> Iterator[dict[str, object]]:
+        self.calls.append(kwargs)
+        records, self._records = self._records, []
+        return iter(records)
+
+
+@pytest.mark.django_db
+def test_importador_access_usa_marca_de_agua_por_id():
+    """La segunda corrida pide solo IDs posteriores al mayor importado."""
+
+    extractor = RecordingExtractor(
+        records=[
+            {
+                "Id": 42,
+                "Unidad": "A100",
+                "Fecha_desde": "2024-03-01",
+                "Intervencion": "RA",
+                "Observaciones": "Nueva",
+            },
+            {
+                "Id": 41,
+                "Unidad": "A101",
+                "Fecha_desde": "2023-12-31",
+                "Intervencion": "RA",
+                "Observaciones": "Cargada tarde",
+            },
+        ]
+    )
+    importer = AccessNovedadImporter(extractor=extractor)
+    source = AccessNovedadSource(db_path=Path("baselocs.mdb"), unit_field="Locs")
+
+    importer.import_all(baselocs=source, baseccrr=None)
+    importer.import_all(baselocs=source, baseccrr=None)
+
+    assert "since_id" not in extractor.calls[0]
+    assert extractor.calls[1]["since_id"] == 42
+    assert extractor.calls[1]["id_field"] == "ID"
+    state = AccessSyncStateModel.objects.get(source="LOCS", table_name="Detenciones")
+    assert state.last_id == 42
+    assert state.last_date == date(2024, 3, 1)
+
+
+@pytest.mark.django_db
+def test_importador_access_deduplica_entre_fuentes_en_dry_run():
+    """Una clave repetida en LOCS y CCRR cuenta una sola vez aun sin escribir."""
+
+    MaintenanceUnitModel.objects.create(
+        id=uuid4(),
+        number="A100",
+        unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+    )
+    IntervencionTipoModel.objects.create(codigo="RA", descripcion="Revision")
+    record = {
+        "Unidad": "A100",
+        "Fecha_desde": "2024-05-10",
+        "Intervencion": "RA",
+        "Observaciones": "Misma novedad",
+    }
+    importer = AccessNovedadImporter(extractor=DummyExtractor(records=[record]))
+
+    stats = importer.import_all(
+        baselocs=AccessNovedadSource(db_path=Path("baselocs.mdb"), unit_field="Locs"),
+        baseccrr=AccessNovedadSource(db_path=Path("baseccrr.mdb"), unit_field="Coche"),
+        dry_run=True,
+    )
+
+    assert stats.processed == 2
+    assert stats.inserted == 1
+    assert stats.duplicates == 1
+    assert NovedadModel.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_unidades_afectadas_solo_de_filas_insertadas_y_con_numero_real(monkeypatch):
+    """Las filas descartadas por conflicto no cuentan; se usa el número de unidad."""
+
+    unit = MaintenanceUnitModel.objects.create(
+        id=uuid4(),
+        number="a100",
+        unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+    )
+    intervencion = IntervencionTipoModel.objects.create(
+        codigo="RA",
+        descripcion="Revision",
+    )
+    NovedadModel.objects.create(
+        id=uuid4(),
+        maintenance_unit=MaintenanceUnitModel.objects.create(
+            id=uuid4(),
+            number="A200",
+            unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+        ),
+        fecha_desde=date(2024, 1, 1),
+        intervencion=intervencion,
+        is_legacy=False,
+    )
+    # Simula una fila que otro proceso insertó después de la deduplicación
+    monkeypatch.setattr(
+        AccessNovedadImporter,
+        "_drop_known_business_keys",
+        staticmethod(lambda batch, _seen: list(batch)),
+    )
+    row = {
+        "Fecha_hasta": "",
+        "Fecha_est": "",
+        "Intervencion": "RA",
+        "Lugar": "",
+        "Observaciones": "",
+    }
+    importer = AccessNovedadImporter(
+        extractor=DummyExtractor(
+            records=[
+                {**row, "Unidad": "A100", "Fecha_desde": "2024-01-01"},
+                {**row, "Unidad": "A200", "Fecha_desde": "2024-01-01"},
+            ]
+        )
+    )
+
+    stats = importer.import_all(
+        baselocs=AccessNovedadSource(db_path=Path("baselocs.mdb"), unit_field="Locs"),
+        baseccrr=None,
+    )
+
+    assert stats.inserted == 1
+    assert stats.duplicates == 1
+    assert stats.affected_units == frozenset({unit.number})
+
+
+@pytest.mark.django_db
+def test_claves_existentes_se_cargan_solo_para_las_fechas_del_lote(monkeypatch):
+    """Un lote con fechas lejanas no carga las claves de los días intermedios."""
+
+    unit = MaintenanceUnitModel.objects.create(
+        id=uuid4(),
+        number="A100",
+        unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+    )
+    intervencion = IntervencionTipoModel.objects.create(
+        codigo="RA",
+        descripcion="Revision",
+    )
+    for fecha in (date(2020, 1, 1), date(2023, 6, 1), date(2026, 1, 1)):
+        NovedadModel.objects.create(
+            id=uuid4(),
+            maintenance_unit=unit,
+            fecha_desde=fecha,
+            intervencion=intervencion,
+            is_legacy=False,
+        )
+    monkeypatch.setattr(AccessNovedadImporter, "DATE_CHUNK_SIZE", 1)
+
+    with CaptureQueriesContext(connection) as queries:
+        known = AccessNovedadImporter._load_existing_business_keys(
+            [date(2026, 1, 1), date(2020, 1, 1), date(2026, 1, 1)]
+        )
+
+    assert len(queries.captured_queries) == 2
+    assert {key[1] for key in known} == {date(2020, 1, 1), date(2026, 1, 1)}
@@ -0,0 +1,98 @@
+"""Pruebas para el worker persistente de PowerShell/Access."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from apps.tickets.infrastructure.services import access_powershell_worker
+from apps.tickets.infrastructure.services.access_powershell_worker import (
+    AccessPowerShellWorker,
+    AccessWorkerError,
+)
+
+_FAKE_SERVER = """
+import json
+import os
+import sys
+
+print(json.dumps({"status": "ready", "pid": os.getpid()}), flush=True)
+for line in sys.stdin:
+    request = json.loads(line)
+    if request.get("operation") == "QUIT":
+        break
+    if request.get("operation") == "CRASH":
+        sys.exit(3)
+    print("ruido no JSON", flush=True)
+    print(
+        json.dumps(
+            {
+                "key": request["key"],
+                "status": "exists",
+                "legacy_id": os.getpid(),
+                "error": None,
+            }
+        ),
+        flush=True,
+    )
+"""
+
+
+@pytest.fixture
+def worker(monkeypatch, tmp_path):
+    server_path = tmp_path / "fake_server.py"
+    server_path.write_text(_FAKE_SERVER, encoding="utf-8")
+    commands: list[list[str]] = []
+    real_popen = subprocess.Popen
+
+    def _fake_popen(command, **kwargs):
+        commands.append(command)
+        return real_popen([sys.executable, str(server_path)], **kwargs)
+
+    monkeypatch.setattr(access_powershell_worker.subprocess, "Popen", _fake_popen)
+    instance = AccessPowerShellWorker(
+        powershell_path=Path("powershell.exe"),
+        script_path=Path("scripts/export_to_access.ps1"),
+        db_path=Path("baseLocs.mdb"),
+        timeout_seconds=10,
+    )
+    instance.commands = commands
+    yield instance
+    instance.close()
+
+
+def test_worker_reuses_one_process_for_many_requests(worker):
+    """Varias consultas reutilizan el mismo proceso y la conexión abierta."""
+    first = worker.request({"operation": "CHECK", "unidad": "A100"})
+    second = worker.request({"operation": "CHECK", "unidad": "A101"})
+
+    assert first["status"] == "exists"
+    assert first["legacy_id"] == second["legacy_id"]
+    assert len(worker.commands) == 1
+    assert worker.commands[0][-2:] == ["-Operation", "SERVE"]
+
+
+def test_worker_restarts_after_crash_without_resending(worker):
+    """Si el proceso muere, falla esa consulta y el siguiente pedido reinicia."""
+    first = worker.request({"operation": "CHECK", "unidad": "A100"})
+
+    with pytest.raises(AccessWorkerError):
+        worker.request({"operation": "CRASH"})
+
+    second = worker.request({"operation": "CHECK", "unidad": "A100"})
+
+    assert worker.restarts == 1
+    assert len(worker.commands) == 2
+    assert second["legacy_id"] != first["legacy_id"]
+
+
+def test_worker_close_stops_process(worker):
+    """close() pide QUIT y deja el worker detenido."""
+    worker.request({"operation": "CHECK", "unidad": "A100"})
+
+    worker.close()
+
+    assert worker.is_running is False
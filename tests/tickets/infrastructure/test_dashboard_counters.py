@@ -0,0 +1,157 @@
+"""Pruebas para los contadores incrementales de la home."""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.tickets.infrastructure.models import (
+    DashboardCountersModel,
+    GOPModel,
+    MaintenanceUnitModel,
+    NovedadModel,
+    TicketModel,
+)
+from apps.tickets.infrastructure.services.dashboard_counters import (
+    DashboardCountersService,
+)
+
+TODAY = date(2026, 10, 14)  # miércoles
+
+
+def _unit() -> MaintenanceUnitModel:
+    return MaintenanceUnitModel.objects.create(
+        id=uuid4(),
+        number="A904",
+        unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+    )
+
+
+def _ticket(unit, number: str, status=TicketModel.Status.PENDING) -> TicketModel:
+    gop, _ = GOPModel.objects.get_or_create(
+        code="G1", defaults={"id": uuid4(), "name": "GOP 1"}
+    )
+    return TicketModel.objects.create(
+        id=uuid4(),
+        ticket_number=number,
+        date=TODAY,
+        maintenance_unit=unit,
+        gop=gop,
+        entry_type=TicketModel.EntryType.IMMEDIATE,
+        status=status,
+        reported_failure="Falla de prueba",
+    )
+
+
+def _novedad(fecha: date, code: str = "A904") -> NovedadModel:
+    return NovedadModel(
+        id=uuid4(),
+        legacy_unit_code=code,
+        fecha_desde=fecha,
+        is_legacy=True,
+    )
+
+
+def _counts(counters: DashboardCountersModel) -> tuple[int, ...]:
+    return (
+        counters.tickets_pending,
+        counters.tickets_completed,
+        counters.tickets_total,
+        counters.novedades_hoy,
+        counters.novedades_semana,
+        counters.novedades_total,
+    )
+
+
+@pytest.mark.django_db
+def test_triggers_mantienen_contadores_sin_recalcular():
+    """Altas, cambios de estado, bulk_create y bajas ajustan la fila única."""
+
+    service = DashboardCountersService()
+    service.reconcile(TODAY)
+    unit = _unit()
+
+    ticket = _ticket(unit, "T-1")
+    _ticket(unit, "T-2", status=TicketModel.Status.COMPLETED)
+    ticket.status = TicketModel.Status.COMPLETED
+    ticket.save()
+    NovedadModel.objects.bulk_create(
+        [
+            _novedad(TODAY),
+            _novedad(TODAY - timedelta(days=2)),
+            _novedad(TODAY - timedelta(days=3), code="A905"),
+        ]
+    )
+    moved = NovedadModel.objects.get(fecha_desde=TODAY - timedelta(days=2))
+    moved.fecha_desde = TODAY
+    moved.save()
+    NovedadModel.objects.filter(legacy_unit_code="A905").delete()
+
+    with CaptureQueriesContext(connection) as queries:
+        counters = service.read(TODAY)
+
+    assert len(queries.captured_queries) == 1
+    assert _counts(counters) == (0, 2, 2, 2, 2, 2)
+    assert service.reconcile(TODAY).drift == {}
+
+
+@pytest.mark.django_db
+def test_cambio_de_dia_recalcula_hoy_y_semana():
+    """Al pasar el día la lectura recalcula las novedades de hoy y de la semana."""
+
+    service = DashboardCountersService()
+    service.reconcile(TODAY)
+    NovedadModel.objects.bulk_create(
+        [_novedad(TODAY), _novedad(TODAY - timedelta(days=1), "A905")]
+    )
+
+    next_monday = TODAY + timedelta(days=5)
+    counters = service.read(next_monday)
+
+    assert counters.as_of == next_monday
+    assert counters.week_start == next_monday
+    assert (counters.novedades_hoy, counters.novedades_semana) == (0, 0)
+    assert counters.novedades_total == 2
+
+
+@pytest.mark.django_db
+def test_reconcile_corrige_y_reporta_desvios():
+    """El recálculo corrige contadores desviados e informa la diferencia."""
+
+    service = DashboardCountersService()
+    service.reconcile(TODAY)
+    _ticket(_unit(), "T-1")
+    DashboardCountersModel.objects.update(tickets_total=7, tickets_pending=0)
+
+    result = service.reconcile(TODAY)
+
+    assert result.drift == {"tickets_pending": 1, "tickets_total": -6}
+    assert _counts(result.counters)[:3] == (1, 0, 1)
+
+
+@pytest.mark.django_db
+def test_reconcile_reporta_triggers_faltantes_y_migrate_los_recrea():
+    """Sin triggers el recálculo los informa; tras migrate vuelven a contar."""
+
+    service = DashboardCountersService()
+    with connection.cursor() as cursor:
+        cursor.execute("DROP TRIGGER dashboard_ticket_ai")
+        cursor.execute("DROP TRIGGER dashboard_novedad_au")
+    unit = _unit()
+    _ticket(unit, "T-1")
+
+    assert service.reconcile(TODAY).missing_triggers == [
+        "dashboard_ticket_ai",
+        "dashboard_novedad_au",
+    ]
+
+    _ticket(unit, "T-2")
+    emit_post_migrate_signal(verbosity=0, interactive=False, db="default")
+    _ticket(unit, "T-3")
+
+    stored = DashboardCountersModel.objects.get()
+    assert (stored.tickets_pending, stored.tickets_total) == (3, 3)
+    assert service.reconcile(TODAY).missing_triggers == []
@@ -0,0 +1,101 @@
+"""Pruebas para la cola de trabajos de PDF y correo de ingresos."""
+
+import threading
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from apps.tickets.infrastructure.models import (
+    IngresoJobModel,
+    MaintenanceEntryModel,
+    NovedadModel,
+)
+from apps.tickets.infrastructure.services.ingreso_job_queue import (
+    MAX_ATTEMPTS,
+    IngresoJobQueue,
+    IngresoJobWorker,
+)
+
+
+def _entry():
+    novedad = NovedadModel.objects.create(
+        fecha_desde=timezone.localdate(), is_legacy=False, ingreso_generado=True
+    )
+    return MaintenanceEntryModel.objects.create(
+        novedad=novedad, entry_datetime=timezone.now()
+    )
+
+
+def _failing_handler(job):
+    raise RuntimeError("disco lleno")
+
+
+@pytest.mark.django_db
+def test_job_fallido_se_reintenta_hasta_agotar_intentos():
+    """Cada error vuelve a encolar el job hasta MAX_ATTEMPTS."""
+    queue = IngresoJobQueue()
+    job = queue.enqueue(_entry())
+
+    for _ in range(MAX_ATTEMPTS):
+        assert queue.run_next(_failing_handler) is True
+
+    job.refresh_from_db()
+    assert job.status == IngresoJobModel.Status.FAILED
+    assert job.attempts == MAX_ATTEMPTS
+    assert job.last_error == "disco lleno"
+    assert job.finished_at is not None
+    assert queue.run_next(_failing_handler) is False
+
+
+@pytest.mark.django_db
+def test_claim_no_entrega_dos_veces_el_mismo_job_y_libera_los_colgados():
+    """Un job en curso no se reclama de nuevo salvo que haya quedado colgado."""
+    queue = IngresoJobQueue()
+    job = queue.enqueue(_entry())
+
+    claimed = queue.claim_next()
+    assert claimed.pk == job.pk
+    assert claimed.status == IngresoJobModel.Status.RUNNING
+    assert queue.claim_next() is None
+
+    IngresoJobModel.objects.filter(pk=job.pk).update(
+        started_at=timezone.now() - timedelta(hours=1)
+    )
+    reclaimed = queue.claim_next()
+    assert reclaimed.pk == job.pk
+    assert reclaimed.attempts == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_worker_procesa_la_cola_y_se_detiene():
+    """El hilo despierta con el evento, procesa el job y termina al pedirlo."""
+    done = threading.Event()
+    seen = []
+
+    def handler(job):
+        seen.append(job.pk)
+        IngresoJobQueue().mark_done(
+            job,
+            recipients_status="ok",
+            recipients_reason=None,
+            outlook_status="pending",
+            outlook_reason=None,
+        )
+        done.set()
+
+    job = IngresoJobQueue().enqueue(_entry())
+    wake = threading.Event()
+    worker = IngresoJobWorker(handler, wake, poll_seconds=0.05)
+    worker.start()
+    try:
+        wake.set()
+        assert done.wait(5)
+    finally:
+        worker.stop()
+        worker.join(5)
+
+    assert seen == [job.pk]
+    assert not worker.is_alive()
+    job.refresh_from_db()
+    assert job.status == IngresoJobModel.Status.DONE
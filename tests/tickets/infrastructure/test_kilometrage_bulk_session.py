@@ -0,0 +1,70 @@
+"""Pruebas para la sesion de carga masiva de kilometraje."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.db import connection
+
+from apps.tickets.infrastructure.services.kilometrage_bulk_session import (
+    DROPPABLE_INDEX,
+    kilometrage_bulk_session,
+)
+from apps.tickets.models import KilometrageRecordModel
+
+
+def _index_exists() -> bool:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = %s",
+            [DROPPABLE_INDEX],
+        )
+        return cursor.fetchone() is not None
+
+
+def _pragma(name: str) -> object:
+    with connection.cursor() as cursor:
+        cursor.execute(f"PRAGMA {name}")
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+def test_sesion_masiva_reconstruye_indice_y_restaura_pragmas():
+    """Quita el indice durante la carga y deja todo como estaba al terminar."""
+    cache_before = _pragma("cache_size")
+
+    with kilometrage_bulk_session(drop_index=True):
+        assert not _index_exists()
+        assert _pragma("cache_size") == -64000
+        KilometrageRecordModel.objects.create(
+            unit_number="A100",
+            record_date=date(2024, 1, 1),
+            km_value=Decimal("10"),
+            source="access_locs",
+        )
+
+    assert _index_exists()
+    assert _pragma("cache_size") == cache_before
+    assert KilometrageRecordModel.objects.filter(unit_number="A100").exists()
+
+
+@pytest.mark.django_db
+def test_sesion_masiva_revierte_ante_error():
+    """Ante un error revierte la carga, conserva el indice y restaura PRAGMAs."""
+    cache_before = _pragma("cache_size")
+
+    with (
+        pytest.raises(RuntimeError),
+        kilometrage_bulk_session(drop_index=True),
+    ):
+        KilometrageRecordModel.objects.create(
+            unit_number="A200",
+            record_date=date(2024, 1, 1),
+            km_value=Decimal("10"),
+            source="access_locs",
+        )
+        raise RuntimeError("fallo de importacion")
+
+    assert _index_exists()
+    assert _pragma("cache_size") == cache_before
+    assert not KilometrageRecordModel.objects.filter(unit_number="A200").exists()
@@ -0,0 +1,264 @@
+"""Pruebas para el repositorio de kilometraje y su índice acumulado."""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from apps.tickets.infrastructure.services.kilometrage_cache import (
+    KilometrageLookupCache,
+    kilometrage_lookup_cache,
+)
+from apps.tickets.infrastructure.services.kilometrage_cumulative_index import (
+    KilometrageCumulativeIndex,
+)
+from apps.tickets.infrastructure.services.kilometrage_monthly_rollup import (
+    KilometrageMonthlyRollup,
+)
+from apps.tickets.infrastructure.services.kilometrage_repository import (
+    KilometrageRepository,
+)
+from apps.tickets.infrastructure.services.legacy_kilometrage_importer import (
+    LegacyKilometrageImporter,
+)
+from apps.tickets.models import KilometrageMonthlyModel, KilometrageRecordModel
+
+
+def _write_km_file(base_path, rows: list[str]) -> None:
+    content = "Locs;Fecha;Kms_diario\n" + "".join(f"{row}\n" for row in rows)
+    (base_path / "Kilometraje_Locs.txt").write_text(content, encoding="latin-1")
+
+
+@pytest.mark.django_db
+def test_importador_mantiene_acumulado_por_unidad(tmp_path):
+    """El importador deja el acumulado consistente y km_since lo usa."""
+    _write_km_file(
+        tmp_path,
+        [
+            "A200;01/01/2024;100",
+            "A200;02/01/2024;50,5",
+            "A200;03/01/2024;25",
+            "A201;01/01/2024;7",
+        ],
+    )
+
+    LegacyKilometrageImporter().import_all(base_path=tmp_path, full=True)
+
+    cumulative = list(
+        KilometrageRecordModel.objects.filter(unit_number="A200")
+        .order_by("record_date")
+        .values_list("cumulative_km", flat=True)
+    )
+    assert cumulative == [Decimal("100"), Decimal("150.5"), Decimal("175.5")]
+
+    repo = KilometrageRepository()
+    assert repo.get_km_since("a200", date(2024, 1, 2)) == Decimal("75.5")
+    assert repo.get_km_since("A200", date(2023, 12, 31)) == Decimal("175.5")
+    assert repo.get_km_since("A200", date(2024, 1, 4)) is None
+    assert repo.get_km_since("A201", date(2024, 1, 1)) == Decimal("7")
+
+
+@pytest.mark.django_db
+def test_registro_retroactivo_recalcula_sufijo(tmp_path):
+    """Un registro con fecha anterior recalcula solo los acumulados posteriores."""
+    _write_km_file(tmp_path, ["A202;01/01/2024;10", "A202;05/01/2024;30"])
+    importer = LegacyKilometrageImporter()
+    importer.import_all(base_path=tmp_path, full=True)
+
+    _write_km_file(tmp_path, ["A202;03/01/2024;20"])
+    importer.import_all(base_path=tmp_path, full=True)
+
+    cumulative = list(
+        KilometrageRecordModel.objects.filter(unit_number="A202")
+        .order_by("record_date")
+        .values_list("cumulative_km", flat=True)
+    )
+    assert cumulative == [Decimal("10"), Decimal("30"), Decimal("60")]
+    assert KilometrageRepository().get_km_since("A202", date(2024, 1, 2)) == Decimal(
+        "50"
+    )
+
+
+@pytest.mark.django_db
+def test_km_since_sin_acumulado_usa_suma():
+    """Sin acumulado calculado, km_since vuelve a la suma directa."""
+    for day, km in ((1, "10"), (2, "20"), (3, "30")):
+        KilometrageRecordModel.objects.create(
+            unit_number="A203",
+            record_date=date(2024, 1, day),
+            km_value=Decimal(km),
+        )
+
+    repo = KilometrageRepository()
+    assert repo.get_km_since("A203", date(2024, 1, 2)) == Decimal("50")
+
+    KilometrageCumulativeIndex().rebuild_all()
+
+    assert (
+        KilometrageRecordModel.objects.filter(cumulative_km__isnull=True).count() == 0
+    )
+    assert repo.get_km_since("A203", date(2024, 1, 2)) == Decimal("50")
+
+
+@pytest.mark.django_db
+def test_consultas_bulk_coinciden_con_consultas_individuales(tmp_path):
+    """Las variantes bulk devuelven lo mismo que las consultas por unidad."""
+    _write_km_file(
+        tmp_path,
+        [
+            "A210;30/12/2023;5",
+            "A210;01/01/2024;100",
+            "A210;15/01/2024;50",
+            "A210;02/02/2024;25",
+            "A211;10/01/2024;7",
+        ],
+    )
+    LegacyKilometrageImporter().import_all(base_path=tmp_path, full=True)
+    repo = KilometrageRepository()
+
+    pairs = [
+        ("a210", date(2024, 1, 1)),
+        ("A210", date(2024, 1, 16)),
+        ("A210", date(2024, 3, 1)),
+        ("A211", date(2024, 1, 1)),
+        ("X999", date(2024, 1, 1)),
+    ]
+    km_since = repo.get_km_since_bulk(pairs)
+    assert km_since == {pair: repo.get_km_since(*pair) for pair in pairs}
+    assert km_since[("a210", date(2024, 1, 1))] == Decimal("175")
+
+    at_or_before = repo.get_km_at_or_before_bulk(pairs)
+    assert at_or_before == {pair: repo.get_km_at_or_before(*pair) for pair in pairs}
+
+    latest = repo.get_latest_km_bulk(["A210", " a211 ", "X999"])
+    assert latest == {
+        "A210": Decimal("25"),
+        " a211 ": Decimal("7"),
+        "X999": None,
+    }
+
+    months = [
+        ("A210", 2023, 12),
+        ("A210", 2024, 1),
+        ("a210", 2024, 2),
+        ("A211", 2024, 2),
+    ]
+    assert repo.get_km_for_month_bulk(months) == {
+        item: repo.get_km_for_month(*item) for item in months
+    }
+    assert repo.get_km_for_month_bulk([]) == {}
+
+
+@pytest.mark.django_db
+def test_km_since_bulk_sin_acumulado_usa_suma():
+    """Sin acumulado calculado, la variante bulk también usa la suma directa."""
+    for day, km in ((1, "10"), (2, "20"), (3, "30")):
+        KilometrageRecordModel.objects.create(
+            unit_number="A212",
+            record_date=date(2024, 1, day),
+            km_value=Decimal(km),
+        )
+
+    result = KilometrageRepository().get_km_since_bulk([("A212", date(2024, 1, 2))])
+
+    assert result == {("A212", date(2024, 1, 2)): Decimal("50")}
+
+
+@pytest.mark.django_db
+def test_cache_compartido_se_invalida_al_importar(tmp_path):
+    """Las lecturas repetidas usan el cache y la importación lo invalida."""
+    cache = KilometrageLookupCache(max_entries=2, ttl_seconds=300)
+    repo = KilometrageRepository(cache=cache)
+    _write_km_file(tmp_path, ["A220;01/01/2024;10"])
+    importer = LegacyKilometrageImporter()
+    importer.import_all(base_path=tmp_path, full=True)
+
+    assert repo.get_latest_km("A220") == Decimal("10")
+    assert repo.get_latest_km("a220") == Decimal("10")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    repo.get_km_since("A220", date(2024, 1, 1))
+    repo.get_km_since("A221", date(2024, 1, 1))
+    assert repo.get_latest_km("A220") == Decimal("10")
+    assert cache.misses == 4
+
+    kilometrage_lookup_cache.set(("latest", "A220"), Decimal("10"))
+    _write_km_file(tmp_path, ["A220;02/01/2024;15"])
+    importer.import_all(base_path=tmp_path, full=True)
+
+    assert kilometrage_lookup_cache.get(("latest", "A220")) is (
+        KilometrageLookupCache.MISSING
+    )
+    assert KilometrageRepository().get_latest_km("A220") == Decimal("15")
+
+
+@pytest.mark.django_db
+def test_importador_mantiene_resumen_mensual_y_promedios(tmp_path):
+    """El resumen mensual sigue a los registros diarios y alimenta promedios."""
+    _write_km_file(
+        tmp_path,
+        [
+            "A230;31/12/2023;40",
+            "A230;05/01/2024;100",
+            "A230;20/01/2024;50",
+            "A230;10/03/2024;30",
+        ],
+    )
+    importer = LegacyKilometrageImporter()
+    importer.import_all(base_path=tmp_path, full=True)
+
+    _write_km_file(tmp_path, ["A230;25/01/2024;20", "A230;02/02/2024;10"])
+    importer.import_all(base_path=tmp_path, full=True)
+
+    monthly = {
+        row.month: (row.km_total, row.record_count)
+        for row in KilometrageMonthlyModel.objects.filter(unit_number="A230")
+    }
+    assert monthly == {
+        date(2023, 12, 1): (Decimal("40"), 1),
+        date(2024, 1, 1): (Decimal("170"), 3),
+        date(2024, 2, 1): (Decimal("10"), 1),
+        date(2024, 3, 1): (Decimal("30"), 1),
+    }
+
+    repo = KilometrageRepository()
+    assert repo.get_km_for_month("a230", 2024, 1) == Decimal("170")
+    assert repo.get_km_for_month("A230", 2024, 4) is None
+    assert (
+        repo.get_average_monthly_km("A230", date(2024, 3, 15), 3) == Decimal("220") / 3
+    )
+    averages = repo.get_average_monthly_km_bulk(["A230", "X999"], date(2024, 4, 1), 6)
+    assert averages == {"A230": Decimal("250") / 6, "X999": None}
+
+    KilometrageMonthlyModel.objects.all().delete()
+    assert KilometrageRepository().get_km_for_month_bulk([("A230", 2024, 1)]) == {
+        ("A230", 2024, 1): Decimal("170")
+    }
+    KilometrageMonthlyRollup().rebuild_all()
+    assert KilometrageMonthlyModel.objects.filter(unit_number="A230").count() == 4
+
+
+@pytest.mark.django_db
+def test_totales_mensuales_incluyen_registros_con_mayusculas_mixtas():
+    """Registros viejos con número en minúsculas siguen sumando al mes."""
+    for unit_number, day, km in (("a240", 3, "15"), ("A240", 9, "25")):
+        KilometrageRecordModel.objects.create(
+            unit_number=unit_number,
+            record_date=date(2024, 5, day),
+            km_value=Decimal(km),
+        )
+
+    repo = KilometrageRepository()
+    assert repo.get_km_for_month("A240", 2024, 5) == Decimal("40")
+    assert repo.get_km_for_month_bulk([("A240", 2024, 5)]) == {
+        ("A240", 2024, 5): Decimal("40")
+    }
+
+    KilometrageMonthlyRollup().rebuild_all()
+
+    assert list(
+        KilometrageMonthlyModel.objects.values_list("unit_number", "km_total")
+    ) == [("A240", Decimal("40"))]
+    assert KilometrageRepository().get_average_monthly_km(
+        "a240", date(2024, 6, 1), 1
+    ) == Decimal("40")
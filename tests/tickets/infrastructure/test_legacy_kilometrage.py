@@ -0,0 +1,59 @@
+"""Pruebas para el lector de kilometraje legacy desde TXT."""
+
+import os
+from datetime import date
+from decimal import Decimal
+
+from apps.tickets.infrastructure.services.legacy_kilometrage import (
+    LegacyKilometrageRepository,
+)
+
+
+def _write(path, header: str, rows: list[str], mtime_ns: int) -> None:
+    content = header + "\n" + "".join(f"{row}\n" for row in rows)
+    path.write_text(content, encoding="latin-1")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_lector_legacy_indexa_ambos_archivos(tmp_path):
+    """Las consultas usan el indice ordenado de Locs y CCRR."""
+    _write(
+        tmp_path / "KilometrajeLocs.txt",
+        "Locs;Fecha;Kms_diario",
+        ["a300;03/01/2024;30", "A300;01/01/2024;10,5", "A301;01/01/2024;99"],
+        1_000_000_000,
+    )
+    _write(
+        tmp_path / "Kilometraje_CCRR.txt",
+        "Coche;Fecha;Kms_diario",
+        ["A300;02/01/2024;20", "A300;xx;5", "C100;01/01/2024;1"],
+        1_000_000_000,
+    )
+
+    repo = LegacyKilometrageRepository(base_path=tmp_path)
+
+    assert repo.get_latest_km("A300") == Decimal("30")
+    assert repo.get_km_at_or_before("A300", date(2024, 1, 2)) == Decimal("20")
+    assert repo.get_km_at_or_before("A300", date(2023, 12, 31)) is None
+    assert repo.get_km_since("A300", date(2024, 1, 2)) == Decimal("50")
+    assert repo.get_km_since("A300", date(2024, 1, 4)) is None
+    assert repo.get_km_since("c100", date(2024, 1, 1)) == Decimal("1")
+    assert repo.get_latest_km("ZZZ") is None
+
+
+def test_lector_legacy_recarga_si_cambia_el_archivo(tmp_path):
+    """El indice se reconstruye solo cuando cambia el archivo en disco."""
+    locs = tmp_path / "KilometrajeLocs.txt"
+    _write(locs, "Locs;Fecha;Kms_diario", ["A310;01/01/2024;10"], 1_000_000_000)
+    repo = LegacyKilometrageRepository(base_path=tmp_path)
+    assert repo.get_latest_km("A310") == Decimal("10")
+
+    _write(
+        locs,
+        "Locs;Fecha;Kms_diario",
+        ["A310;01/01/2024;10", "A310;02/01/2024;15"],
+        2_000_000_000,
+    )
+
+    assert repo.get_latest_km("A310") == Decimal("15")
+    assert repo.get_km_since("A310", date(2024, 1, 1)) == Decimal("25")
@@ -106,3 +106,79 @@ def test_import_kilometrage_cuenta_solo_nuevos_con_duplicados(tmp_path):
     assert stats.skipped_old == 0
     assert stats.invalid == 0
     assert KilometrageRecordModel.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_import_kilometrage_insercion_directa_equivale_a_orm(tmp_path):
+    """La ruta INSERT OR IGNORE guarda lo mismo que el ORM y omite duplicados."""
+    base_path = tmp_path / "context" / "db-legacy"
+    base_path.mkdir(parents=True)
+
+    unit = MaintenanceUnitModel.objects.create(
+        id=uuid4(),
+        number="A102",
+        unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+    )
+    KilometrageRecordModel.objects.create(
+        maintenance_unit=unit,
+        unit_number="A102",
+        record_date=date(2024, 1, 1),
+        km_value=Decimal("100"),
+        source="legacy_csv",
+    )
+
+    content = (
+        "Locs;Fecha;Kms_diario\n"
+        "A102;01/01/2024;999\n"
+        "a102;02/01/2024;50,25\n"
+        "A102;sin fecha;10\n"
+        "Z900;03/01/2024;7\n"
+    )
+    (base_path / "Kilometraje_Locs.txt").write_text(content, encoding="latin-1")
+
+    stats = LegacyKilometrageImporter(direct_insert=True).import_all(
+        base_path=base_path, full=True
+    )
+
+    assert stats.processed == 4
+    assert stats.inserted == 2
+    assert stats.invalid == 1
+    records = {
+        (record.unit_number, record.record_date): record
+        for record in KilometrageRecordModel.objects.all()
+    }
+    assert records[("A102", date(2024, 1, 1))].km_value == Decimal("100")
+    inserted = records[("A102", date(2024, 1, 2))]
+    assert inserted.maintenance_unit_id == unit.id
+    assert inserted.km_value == Decimal("50.25")
+    assert inserted.cumulative_km == Decimal("150.25")
+    assert inserted.source == "legacy_csv"
+    assert records[("Z900", date(2024, 1, 3))].maintenance_unit_id is None
+
+
+@pytest.mark.django_db
+def test_import_kilometrage_parseo_en_procesos_equivale_a_secuencial(tmp_path):
+    """Partir el archivo por lineas y parsear en procesos da el mismo resultado."""
+    base_path = tmp_path / "context" / "db-legacy"
+    base_path.mkdir(parents=True)
+    rows = [
+        f"A{index // 28:03d};{index % 28 + 1:02d}/02/2024;{index},5"
+        for index in range(300)
+    ]
+    rows.insert(150, "A001;fecha mala;10")
+    content = "Locs;Fecha;Kms_diario\r\n" + "".join(f"{row}\r\n" for row in rows)
+    (base_path / "Kilometraje_Locs.txt").write_text(content, encoding="latin-1")
+
+    importer = LegacyKilometrageImporter(parse_workers=2)
+    importer.PARALLEL_MIN_BYTES = 0
+    stats = importer.import_all(base_path=base_path, full=True)
+
+    sequential = LegacyKilometrageImporter().import_all(
+        base_path=base_path, full=True, dry_run=True
+    )
+    assert stats.processed == sequential.processed == 301
+    assert stats.invalid == sequential.invalid == 1
+    assert stats.inserted == KilometrageRecordModel.objects.count() == 300
+    assert KilometrageRecordModel.objects.get(
+        unit_number="A000", record_date=date(2024, 2, 1)
+    ).km_value == Decimal("0.5")
@@ -0,0 +1,144 @@
+"""Pruebas para la conciliación Access vs SQLite por digest de buckets."""
+
+from collections.abc import Iterator
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from apps.tickets.infrastructure.services.novedad_reconciliation import (
+    NovedadReconciliationService,
+    ReconciliationSource,
+)
+from apps.tickets.models import (
+    IntervencionTipoModel,
+    MaintenanceUnitModel,
+    NovedadModel,
+)
+
+
+class FilteringExtractor:
+    """Extractor doble que filtra por unidad y registra cada llamada."""
+
+    def __init__(self, records: list[dict[str, object]]) -> None:
+        self._records = records
+        self.calls: list[str | None] = []
+
+    def iter_records(self, **kwargs) -> Iterator[dict[str, object]]:
+        unit_value = kwargs.get("unit_value")
+        self.calls.append(unit_value)
+        return iter(
+            [
+                record
+                for record in self._records
+                if unit_value is None or record["Unidad"] == unit_value
+            ]
+        )
+
+
+@pytest.mark.django_db
+def test_conciliacion_solo_detalla_buckets_con_diferencias(tmp_path):
+    """Solo los buckets unidad/año con digest distinto se comparan clave a clave."""
+
+    db_path = tmp_path / "baselocs.mdb"
+    db_path.write_bytes(b"")
+    unit = MaintenanceUnitModel.objects.create(
+        id=uuid4(),
+        number="A100",
+        unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+    )
+    intervencion = IntervencionTipoModel.objects.create(
+        codigo="RA",
+        descripcion="Revision",
+    )
+    for fecha in (date(2023, 3, 1), date(2024, 1, 1), date(2024, 6, 1)):
+        NovedadModel.objects.create(
+            id=uuid4(),
+            maintenance_unit=unit,
+            fecha_desde=fecha,
+            intervencion=intervencion,
+        )
+    NovedadModel.objects.create(
+        id=uuid4(),
+        legacy_unit_code="b200",
+        fecha_desde=date(2024, 2, 2),
+        legacy_intervencion_codigo="ra",
+        is_legacy=True,
+    )
+
+    extractor = FilteringExtractor(
+        records=[
+            {"Unidad": "A100", "Fecha_desde": "2023-03-01", "Intervencion": "RA"},
+            {"Unidad": "A100", "Fecha_desde": "2024-01-01", "Intervencion": "RA"},
+            {"Unidad": "A100", "Fecha_desde": "2024-01-01", "Intervencion": "RA"},
+            {"Unidad": "A100", "Fecha_desde": "2024-09-09", "Intervencion": "RA"},
+            {"Unidad": "B200", "Fecha_desde": "02/02/2024", "Intervencion": "RA"},
+            {"Unidad": "B200", "Fecha_desde": "", "Intervencion": "RA"},
+        ]
+    )
+    service = NovedadReconciliationService(
+        extractor=extractor,
+        sources=[ReconciliationSource("LOCS", db_path, "Locs")],
+    )
+
+    report = service.reconcile()
+
+    assert report.access_rows == 6
+    assert report.access_invalid_rows == 1
+    assert report.sqlite_rows == 4
+    assert report.buckets_compared == 3
+    assert report.units_compared == 2
+    assert report.units_differing == 1
+    assert extractor.calls == [None, "A100"]
+    assert len(report.diffs) == 1
+    diff = report.diffs[0]
+    assert (diff.unit, diff.year) == ("A100", 2024)
+    assert diff.missing_in_sqlite == [("2024-09-09", "RA")]
+    assert diff.extra_in_sqlite == [("2024-06-01", "RA")]
+    assert report.to_dict()["missing_total"] == 1
+
+    filtered = service.reconcile(units=["b200"])
+
+    assert filtered.is_consistent
+    assert filtered.units_compared == 1
+    assert extractor.calls[-1] == "B200"
+
+
+@pytest.mark.django_db
+def test_conciliacion_excluye_la_fecha_de_corte_como_el_extractor(tmp_path):
+    """Access filtra Fecha_desde > since; SQLite no debe sumar ese día."""
+
+    class StrictSinceExtractor(FilteringExtractor):
+        def iter_records(self, **kwargs) -> Iterator[dict[str, object]]:
+            since = kwargs["since_date"].isoformat()
+            return (
+                record
+                for record in super().iter_records(**kwargs)
+                if record["Fecha_desde"] > since
+            )
+
+    db_path = tmp_path / "baselocs.mdb"
+    db_path.write_bytes(b"")
+    for fecha in (date(2024, 3, 1), date(2024, 3, 2)):
+        NovedadModel.objects.create(
+            id=uuid4(),
+            legacy_unit_code="A100",
+            fecha_desde=fecha,
+            legacy_intervencion_codigo="RA",
+            is_legacy=True,
+        )
+    extractor = StrictSinceExtractor(
+        records=[
+            {"Unidad": "A100", "Fecha_desde": "2024-03-01", "Intervencion": "RA"},
+            {"Unidad": "A100", "Fecha_desde": "2024-03-02", "Intervencion": "RA"},
+        ]
+    )
+    service = NovedadReconciliationService(
+        extractor=extractor,
+        sources=[ReconciliationSource("LOCS", db_path, "Locs")],
+    )
+
+    report = service.reconcile(since_date=date(2024, 3, 1))
+
+    assert report.is_consistent
+    assert (report.access_rows, report.sqlite_rows) == (1, 1)
@@ -0,0 +1,122 @@
+"""Pruebas para el índice FTS5 de búsqueda de novedades."""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import connection
+
+from apps.tickets.infrastructure.services.novedad_search_index import (
+    NovedadSearchIndex,
+    build_match_query,
+)
+from apps.tickets.models import (
+    IntervencionTipoModel,
+    MaintenanceUnitModel,
+    NovedadModel,
+)
+
+
+def _search(text: str) -> list[str]:
+    queryset = NovedadSearchIndex().search(NovedadModel.objects.all(), text)
+    return [novedad.observaciones for novedad in queryset]
+
+
+def test_consulta_fts_cita_palabras_como_prefijo():
+    """Cada palabra se cita y se busca como prefijo; sin palabras no hay consulta."""
+
+    assert build_match_query('A90 fre"no OR') == '"A90"* "fre"* "no"* "OR"*'
+    assert build_match_query(" -- ") is None
+
+
+@pytest.mark.django_db
+def test_indice_se_mantiene_con_triggers_y_rankea():
+    """Altas ORM, bulk_create, ediciones y bajas se reflejan en la búsqueda."""
+
+    unit = MaintenanceUnitModel.objects.create(
+        id=uuid4(),
+        number="A904",
+        unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+    )
+    intervencion = IntervencionTipoModel.objects.create(
+        codigo="RA",
+        descripcion="Revision",
+    )
+    manual = NovedadModel.objects.create(
+        id=uuid4(),
+        maintenance_unit=unit,
+        fecha_desde=date(2024, 1, 1),
+        intervencion=intervencion,
+        observaciones="Revisión de frenos",
+    )
+    NovedadModel.objects.bulk_create(
+        [
+            NovedadModel(
+                id=uuid4(),
+                legacy_unit_code="CKD8G0013",
+                fecha_desde=date(2005, 5, 5),
+                legacy_intervencion_codigo="N1",
+                observaciones="Cambio de frenos, frenos traseros",
+                is_legacy=True,
+            )
+        ]
+    )
+
+    assert _search("revision fren") == ["Revisión de frenos"]
+    assert _search("904") == ["Revisión de frenos"]
+    assert _search("ckd8g") == ["Cambio de frenos, frenos traseros"]
+    assert _search("frenos") == [
+        "Cambio de frenos, frenos traseros",
+        "Revisión de frenos",
+    ]
+
+    manual.observaciones = "Motor"
+    manual.save()
+    assert _search("revision") == []
+    assert _search("motor ra") == ["Motor"]
+
+    manual.delete()
+    assert _search("motor") == []
+
+
+@pytest.mark.django_db
+def test_rebuild_repuebla_el_indice():
+    """El rebuild reconstruye el índice aunque se haya vaciado."""
+
+    NovedadModel.objects.create(
+        id=uuid4(),
+        legacy_unit_code="U3001",
+        fecha_desde=date(2024, 2, 2),
+        observaciones="Pintura",
+        is_legacy=True,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute("DELETE FROM novedad_fts")
+    assert _search("pintura") == []
+
+    assert NovedadSearchIndex().rebuild() == 1
+    assert _search("pintura") == ["Pintura"]
+
+
+@pytest.mark.django_db
+def test_post_migrate_recrea_triggers_borrados_por_un_rebuild():
+    """Sin triggers el índice no se usa; tras migrate vuelven y se repuebla."""
+
+    with connection.cursor() as cursor:
+        cursor.execute("DROP TRIGGER novedad_fts_ai")
+    NovedadModel.objects.create(
+        id=uuid4(),
+        legacy_unit_code="U3002",
+        fecha_desde=date(2024, 2, 3),
+        observaciones="Lubricación",
+        is_legacy=True,
+    )
+    index = NovedadSearchIndex()
+    assert index.is_available() is False
+    assert index.search(NovedadModel.objects.all(), "lubricacion") is None
+
+    emit_post_migrate_signal(verbosity=0, interactive=False, db="default")
+
+    assert index.is_available() is True
+    assert _search("lubricacion") == ["Lubricación"]
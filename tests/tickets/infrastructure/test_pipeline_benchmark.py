@@ -0,0 +1,57 @@
+"""Pruebas para el benchmark sintético del pipeline de sync e ingreso."""
+
+import json
+from datetime import date
+
+import pytest
+
+from apps.tickets.infrastructure.services.pipeline_benchmark import (
+    FleetProfile,
+    PipelineBenchmark,
+    SyntheticFleet,
+    iter_stage_comparison,
+)
+from apps.tickets.models import KilometrageRecordModel, NovedadModel
+
+
+def test_flota_sintetica_es_deterministica():
+    """La misma semilla genera exactamente los mismos registros Access."""
+
+    profile = FleetProfile(
+        locomotives=1, railcars=1, years=2, end_date=date(2025, 6, 30), seed=7
+    )
+
+    first = SyntheticFleet(profile)
+    second = SyntheticFleet(profile)
+
+    assert first.kilometrage_records() == second.kilometrage_records()
+    assert first.novedad_records() == second.novedad_records()
+    assert first.start_date == date(2024, 1, 1)
+
+
+@pytest.mark.django_db
+def test_benchmark_recorre_todas_las_etapas():
+    """Cada etapa reporta tiempo, filas y consultas en un JSON serializable."""
+
+    profile = FleetProfile(locomotives=2, railcars=1, years=1, seed=3)
+
+    results = PipelineBenchmark(profile, repeat=1, draft_samples=3).run()
+
+    assert list(results["stages"]) == [
+        "seed_reference_data",
+        "access_km_import",
+        "access_novedad_import",
+        "snapshot_refresh_bulk",
+        "prepare_draft",
+        "novedad_list_view",
+    ]
+    stages = results["stages"]
+    assert stages["access_km_import"]["rows"] == KilometrageRecordModel.objects.count()
+    assert stages["access_novedad_import"]["rows"] == NovedadModel.objects.count()
+    assert stages["prepare_draft"]["rows"] == 3
+    assert stages["novedad_list_view"]["extra"]["default"]["queries"] > 0
+    assert results["meta"]["profile"]["locomotives"] == 2
+    json.dumps(results)
+
+    comparison = list(iter_stage_comparison(results, results))
+    assert {ratio for *_, ratio in comparison} == {1.0}
@@ -0,0 +1,109 @@
+"""Pruebas para la caché versionada de listas de referencia."""
+
+from uuid import uuid4
+
+import pytest
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.tickets.infrastructure.models import (
+    IntervencionTipoModel,
+    LugarModel,
+    MaintenanceUnitModel,
+    TrainNumberModel,
+)
+from apps.tickets.infrastructure.services.reference_data_cache import (
+    NOVEDAD_OPTIONS,
+    TICKET_OPTIONS,
+    ReferenceDataCache,
+)
+
+
+def _unit(number: str, category: str = MaintenanceUnitModel.Category.TRACTION):
+    return MaintenanceUnitModel.objects.create(
+        id=uuid4(),
+        number=number,
+        unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+        rolling_stock_category=category,
+    )
+
+
+@pytest.mark.django_db
+def test_triggers_suben_la_version_solo_con_columnas_de_las_listas():
+    """Altas, bajas y cambios relevantes suben la versión; otros cambios no."""
+
+    cache = ReferenceDataCache()
+    start = cache.version()
+
+    unit = _unit("A904")
+    assert cache.version() == start + 1
+
+    unit.is_active = False
+    unit.save(update_fields=["is_active"])
+    assert cache.version() == start + 1
+
+    LugarModel.objects.create(codigo=20, descripcion="Taller Escalada")
+    TrainNumberModel.objects.create(id=uuid4(), number="3001")
+    unit.delete()
+    assert cache.version() == start + 4
+
+
+@pytest.mark.django_db
+def test_listas_se_reusan_hasta_que_cambia_la_version():
+    """Con la versión sin cambios solo se lee la fila de versión."""
+
+    cache = ReferenceDataCache()
+    _unit("A904")
+    _unit("U3001", category=MaintenanceUnitModel.Category.RAILCAR)
+    IntervencionTipoModel.objects.create(codigo="RA", descripcion="Revisión")
+
+    _, first = cache.options(NOVEDAD_OPTIONS, "traccion")
+    with CaptureQueriesContext(connection) as queries:
+        _, again = cache.options(NOVEDAD_OPTIONS, "traccion")
+
+    assert again is first
+    assert len(queries.captured_queries) == 1
+    assert first["unit_options"] == [{"number": "A904", "display": "A904 (Locomotora)"}]
+    assert {"codigo": "RA", "descripcion": "Revisión"} in first["intervencion_options"]
+
+    _unit("A905")
+    _, rebuilt = cache.options(NOVEDAD_OPTIONS, "traccion")
+    assert [option["number"] for option in rebuilt["unit_options"]] == [
+        "A904",
+        "A905",
+    ]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@pytest.mark.django_db
+def test_listas_de_ticket_y_nombre_desconocido():
+    """El formulario de tickets recibe trenes activos; un nombre inválido falla."""
+
+    cache = ReferenceDataCache()
+    TrainNumberModel.objects.create(id=uuid4(), number="3001")
+    TrainNumberModel.objects.create(id=uuid4(), number="3002", is_active=False)
+
+    _, options = cache.options(TICKET_OPTIONS)
+
+    assert options["trains"] == [{"number": "3001"}]
+    with pytest.raises(KeyError):
+        cache.options("desconocido")
+
+
+@pytest.mark.django_db
+def test_migrate_recrea_triggers_de_version_y_sube_la_version():
+    """Un trigger borrado vuelve tras migrate y la versión invalida la caché."""
+
+    cache = ReferenceDataCache()
+    with connection.cursor() as cursor:
+        cursor.execute("DROP TRIGGER reference_version_lugar_ai")
+    start = cache.version()
+    LugarModel.objects.create(codigo=91, descripcion="Taller nuevo")
+    assert cache.version() == start
+
+    emit_post_migrate_signal(verbosity=0, interactive=False, db="default")
+    assert cache.version() == start + 1
+
+    LugarModel.objects.create(codigo=92, descripcion="Otro taller")
+    assert cache.version() == start + 2
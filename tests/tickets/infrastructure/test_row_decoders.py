@@ -0,0 +1,102 @@
+"""Pruebas para los decodificadores de columnas compartidos por importadores."""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from apps.tickets.infrastructure.services.row_decoders import (
+    LEGACY_DATE_FORMATS,
+    CodeNormalizer,
+    DateDecoder,
+    parse_comma_decimal,
+    parse_date,
+    parse_decimal,
+)
+
+
+@pytest.mark.parametrize(
+    ("raw_value", "expected"),
+    [
+        ("2024-03-05", date(2024, 3, 5)),
+        ("2024-03-05T10:30:00", date(2024, 3, 5)),
+        ("2024-3-5", date(2024, 3, 5)),
+        ("03/05/2024", date(2024, 3, 5)),
+        ("25/12/2024", date(2024, 12, 25)),
+        (" 1/2/2024 ", date(2024, 1, 2)),
+        (datetime(2024, 1, 2, 8, 0), date(2024, 1, 2)),
+        ("31/02/2024", None),
+        ("05/03/24", None),
+        ("2024/03/05", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_parse_date_respeta_formatos_previos(raw_value, expected):
+    """Acepta los mismos formatos que el fromisoformat + strptime anterior."""
+    assert parse_date(raw_value) == expected
+
+
+def test_decodificador_fija_formato_y_vuelve_a_probar_si_no_coincide():
+    """Tras ver un dd/mm la columna lo mantiene; si no encaja prueba el resto."""
+    decode = DateDecoder()
+
+    assert decode("25/12/2024") == date(2024, 12, 25)
+    assert decode("13/02/2024") == date(2024, 2, 13)
+    assert decode("2024-06-30") == date(2024, 6, 30)
+    assert decode("26/12/2024") == date(2024, 12, 26)
+    assert decode("basura") is None
+
+
+def test_decodificador_no_depende_del_orden_de_las_filas():
+    """Un valor ambiguo da la misma fecha antes y después de un dd/mm."""
+    decode = DateDecoder()
+
+    assert decode("03/04/2024") == date(2024, 3, 4)
+    assert decode("25/03/2024") == date(2024, 3, 25)
+    assert decode("03/04/2024") == date(2024, 3, 4)
+
+    day_first = DateDecoder()
+    assert day_first("25/03/2024") == date(2024, 3, 25)
+    assert day_first("03/04/2024") == parse_date("03/04/2024") == date(2024, 3, 4)
+
+
+def test_decodificador_legacy_solo_acepta_dia_mes_anio():
+    """Las exportaciones TXT legacy son siempre dd/mm/aaaa."""
+    decode = DateDecoder(LEGACY_DATE_FORMATS)
+
+    assert decode("05/03/2024") == date(2024, 3, 5)
+    assert decode("2024-03-05") is None
+
+
+@pytest.mark.parametrize(
+    ("raw_value", "expected"),
+    [
+        ("204.8", Decimal("204.8")),
+        ("1.234,56", Decimal("1234.56")),
+        ("204,80", Decimal("204.80")),
+        (12, Decimal("12")),
+        ("abc", None),
+    ],
+)
+def test_parse_decimal_invariante_y_europeo(raw_value, expected):
+    """Convierte formato invariante y europeo con un solo intento."""
+    assert parse_decimal(raw_value) == expected
+
+
+def test_parse_comma_decimal_legacy():
+    """El TXT legacy usa coma decimal."""
+    assert parse_comma_decimal("50,25") == Decimal("50.25")
+    assert parse_comma_decimal("") is None
+
+
+def test_normalizador_de_codigos_memoriza_valores():
+    """Devuelve el mismo objeto para valores repetidos y None para vacios."""
+    normalize = CodeNormalizer(max_entries=1)
+
+    first = normalize(" a100 ")
+    assert first == "A100"
+    assert normalize(" a100 ") is first
+    assert normalize("b200") == "B200"
+    assert normalize("   ") is None
+    assert CodeNormalizer(upper=False)(" Ra ") == "Ra"
@@ -0,0 +1,137 @@
+"""Pruebas para la sincronización programada con Access."""
+
+import importlib
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from apps.tickets.application.use_cases.legacy_sync_use_case import (
+    LegacySyncResult,
+    SyncStats,
+)
+from apps.tickets.infrastructure.scheduler import run_sync
+from apps.tickets.models import AccessSyncLogModel
+
+
+def _stats(inserted: int, affected_units: set[str]) -> SyncStats:
+    return SyncStats(
+        processed=inserted,
+        inserted=inserted,
+        skipped_old=0,
+        duplicates=0,
+        invalid=0,
+        affected_units=frozenset(affected_units),
+    )
+
+
+@pytest.mark.django_db
+def test_run_sync_refresca_solo_unidades_afectadas():
+    """El snapshot se recalcula solo para las unidades con filas nuevas."""
+    result = LegacySyncResult(
+        novedades=_stats(1, {"A400"}),
+        kilometrage=_stats(3, {"A401", "A400"}),
+        duration_seconds=0.1,
+    )
+
+    with (
+        patch(
+            "apps.tickets.application.use_cases.access_sync_use_case.AccessSyncUseCase"
+        ) as use_case_cls,
+        patch(
+            "apps.tickets.infrastructure.services.unit_maintenance_snapshot_service."
+            "UnitMaintenanceSnapshotService.refresh_bulk",
+            return_value=2,
+        ) as refresh_bulk,
+    ):
+        use_case_cls.return_value.run.return_value = result
+        run_sync(trigger="manual")
+
+    refresh_bulk.assert_called_once_with(unit_numbers=["A400", "A401"])
+    log = AccessSyncLogModel.objects.get()
+    assert log.status == AccessSyncLogModel.STATUS_OK
+    assert log.kilometrage_inserted == 3
+
+
+@pytest.mark.django_db
+def test_run_sync_sin_unidades_afectadas_no_refresca():
+    """Sin filas nuevas no se recalcula ningún snapshot."""
+    result = LegacySyncResult(
+        novedades=_stats(0, set()),
+        kilometrage=_stats(0, set()),
+        duration_seconds=0.1,
+    )
+
+    with (
+        patch(
+            "apps.tickets.application.use_cases.access_sync_use_case.AccessSyncUseCase"
+        ) as use_case_cls,
+        patch(
+            "apps.tickets.infrastructure.services.unit_maintenance_snapshot_service."
+            "UnitMaintenanceSnapshotService.refresh_bulk"
+        ) as refresh_bulk,
+    ):
+        use_case_cls.return_value.run.return_value = result
+        run_sync(trigger="manual")
+
+    refresh_bulk.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_run_sync_guarda_tiempos_por_etapa():
+    """El log guarda las etapas del caso de uso más el refresh de snapshots."""
+    result = LegacySyncResult(
+        novedades=_stats(1, {"A400"}),
+        kilometrage=_stats(0, set()),
+        duration_seconds=0.1,
+        stage_timings=[
+            {
+                "stage": "insert",
+                "source": "LOCS",
+                "table": "Detenciones",
+                "seconds": 0.05,
+                "rows": 1,
+            }
+        ],
+    )
+
+    with (
+        patch(
+            "apps.tickets.application.use_cases.access_sync_use_case.AccessSyncUseCase"
+        ) as use_case_cls,
+        patch(
+            "apps.tickets.infrastructure.services.unit_maintenance_snapshot_service."
+            "UnitMaintenanceSnapshotService.refresh_bulk",
+            return_value=1,
+        ),
+    ):
+        use_case_cls.return_value.run.return_value = result
+        run_sync(trigger="manual")
+
+    log = AccessSyncLogModel.objects.get()
+    assert [stage["stage"] for stage in log.stage_timings] == [
+        "insert",
+        "snapshot_refresh",
+    ]
+    assert log.stage_timings[1]["rows"] == 1
+
+
+def test_wsgi_arranca_los_workers_de_ingreso_segun_el_flag(settings, monkeypatch):
+    """Waitress no pasa por manage.py: el módulo WSGI arranca los workers."""
+    monkeypatch.delitem(sys.modules, "config.wsgi", raising=False)
+    target = (
+        "apps.tickets.infrastructure.services.ingreso_job_queue.start_ingreso_workers"
+    )
+
+    settings.INGRESO_ASYNC_JOBS = False
+    with patch(target) as start:
+        importlib.import_module("config.wsgi")
+    start.assert_not_called()
+
+    monkeypatch.delitem(sys.modules, "config.wsgi")
+    settings.INGRESO_ASYNC_JOBS = True
+    settings.INGRESO_JOB_WORKERS = 2
+    with patch(target, return_value=2) as start:
+        importlib.import_module("config.wsgi")
+    start.assert_called_once()
+    assert start.call_args.kwargs["count"] == 2
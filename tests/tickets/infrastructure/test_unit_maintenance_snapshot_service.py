@@ -0,0 +1,124 @@
+"""Pruebas para el cálculo de snapshots de mantenimiento."""
+
+import uuid
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from apps.tickets.infrastructure.models import UnitMaintenanceSnapshotModel
+from apps.tickets.infrastructure.services.kilometrage_cumulative_index import (
+    KilometrageCumulativeIndex,
+)
+from apps.tickets.infrastructure.services.unit_maintenance_snapshot_service import (
+    UnitMaintenanceSnapshotService,
+)
+from apps.tickets.models import (
+    BrandModel,
+    IntervencionTipoModel,
+    KilometrageRecordModel,
+    LocomotiveModel,
+    LocomotiveModelModel,
+    MaintenanceCycleModel,
+    MaintenanceUnitModel,
+    NovedadModel,
+)
+
+SNAPSHOT_FIELDS = UnitMaintenanceSnapshotService._SNAPSHOT_FIELDS
+
+
+def _create_locomotive(number: str, brand, model) -> MaintenanceUnitModel:
+    unit = MaintenanceUnitModel.objects.create(
+        id=uuid.uuid4(), number=number, unit_type="locomotora"
+    )
+    LocomotiveModel.objects.create(maintenance_unit=unit, brand=brand, model=model)
+    return unit
+
+
+def _add_km(unit_number: str, rows: list[tuple[date, str]]) -> None:
+    for record_date, km in rows:
+        KilometrageRecordModel.objects.create(
+            unit_number=unit_number, record_date=record_date, km_value=Decimal(km)
+        )
+
+
+def _close_intervention(unit, intervencion, date_from: date, date_until: date) -> None:
+    NovedadModel.objects.create(
+        id=uuid.uuid4(),
+        maintenance_unit=unit,
+        fecha_desde=date_from,
+        fecha_hasta=date_until,
+        intervencion=intervencion,
+        is_legacy=True,
+    )
+
+
+@pytest.mark.django_db
+def test_refresh_bulk_coincide_con_refresh_por_unidad():
+    """El cálculo masivo produce los mismos snapshots que el cálculo por unidad."""
+    brand, _ = BrandModel.objects.get_or_create(
+        code="GM",
+        defaults={"id": uuid.uuid4(), "name": "GM", "full_name": "General Motors"},
+    )
+    model = LocomotiveModelModel.objects.create(
+        id=uuid.uuid4(), name="GT22-CW", code="GT22-CW", brand=brand
+    )
+    for code, value in (("RG", 720000), ("A", 16000)):
+        MaintenanceCycleModel.objects.create(
+            id=uuid.uuid4(),
+            rolling_stock_type="locomotora",
+            brand=brand,
+            model=None,
+            intervention_code=code,
+            intervention_name=f"Revision {code}",
+            trigger_type="km",
+            trigger_value=value,
+            trigger_unit="km",
+            is_active=True,
+        )
+    rg = IntervencionTipoModel.objects.create(
+        id=uuid.uuid4(), codigo="RG", descripcion="Reparacion general"
+    )
+    revision_a = IntervencionTipoModel.objects.create(
+        id=uuid.uuid4(), codigo="A", descripcion="Revision A"
+    )
+
+    with_rg = _create_locomotive("A500", brand, model)
+    _close_intervention(with_rg, rg, date(2024, 1, 1), date(2024, 1, 10))
+    _close_intervention(with_rg, revision_a, date(2024, 2, 1), date(2024, 2, 2))
+    _add_km(
+        "A500",
+        [
+            (date(2024, 1, 5), "100"),
+            (date(2024, 1, 20), "200"),
+            (date(2024, 3, 1), "50"),
+        ],
+    )
+
+    without_rg = _create_locomotive("A501", brand, model)
+    _add_km("A501", [(date(2023, 6, 1), "10"), (date(2023, 7, 1), "15")])
+    KilometrageCumulativeIndex().rebuild_all()
+
+    service = UnitMaintenanceSnapshotService()
+    expected = {}
+    for unit in (with_rg, without_rg):
+        snapshot = service.refresh_unit(unit)
+        expected[unit.number] = {
+            field: getattr(snapshot, field) for field in SNAPSHOT_FIELDS
+        }
+    UnitMaintenanceSnapshotModel.objects.update(km_since_rg=None, last_rg_date=None)
+
+    processed = []
+    count = service.refresh_bulk(progress_callback=processed.append)
+
+    assert count == 2
+    assert sorted(processed) == ["A500", "A501"]
+    assert UnitMaintenanceSnapshotModel.objects.count() == 2
+    for snapshot in UnitMaintenanceSnapshotModel.objects.all():
+        actual = {field: getattr(snapshot, field) for field in SNAPSHOT_FIELDS}
+        assert actual == expected[snapshot.unit_number]
+
+    assert expected["A500"]["last_rg_date"] == date(2024, 1, 10)
+    assert expected["A500"]["km_since_rg"] == Decimal("250")
+    assert expected["A501"]["last_rg_date"] == date(2023, 6, 1)
+    assert expected["A501"]["km_since_rg"] == Decimal("25")
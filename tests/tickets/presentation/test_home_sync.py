@@ -5,11 +5,13 @@ from unittest.mock import patch
 import pytest
 from django.contrib.auth import get_user_model
 from django.urls import reverse
+from django.utils import timezone
 
 from apps.tickets.application.use_cases.legacy_sync_use_case import (
     LegacySyncResult,
     SyncStats,
 )
+from apps.tickets.infrastructure.models import DashboardCountersModel, NovedadModel
 
 
 @pytest.mark.django_db
@@ -75,3 +77,25 @@ def test_home_does_not_show_legacy_sync_button(client):
 
     assert response.status_code == 200
     assert "Sincronizar novedades y kilometraje" not in response.content.decode("utf-8")
+
+
+@pytest.mark.django_db
+def test_home_lee_contadores_de_la_fila_unica(client):
+    """Los contadores de la home salen de dashboard_counters y siguen las altas."""
+    user = get_user_model().objects.create_user(
+        username="counter-user", password="secret123"
+    )
+    client.force_login(user)
+    NovedadModel.objects.create(
+        legacy_unit_code="A904",
+        fecha_desde=timezone.now().date(),
+        is_legacy=True,
+    )
+
+    response = client.get(reverse("tickets:home"))
+
+    assert response.context["novedades_hoy"] == 1
+    assert response.context["novedades_total"] == 1
+    assert response.context["total_count"] == 0
+    counters = DashboardCountersModel.objects.get()
+    assert counters.as_of == timezone.now().date()
@@ -73,6 +73,34 @@ def test_pending_endpoint_returns_signed_payload(client, settings, tmp_path):
     assert IngresoEmailSigner.verify(payload, signature, "secret")
 
 
+@pytest.mark.django_db
+def test_pending_endpoint_skips_dispatch_without_pdf(client, settings, tmp_path):
+    settings.INGRESO_TRAY_TOKEN = "token"
+    settings.INGRESO_EMAIL_SIGNING_SECRET = "secret"
+
+    entry = _create_entry_with_pdf(tmp_path)
+    MaintenanceEntryModel.objects.filter(pk=entry.pk).update(pdf_path=None)
+    dispatch = MaintenanceEntryEmailDispatchModel.objects.create(
+        entry=entry,
+        status=MaintenanceEntryEmailDispatchModel.Status.PENDING,
+        attempts=0,
+        to_recipients=["to@example.com"],
+        cc_recipients=[],
+        subject="Ingreso 123",
+        body="Body",
+        body_html=None,
+    )
+
+    response = client.get(
+        reverse("tickets:ingreso_email_pending"),
+        HTTP_X_TRAY_TOKEN="token",
+    )
+
+    assert response.status_code == 204
+    dispatch.refresh_from_db()
+    assert dispatch.status == MaintenanceEntryEmailDispatchModel.Status.PENDING
+
+
 @pytest.mark.django_db
 def test_result_endpoint_marks_sent(client, settings, tmp_path):
     settings.INGRESO_TRAY_TOKEN = "token"
@@ -0,0 +1,64 @@
+"""Pruebas del estado de los trabajos de ingreso en segundo plano."""
+
+from uuid import uuid4
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.tickets.infrastructure.models import MaintenanceEntryModel, NovedadModel
+from apps.tickets.infrastructure.services.ingreso_job_queue import IngresoJobQueue
+
+
+def _login(client):
+    user = get_user_model().objects.create_user(
+        username="job-user", password="secret123"
+    )
+    client.force_login(user)
+
+
+@pytest.mark.django_db
+def test_detalle_consulta_el_estado_hasta_que_el_job_termina(client):
+    """Con el job en cola la página lo consulta; al terminar deja de hacerlo."""
+    _login(client)
+    novedad = NovedadModel.objects.create(
+        fecha_desde=timezone.localdate(), is_legacy=False, ingreso_generado=True
+    )
+    entry = MaintenanceEntryModel.objects.create(
+        novedad=novedad, entry_datetime=timezone.now()
+    )
+    queue = IngresoJobQueue()
+    job = queue.enqueue(entry)
+    status_url = reverse("tickets:ingreso_job_status", kwargs={"entry_id": entry.pk})
+    detail_url = reverse("tickets:novedad_detail", kwargs={"pk": novedad.pk})
+
+    html = client.get(detail_url).content.decode("utf-8")
+    assert 'data-role="ingreso-job-status"' in html
+    assert status_url in html
+    queued = client.get(status_url).json()
+    assert (queued["status"], queued["finished"]) == ("queued", False)
+
+    queue.mark_done(
+        job,
+        recipients_status="ok",
+        recipients_reason=None,
+        outlook_status="pending",
+        outlook_reason=None,
+    )
+    done = client.get(status_url)
+    assert done.json()["finished"] is True
+    assert "no-cache" in done["Cache-Control"]
+    assert 'data-role="ingreso-job-status"' not in client.get(
+        detail_url
+    ).content.decode("utf-8")
+
+
+@pytest.mark.django_db
+def test_estado_requiere_login_y_un_job_existente(client):
+    """Sin sesión redirige al login; un ingreso sin job da 404."""
+    url = reverse("tickets:ingreso_job_status", kwargs={"entry_id": uuid4()})
+    assert client.get(url).status_code == 302
+
+    _login(client)
+    assert client.get(url).status_code == 404
@@ -0,0 +1,125 @@
+"""Pruebas para la paginación por cursor de los listados."""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.tickets.infrastructure.models import NovedadModel
+from apps.tickets.infrastructure.services.novedad_search_index import (
+    NovedadSearchIndex,
+)
+from apps.tickets.presentation.views.keyset_pagination import KeysetPaginator
+
+
+def _novedades(count: int) -> list[NovedadModel]:
+    base = date(2024, 3, 1)
+    NovedadModel.objects.bulk_create(
+        [
+            NovedadModel(
+                id=uuid4(),
+                legacy_unit_code=f"A{index:03d}",
+                # Fechas repetidas para forzar el desempate por created_at e id
+                fecha_desde=base - timedelta(days=index // 3),
+                observaciones=f"Freno {index}" if index % 2 else f"Motor {index}",
+                is_legacy=True,
+            )
+            for index in range(count)
+        ]
+    )
+    NovedadModel.objects.filter(fecha_desde=base).update(
+        created_at=NovedadModel.objects.first().created_at
+    )
+    return list(NovedadModel.objects.order_by("-fecha_desde", "-created_at", "-id"))
+
+
+def _walk_forward(paginator: KeysetPaginator) -> list[list]:
+    pages = [paginator.page()]
+    while pages[-1].has_next():
+        pages.append(paginator.page(after=pages[-1].next_cursor))
+    return pages
+
+
+@pytest.mark.django_db
+def test_recorre_todas_las_paginas_sin_saltos_ni_repetidos():
+    """Avanzar y retroceder por cursor devuelve las mismas filas que el orden total."""
+
+    expected = _novedades(11)
+    paginator = KeysetPaginator(
+        NovedadModel.objects.order_by("-fecha_desde", "-created_at"), per_page=4
+    )
+
+    pages = _walk_forward(paginator)
+
+    assert [row for page in pages for row in page] == expected
+    assert [len(page) for page in pages] == [4, 4, 3]
+    assert not pages[0].has_previous()
+    assert pages[1].has_previous() and pages[1].has_next()
+
+    back = paginator.page(before=pages[2].previous_cursor)
+    assert back.object_list == pages[1].object_list
+    first = paginator.page(before=back.previous_cursor)
+    assert first.object_list == pages[0].object_list
+    assert not first.has_previous()
+
+
+@pytest.mark.django_db
+def test_pagina_profunda_no_usa_offset_ni_count():
+    """Una página intermedia es un único SELECT con LIMIT y sin OFFSET ni COUNT."""
+
+    _novedades(9)
+    paginator = KeysetPaginator(
+        NovedadModel.objects.order_by("-fecha_desde", "-created_at"), per_page=3
+    )
+    cursor = paginator.page().next_cursor
+
+    with CaptureQueriesContext(connection) as queries:
+        page = paginator.page(after=cursor)
+
+    assert len(page) == 3
+    assert len(queries.captured_queries) == 1
+    sql = queries.captured_queries[0]["sql"].upper()
+    assert "OFFSET" not in sql
+    assert "COUNT(" not in sql
+
+
+@pytest.mark.django_db
+def test_conteo_aproximado_se_corta_en_el_limite():
+    """El conteo del encabezado deja de contar al superar el límite."""
+
+    _novedades(7)
+    paginator = KeysetPaginator(NovedadModel.objects.all(), per_page=2, count_cap=5)
+
+    assert paginator.approximate_count == 6
+    assert paginator.count_is_capped
+    assert paginator.count == 7
+
+
+@pytest.mark.django_db
+def test_cursor_invalido_vuelve_a_la_primera_pagina():
+    """Un cursor corrupto o de otro orden no falla: muestra la primera página."""
+
+    _novedades(5)
+    paginator = KeysetPaginator(
+        NovedadModel.objects.order_by("-fecha_desde", "-created_at"), per_page=2
+    )
+    first = paginator.page()
+
+    assert paginator.page(after="no-es-un-cursor").object_list == first.object_list
+    assert paginator.page(after="WzFd").object_list == first.object_list
+
+
+@pytest.mark.django_db
+def test_pagina_resultados_fts_por_ranking():
+    """La búsqueda FTS pagina por ranking conservando el orden completo."""
+
+    _novedades(10)
+    searched = NovedadSearchIndex().search(NovedadModel.objects.all(), "freno")
+    expected = list(searched)
+
+    pages = _walk_forward(KeysetPaginator(searched, per_page=2))
+
+    assert len(expected) == 5
+    assert [row for page in pages for row in page] == expected
@@ -1,6 +1,6 @@
 """Pruebas de vistas para novedades."""
 
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
 from unittest.mock import patch
 from uuid import uuid4
@@ -20,6 +20,7 @@ from apps.tickets.application.use_cases.maintenance_entry_use_case import (
     MaintenanceEntryUseCase,
 )
 from apps.tickets.infrastructure.models import (
+    AccessSyncLogModel,
     IntervencionTipoModel,
     KilometrageRecordModel,
     LugarModel,
@@ -278,6 +279,102 @@ class TestNovedadViews:
             assert response.status_code == 200
             assert "Sync manual" not in response.content.decode("utf-8")
 
+    def test_list_pagina_por_cursor(self, client):
+        """La lista avanza con ?after= y conserva los filtros en los enlaces."""
+        user = self._user()
+        unit_loco, _, intervencion, lugar = self._references()
+        today = date.today()
+        NovedadModel.objects.bulk_create(
+            [
+                NovedadModel(
+                    maintenance_unit=unit_loco,
+                    fecha_desde=today - timedelta(days=index),
+                    intervencion=intervencion,
+                    lugar=lugar,
+                    observaciones=f"Novedad {index}",
+                )
+                for index in range(53)
+            ]
+        )
+        client.force_login(user)
+        url = reverse("tickets:novedad_list")
+
+        first = client.get(url, {"range_days": 90})
+        page = first.context["page_obj"]
+        assert len(page.object_list) == 50
+        assert page.has_next() and not page.has_previous()
+        assert page.paginator.approximate_count == 53
+        assert f"?after={page.next_cursor}&range_days=90" in first.content.decode(
+            "utf-8"
+        )
+
+        second = client.get(url, {"range_days": 90, "after": page.next_cursor})
+        next_page = second.context["page_obj"]
+        assert len(next_page.object_list) == 3
+        assert next_page.has_previous() and not next_page.has_next()
+        assert not set(next_page.object_list) & set(page.object_list)
+
+    def test_list_muestra_tiempos_por_etapa_del_ultimo_sync(self, client):
+        """El panel del último sync lista las etapas y resalta la más lenta."""
+        AccessSyncLogModel.objects.create(
+            trigger=AccessSyncLogModel.TRIGGER_SCHEDULED,
+            status=AccessSyncLogModel.STATUS_OK,
+            stage_timings=[
+                {
+                    "stage": "extract",
+                    "source": "LOCS",
+                    "table": "Detenciones",
+                    "seconds": 4.5,
+                    "rows": 0,
+                },
+                {
+                    "stage": "snapshot_refresh",
+                    "source": "",
+                    "table": "",
+                    "seconds": 0.25,
+                    "rows": 3,
+                },
+            ],
+        )
+        client.force_login(self._user())
+
+        response = client.get(reverse("tickets:novedad_list"))
+
+        stages = response.context["last_sync_stages"]
+        assert [stage["stage"] for stage in stages] == ["extract", "snapshot_refresh"]
+        assert stages[0]["slowest"] is True
+        assert "slowest" not in stages[1]
+        assert 'data-role="sync-stage-timings"' in response.content.decode("utf-8")
+
+    def test_list_muestra_etapas_del_sync_aunque_haya_un_export_posterior(self, client):
+        """Un export más reciente, sin etapas, no oculta las del último sync."""
+        sync = AccessSyncLogModel.objects.create(
+            trigger=AccessSyncLogModel.TRIGGER_SCHEDULED,
+            status=AccessSyncLogModel.STATUS_OK,
+            stage_timings=[
+                {
+                    "stage": "extract",
+                    "source": "LOCS",
+                    "table": "Detenciones",
+                    "seconds": 4.5,
+                    "rows": 0,
+                }
+            ],
+        )
+        export = AccessSyncLogModel.objects.create(
+            trigger="scheduled_export", status=AccessSyncLogModel.STATUS_OK
+        )
+        AccessSyncLogModel.objects.filter(pk=export.pk).update(
+            ran_at=sync.ran_at + timedelta(minutes=5)
+        )
+        client.force_login(self._user())
+
+        response = client.get(reverse("tickets:novedad_list"))
+
+        assert response.context["last_sync"].pk == export.pk
+        stages = response.context["last_sync_stages"]
+        assert [stage["stage"] for stage in stages] == ["extract"]
+
     def test_prefill_km_usa_formato_eu(self):
         """El prefill de km aplica formato europeo con decimales reales."""
         assert MaintenanceEntryCreateView._format_km(Decimal("1000.5")) == "1.000,5"
@@ -0,0 +1,81 @@
+"""Pruebas del endpoint de listas de referencia con ETag."""
+
+from uuid import uuid4
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils.html import escapejs
+
+from apps.tickets.infrastructure.models import MaintenanceUnitModel
+
+
+def _login(client):
+    user = get_user_model().objects.create_user(
+        username="ref-user", password="secret123"
+    )
+    client.force_login(user)
+
+
+@pytest.mark.django_db
+def test_endpoint_responde_304_mientras_no_cambia_la_version(client):
+    """El navegador revalida con If-None-Match y solo recibe cuerpo si cambió."""
+    _login(client)
+    MaintenanceUnitModel.objects.create(
+        id=uuid4(),
+        number="A904",
+        unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+    )
+    url = reverse("tickets:reference_options", kwargs={"name": "novedad"})
+
+    first = client.get(url)
+    etag = first["ETag"]
+    assert first.status_code == 200
+    assert "no-cache" in first["Cache-Control"]
+    assert first.json()["unit_options"][0]["number"] == "A904"
+
+    cached = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    MaintenanceUnitModel.objects.create(
+        id=uuid4(),
+        number="A905",
+        unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+    )
+    changed = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert changed["ETag"] != etag
+    assert len(changed.json()["unit_options"]) == 2
+
+
+@pytest.mark.django_db
+def test_endpoint_requiere_login_y_nombre_valido(client):
+    """Sin sesión redirige al login; un nombre desconocido da 404."""
+    url = reverse("tickets:reference_options", kwargs={"name": "ticket"})
+    assert client.get(url).status_code == 302
+
+    _login(client)
+    assert client.get(url).status_code == 200
+    missing = reverse("tickets:reference_options", kwargs={"name": "otro"})
+    assert client.get(missing).status_code == 404
+
+
+@pytest.mark.django_db
+def test_formulario_de_novedad_no_incrusta_las_unidades(client):
+    """El formulario carga las unidades desde el endpoint, no en el HTML."""
+    _login(client)
+    MaintenanceUnitModel.objects.create(
+        id=uuid4(),
+        number="A904",
+        unit_type=MaintenanceUnitModel.UnitType.LOCOMOTIVE,
+    )
+
+    response = client.get(reverse("tickets:novedad_create"))
+
+    html = response.content.decode("utf-8")
+    assert response.status_code == 200
+    assert '<datalist id="unit-list"></datalist>' in html
+    assert "A904 (Locomotora)" not in html
+    url = reverse("tickets:reference_options", kwargs={"name": "novedad"})
+    assert escapejs(url) in html